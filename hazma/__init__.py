@@ -7,7 +7,13 @@ __all__ = [
     "gamma_ray_parameters",
     "gamma_ray",
     "hazma_errors",
+    "parallel",
     "parameters",
     "positron_spectra",
     "rambo",
+    "set_executor",
+    "set_num_threads",
+    "use_executor",
 ]
+
+from hazma.parallel import set_executor, set_num_threads, use_executor
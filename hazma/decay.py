@@ -11,6 +11,11 @@ from hazma.decay_helper_functions import decay_charged_kaon
 from hazma.decay_helper_functions import decay_muon
 from hazma.decay_helper_functions import decay_neutral_pion
 from hazma.decay_helper_functions import decay_short_kaon
+from hazma.decay_helper_functions.decay_tables import disable_tables  # noqa: F401
+from hazma.decay_helper_functions.decay_tables import enable_tables  # noqa: F401
+from hazma.decay_helper_functions.rest_frame_spectra import (  # noqa: F401
+    set_boost_method,
+)
 
 
 def __mode_deprecation_warning():
@@ -48,8 +53,11 @@ def muon(photon_energies, muon_energy):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    muon_energy : double
+    muon_energy : float or numpy.ndarray
         Muon energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(muon_energy), len(photon_energies)).
 
     Returns
     -------
@@ -85,8 +93,11 @@ def neutral_pion(photon_energies, pion_energy):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    pion_energy : float
+    pion_energy : float or numpy.ndarray
         Neutral pion energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(pion_energy), len(photon_energies)).
 
     Returns
     -------
@@ -125,8 +136,11 @@ def charged_pion(photon_energies, pion_energy, modes=None):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    pion_energy : double
+    pion_energy : float or numpy.ndarray
         Charged pion energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(pion_energy), len(photon_energies)).
     modes : List[str], optional
         A list modes the user would like include. The availible entries
         are: "munu", "munug" and "enug". Default is all of these.
@@ -171,8 +185,11 @@ def charged_kaon(photon_energies, kaon_energy, modes=None):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    kaon_energy : float
+    kaon_energy : float or numpy.ndarray
         Charged kaon energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(kaon_energy), len(photon_energies)).
     modes : List[str], optional
         A list modes the user would like to have included. The availible entries are:
         "0enu", "0munu", "00p", "mmug", "munu", "p0", "p0g" and "ppm". Here
@@ -236,8 +253,11 @@ def short_kaon(photon_energies, kaon_energy, modes=None):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    kaon_energy : float
+    kaon_energy : float or numpy.ndarray
         Charged kaon energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(kaon_energy), len(photon_energies)).
     mode : str
         The mode the user would like to have returned. The options are "total",
         "00", "pm" or "pmg". Here "p" stands for pi plus, "m" stands for pi
@@ -293,8 +313,11 @@ def long_kaon(photon_energies, kaon_energy, modes=None):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    kaon_energy : float
+    kaon_energy : float or numpy.ndarray
         Charged kaon energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(kaon_energy), len(photon_energies)).
     mode : str
         The mode the user would like to have returned. The options are "total",
         "000", "penu", "penug", "pm0", "pm0g", "pmunu" or "pmunug". Here "p"
@@ -343,7 +366,7 @@ def long_kaon(photon_energies, kaon_energy, modes=None):
     )
 
 
-def electron(photon_energies, _):
+def electron(photon_energies, electron_energy):
     r"""Compute gamma-ray spectrum from electron decay (returns zero).
 
     The purpose of this function is so we can use the electron as a final
@@ -353,14 +376,15 @@ def electron(photon_energies, _):
     ----------
     photon_energies : float or numpy.ndarray
         Photon energy(ies) in laboratory frame.
-    electron_energy : double
+    electron_energy : float or numpy.ndarray
         Electron energy in laboratory frame.
+        If an array is given, the spectra for all energies are computed in
+        a single call and returned as an array of shape
+        (len(electron_energy), len(photon_energies)).
 
     Returns
     -------
-    spec : numpy.ndarray
-        An array of zeros.
+    spec : float or numpy.ndarray
+        Zero, or an array of zeros.
     """
-    if hasattr(photon_energies, "__len__"):
-        return np.array([0.0 for _ in photon_energies])
-    return 0.0
+    return np.zeros(np.shape(electron_energy) + np.shape(photon_energies))
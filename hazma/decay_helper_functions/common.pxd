@@ -1,19 +1,177 @@
 import numpy as np
 cimport numpy as np
 import cython
-from libc.math cimport sqrt
+from libc.math cimport sqrt, fabs, NAN
+from libc.stdlib cimport malloc, free
 
 @cython.cdivision(True)
-cdef inline double gamma(double eng, double mass):
+cdef inline double gamma(double eng, double mass) nogil:
     """Returns boost factor."""
     return eng / mass
 
 
 @cython.cdivision(True)
-cdef inline double beta(double eng, double mass):
+cdef inline double beta(double eng, double mass) nogil:
     """Returns velocity in natural units."""
     return sqrt(1.0 - (mass / eng)**2.0)
 
+
+@cython.cdivision(True)
+cdef inline double rest_frame_energy(double eng, double mass, double eng_parent, double mass_parent, double cl) nogil:
+    """
+    Returns the energy in the rest frame of a parent of a particle with
+    energy `eng` at an angle with cosine `cl` to the boost of the parent.
+    E - beta * p * cl is rearranged into positive terms, since it cancels
+    catastrophically at large boosts.
+    """
+    cdef double g = gamma(eng_parent, mass_parent)
+    cdef double b = beta(eng_parent, mass_parent)
+    cdef double p = sqrt(eng * eng - mass * mass)
+    return g * (mass * mass / (eng + p) + p * (1.0 - cl) + p * cl / (g * g * (1.0 + b)))
+
+
+@cython.cdivision(True)
+cdef inline list boost_break_points(double eng_gam, double eng, double mass, double eng_max_rf):
+    """
+    Returns the break points of integrals over the cosine of the angle
+    between a photon and the boost of a particle whose rest-frame spectrum
+    vanishes above `eng_max_rf`. Only photons at angles inside of the break
+    point contribute, which for large boosts is a narrow forward cone.
+    """
+    cdef double cl = (1.0 - eng_max_rf / (gamma(eng, mass) * eng_gam)) / beta(eng, mass)
+    if -1.0 < cl < 1.0:
+        return [-1.0, cl, 1.0]
+    return [-1.0, 1.0]
+
+# =========================================================
+# ---- Gauss-Kronrod quadrature ---------------------------
+# =========================================================
+
+# Integrand of the form f(x, args), where `args` points to the parameters of
+# the integrand.
+ctypedef double (*integrand_t)(double, void*) nogil
+
+# Maximum number of bisections of an interval
+DEF GK_MAX_DEPTH = 20
+
+# Nodes and weights of the 15-point Kronrod rule and of the embedded 7-point
+# Gauss rule, as in QUADPACK. The Gauss nodes are GK15_NODES[1::2].
+cdef double[8] GK15_NODES = [
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+]
+cdef double[8] GK15_WEIGHTS = [
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+]
+cdef double[4] G7_WEIGHTS = [
+    0.129484966168869693270611432679082,
+    0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975,
+    0.417959183673469387755102040816327,
+]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef inline double gauss_kronrod_15(integrand_t f, void* args, double a, double b, double* err) nogil:
+    """
+    Returns the 15-point Kronrod estimate of the integral of `f` from `a` to
+    `b` and stores its difference from the 7-point Gauss estimate in `err`.
+    """
+    cdef int j
+    cdef double center = 0.5 * (a + b)
+    cdef double half = 0.5 * (b - a)
+    cdef double fc = f(center, args)
+    cdef double fsum
+    cdef double res_k = fc * GK15_WEIGHTS[7]
+    cdef double res_g = fc * G7_WEIGHTS[3]
+
+    for j in range(7):
+        fsum = f(center - half * GK15_NODES[j], args) + f(center + half * GK15_NODES[j], args)
+        res_k += GK15_WEIGHTS[j] * fsum
+        if j % 2 == 1:
+            res_g += G7_WEIGHTS[j // 2] * fsum
+
+    err[0] = fabs((res_k - res_g) * half)
+    return res_k * half
+
+
+@cython.cdivision(True)
+cdef double gauss_kronrod_adaptive(integrand_t f, void* args, double a, double b, double estimate, double error, double tol, int depth) nogil:
+    """
+    Returns the integral of `f` from `a` to `b`, given its Kronrod estimate
+    and error, bisecting the interval until the error is below `tol`.
+    """
+    cdef double mid, left, right, err_left, err_right
+
+    if error <= tol or depth >= GK_MAX_DEPTH:
+        return estimate
+
+    mid = 0.5 * (a + b)
+    left = gauss_kronrod_15(f, args, a, mid, &err_left)
+    right = gauss_kronrod_15(f, args, mid, b, &err_right)
+    return (
+        gauss_kronrod_adaptive(f, args, a, mid, left, err_left, 0.5 * tol, depth + 1) +
+        gauss_kronrod_adaptive(f, args, mid, b, right, err_right, 0.5 * tol, depth + 1)
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double gauss_kronrod(integrand_t f, void* args, const double* points, int num_points, double epsabs, double epsrel) nogil:
+    """
+    Returns the integral of `f` over the intervals between the increasing
+    `points`, such as the break points where the integrand has kinks, by
+    adaptive Gauss-Kronrod quadrature. Like `scipy.integrate.quad`, the
+    absolute error is aimed to be below max(epsabs, epsrel * |integral|).
+    The intervals are bisected at most `GK_MAX_DEPTH` times. Returns NaN if
+    the buffers for the estimates cannot be allocated.
+    """
+    cdef int i
+    cdef double* estimates
+    cdef double* errors
+    cdef double total = 0.0
+    cdef double result = 0.0
+    cdef double tol
+
+    if num_points < 2:
+        return 0.0
+
+    estimates = <double*> malloc(2 * (num_points - 1) * sizeof(double))
+    if estimates == NULL:
+        return NAN
+    errors = estimates + num_points - 1
+
+    for i in range(num_points - 1):
+        estimates[i] = gauss_kronrod_15(f, args, points[i], points[i + 1], &errors[i])
+        total += estimates[i]
+
+    tol = max(epsabs, epsrel * fabs(total))
+    for i in range(num_points - 1):
+        result += gauss_kronrod_adaptive(
+            f, args, points[i], points[i + 1], estimates[i], errors[i],
+            tol * (points[i + 1] - points[i]) / (points[num_points - 1] - points[0]), 0
+        )
+
+    free(estimates)
+    return result
+
+
 # =========================================================
 # ---- Masses in MeV --------------------------------------
 # =========================================================
@@ -31,6 +31,8 @@ import cython
 import os
 import sys
 from .get_path import get_dir_path
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTables
+from hazma.decay_helper_functions.rest_frame_spectra cimport RestFrameSpectra
 include "common.pxd"
 
 
@@ -72,67 +74,80 @@ data_path_ppm = os.path.join(get_dir_path(),
                              "charged_kaon_interp_ppm.dat")
 
 __e_gams_total, __spec_total = np.loadtxt(data_path_total, delimiter=',').T
-__e_gams_0enu, __spec_0enu = np.loadtxt(data_path_0enu, delimiter=',').T
-__e_gams_0munu, __spec_0munu = np.loadtxt(data_path_0munu, delimiter=',').T
-__e_gams_00p, __spec_00p = np.loadtxt(data_path_00p, delimiter=',').T
-__e_gams_mmug, __spec_mmug = np.loadtxt(data_path_mmug, delimiter=',').T
-__e_gams_munu, __spec_munu = np.loadtxt(data_path_munu, delimiter=',').T
-__e_gams_p0, __spec_p0 = np.loadtxt(data_path_p0, delimiter=',').T
-__e_gams_p0g, __spec_p0g = np.loadtxt(data_path_p0g, delimiter=',').T
-__e_gams_ppm, __spec_ppm = np.loadtxt(data_path_ppm, delimiter=',').T
+
+# Rest-frame spectra of the modes, in the order of their bitflags
+cdef RestFrameSpectra __spectra = RestFrameSpectra(
+    __e_gams_total,
+    [np.loadtxt(path, delimiter=',')[:, 1] for path in [
+        data_path_0enu,
+        data_path_0munu,
+        data_path_00p,
+        data_path_mmug,
+        data_path_munu,
+        data_path_p0,
+        data_path_p0g,
+        data_path_ppm,
+    ]],
+)
+
+# Maximum energy of the photons in the kaon's rest frame: the spectra vanish
+# from the node following the last non-zero value.
+cdef double ENG_GAM_MAX_KRF = __e_gams_total[np.nonzero(__spec_total)[0][-1] + 1]
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double __interp_spec(double eng_gam, int bitflags):
-    cdef double ret = 0.0
-    if bitflags & 1:
-        ret += np.interp(eng_gam, __e_gams_0enu, __spec_0enu)
-    if bitflags & 2:
-        ret += np.interp(eng_gam, __e_gams_0munu, __spec_0munu)
-    if bitflags & 4:
-        ret += np.interp(eng_gam, __e_gams_00p, __spec_00p)
-    if bitflags & 8:
-        ret += np.interp(eng_gam, __e_gams_mmug, __spec_mmug)
-    if bitflags & 16:
-        ret += np.interp(eng_gam, __e_gams_munu, __spec_munu)
-    if bitflags & 32:
-        ret += np.interp(eng_gam, __e_gams_p0, __spec_p0)
-    if bitflags & 64:
-        ret += np.interp(eng_gam, __e_gams_p0g, __spec_p0g)
-    if bitflags & 128:
-        ret += np.interp(eng_gam, __e_gams_ppm, __spec_ppm)
-    return ret
+cdef double __boosted_spectrum_point(double eng_gam, double eng_k, int mode):
+    if eng_k < MASS_K:
+        return 0.0
+    return __spectra.c_boosted_point(eng_gam, eng_k, MASS_K, ENG_GAM_MAX_KRF, mode)
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef double __integrand(double cl, double eng_gam, double eng_k, int mode):
-    cdef double gamma_k = eng_k / MASS_K
-    cdef double beta_k = sqrt(1.0 - (MASS_K / eng_k)**2)
-    cdef double eng_gam_k_rf = eng_gam * gamma_k * (1.0 - beta_k * cl)
-    cdef double pre_factor = 1.0 / (2.0 * gamma_k * (1.0 - beta_k * cl))
-    return  __interp_spec(eng_gam_k_rf, mode)
+def _boosted_spectrum(np.ndarray[np.float64_t,ndim=1] egams, double eng_k, int mode):
+    """
+    Returns the spectrum boosted from the rest frame. Used to build the decay
+    tables.
+    """
+    return np.array([__boosted_spectrum_point(egam, eng_k, mode) for egam in egams])
+
+
+cdef DecaySpectrumTables __tables = DecaySpectrumTables(
+    "charged_kaon", MASS_K, ENG_GAM_MAX_KRF, _boosted_spectrum
+)
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
 cdef double c_charged_kaon_decay_spectrum_point(double eng_gam, double eng_k, int mode):
-    if eng_k < MASS_K:
-        return 0.0
-    return quad(__integrand, -1.0, 1.0, points=[-1.0, 1.0], args=(eng_gam, eng_k, mode), epsabs=1e-10, epsrel=1e-4)[0]
+    cdef double value
+    if __tables.c_lookup(eng_gam, eng_k, mode, &value):
+        return value
+    return __boosted_spectrum_point(eng_gam, eng_k, mode)
+
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
 cdef np.ndarray[np.float64_t,ndim=1] c_charged_kaon_decay_spectrum_array(np.ndarray[np.float64_t,ndim=1] eng_gams, double eng_k, int mode):
-    cdef int npts = eng_gams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(eng_gams)
-    for i in range(npts):
-        spec[i] = c_charged_kaon_decay_spectrum_point(eng_gams[i], eng_k, mode)
+    return __spectra.c_boosted_array(
+        eng_gams, eng_k, MASS_K, ENG_GAM_MAX_KRF, mode, __tables.c_table(mode)
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_charged_kaon_decay_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] egams, np.ndarray[np.float64_t,ndim=1] eparents, int mode):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(egams)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_gams = egams.shape[0]
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_gams), dtype=np.float64)
+
+    for i in range(num_parents):
+        for j in range(num_gams):
+            spec[i, j] = c_charged_kaon_decay_spectrum_point(egams[j], eparents[i], mode)
     return spec
 
 
@@ -151,8 +166,9 @@ def charged_kaon_decay_spectrum(egam, ek, modes=["0enu", "0munu", "00p","mmug","
     ----------
     egam: float or array-like
         Photon energy.
-    ek: float 
-        Energy of the kaon.
+    ek: float or array-like
+        Energy of the kaon. For an array of energies, the spectra are
+        returned as an array of shape (len(ek), len(egam)).
     modes: List[str]
         List of strings representing the modes to include. The availible modes are:
         "0enu", "0munu", "00p","mmug","munu","p0","p0g" and "ppm".
@@ -179,6 +195,15 @@ def charged_kaon_decay_spectrum(egam, ek, modes=["0enu", "0munu", "00p","mmug","
     if bitflags == 0:
         raise ValueError("Invalid modes specified.") 
 
+    if hasattr(ek, '__len__'):
+        parent_energies = np.array(ek, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(egam, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Photon energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_charged_kaon_decay_spectrum_matrix(energies, parent_energies, bitflags)
+        return c_charged_kaon_decay_spectrum_matrix(np.atleast_1d(energies), parent_energies, bitflags)[:, 0]
+
     if hasattr(egam, '__len__'):
         energies = np.array(egam)
         assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
@@ -4,6 +4,8 @@ cimport numpy as np
 from scipy.integrate import quad
 from libc.math cimport exp, log, M_PI, log10, sqrt, abs, pow
 import cython
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTables
+from hazma.decay_helper_functions.rest_frame_spectra cimport RestFrameSpectra, at_rest, boost_by_quad
 include "common.pxd"
 
 
@@ -115,12 +117,70 @@ cdef double integrand(double cl, double eng_gam, double eng_pi, int bitflag):
 
     return result
 
-cdef double c_charged_pion_decay_spectrum_point(double eng_gam, double eng_pi, int mode):
+cdef double __rest_frame_spectrum_point(double eng_gam, int mode):
+    """
+    Returns the spectrum of the enabled modes in the rest frame of the pion.
+    """
+    cdef double result = 0.0
+
+    if (mode & 1) and (0.0 < eng_gam and eng_gam < ENG_GAM_MAX_PIRG):
+        result += BR_PI_TO_MUNU * __dnde_muon_pirf(eng_gam)
+
+    if mode & 2:
+        result += BR_PI_TO_MUNU * dnde_pi_to_lnug(eng_gam, MMU)
+
+    if mode & 4:
+        result += BR_PI_TO_ENU * dnde_pi_to_lnug(eng_gam, ME)
+
+    return result
+
+
+def __rest_frame_grid():
+    """
+    Returns the photon energies at which the rest-frame spectra are
+    tabulated. The nodes are densest above 1e-4 * MPI / 2, where the spectra
+    are largest, and the grid extends down to photon energies far below the
+    ones reached in the boost of any pion. Nodes are added at the kinematic
+    edges of the modes and at the kink of the spectrum of the muon, and are
+    refined geometrically towards them since the spectra vary fastest there.
+    """
+    cdef double eng_max = MPI / 2.0
+    edges = np.array([
+        (MPI**2 - MMU**2) / (2.0 * MPI),
+        ENG_GAM_MAX_MURF * GAMMA_MU_PIRF * (1.0 - BETA_MU_PIRF),
+        ENG_GAM_MAX_PIRG,
+        (MPI**2 - ME**2) / (2.0 * MPI),
+    ])
+    offsets = np.geomspace(1e-7, 0.3, 1001)
+    engs = np.concatenate([
+        np.geomspace(1e-10 * eng_max, 1e-4 * eng_max, 1201),
+        np.geomspace(1e-4 * eng_max, eng_max, 2001),
+        edges,
+        np.outer(edges, 1.0 - offsets).flat,
+        np.outer(edges, 1.0 + offsets).flat,
+    ])
+    return np.unique(engs[engs <= eng_max])
+
+
+# Rest-frame spectra of the modes, in the order of their bitflags
+__e_gams_pirf = __rest_frame_grid()
+
+cdef RestFrameSpectra __spectra = RestFrameSpectra(
+    __e_gams_pirf,
+    [
+        [__rest_frame_spectrum_point(e, 1 << i) for e in __e_gams_pirf]
+        for i in range(3)
+    ],
+)
+
+
+cdef double __boosted_spectrum_point(double eng_gam, double eng_pi, int mode):
     """
     Returns the radiative spectrum value from charged pion given a gamma
-    ray energy eng_gam and charged pion energy eng_pi. When the
-    ChargedPion object is instatiated, an interplating function for the
-    mu spectrum is computed.
+    ray energy eng_gam and charged pion energy eng_pi. The rest-frame
+    spectrum is boosted with the integral of the tabulated spectrum, or by
+    quadrature of the exact spectrum if the boost method is "quad". The
+    exact spectrum is returned for a pion at rest.
 
     Keyword arguments::
         eng_gam: Energy of photon is laboratory frame.
@@ -128,20 +188,67 @@ cdef double c_charged_pion_decay_spectrum_point(double eng_gam, double eng_pi, i
     """
     if eng_pi < MASS_PI:
         return 0.0
+    if at_rest(beta(eng_pi, MASS_PI)):
+        return __rest_frame_spectrum_point(eng_gam, mode)
 
-    return quad(integrand, -1.0, 1.0, points=[-1.0, 1.0], \
-                   args=(eng_gam, eng_pi, mode), epsabs=1e-10, \
-                   epsrel=1e-5)[0]
+    if boost_by_quad():
+        return quad(integrand, -1.0, 1.0, points=boost_break_points(eng_gam, eng_pi, MASS_PI, ENG_GAM_MAX_PIRG), \
+                       args=(eng_gam, eng_pi, mode), epsabs=1e-10, \
+                       epsrel=1e-5)[0]
+    return __spectra.c_boosted_point(eng_gam, eng_pi, MASS_PI, ENG_GAM_MAX_PIRG, mode)
+
+
+def _boosted_spectrum(np.ndarray[np.float64_t,ndim=1] egams, double eng_pi, int mode):
+    """
+    Returns the spectrum boosted from the rest frame. Used to build the decay
+    tables.
+    """
+    return np.array([__boosted_spectrum_point(egam, eng_pi, mode) for egam in egams])
+
+
+cdef DecaySpectrumTables __tables = DecaySpectrumTables(
+    "charged_pion", MASS_PI, ENG_GAM_MAX_PIRG, _boosted_spectrum
+)
+
+
+cdef double c_charged_pion_decay_spectrum_point(double eng_gam, double eng_pi, int mode):
+    cdef double value
+    if __tables.c_lookup(eng_gam, eng_pi, mode, &value):
+        return value
+    return __boosted_spectrum_point(eng_gam, eng_pi, mode)
 
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
 cdef np.ndarray[np.float64_t,ndim=1] c_charged_pion_decay_spectrum_array(np.ndarray[np.float64_t,ndim=1] egams, double epi, int mode):
     cdef int npts = egams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(egams)
+    cdef np.ndarray[np.float64_t,ndim=1] spec
 
-    for i in range(npts):
-        spec[i] = c_charged_pion_decay_spectrum_point(egams[i], epi, mode)
+    if boost_by_quad() or at_rest(beta(epi, MASS_PI)):
+        spec = np.zeros_like(egams)
+        for i in range(npts):
+            spec[i] = c_charged_pion_decay_spectrum_point(egams[i], epi, mode)
+        return spec
+    return __spectra.c_boosted_array(
+        egams, epi, MASS_PI, ENG_GAM_MAX_PIRG, mode, __tables.c_table(mode)
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_charged_pion_decay_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] egams, np.ndarray[np.float64_t,ndim=1] eparents, int mode):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(egams)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_gams = egams.shape[0]
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_gams), dtype=np.float64)
+
+    for i in range(num_parents):
+        for j in range(num_gams):
+            spec[i, j] = c_charged_pion_decay_spectrum_point(egams[j], eparents[i], mode)
     return spec
 
 
@@ -155,8 +262,9 @@ def charged_pion_decay_spectrum(egams, epi, modes=["munu", "munug", "enug"]):
     ----------
     egam: float or array-like
         Photon energy.
-    epi: float 
-        Energy of the pion.
+    epi: float or array-like
+        Energy of the pion. For an array of energies, the spectra are
+        returned as an array of shape (len(epi), len(egams)).
     mode: optional, List 
         List of modes to compute spectrum for. Entries can be:
         "munu", "munug" and "enug". Default is all of these.
@@ -173,6 +281,15 @@ def charged_pion_decay_spectrum(egams, epi, modes=["munu", "munug", "enug"]):
     if bitflag == 0:
         raise ValueError("Invalid modes specified.") 
     
+    if hasattr(epi, '__len__'):
+        parent_energies = np.array(epi, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(egams, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Photon energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_charged_pion_decay_spectrum_matrix(energies, parent_energies, bitflag)
+        return c_charged_pion_decay_spectrum_matrix(np.atleast_1d(energies), parent_energies, bitflag)[:, 0]
+
     if hasattr(egams, '__len__'):
         energies = np.array(egams)
         assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
@@ -3,3 +3,4 @@ cimport numpy as np
 
 cdef double c_long_kaon_decay_spectrum_point(double, double, int)
 cdef np.ndarray[np.float64_t,ndim=1] c_long_kaon_decay_spectrum_array(np.ndarray[np.float64_t, ndim=1], double, int)
+cdef np.ndarray[np.float64_t,ndim=2] c_long_kaon_decay_spectrum_matrix(np.ndarray[np.float64_t,ndim=1], np.ndarray[np.float64_t,ndim=1], int)
@@ -11,7 +11,9 @@ from scipy.integrate import quad
 from libc.math cimport exp, log, M_PI, log10, sqrt
 from scipy.special.cython_special cimport spence
 import cython
+from cython.parallel cimport prange
 from functools import partial
+from hazma.parallel import num_threads
 include "common.pxd"
 
 
@@ -26,7 +28,7 @@ include "common.pxd"
 @cython.cdivision(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double c_muon_decay_spectrum_point(double egam, double emu):
+cdef double c_muon_decay_spectrum_point(double egam, double emu) nogil:
     cdef double gamma
     cdef double beta
     cdef double y
@@ -87,15 +89,36 @@ cdef double c_muon_decay_spectrum_point(double egam, double emu):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef np.ndarray[np.float64_t,ndim=1] c_muon_decay_spectrum_array(np.ndarray[np.float64_t,ndim=1] energies, double muon_eng):
+    cdef int i
     cdef int npts = energies.shape[0]
+    cdef int nthreads = num_threads()
     cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(energies)
 
-    for i in range(npts):
+    for i in prange(npts, nogil=True, num_threads=nthreads):
         spec[i] = c_muon_decay_spectrum_point(energies[i], muon_eng)
 
     return spec
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_muon_decay_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] egams, np.ndarray[np.float64_t,ndim=1] eparents):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(egams)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_gams = egams.shape[0]
+    cdef int nthreads = num_threads()
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_gams), dtype=np.float64)
+
+    for i in prange(num_parents, nogil=True, num_threads=nthreads):
+        for j in range(num_gams):
+            spec[i, j] = c_muon_decay_spectrum_point(egams[j], eparents[i])
+    return spec
+
+
 # ===================================================================
 # ---- Python API ---------------------------------------------------
 # ===================================================================
@@ -109,9 +132,19 @@ def muon_decay_spectrum(egam, emu):
     ----------
     egam: float or array-like
         Photon energy.
-    emu: float 
-        Energy of the muon.
+    emu: float or array-like
+        Energy of the muon. For an array of energies, the spectra are
+        returned as an array of shape (len(emu), len(egam)).
     """
+    if hasattr(emu, '__len__'):
+        parent_energies = np.array(emu, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(egam, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Photon energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_muon_decay_spectrum_matrix(energies, parent_energies)
+        return c_muon_decay_spectrum_matrix(np.atleast_1d(energies), parent_energies)[:, 0]
+
     if hasattr(egam, '__len__'):
         energies = np.array(egam)
         assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
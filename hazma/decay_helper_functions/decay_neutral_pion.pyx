@@ -1,7 +1,9 @@
-from libc.math cimport sqrt
+from libc.math cimport log, sqrt
 import numpy as np
 cimport numpy as np
 import cython
+from cython.parallel cimport prange
+from hazma.parallel import num_threads
 include "common.pxd"
 
 
@@ -10,7 +12,7 @@ Module for computing the decay spectrum from neutral pion.
 """
 
 @cython.cdivision(True)
-cdef double c_neutral_pion_decay_spectrum_point(double eng_gam, double eng_pi):
+cdef double c_neutral_pion_decay_spectrum_point(double eng_gam, double eng_pi) nogil:
     """
     Returns decay spectrum for pi0 -> g g.
     """
@@ -25,18 +27,66 @@ cdef double c_neutral_pion_decay_spectrum_point(double eng_gam, double eng_pi):
 
     return ret_val
 
+
 @cython.cdivision(True)
+cdef double c_neutral_pion_boosted_decay_spectrum_point(double eng_gam, double eng_pi, double gamma, double beta) nogil:
+    """
+    Returns decay spectrum for pi0 -> g g, with the pion energy `eng_pi` given
+    in the rest frame of a particle with boost `gamma` and velocity `beta`.
+    The spectrum of the pion is flat, so the integral over the angle of the
+    photon is computed in closed form.
+    """
+    cdef double beta_pi, eng_min, eng_max
+
+    if eng_pi < MASS_PI0:
+        return 0.0
+    if beta < 1e-7:
+        return c_neutral_pion_decay_spectrum_point(eng_gam, eng_pi)
+
+    beta_pi = sqrt(1.0 - (MASS_PI0 / eng_pi)**2)
+    eng_min = max(eng_pi * (1 - beta_pi) / 2.0, eng_gam / (gamma * (1.0 + beta)))
+    eng_max = min(eng_pi * (1 + beta_pi) / 2.0, eng_gam * gamma * (1.0 + beta))
+    if eng_max <= eng_min:
+        return 0.0
+
+    return BR_PI0_TO_GG * 2.0 / (eng_pi * beta_pi) * log(eng_max / eng_min) / (2.0 * gamma * beta)
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
 cdef np.ndarray[np.float64_t,ndim=1] c_neutral_pion_decay_spectrum_array(np.ndarray[np.float64_t,ndim=1] egams, double epi):
     """
     Returns decay spectrum for pi0 -> g g.
     """
+    cdef int i
     cdef int npts = egams.shape[0]
+    cdef int nthreads = num_threads()
     cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(egams)
-    for i in range(npts):
+    for i in prange(npts, nogil=True, num_threads=nthreads):
         spec[i] = c_neutral_pion_decay_spectrum_point(egams[i], epi)
     return spec
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_neutral_pion_decay_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] egams, np.ndarray[np.float64_t,ndim=1] eparents):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(egams)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_gams = egams.shape[0]
+    cdef int nthreads = num_threads()
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_gams), dtype=np.float64)
+
+    for i in prange(num_parents, nogil=True, num_threads=nthreads):
+        for j in range(num_gams):
+            spec[i, j] = c_neutral_pion_decay_spectrum_point(egams[j], eparents[i])
+    return spec
+
+
 @cython.cdivision(True)
 @cython.boundscheck(True)
 @cython.wraparound(False)
@@ -48,9 +98,19 @@ def neutral_pion_decay_spectrum(egams, epi):
     ----------
     egam: float or array-like
         Photon energy.
-    epi: float 
-        Energy of the pion.
+    epi: float or array-like
+        Energy of the pion. For an array of energies, the spectra are
+        returned as an array of shape (len(epi), len(egams)).
     """
+    if hasattr(epi, '__len__'):
+        parent_energies = np.array(epi, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(egams, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Photon energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_neutral_pion_decay_spectrum_matrix(energies, parent_energies)
+        return c_neutral_pion_decay_spectrum_matrix(np.atleast_1d(energies), parent_energies)[:, 0]
+
     if hasattr(egams, '__len__'):
         energies = np.array(egams)
         assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
@@ -21,6 +21,8 @@ import cython
 import os
 import sys
 from .get_path import get_dir_path
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTables
+from hazma.decay_helper_functions.rest_frame_spectra cimport RestFrameSpectra
 include "common.pxd"
 
 
@@ -43,53 +45,75 @@ data_path_pmg = os.path.join(get_dir_path(),
                              "short_kaon_interp_pmg.dat")
 
 __e_gams_total, __spec_total = np.loadtxt(data_path_total, delimiter=',').T
-__e_gams_00, __spec_00 = np.loadtxt(data_path_00, delimiter=',').T
-__e_gams_pm, __spec_pm = np.loadtxt(data_path_pm, delimiter=',').T
-__e_gams_pmg, __spec_pmg = np.loadtxt(data_path_pmg, delimiter=',').T
 
+# Rest-frame spectra of the modes, in the order of their bitflags
+cdef RestFrameSpectra __spectra = RestFrameSpectra(
+    __e_gams_total,
+    [np.loadtxt(path, delimiter=',')[:, 1] for path in [
+        data_path_00,
+        data_path_pm,
+        data_path_pmg,
+    ]],
+)
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef double __interp_spec(double eng_gam, int bitflags):
-    cdef double ret = 0.0
-    if bitflags & 1:
-        ret += np.interp(eng_gam, __e_gams_00, __spec_00)
-    if bitflags & 2:
-        ret += np.interp(eng_gam, __e_gams_pm, __spec_pm)
-    if bitflags & 4:
-        ret += np.interp(eng_gam, __e_gams_pmg, __spec_pmg)
-    return ret
+# Maximum energy of the photons in the kaon's rest frame: the spectra vanish
+# from the node following the last non-zero value.
+cdef double ENG_GAM_MAX_KRF = __e_gams_total[np.nonzero(__spec_total)[0][-1] + 1]
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double __integrand(double cl, double eng_gam, double eng_k, str mode):
-    cdef double gamma_k = eng_k / MASS_K
-    cdef double beta_k = sqrt(1.0 - (MASS_K / eng_k)**2)
-    cdef double eng_gam_k_rf = eng_gam * gamma_k * (1.0 - beta_k * cl)
-    cdef double pre_factor = 1.0 / (2.0 * gamma_k * (1.0 - beta_k * cl))
-    return pre_factor * __interp_spec(eng_gam_k_rf, mode)
+cdef double __boosted_spectrum_point(double eng_gam, double eng_k, int mode):
+    if eng_k < MASS_K0:
+        return 0.0
+    return __spectra.c_boosted_point(eng_gam, eng_k, MASS_K0, ENG_GAM_MAX_KRF, mode)
+
+
+def _boosted_spectrum(np.ndarray[np.float64_t,ndim=1] egams, double eng_k, int mode):
+    """
+    Returns the spectrum boosted from the rest frame. Used to build the decay
+    tables.
+    """
+    return np.array([__boosted_spectrum_point(egam, eng_k, mode) for egam in egams])
+
+
+cdef DecaySpectrumTables __tables = DecaySpectrumTables(
+    "short_kaon", MASS_K0, ENG_GAM_MAX_KRF, _boosted_spectrum
+)
 
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
 cdef double c_short_kaon_decay_spectrum_point(double eng_gam, double eng_k, int mode):
-    if eng_k < MASS_K0:
-        return 0.0
-    return quad(__integrand, -1.0, 1.0, points=[-1.0, 1.0], args=(eng_gam, eng_k, mode), epsabs=1e-10, epsrel=1e-4)[0]
+    cdef double value
+    if __tables.c_lookup(eng_gam, eng_k, mode, &value):
+        return value
+    return __boosted_spectrum_point(eng_gam, eng_k, mode)
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
 cdef np.ndarray[np.float64_t,ndim=1] c_short_kaon_decay_spectrum_array(np.ndarray[np.float64_t,ndim=1] eng_gams, double eng_k, int mode):
-    cdef int npts = eng_gams.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(eng_gams)
-    for i in range(npts):
-        spec[i] = c_short_kaon_decay_spectrum_point(eng_gams[i], eng_k, mode)
+    return __spectra.c_boosted_array(
+        eng_gams, eng_k, MASS_K0, ENG_GAM_MAX_KRF, mode, __tables.c_table(mode)
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_short_kaon_decay_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] egams, np.ndarray[np.float64_t,ndim=1] eparents, int mode):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(egams)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_gams = egams.shape[0]
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_gams), dtype=np.float64)
+
+    for i in range(num_parents):
+        for j in range(num_gams):
+            spec[i, j] = c_short_kaon_decay_spectrum_point(egams[j], eparents[i], mode)
     return spec
 
 
@@ -108,8 +132,9 @@ def short_kaon_decay_spectrum(egam, ek, modes=["00","pm","pmg"]):
     ----------
     egam: float or array-like
         Photon energy.
-    ek: float 
-        Energy of the kaon.
+    ek: float or array-like
+        Energy of the kaon. For an array of energies, the spectra are
+        returned as an array of shape (len(ek), len(egam)).
     modes: List[str]
         List of strings representing the modes to include. The availible modes are:
         "00","pm", and "pmg".
@@ -126,6 +151,15 @@ def short_kaon_decay_spectrum(egam, ek, modes=["00","pm","pmg"]):
     if bitflags == 0:
         raise ValueError("Invalid modes specified.") 
 
+    if hasattr(ek, '__len__'):
+        parent_energies = np.array(ek, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(egam, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Photon energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_short_kaon_decay_spectrum_matrix(energies, parent_energies, bitflags)
+        return c_short_kaon_decay_spectrum_matrix(np.atleast_1d(energies), parent_energies, bitflags)[:, 0]
+
     if hasattr(egam, '__len__'):
         energies = np.array(egam)
         assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
@@ -0,0 +1,22 @@
+cdef class DecaySpectrumTable:
+    cdef readonly double mass
+    cdef readonly double eng_max_rf
+    cdef readonly double rtol
+    cdef double[:, ::1] values
+    cdef double[:, ::1] errors
+    cdef double deta
+    cdef double log_x_min
+    cdef double dlog_x
+
+    cdef bint c_interp(self, double eng_gam, double eng_parent, double* value) nogil
+
+
+cdef class DecaySpectrumTables:
+    cdef readonly str name
+    cdef readonly double mass
+    cdef readonly double eng_max_rf
+    cdef object exact
+    cdef dict tables
+
+    cdef DecaySpectrumTable c_table(self, int bitflags)
+    cdef bint c_lookup(self, double eng_gam, double eng_parent, int bitflags, double* value)
@@ -0,0 +1,87 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+TABLES_VERSION: int
+SHIPPED_TABLES_DIR: str
+
+
+def enable_tables(cache_dir: Optional[str] = None, rtol: float = 1e-2) -> None:
+    ...
+
+
+def disable_tables() -> None:
+    ...
+
+
+def tables_enabled() -> bool:
+    ...
+
+
+def get_tables(name: str) -> "DecaySpectrumTables":
+    ...
+
+
+def build_grid() -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    ...
+
+
+class DecaySpectrumTable:
+    mass: float
+    eng_max_rf: float
+    rtol: float
+
+    def __init__(
+        self,
+        mass: float,
+        eng_max_rf: float,
+        values: npt.ArrayLike,
+        errors: npt.ArrayLike,
+        rtol: float,
+    ) -> None:
+        ...
+
+    @property
+    def table(self) -> npt.NDArray[np.float64]:
+        ...
+
+    @property
+    def cell_errors(self) -> npt.NDArray[np.float64]:
+        ...
+
+    @property
+    def coverage(self) -> float:
+        ...
+
+    def __call__(self, eng_gam: float, eng_parent: float) -> float:
+        ...
+
+
+class DecaySpectrumTables:
+    name: str
+    mass: float
+    eng_max_rf: float
+
+    def __init__(
+        self,
+        name: str,
+        mass: float,
+        eng_max_rf: float,
+        exact: Callable[[npt.NDArray[np.float64], float, int], npt.NDArray[np.float64]],
+    ) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def filename(self, bitflags: int) -> str:
+        ...
+
+    def build(
+        self, bitflags: int
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        ...
+
+    def table(self, bitflags: int) -> DecaySpectrumTable:
+        ...
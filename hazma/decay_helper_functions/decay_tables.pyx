@@ -0,0 +1,350 @@
+"""
+Tables of the boosted decay spectra of the charged pion and kaons, and of
+the positron spectra of the muon and charged pion.
+
+The lab-frame spectra of the charged pion and kaons are computed by
+boosting their rest-frame spectra, see ``rest_frame_spectra``. The positron
+spectra are boosted in ``hazma.positron_helper_functions``.
+When tables are enabled (see ``enable_tables``), the spectra are instead
+interpolated from a grid in the rapidity of the parent,
+eta = arccosh(E_parent / m), and the logarithm of
+x = E_gamma / (exp(eta) * E_max), where E_max is the maximum energy of the
+photons in the rest frame of the parent. The lab-frame spectrum vanishes
+above x = 1 for all boosts.
+A table is built for each combination of decay modes on first use and
+checked against the boosted spectrum at the center of each of its cells.
+Cells whose error exceeds the tolerance, e.g. around the sharp edges of the
+spectra of slow kaons, and points outside of the grid are boosted from the
+rest frame. Tables can be saved as ``.npy`` files in a cache directory.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import os
+import tempfile
+
+import numpy as np
+cimport numpy as np
+import cython
+from libc.math cimport acosh, cosh, log
+
+# Version of the tables. Bump it when the grid or the spectra change, so
+# that stale files are not reused.
+TABLES_VERSION = 2
+
+# Grid of the tables: the rapidity of the parent is in [0, ETA_MAX] and
+# x = E_gamma / (exp(eta) * E_max) is in [X_MIN, 1].
+cdef double ETA_MAX = acosh(1e3)
+cdef int NUM_ETA = 121
+cdef double X_MIN = 1e-5
+cdef int NUM_X = 161
+
+cdef bint _enabled = False
+cdef double _rtol = 1e-2
+_cache_dir = None
+
+# Maps the names of the particles to their tables.
+_REGISTRY = {}
+
+
+def enable_tables(cache_dir=None, rtol=1e-2):
+    """
+    Compute the boosted decay spectra of the charged pion and kaons and the
+    positron spectra of the muon and charged pion by interpolating tables.
+
+    Parameters
+    ----------
+    cache_dir : str {None]
+        Directory in which the tables built on first use are saved as
+        ``.npy`` files and from which they are loaded. If None, the tables
+        are only kept in memory.
+    rtol : float {1e-2]
+        Tolerance of the tables. When a table is built, it is compared to
+        the boosted spectrum at the center of each of its cells. The
+        spectrum is only interpolated in the cells where the error on
+        E_gamma * dN/dE_gamma is smaller than `rtol` times the maximum of
+        E_gamma * dN/dE_gamma at the same parent energy.
+    """
+    global _enabled, _rtol, _cache_dir
+    _enabled = True
+    _rtol = rtol
+    _cache_dir = None if cache_dir is None else os.path.expanduser(cache_dir)
+    for tables in _REGISTRY.values():
+        tables.clear()
+
+
+def disable_tables():
+    """
+    Compute the boosted decay spectra of the charged pion and kaons and the
+    positron spectra of the muon and charged pion from their rest-frame
+    spectra. This is the default.
+    """
+    global _enabled
+    _enabled = False
+
+
+def tables_enabled():
+    """Returns True if the decay spectra are interpolated from tables."""
+    return _enabled
+
+
+def get_tables(name):
+    """
+    Returns the tables of a particle: "charged_pion", "charged_kaon",
+    "short_kaon" or "long_kaon", or of the positron spectra:
+    "muon_positron" or "charged_pion_positron".
+    """
+    return _REGISTRY[name]
+
+
+def build_grid():
+    """
+    Returns the nodes of the tables.
+
+    Returns
+    -------
+    etas : numpy.ndarray
+        Rapidities of the parent particle.
+    log_xs : numpy.ndarray
+        Logarithms of the ratios of the photon energies and their maximum
+        values.
+    """
+    return (
+        np.linspace(0.0, ETA_MAX, NUM_ETA),
+        np.linspace(log(X_MIN), 0.0, NUM_X),
+    )
+
+
+cdef class DecaySpectrumTable:
+    """
+    Table of E_gamma * dN/dE_gamma of a particle's boosted decay spectrum
+    on the grid returned by ``build_grid``.
+
+    Parameters
+    ----------
+    mass : float
+        Mass of the particle.
+    eng_max_rf : float
+        Maximum energy of the photons in the rest frame of the particle.
+    values : numpy.ndarray
+        Values of E_gamma * dN/dE_gamma at the nodes, with shape
+        (NUM_ETA, NUM_X).
+    errors : numpy.ndarray
+        Relative errors at the centers of the cells, with shape
+        (NUM_ETA - 1, NUM_X - 1).
+    rtol : float
+        Tolerance of the table. Cells with larger errors are not used.
+    """
+
+    def __init__(self, double mass, double eng_max_rf, values, errors, double rtol):
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        errors = np.ascontiguousarray(errors, dtype=np.float64)
+        if values.shape != (NUM_ETA, NUM_X) or errors.shape != (NUM_ETA - 1, NUM_X - 1):
+            raise ValueError(
+                "Tables must have shape {}.".format((NUM_ETA, NUM_X))
+            )
+        self.mass = mass
+        self.eng_max_rf = eng_max_rf
+        self.values = values
+        self.errors = errors
+        self.rtol = rtol
+        self.deta = ETA_MAX / (NUM_ETA - 1)
+        self.log_x_min = log(X_MIN)
+        self.dlog_x = -self.log_x_min / (NUM_X - 1)
+
+    @property
+    def table(self):
+        """Values of E_gamma * dN/dE_gamma at the nodes."""
+        return np.asarray(self.values)
+
+    @property
+    def cell_errors(self):
+        """Relative errors at the centers of the cells."""
+        return np.asarray(self.errors)
+
+    @property
+    def coverage(self):
+        """Fraction of the cells which are used."""
+        return np.mean(self.cell_errors <= self.rtol)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef bint c_interp(self, double eng_gam, double eng_parent, double* value) nogil:
+        cdef double eta, log_x, s, t
+        cdef int i, j
+
+        if eng_gam <= 0.0 or eng_parent < self.mass:
+            return False
+        eta = acosh(eng_parent / self.mass)
+        log_x = log(eng_gam / self.eng_max_rf) - eta
+        if log_x > 0.0:
+            value[0] = 0.0
+            return True
+        if eta > ETA_MAX or log_x < self.log_x_min:
+            return False
+
+        s = eta / self.deta
+        i = <int>s
+        if i > NUM_ETA - 2:
+            i = NUM_ETA - 2
+        s -= i
+        t = (log_x - self.log_x_min) / self.dlog_x
+        j = <int>t
+        if j > NUM_X - 2:
+            j = NUM_X - 2
+        t -= j
+
+        if not self.errors[i, j] <= self.rtol:
+            return False
+
+        value[0] = (
+            (1.0 - s) * ((1.0 - t) * self.values[i, j] + t * self.values[i, j + 1])
+            + s * ((1.0 - t) * self.values[i + 1, j] + t * self.values[i + 1, j + 1])
+        ) / eng_gam
+        return True
+
+    def __call__(self, eng_gam, eng_parent):
+        """
+        Returns the interpolated spectrum, or nan if it must be computed from
+        the rest-frame spectrum.
+        """
+        cdef double value
+        if self.c_interp(eng_gam, eng_parent, &value):
+            return value
+        return np.nan
+
+
+cdef class DecaySpectrumTables:
+    """
+    Tables of the boosted decay spectrum of a particle, one for each
+    combination of decay modes.
+
+    Parameters
+    ----------
+    name : str
+        Name of the particle, used to name the files of the tables.
+    mass : float
+        Mass of the particle.
+    eng_max_rf : float
+        Maximum energy of the photons in the rest frame of the particle.
+    exact : callable
+        Function ``exact(eng_gams, eng_parent, bitflags)`` computing the
+        boosted spectrum at an array of photon energies.
+    """
+
+    def __init__(self, str name, double mass, double eng_max_rf, exact):
+        self.name = name
+        self.mass = mass
+        self.eng_max_rf = eng_max_rf
+        self.exact = exact
+        self.tables = {}
+        _REGISTRY[name] = self
+
+    def clear(self):
+        """Forget the tables loaded or built so far."""
+        self.tables.clear()
+
+    def filename(self, int bitflags):
+        """Name of the file of the table of a combination of modes."""
+        return "{}-{}-v{}.npy".format(self.name, bitflags, TABLES_VERSION)
+
+    def _spectra(self, etas, xs, int bitflags):
+        """E_gamma * dN/dE_gamma boosted from the rest frame on a grid."""
+        values = np.zeros((len(etas), len(xs)), dtype=np.float64)
+        for i, eta in enumerate(etas):
+            eng_gams = xs * np.exp(eta) * self.eng_max_rf
+            values[i] = eng_gams * self.exact(eng_gams, self.mass * cosh(eta), bitflags)
+        return values
+
+    def build(self, int bitflags):
+        """
+        Build the table of a combination of modes and check it against the
+        quadrature at the centers of its cells.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Values of E_gamma * dN/dE_gamma at the nodes.
+        errors : numpy.ndarray
+            Relative errors at the centers of the cells.
+        """
+        etas, log_xs = build_grid()
+        values = self._spectra(etas, np.exp(log_xs), bitflags)
+
+        mid_etas = 0.5 * (etas[1:] + etas[:-1])
+        exact = self._spectra(mid_etas, np.exp(0.5 * (log_xs[1:] + log_xs[:-1])), bitflags)
+        # Bilinear interpolation at the centers of the cells
+        approx = 0.25 * (values[1:, 1:] + values[1:, :-1] + values[:-1, 1:] + values[:-1, :-1])
+        scale = np.max(np.abs(exact), axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            errors = np.where(approx == exact, 0.0, np.abs(approx - exact) / scale)
+        return values, errors
+
+    def _load(self, int bitflags):
+        if _cache_dir is None:
+            return None
+        path = os.path.join(_cache_dir, self.filename(bitflags))
+        if not os.path.exists(path):
+            return None
+        data = np.load(path)
+        return data[0], data[1, :-1, :-1]
+
+    def _save(self, int bitflags, values, errors):
+        # The values and errors are stored in a single array, with the
+        # errors padded to the shape of the values.
+        data = np.full((2, NUM_ETA, NUM_X), np.inf)
+        data[0] = values
+        data[1, :-1, :-1] = errors
+
+        os.makedirs(_cache_dir, exist_ok=True)
+        # Write to a temporary file first, so that concurrent sessions never
+        # see a partially written file.
+        fd, tmp = tempfile.mkstemp(suffix=".npy", dir=_cache_dir)
+        os.close(fd)
+        try:
+            np.save(tmp, data)
+            os.replace(tmp, os.path.join(_cache_dir, self.filename(bitflags)))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def table(self, int bitflags):
+        """
+        Returns the table of a combination of modes, loading or building it
+        if needed.
+        """
+        if bitflags in self.tables:
+            return self.tables[bitflags]
+
+        data = self._load(bitflags)
+        if data is None:
+            data = self.build(bitflags)
+            if _cache_dir is not None:
+                self._save(bitflags, *data)
+        table = DecaySpectrumTable(self.mass, self.eng_max_rf, *data, rtol=_rtol)
+        self.tables[bitflags] = table
+        return table
+
+    cdef DecaySpectrumTable c_table(self, int bitflags):
+        """
+        Returns the table of a combination of modes, or None if tables are
+        disabled.
+        """
+        cdef object table
+        if not _enabled:
+            return None
+        table = self.tables.get(bitflags)
+        if table is None:
+            table = self.table(bitflags)
+        return <DecaySpectrumTable>table
+
+    cdef bint c_lookup(self, double eng_gam, double eng_parent, int bitflags, double* value):
+        """
+        Interpolate the spectrum if tables are enabled. Returns False if the
+        spectrum must be computed by boosting the rest-frame spectrum.
+        """
+        cdef DecaySpectrumTable table = self.c_table(bitflags)
+        if table is None:
+            return False
+        return table.c_interp(eng_gam, eng_parent, value)
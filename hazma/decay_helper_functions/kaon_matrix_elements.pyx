@@ -0,0 +1,192 @@
+"""
+Native squared matrix elements for the three-body decays of kaons, used with
+RAMBO to build the kaon decay spectra (see
+``interpolation_data/gen_ckaon_interp.py``). They are registered in
+``hazma.phase_space_helper_functions.native``.
+
+The weak hadronic amplitudes K -> 3 pi are expanded to second order in the
+Dalitz variables x = (s2 - s1) / mpi^2 and y = (s3 - s0) / mpi^2, where
+s_i = (k - p_i)^2.
+"""
+import cython
+from libc.math cimport sqrt
+from libcpp.vector cimport vector
+
+from hazma.phase_space_helper_functions.native cimport register_matrix_element
+from hazma.parameters import charged_pion_mass as _mpi
+from hazma.parameters import neutral_pion_mass as _mpi0
+from hazma.parameters import charged_kaon_mass as _mk
+from hazma.parameters import neutral_kaon_mass as _mk0
+
+cdef double mpi = _mpi
+cdef double mpi0 = _mpi0
+cdef double mk = _mk
+cdef double mk0 = _mk0
+
+# Constants for weak hadronic matrix elements
+cdef double alpha1 = 93.16e-8
+cdef double alpha3 = -6.72e-8
+cdef double beta1 = -27.06e-8
+cdef double beta3 = -2.22e-8
+cdef double gamma3 = 2.95e-8
+cdef double zeta1 = -0.40e-8
+cdef double zeta3 = -0.09e-8
+cdef double xi1 = -1.83e-8
+cdef double xi3 = -0.17e-8
+cdef double xi3p = -0.56e-8
+cdef double lamp = 0.034
+cdef double lam0 = 0.025
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double ldot(vector[double] &fv1, vector[double] &fv2) nogil:
+    return fv1[0] * fv2[0] - fv1[1] * fv2[1] - fv1[2] * fv2[2] - fv1[3] * fv2[3]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void dalitz_xy(vector[vector[double]] &moms, double s0, double *x,
+                    double *y) nogil:
+    """
+    Compute the Dalitz variables x and y of a three pion final state.
+    """
+    cdef int i, j
+    cdef double s[3]
+    cdef vector[double] q = vector[double](4)
+
+    for i in range(3):
+        # k - p_i is the sum of the other two momenta.
+        for j in range(4):
+            q[j] = moms[(i + 1) % 3][j] + moms[(i + 2) % 3][j]
+        s[i] = ldot(q, q)
+
+    x[0] = (s[1] - s[0]) / mpi ** 2
+    y[0] = (s[2] - s0) / mpi ** 2
+
+
+@cython.cdivision(True)
+cdef double msqrd_L000(vector[vector[double]] &moms,
+                       vector[double] &params) nogil:
+    """k_L -> pi0 + pi0 + pi0"""
+    cdef double x, y
+    dalitz_xy(moms, (mk0 ** 2 + 3 * mpi0 ** 2) / 3.0, &x, &y)
+    return (
+        3.0 * (alpha1 + alpha3)
+        - 3.0 * (zeta1 - 2.0 * zeta3) * (y ** 2 + x ** 2 / 3.0)
+    ) ** 2
+
+
+@cython.cdivision(True)
+cdef double msqrd_Lpm0(vector[vector[double]] &moms,
+                       vector[double] &params) nogil:
+    """k_L -> pi+ + pi- + pi0"""
+    cdef double x, y
+    dalitz_xy(moms, (mk0 ** 2 + 2 * mpi ** 2 + mpi0 ** 2) / 3.0, &x, &y)
+    return (
+        (alpha1 + alpha3)
+        - (beta1 + beta3) * y
+        + (zeta1 - 2.0 * zeta3) * (y ** 2 + x ** 2 / 3.0)
+        + (xi1 - 2.0 * xi3) * (y ** 2 - x ** 2 / 3.0)
+    ) ** 2
+
+
+@cython.cdivision(True)
+cdef double msqrd_Spm0(vector[vector[double]] &moms,
+                       vector[double] &params) nogil:
+    """k_S -> pi+ + pi- + pi0"""
+    cdef double x, y
+    dalitz_xy(moms, (mk0 ** 2 + 2 * mpi ** 2 + mpi0 ** 2) / 3.0, &x, &y)
+    return (
+        (2.0 / 3.0) * sqrt(3.0) * gamma3 * x - (4.0 / 3.0) * xi3p * x * y
+    ) ** 2
+
+
+@cython.cdivision(True)
+cdef double msqrd_00p(vector[vector[double]] &moms,
+                      vector[double] &params) nogil:
+    """k+ -> pi0 + pi0 + pi+"""
+    cdef double x, y
+    dalitz_xy(moms, (mk0 ** 2 + 2 * mpi0 ** 2 + mpi ** 2) / 3.0, &x, &y)
+    return (
+        -0.5 * (2.0 * alpha1 - alpha3)
+        + (beta1 - 0.5 * beta3 - sqrt(3.0) * gamma3) * y
+        - (zeta1 + zeta3) * (y ** 2 + x ** 2 / 3.0)
+        - (xi1 + xi3 + xi3p) * (y ** 2 - x ** 2 / 3.0)
+    ) ** 2
+
+
+@cython.cdivision(True)
+cdef double msqrd_ppm(vector[vector[double]] &moms,
+                      vector[double] &params) nogil:
+    """k+ -> pi+ + pi+ + pi-"""
+    cdef double x, y
+    dalitz_xy(moms, (mk ** 2 + 3 * mpi ** 2) / 3.0, &x, &y)
+    return (
+        (2.0 * alpha1 - alpha3)
+        + (beta1 - 0.5 * beta3 + sqrt(3.0) * gamma3) * y
+        - 2.0 * (zeta1 + zeta3) * (y ** 2 + x ** 2 / 3.0)
+        - (xi1 + xi3 - xi3p) * (y ** 2 - x ** 2 / 3.0)
+    ) ** 2
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double msqrd_pilnu(vector[vector[double]] &moms,
+                        vector[double] &params) nogil:
+    """
+    k+ -> pi0 + l+ + nu, with momenta ordered as {pi0, l+, nu} and the mass
+    of the lepton as the only parameter.
+    """
+    cdef double ml = params[0]
+    cdef double pl_pn = ldot(moms[1], moms[2])
+    cdef double pl_pp = ldot(moms[1], moms[0])
+    cdef double pp_pn = ldot(moms[0], moms[2])
+    cdef double f = (
+        lamp * mk ** 2
+        + (1 + lamp) * mpi ** 2
+        - 2 * lamp * (mpi ** 2 + pl_pp + pp_pn)
+    )
+
+    return (
+        (lam0 - lamp) ** 2
+        * (mk - mpi) ** 2
+        * (mk + mpi) ** 2
+        * pl_pn
+        * (-mk ** 2 + 2 * ml ** 2 + mpi ** 2 + 2 * pl_pn + 2 * pl_pp + 2 * pp_pn)
+        - (lamp * mk ** 2 + mpi ** 2 - lamp * mpi ** 2 - 2 * lamp * pl_pp
+           - 2 * lamp * pp_pn) ** 2
+        * (
+            -2 * pl_pn ** 2
+            + pl_pn * (mk ** 2 - 2 * ml ** 2 + 3 * mpi ** 2 - 2 * pl_pp - 2 * pp_pn)
+            - 4 * (ml ** 2 + 2 * pl_pp) * pp_pn
+        )
+        - (lam0 - lamp)
+        * (mk - mpi)
+        * (mk + mpi)
+        * (
+            -2 * pl_pn ** 2
+            + pl_pn * (mk ** 2 - 2 * ml ** 2 - mpi ** 2 - 2 * pl_pp - 2 * pp_pn)
+            - 2 * ml ** 2 * pp_pn
+        )
+        * f
+        - (lam0 - lamp)
+        * (-mk + mpi)
+        * (mk + mpi)
+        * f
+        * (
+            2 * pl_pn ** 2
+            + 2 * ml ** 2 * pp_pn
+            + pl_pn * (-mk ** 2 + 2 * ml ** 2 + mpi ** 2 + 2 * pl_pp + 2 * pp_pn)
+        )
+    ) / mpi ** 4
+
+
+register_matrix_element("long_kaon.000", msqrd_L000, 3, (), __name__)
+register_matrix_element("long_kaon.pm0", msqrd_Lpm0, 3, (), __name__)
+register_matrix_element("short_kaon.pm0", msqrd_Spm0, 3, (), __name__)
+register_matrix_element("charged_kaon.00p", msqrd_00p, 3, (), __name__)
+register_matrix_element("charged_kaon.ppm", msqrd_ppm, 3, (), __name__)
+register_matrix_element("charged_kaon.0lnu", msqrd_pilnu, 3, ("ml",), __name__)
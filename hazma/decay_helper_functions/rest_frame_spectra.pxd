@@ -0,0 +1,35 @@
+cimport numpy as np
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTable
+
+cdef struct LogGridSpectrum:
+    double log_eng_min
+    # Spacing of the logarithms of the energies, or 0 if these are not
+    # uniformly spaced
+    double dlog_eng
+    int num
+    double* engs
+    double* values
+    # Integrals of the spectrum divided by the energy from the nodes to
+    # infinity
+    double* tails
+
+
+cdef bint boost_by_quad() nogil
+cdef bint at_rest(double beta) nogil
+cdef double interp_log_grid(const LogGridSpectrum* spectrum, double eng) nogil
+cdef double tail_log_grid(const LogGridSpectrum* spectrum, double eng) nogil
+cdef double boost_log_grid(const LogGridSpectrum* spectrum, double eng_gam, double gamma, double beta) nogil
+
+
+cdef class RestFrameSpectra:
+    cdef np.ndarray engs
+    cdef np.ndarray spectra
+    cdef dict sums
+    cdef dict tails
+    cdef double log_eng_min
+    cdef double dlog_eng
+
+    cdef LogGridSpectrum c_spectrum(self, int bitflags) except *
+    cdef double c_boosted_point(self, double eng_gam, double eng, double mass, double eng_max_rf, int bitflags) except *
+    cdef np.ndarray c_boosted_modes_array(self, double[:] eng_gams, double eng, double mass, double[:] weights)
+    cdef np.ndarray c_boosted_array(self, double[:] eng_gams, double eng, double mass, double eng_max_rf, int bitflags, DecaySpectrumTable table=*)
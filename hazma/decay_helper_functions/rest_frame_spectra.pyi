@@ -0,0 +1,30 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+BOOST_METHODS: Tuple[str, ...]
+
+
+def set_boost_method(method: str) -> None:
+    ...
+
+
+def get_boost_method() -> str:
+    ...
+
+
+class RestFrameSpectra:
+    def __init__(
+        self, engs: npt.ArrayLike, spectra: Sequence[npt.ArrayLike]
+    ) -> None:
+        ...
+
+    def spectrum(self, bitflags: int) -> npt.NDArray[np.float64]:
+        ...
+
+    def tail(self, bitflags: int) -> npt.NDArray[np.float64]:
+        ...
+
+    def __call__(self, eng: npt.ArrayLike, bitflags: int) -> npt.NDArray[np.float64]:
+        ...
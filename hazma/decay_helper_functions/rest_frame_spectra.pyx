@@ -0,0 +1,393 @@
+"""
+Rest-frame photon spectra of particles with many decay modes, tabulated on a
+grid of photon energies.
+
+The spectra of the enabled decay modes are summed once for each combination
+of modes (given as bitflags) and cached. A point of the summed spectrum is
+found by an index lookup on the grid followed by a linear interpolation in
+the photon energy, matching ``np.interp``. The lookup takes constant time on
+grids uniformly spaced in logarithm and uses bisection on other grids, which
+can have extra nodes at the kinematic edges of the spectra.
+
+For an isotropic decay, the spectrum in the lab frame of a particle with
+boost gamma and velocity beta is
+
+    dN/dE = 1 / (2 gamma beta) * int_{E_-}^{E_+} dE' f(E') / E',
+
+with E_- = E / (gamma (1 + beta)) and E_+ = E gamma (1 + beta), where f is
+the rest-frame spectrum. The integral of f(E') / E' above each node is
+computed exactly for the interpolated spectrum once for each combination of
+modes, so that a point of the boosted spectrum only needs two lookups.
+Computing the integral over the angle of the photon with
+``scipy.integrate.quad`` is kept as a reference (see ``set_boost_method``).
+The integrand is then a plain C function, passed to ``quad`` as a
+``LowLevelCallable``.
+
+The lookups do not need the GIL, so the spectrum at many photon energies is
+computed in parallel, with the number of threads set by
+``hazma.parallel.set_num_threads``.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import numpy as np
+cimport numpy as np
+import cython
+from cpython.pycapsule cimport PyCapsule_New
+from cython.parallel cimport prange
+from libc.math cimport log
+from scipy import LowLevelCallable
+from scipy.integrate import quad
+
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTable
+from hazma.parallel import num_threads
+include "common.pxd"
+
+BOOST_METHODS = ("cumulative", "quad")
+
+cdef bint _quad = False
+
+
+def set_boost_method(method):
+    """
+    Set the method used to boost rest-frame spectra into the lab frame.
+
+    Parameters
+    ----------
+    method : str
+        "cumulative" (the default) to use the integral of the rest-frame
+        spectrum divided by the photon energy, or "quad" to integrate over
+        the angle of the photon by quadrature, which is much slower and
+        is meant to validate the former. "quad" also integrates the
+        positron spectra with `scipy.integrate.quad` instead of the
+        Gauss-Kronrod rule.
+    """
+    global _quad
+    if method not in BOOST_METHODS:
+        raise ValueError(
+            "Invalid boost method {}. Use one of {}.".format(method, BOOST_METHODS)
+        )
+    _quad = method == "quad"
+
+
+def get_boost_method():
+    """Returns the method used to boost rest-frame spectra."""
+    return "quad" if _quad else "cumulative"
+
+
+cdef bint boost_by_quad() nogil:
+    return _quad
+
+
+cdef struct BoostIntegrand:
+    LogGridSpectrum spectrum
+    double eng_gam
+    double gamma
+    double beta
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef inline int find_cell(const LogGridSpectrum* spectrum, double eng) nogil:
+    """
+    Returns the index of the node below `eng`, which must lie strictly inside
+    of the grid.
+    """
+    cdef int j, mid
+    cdef int hi = spectrum.num - 1
+    cdef double* engs = spectrum.engs
+
+    if spectrum.dlog_eng > 0.0:
+        j = <int>((log(eng) - spectrum.log_eng_min) / spectrum.dlog_eng)
+        if j > hi - 1:
+            j = hi - 1
+        # Correct for the rounding of the logarithm at the nodes
+        if eng < engs[j]:
+            j -= 1
+        elif eng > engs[j + 1]:
+            j += 1
+        return j
+
+    j = 0
+    while hi - j > 1:
+        mid = (j + hi) // 2
+        if engs[mid] <= eng:
+            j = mid
+        else:
+            hi = mid
+    return j
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double interp_log_grid(const LogGridSpectrum* spectrum, double eng) nogil:
+    """
+    Returns the spectrum at `eng`, interpolated linearly between the nodes.
+    Outside of the grid, the spectrum is extended by its values at the ends.
+    """
+    cdef int j
+    cdef int num = spectrum.num
+    cdef double* engs = spectrum.engs
+    cdef double* values = spectrum.values
+
+    if eng <= engs[0]:
+        return values[0]
+    if eng >= engs[num - 1]:
+        return values[num - 1]
+
+    j = find_cell(spectrum, eng)
+    return values[j] + (values[j + 1] - values[j]) * (eng - engs[j]) / (engs[j + 1] - engs[j])
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double tail_log_grid(const LogGridSpectrum* spectrum, double eng) nogil:
+    """
+    Returns the integral of the spectrum divided by the energy from `eng` to
+    infinity. The spectrum vanishes above the grid and is extended by its
+    first value below it.
+    """
+    cdef int j
+    cdef int num = spectrum.num
+    cdef double* engs = spectrum.engs
+    cdef double* values = spectrum.values
+    cdef double slope
+
+    if eng >= engs[num - 1]:
+        return 0.0
+    if eng <= engs[0]:
+        return spectrum.tails[0] + values[0] * log(engs[0] / eng)
+
+    j = find_cell(spectrum, eng)
+    # Exact integral of (values[j] + slope * (e - engs[j])) / e up to the
+    # next node
+    slope = (values[j + 1] - values[j]) / (engs[j + 1] - engs[j])
+    return (
+        spectrum.tails[j + 1]
+        + (values[j] - slope * engs[j]) * log(engs[j + 1] / eng)
+        + slope * (engs[j + 1] - eng)
+    )
+
+
+cdef bint at_rest(double beta) nogil:
+    """
+    Returns whether a particle with velocity `beta` is treated as being at
+    rest, in which case its spectrum is not boosted.
+    """
+    return beta < 1e-7
+
+
+@cython.cdivision(True)
+cdef double boost_log_grid(const LogGridSpectrum* spectrum, double eng_gam, double gamma, double beta) nogil:
+    """
+    Returns the spectrum boosted into the lab frame.
+    """
+    if at_rest(beta):
+        return interp_log_grid(spectrum, eng_gam)
+    return (
+        tail_log_grid(spectrum, eng_gam / (gamma * (1.0 + beta)))
+        - tail_log_grid(spectrum, eng_gam * gamma * (1.0 + beta))
+    ) / (2.0 * gamma * beta)
+
+
+@cython.cdivision(True)
+cdef double boost_integrand(int n, double* xx, void* user_data) nogil:
+    """
+    Integrand of the boosted spectrum, as a function of the cosine of the
+    angle between the photon and the boost.
+    """
+    cdef BoostIntegrand* data = <BoostIntegrand*>user_data
+    cdef double w = 1.0 - data.beta * xx[0]
+    return interp_log_grid(&data.spectrum, data.eng_gam * data.gamma * w) / (2.0 * data.gamma * w)
+
+
+_BOOST_INTEGRAND = PyCapsule_New(
+    <void*>boost_integrand, "double (int, double *, void *)", NULL
+)
+
+
+cdef class RestFrameSpectra:
+    """
+    Rest-frame spectra of the decay modes of a particle.
+
+    Parameters
+    ----------
+    engs : numpy.ndarray
+        Increasing photon energies. The spectra are looked up fastest when
+        these are uniformly spaced in logarithm.
+    spectra : list of numpy.ndarray
+        Spectra of the decay modes at `engs`. The i-th mode is enabled by
+        the bit ``1 << i`` of the bitflags. When boosted, the spectra are
+        taken to vanish above the last node.
+    """
+
+    def __init__(self, engs, spectra):
+        engs = np.ascontiguousarray(engs, dtype=np.float64)
+        if len(engs) < 2 or np.any(np.diff(engs) <= 0.0):
+            raise ValueError("Energies must be increasing.")
+
+        self.engs = engs
+        self.spectra = np.ascontiguousarray(spectra, dtype=np.float64)
+        self.sums = {}
+        self.tails = {}
+
+        log_engs = np.log(engs)
+        self.log_eng_min = log_engs[0]
+        self.dlog_eng = (log_engs[-1] - log_engs[0]) / (len(engs) - 1)
+        # Other grids are searched by bisection
+        if not np.allclose(
+            log_engs, np.linspace(log_engs[0], log_engs[-1], len(engs)), rtol=0.0, atol=1e-10
+        ):
+            self.dlog_eng = 0.0
+
+    def spectrum(self, int bitflags):
+        """
+        Returns the sum of the spectra of the enabled modes at the nodes.
+        """
+        if bitflags not in self.sums:
+            modes = [i for i in range(len(self.spectra)) if bitflags & (1 << i)]
+            self.sums[bitflags] = np.ascontiguousarray(
+                np.sum(self.spectra[modes], axis=0)
+            )
+        return self.sums[bitflags]
+
+    def tail(self, int bitflags):
+        """
+        Returns the integrals of the sum of the spectra of the enabled modes,
+        divided by the energy, from the nodes to infinity.
+        """
+        if bitflags not in self.tails:
+            values = self.spectrum(bitflags)
+            engs = self.engs
+            slopes = np.diff(values) / np.diff(engs)
+            cells = (
+                (values[:-1] - slopes * engs[:-1]) * np.log(engs[1:] / engs[:-1])
+                + slopes * np.diff(engs)
+            )
+            tails = np.zeros_like(values)
+            tails[:-1] = np.cumsum(cells[::-1])[::-1]
+            self.tails[bitflags] = tails
+        return self.tails[bitflags]
+
+    cdef LogGridSpectrum c_spectrum(self, int bitflags) except *:
+        cdef np.ndarray[np.float64_t, ndim=1] values = self.spectrum(bitflags)
+        cdef np.ndarray[np.float64_t, ndim=1] tails = self.tail(bitflags)
+        cdef LogGridSpectrum spectrum
+        spectrum.log_eng_min = self.log_eng_min
+        spectrum.dlog_eng = self.dlog_eng
+        spectrum.num = self.engs.shape[0]
+        spectrum.engs = <double*>self.engs.data
+        spectrum.values = <double*>values.data
+        spectrum.tails = <double*>tails.data
+        return spectrum
+
+    @cython.cdivision(True)
+    cdef double c_boosted_point(self, double eng_gam, double eng, double mass, double eng_max_rf, int bitflags) except *:
+        """
+        Returns the lab-frame spectrum of a particle with energy `eng` and
+        mass `mass`, whose rest-frame spectrum vanishes above `eng_max_rf`.
+        """
+        cdef BoostIntegrand data
+        data.spectrum = self.c_spectrum(bitflags)
+        data.eng_gam = eng_gam
+        data.gamma = eng / mass
+        data.beta = sqrt(1.0 - (mass / eng)**2)
+
+        if not _quad:
+            return boost_log_grid(&data.spectrum, eng_gam, data.gamma, data.beta)
+
+        integrand = LowLevelCallable(
+            _BOOST_INTEGRAND, PyCapsule_New(<void*>&data, NULL, NULL)
+        )
+        return quad(
+            integrand,
+            -1.0,
+            1.0,
+            points=boost_break_points(eng_gam, eng, mass, eng_max_rf),
+            epsabs=1e-10,
+            epsrel=1e-4,
+        )[0]
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef np.ndarray c_boosted_array(self, double[:] eng_gams, double eng, double mass, double eng_max_rf, int bitflags, DecaySpectrumTable table=None):
+        """
+        Returns the lab-frame spectrum at many photon energies, interpolated
+        from `table` where possible. The photon energies are distributed
+        over ``hazma.parallel.num_threads()`` threads, unless the boost is
+        computed by quadrature.
+        """
+        cdef int i
+        cdef int npts = eng_gams.shape[0]
+        cdef int nthreads = num_threads()
+        cdef np.ndarray[np.float64_t, ndim=1] spec = np.zeros(npts, dtype=np.float64)
+        cdef double[:] spec_view = spec
+        cdef bint use_table = table is not None
+        cdef LogGridSpectrum spectrum
+        cdef double boost_gamma, boost_beta
+
+        if eng < mass:
+            return spec
+
+        if _quad:
+            for i in range(npts):
+                if not (use_table and table.c_interp(eng_gams[i], eng, &spec_view[i])):
+                    spec_view[i] = self.c_boosted_point(eng_gams[i], eng, mass, eng_max_rf, bitflags)
+            return spec
+
+        spectrum = self.c_spectrum(bitflags)
+        boost_gamma = gamma(eng, mass)
+        boost_beta = beta(eng, mass)
+        for i in prange(npts, nogil=True, num_threads=nthreads):
+            if not (use_table and table.c_interp(eng_gams[i], eng, &spec_view[i])):
+                spec_view[i] = boost_log_grid(&spectrum, eng_gams[i], boost_gamma, boost_beta)
+        return spec
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef np.ndarray c_boosted_modes_array(self, double[:] eng_gams, double eng, double mass, double[:] weights):
+        """
+        Returns the lab-frame spectrum at many photon energies of the sum of
+        the modes weighted by `weights`, boosted with the cumulative
+        integrals. The loop over the photon energies does not hold the GIL.
+        """
+        cdef int i, k
+        cdef int num_modes = 0
+        cdef int npts = eng_gams.shape[0]
+        cdef np.ndarray[np.float64_t, ndim=1] spec = np.zeros(npts, dtype=np.float64)
+        cdef double[:] spec_view = spec
+        cdef LogGridSpectrum spectra[32]
+        cdef double mode_weights[32]
+        cdef double boost_gamma, boost_beta
+
+        if weights.shape[0] > self.spectra.shape[0]:
+            raise ValueError("There are more weights than modes.")
+        if eng < mass:
+            return spec
+
+        for k in range(weights.shape[0]):
+            if weights[k] != 0.0:
+                spectra[num_modes] = self.c_spectrum(1 << k)
+                mode_weights[num_modes] = weights[k]
+                num_modes += 1
+
+        boost_gamma = gamma(eng, mass)
+        boost_beta = beta(eng, mass)
+        with nogil:
+            for i in range(npts):
+                for k in range(num_modes):
+                    spec_view[i] += mode_weights[k] * boost_log_grid(
+                        &spectra[k], eng_gams[i], boost_gamma, boost_beta
+                    )
+        return spec
+
+    def __call__(self, eng, int bitflags):
+        """
+        Returns the sum of the spectra of the enabled modes at `eng`.
+        """
+        cdef LogGridSpectrum spectrum = self.c_spectrum(bitflags)
+        engs = np.asarray(eng, dtype=np.float64)
+        values = np.array([interp_log_grid(&spectrum, e) for e in engs.flat])
+        return values.reshape(engs.shape)
@@ -4,6 +4,7 @@
 # author : Logan Morrison and Adam Coogan
 # date : December 2017
 
+from hazma import parallel
 from hazma import rambo
 from hazma.gamma_ray_helper_functions.gamma_ray_generator import (
     gamma,
@@ -23,6 +24,10 @@ def gamma_ray_decay(
     num_ps_pts=1000,
     num_bins=25,
     verbose=False,
+    batched=None,
+    events=None,
+    method="histogram",
+    return_errors=False,
 ):
     r"""Returns gamma ray spectrum from the decay of a set of particles.
 
@@ -47,15 +52,43 @@ def gamma_ray_decay(
     num_ps_pts : int {1000}, optional
         Number of phase space points to use.
     num_bins : int {25}, optional
-        Number of bins to use.
+        Number of bins to use, or of quadrature nodes per particle for the
+        "events" method.
     verbose: Bool
         If true, additional output is displayed while the function is computing
         spectra.
+    batched: Bool, optional
+        If True, `mat_elem_sqrd` takes an array of four momenta of shape
+        (num_ps_pts, len(particles), 4) and returns an array of
+        `num_ps_pts` values. If not specified, functions decorated with
+        ``hazma.rambo.batched_matrix_element`` are treated as batched.
+    events: EventStore, optional
+        Stored RAMBO events of the final state (see
+        ``hazma.phase_space_helper_functions.event_store``). If given, they
+        are reweighted by `mat_elem_sqrd` instead of generating new events,
+        which is much faster when scanning the parameters of the matrix
+        element. `num_ps_pts` is then ignored.
+    method: str {"histogram"}, optional
+        How the decay spectra are convolved with the energy distributions of
+        the particles. "histogram" evaluates them at the centers of
+        `num_bins` linear energy bins. "events" keeps the energies of the
+        events and evaluates the spectra at `num_bins` quantiles of the
+        energy distribution of each particle, which avoids the bias of the
+        bins near kinematic edges.
+    return_errors: Bool, optional
+        If true, the estimated errors of the contributions of each particle
+        are returned as well. Ignored for a single photon energy.
 
     Returns
     -------
     spec : np.ndarray
         Total gamma ray spectrum from all final state particles.
+    errs : np.ndarray
+        Estimated errors of the contributions of each particle, with shape
+        (len(particles), len(photon_energies)). Only returned if
+        `return_errors` is true. For the "histogram" method, they only
+        include the statistical errors of the histograms. For the "events"
+        method, they also include an estimate of the quadrature error.
 
     Notes
     -----
@@ -70,7 +103,10 @@ def gamma_ray_decay(
     energies sampled from probability distributions. :math:`P_{i}(E_{j})` is
     the probability that particle :math:`i` has energy :math:`E_{j}`. The
     probabilities are computed using ``hazma.phase_space_generator.rambo``. The
-    total number of energies used is ``num_bins``.
+    total number of energies used is ``num_bins``. With the "events" method,
+    the :math:`E_{j}` are the quantiles of the energy of particle :math:`i`
+    at the probabilities :math:`(j + 1/2) / N` and
+    :math:`P_{i}(E_{j}) = 1 / N`, with :math:`N` = ``num_bins``.
 
     Examples
     --------
@@ -100,14 +136,33 @@ def gamma_ray_decay(
             num_ps_pts=num_ps_pts,
             num_bins=num_bins,
             verbose=verbose,
+            batched=batched,
+            events=events,
+            method=method,
+            return_errors=return_errors,
         )
     return gamma_point(
-        particles, cme, photon_energies, mat_elem_sqrd, num_ps_pts, num_bins
+        particles,
+        cme,
+        photon_energies,
+        mat_elem_sqrd,
+        num_ps_pts,
+        num_bins,
+        batched=batched,
+        events=events,
+        method=method,
     )
 
 
 def __gamma_ray_fsr(
-    photon_energy, cme, isp_masses, fsp_masses, non_rad, msqrd, nevents=1000
+    photon_energy,
+    cme,
+    isp_masses,
+    fsp_masses,
+    non_rad,
+    msqrd,
+    nevents=1000,
+    seed=None,
 ):
     """
     Compute the gamma-ray spectrum for a given process at specified photon
@@ -135,6 +190,8 @@ def __gamma_ray_fsr(
         last momentum in the list, i.e. at `momentum[len(fsp_masses)]`.
     nevents: int, optional
         Number of events to use for computing the dnde.
+    seed: None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed for the random number generators.
 
     Returns
     -------
@@ -156,12 +213,17 @@ def __gamma_ray_fsr(
     _cme_rf = np.sqrt(_cme * (-2 * photon_energy + _cme))
     # Number of final state particles
     nfsp = len(fsp_masses)
+    # Independent streams for the events and the photon directions
+    seed_events, seed_photons = parallel.spawn_seeds(seed, 2)
     # Generate events for the final state particles in their rest frame
-    events = rambo.generate_phase_space(fsp_masses, _cme_rf, nevents)
+    events = rambo.generate_phase_space(
+        fsp_masses, _cme_rf, nevents, seed=seed_events
+    )
 
     # Photon momenta in N + photon rest frame
-    phis = np.random.rand(nevents) * 2.0 * np.pi
-    cts = 2.0 * np.random.rand(nevents) - 1.0
+    rng = np.random.default_rng(seed_photons)
+    phis = rng.random(nevents) * 2.0 * np.pi
+    cts = 2.0 * rng.random(nevents) - 1.0
     g_momenta = [
         np.array(
             [
@@ -198,7 +260,14 @@ def __gamma_ray_fsr(
 
 
 def gamma_ray_fsr(
-    photon_energies, cme, isp_masses, fsp_masses, non_rad, msqrd, nevents=1000
+    photon_energies,
+    cme,
+    isp_masses,
+    fsp_masses,
+    non_rad,
+    msqrd,
+    nevents=1000,
+    seed=None,
 ):
     """
     Compute the gamma-ray spectrum for a given process at specified photon
@@ -226,6 +295,10 @@ def gamma_ray_fsr(
         last momentum in the list, i.e. at `momentum[len(fsp_masses)]`.
     nevents: int, optional
         Number of events to use for computing the dnde.
+    seed: None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed for the random number generators. An independent stream is
+        derived from it for each photon energy. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
@@ -237,6 +310,7 @@ def gamma_ray_fsr(
     assert len(isp_masses) in [1, 2], "`isp_masses` must be of length 1 or 2."
 
     if hasattr(photon_energies, "__len__"):
+        seeds = parallel.spawn_seeds(seed, len(photon_energies))
         return np.array(
             [
                 __gamma_ray_fsr(
@@ -247,8 +321,9 @@ def gamma_ray_fsr(
                     non_rad,
                     msqrd,
                     nevents=nevents,
+                    seed=s,
                 )
-                for e in photon_energies
+                for e, s in zip(photon_energies, seeds)
             ]
         )
     return __gamma_ray_fsr(
@@ -259,5 +334,6 @@ def gamma_ray_fsr(
         non_rad,
         msqrd,
         nevents=nevents,
+        seed=seed,
     )
 
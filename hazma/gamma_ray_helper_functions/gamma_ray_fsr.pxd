@@ -1,7 +1,6 @@
 from libcpp.vector cimport vector
 from libcpp.pair cimport pair
-
-ctypedef double (*msqrd_type_vector)(vector[vector[double]]&, vector[double]&)
+from hazma.phase_space_helper_functions.native cimport msqrd_type_vector
 
 cdef pair[vector[double], vector[double]] c_gamma_ray_fsr(
     vector[double] &,
@@ -12,4 +11,5 @@ cdef pair[vector[double], vector[double]] c_gamma_ray_fsr(
     msqrd_type_vector,
     int,
     vector[double]&,
+    vector[unsigned int]&,
 )
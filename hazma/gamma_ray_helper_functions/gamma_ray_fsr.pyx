@@ -1,34 +1,21 @@
 import numpy as np
 cimport numpy as np
 import cython
-from hazma.phase_space_helper_functions.generator cimport c_generate_space
+from hazma.phase_space_helper_functions.generator cimport (
+    c_generate_space,
+    c_make_rng,
+    make_rng,
+    mt19937,
+    uniform_real_distribution,
+)
 from libc.math cimport M_PI, sqrt, cos, sin
 from libcpp.vector cimport vector
 from libcpp.pair cimport pair
 
 
-cdef extern from "<random>" namespace "std":
-    cdef cppclass mt19937 nogil:
-        mt19937() nogil
-        mt19937(unsigned int seed) nogil
-
-    cdef cppclass random_device nogil:
-        random_device() except +
-        unsigned int operator()()
-
-    cdef cppclass uniform_real_distribution[T] nogil:
-        uniform_real_distribution() nogil
-        uniform_real_distribution(T a, T b) nogil
-        T operator()(mt19937 gen) nogil
-
 cdef uniform_real_distribution[double] uniform \
     = uniform_real_distribution[double](0., 1.)
 
-cdef mt19937 rng
-
-cdef extern from "random" namespace "std":
-    cdef cppclass random
-
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -60,6 +47,7 @@ cdef pair[double,double] c_gamma_ray_fsr_point(
     msqrd_type_vector msqrd,
     int nevents,
     vector[double] &params,
+    mt19937 &rng,
 ):
     cdef int nfsp = fsp_masses.size()
     cdef int i
@@ -104,7 +92,7 @@ cdef pair[double,double] c_gamma_ray_fsr_point(
     # rest frame
     _cme_rf = sqrt(_cme * (-2 * photon_energy + _cme))
     # Generate events for the final state particles in their rest frame
-    events = c_generate_space(nevents, fsp_masses, _cme_rf, nfsp)
+    events = c_generate_space(nevents, fsp_masses, _cme_rf, nfsp, rng)
 
     res = 0.0
     std = 0.0
@@ -155,9 +143,11 @@ cdef pair[vector[double], vector[double]] c_gamma_ray_fsr(
     msqrd_type_vector msqrd,
     int nevents,
     vector[double] &params,
+    vector[unsigned int] &seed,
 ):
     cdef int i
     cdef int npts = photon_energies.size()
+    cdef mt19937 rng = c_make_rng(seed)
     cdef pair[double,double] result
     cdef vector[double] results = vector[double](npts)
     cdef vector[double] errors = vector[double](npts)
@@ -172,6 +162,7 @@ cdef pair[vector[double], vector[double]] c_gamma_ray_fsr(
             msqrd,
             nevents,
             params,
+            rng,
         )
         results[i] = result.first
         errors[i] = result.second
@@ -190,6 +181,7 @@ cdef pair[double, double] py_gamma_ray_fsr_point(
     double non_rad,
     msqrd,
     int nevents,
+    mt19937 &rng,
 ):
     cdef int nfsp = fsp_masses.size()
     cdef int i
@@ -234,7 +226,7 @@ cdef pair[double, double] py_gamma_ray_fsr_point(
     # rest frame
     _cme_rf = sqrt(_cme * (-2 * photon_energy + _cme))
     # Generate events for the final state particles in their rest frame
-    events = c_generate_space(nevents, fsp_masses, _cme_rf, nfsp)
+    events = c_generate_space(nevents, fsp_masses, _cme_rf, nfsp, rng)
 
     res = 0.0
     std = 0.0
@@ -244,10 +236,12 @@ cdef pair[double, double] py_gamma_ray_fsr_point(
 
         # Copy the four-momenta from the event
         for j in range(nfsp):
+            momenta[j] = vector[double](4)
             for k in range(4):
-                momenta[j].push_back(events[i][4 * j + k])
+                momenta[j][k] = events[i][4 * j + k]
 
         # Fill in the photon four-momentum
+        momenta[nfsp] = vector[double](4)
         momenta[nfsp][0] = e_gamma
         momenta[nfsp][1] = e_gamma * cos(phi) * sqrt(1 - ct ** 2)
         momenta[nfsp][2] = e_gamma * sin(phi) * sqrt(1 - ct ** 2)
@@ -282,6 +276,7 @@ cdef pair[vector[double], vector[double]] py_gamma_ray_fsr(
     double non_rad,
     msqrd,
     int nevents,
+    mt19937 &rng,
 ):
     cdef int i
     cdef int npts = photon_energies.size()
@@ -298,6 +293,7 @@ cdef pair[vector[double], vector[double]] py_gamma_ray_fsr(
             non_rad,
             msqrd,
             nevents,
+            rng,
         )
         results[i] = result.first
         errors[i] = result.second
@@ -313,6 +309,7 @@ def gamma_ray_fsr(
     non_rad,
     msqrd,
     nevents,
+    seed=None,
 ):
     """
     Compute the gamma-ray spectrum for a given process at specified photon
@@ -340,12 +337,17 @@ def gamma_ray_fsr(
         last momentum in the list, i.e. at `momentum[len(fsp_masses)]`.
     nevents: int, optional
         Number of events to use for computing the dnde.
+    seed: None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed for the random number generator. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
     dnde: tuple of floats
         The photon spectrum at `photon_energy` and the error estimate.
     """
+    cdef mt19937 rng = make_rng(seed)
+
     if hasattr(photon_energies, '__len__'):
         return py_gamma_ray_fsr(
             np.array(photon_energies),
@@ -355,6 +357,7 @@ def gamma_ray_fsr(
             non_rad,
             msqrd,
             nevents,
+            rng,
         )
     return py_gamma_ray_fsr_point(
             photon_energies,
@@ -364,6 +367,7 @@ def gamma_ray_fsr(
             non_rad,
             msqrd,
             nevents,
+            rng,
         )
 
 
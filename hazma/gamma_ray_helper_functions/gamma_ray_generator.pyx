@@ -6,9 +6,10 @@
 import numpy as np
 cimport numpy as np
 import cython
-import multiprocessing as mp
 
+from hazma import parallel
 from hazma import rambo
+from hazma.phase_space_helper_functions import statistics
 from hazma.rambo import compute_annihilation_cross_section
 from hazma.rambo import compute_decay_width
 
@@ -36,6 +37,10 @@ cdef mass_dict = {'muon': MASS_MU, 'electron': MASS_E, 'neutrino': 0.0,
 cdef dict cspec_dict = spec_dict
 cdef dict cmass_dict = mass_dict
 
+# Ways of convolving the decay spectra with the energy distributions of the
+# particles, see ``gamma``.
+GAMMA_METHODS = ("histogram", "events")
+
 cdef np.ndarray names_to_masses(np.ndarray names):
     """Returns the masses of particles given a list of their names.
 
@@ -58,14 +63,15 @@ cdef np.ndarray names_to_masses(np.ndarray names):
         masses[i] = cmass_dict[names[i]]
     return masses
 
-def __gen_spec(name, eng, eng_gams, norm, verbose=False):
+def __gen_spec(name, engs, eng_gams, verbose=False):
     """
-    c-function used by ``gamma`` and ``gamma_point`` to generate spectrum
-    values.
+    Returns the spectra of particle `name` for each of the energies `engs`,
+    with shape (len(engs), len(eng_gams)). Used by ``gamma`` to convolve the
+    spectra with the energy distributions of the particles.
     """
     if verbose is True:
-        print("creating {} spectrum with energy {}".format(name, eng))
-    return norm * cspec_dict[name](eng_gams, eng)
+        print("creating {} spectra with energies {}".format(name, engs))
+    return cspec_dict[name](eng_gams, engs)
 
 def __gen_spec_2body(particles, cme, eng_gams):
     masses = names_to_masses(particles)
@@ -81,11 +87,118 @@ def __gen_spec_2body(particles, cme, eng_gams):
 
     return spec
 
+def _energy_histogram(masses, cme, num_ps_pts, mat_elem_sqrd, num_bins,
+                      density, batched, events):
+    """
+    Energy histograms of the final state particles and their errors, either
+    from new RAMBO events or by reweighting stored ones.
+    """
+    if events is None:
+        return rambo.generate_energy_histogram(
+            masses, cme, num_ps_pts, mat_elem_sqrd, num_bins, density=density,
+            batched=batched)
+    events.check_kinematics(masses, cme)
+    return events.energy_histogram(mat_elem_sqrd, num_bins, density=density,
+                                   batched=batched)
+
+def _energy_sample(masses, cme, num_ps_pts, mat_elem_sqrd, batched, events):
+    """
+    Energies of the final state particles and weights of the events, either
+    from new RAMBO events or by reweighting stored ones.
+    """
+    if events is None:
+        return rambo.generate_energy_sample(
+            masses, cme, num_ps_pts, mat_elem_sqrd, batched=batched)
+    events.check_kinematics(masses, cme)
+    return events.energy_sample(mat_elem_sqrd, batched=batched)
+
+def _particle_spectra(particles, engs, eng_gams, verbose):
+    """
+    Returns the spectra of each particle at each of its energies `engs`, an
+    array of shape (num_fsp, n), with shape (num_fsp, n, len(eng_gams)). The
+    spectra of each species are computed for all of the energies of its
+    particles in a single call, using the shared pool of workers.
+    """
+    tasks = []
+    groups = []
+    for part in dict.fromkeys(particles):
+        idxs = [j for j in range(len(particles)) if particles[j] == part]
+        part_engs, inv = np.unique(engs[idxs].ravel(), return_inverse=True)
+        tasks.append((part, part_engs, eng_gams, verbose))
+        groups.append((idxs, inv.reshape(len(idxs), -1)))
+
+    specs = parallel.parallel_map(__gen_spec, tasks)
+    result = np.empty(engs.shape + (len(eng_gams),), dtype=np.float64)
+    for (idxs, inv), spec in zip(groups, specs):
+        result[idxs] = spec[inv]
+    return result
+
+def _convolve_histograms(particles, cme, eng_gams, mat_elem_sqrd, num_ps_pts,
+                         num_bins, verbose, batched, events):
+    """
+    Convolves the spectra with the energy histograms of the particles. The
+    errors only include the statistical errors of the histograms.
+    """
+    cdef np.ndarray masses = names_to_masses(particles)
+
+    hist, hist_errs = _energy_histogram(masses, cme, num_ps_pts, mat_elem_sqrd,
+                                        num_bins, True, batched, events)
+
+    # Normalize spectrum: Need to multiply by the probability of particle
+    # having energy part_eng. Since we are essentially integrating over the
+    # energy probability distribution, we need to multiply by (b - a) / N,
+    # where a = e_min, b = e_max and N = num_bins.
+    widths = (hist[:, 0, -1] - hist[:, 0, 0])[:, np.newaxis] / num_bins
+
+    specs = _particle_spectra(particles, hist[:, 0, :], eng_gams, verbose)
+    spec = np.einsum("ij,ijk->k", widths * hist[:, 1, :], specs)
+    errs = np.sqrt(np.einsum("ij,ijk->ik", (widths * hist_errs)**2, specs**2))
+    return spec, errs
+
+def _convolve_events(particles, cme, eng_gams, mat_elem_sqrd, num_ps_pts,
+                     num_nodes, verbose, batched, events):
+    """
+    Convolves the spectra with the exact energy distributions of the
+    particles in the events, using the midpoint rule in the cumulative
+    probability of each particle's energy (see
+    ``statistics.quantile_nodes``).
+
+    The error of each particle combines the statistical error of the events,
+    estimated by assigning the spectrum at a node to the events of its
+    interval of probability, and half of the difference between the rules
+    built from the even and odd nodes, which overestimates the error of the
+    quadrature.
+    """
+    cdef np.ndarray masses = names_to_masses(particles)
+    cdef int num_fsp = len(masses)
+    cdef int i
+
+    energies, weights = _energy_sample(masses, cme, num_ps_pts, mat_elem_sqrd,
+                                       batched, events)
+    probs = weights / np.sum(weights)
+
+    nodes = np.empty((num_fsp, num_nodes), dtype=np.float64)
+    cells = np.empty((num_fsp, len(weights)), dtype=np.intp)
+    for i in range(num_fsp):
+        nodes[i], cells[i] = statistics.quantile_nodes(energies[:, i], weights, num_nodes)
+
+    specs = _particle_spectra(particles, nodes, eng_gams, verbose)
+    means = np.mean(specs, axis=1)
+
+    errs = np.empty((num_fsp, len(eng_gams)), dtype=np.float64)
+    for i in range(num_fsp):
+        probs_sqrd = np.bincount(cells[i], weights=probs**2, minlength=num_nodes)
+        errs[i] = probs_sqrd @ (specs[i] - means[i])**2
+        if num_nodes > 1:
+            errs[i] += (0.5 * (np.mean(specs[i, 0::2], axis=0) - np.mean(specs[i, 1::2], axis=0)))**2
+    return np.sum(means, axis=0), np.sqrt(errs)
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def gamma(np.ndarray particles, double cme,
           np.ndarray eng_gams, mat_elem_sqrd=lambda k_list: 1.0,
-          int num_ps_pts=10000, int num_bins=25, verbose=False):
+          int num_ps_pts=10000, int num_bins=25, verbose=False, batched=None,
+          events=None, method="histogram", return_errors=False):
     """Returns total gamma ray spectrum from final state particles.
 
     Parameters
@@ -105,64 +218,62 @@ def gamma(np.ndarray particles, double cme,
     num_ps_pts : int
         Number of phase space points to use.
     num_bins : int
-        Number of bins to use.
+        Number of bins to use, or of quadrature nodes per particle for the
+        "events" method.
+    batched : bool
+        If True, ``mat_elem_sqrd`` takes an array of four momenta of shape
+        (num_ps_pts, num_fsp, 4). If None, functions decorated with
+        ``hazma.rambo.batched_matrix_element`` are treated as batched.
+    events : EventStore
+        Stored events of the final state to reweight by ``mat_elem_sqrd``
+        instead of generating new ones. ``num_ps_pts`` is then ignored.
+    method : str {"histogram"]
+        With "histogram", the spectra are evaluated at the centers of linear
+        energy histograms of the particles. With "events", the energy
+        distributions of the events are kept exactly and the spectra are
+        evaluated at their quantiles, which avoids the bias of the bins near
+        kinematic edges.
+    return_errors : bool {False]
+        If True, the estimated errors of the contributions of the particles
+        are returned as well.
 
     Returns
     -------
     spec : np.ndarray[double, ndim=1]
         1-D array of total gamma ray spectrum from all final state particles.
+    errs : np.ndarray[double, ndim=2]
+        Estimated errors of the contributions of each particle to the
+        spectrum, with shape (len(particles), len(eng_gams)). Only returned
+        if `return_errors` is True. The spectra of one- and two-body final
+        states are exact.
     """
-
-    if len(particles) == 1:
-        return cspec_dict[particles[0]](eng_gams, cme)
-
-    if len(particles) == 2:
-        return __gen_spec_2body(particles, cme, eng_gams)
-
-    cdef int i, j
-    cdef int num_fsp
-    cdef int num_engs
-    cdef np.ndarray masses
-    cdef np.ndarray hist
-    cdef double prefactor
-
-    masses = names_to_masses(particles)
-
-    num_fsp = len(masses)
-    num_engs = len(eng_gams)
-
-    hist = rambo.generate_energy_histogram(masses, cme, num_ps_pts, mat_elem_sqrd, num_bins, density=True)[0]
-
-    cpdef int num_cpus = int(np.floor(mp.cpu_count() * 0.75))
-
-    p = mp.Pool(num_cpus)
-    specs = []
-
-    for i in range(num_bins):
-        for j in range(num_fsp):
-            part = particles[j]  # particle name
-            part_eng = hist[j, 0, i]  # particle energy
-
-            # Normalize spectrum: Need to multiply by the probability of
-            # particle having energy part_eng. Since we are essentially
-            # integrating over the energy probability distribution, we need to
-            # multiply by (b - a) / N, where a = e_min, b = e_max and
-            # N = num_bins.
-            norm = (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins * hist[j, 1, i]
-
-            specs.append(p.apply_async(__gen_spec, \
-                                       (part, part_eng, eng_gams, norm, verbose)))
-
-    p.close()
-    p.join()
-
-    return sum([spec.get() for spec in specs])
+    if method not in GAMMA_METHODS:
+        raise ValueError(
+            "Invalid method {!r}. Must be one of {}.".format(method, GAMMA_METHODS)
+        )
+
+    if len(particles) <= 2:
+        if len(particles) == 1:
+            spec = cspec_dict[particles[0]](eng_gams, cme)
+        else:
+            spec = __gen_spec_2body(particles, cme, eng_gams)
+        if return_errors:
+            return spec, np.zeros((len(particles), len(eng_gams)), dtype=np.float64)
+        return spec
+
+    convolve = _convolve_events if method == "events" else _convolve_histograms
+    spec, errs = convolve(particles, cme, eng_gams, mat_elem_sqrd, num_ps_pts,
+                          num_bins, verbose, batched, events)
+    if return_errors:
+        return spec, errs
+    return spec
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def gamma_point(np.ndarray particles, double cme,
                 double eng_gam, mat_elem_sqrd=lambda k_list: 1.0,
-                int num_ps_pts=1000, int num_bins=25):
+                int num_ps_pts=1000, int num_bins=25, batched=None,
+                events=None, method="histogram"):
     """Returns total gamma ray spectrum from final state particles.
 
     Parameters
@@ -183,52 +294,22 @@ def gamma_point(np.ndarray particles, double cme,
         Number of phase space points to use.
     num_bins : int
         Number of bins to use.
+    batched : bool
+        If True, ``mat_elem_sqrd`` takes an array of four momenta of shape
+        (num_ps_pts, num_fsp, 4). If None, functions decorated with
+        ``hazma.rambo.batched_matrix_element`` are treated as batched.
+    events : EventStore
+        Stored events of the final state to reweight by ``mat_elem_sqrd``
+        instead of generating new ones. ``num_ps_pts`` is then ignored.
+    method : str {"histogram"]
+        See ``gamma``.
 
     Returns
     -------
     spec : double
         Spectrum evaluated at ``eng_gam``.
     """
-    cdef int i, j
-    cdef int num_fsp
-    cdef np.ndarray masses
-    cdef np.ndarray hist
-    cdef double spec_val = 0.0
-    cdef double prefactor
-
-    masses = names_to_masses(particles)
-
-    num_fsp = len(masses)
-
-    hist = rambo.generate_energy_histogram(masses, cme, num_ps_pts, mat_elem_sqrd, num_bins)[0]
-
-    for i in range(num_bins):
-        for j in range(num_fsp):
-            if particles[j] is 'electron':
-                spec_val += 0.0
-            if particles[j] is 'muon':
-                spec_val += hist[j, 1, i] * \
-                            dm(eng_gam, hist[j, 0, i]) * \
-                            (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins
-            if particles[j] is 'charged_pion':
-                spec_val += hist[j, 1, i] * \
-                            dcp(eng_gam, hist[j, 0, i], "total") * \
-                            (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins
-            if particles[j] is 'neutral_pion':
-                spec_val += hist[j, 1, i] * \
-                            dnp(eng_gam, hist[j, 0, i]) * \
-                            (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins
-            if particles[j] is 'charged_kaon':
-                spec_val += hist[j, 1, i] * \
-                            dck(eng_gam, hist[j, 0, i], "total") * \
-                            (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins
-            if particles[j] is 'short_kaon':
-                spec_val += hist[j, 1, i] * \
-                            dsk(eng_gam, hist[j, 0, i], "total") * \
-                            (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins
-            if particles[j] is 'long_kaon':
-                spec_val += hist[j, 1, i] * \
-                            dlk(eng_gam, hist[j, 0, i], "total") * \
-                            (hist[j, 0, -1] - hist[j, 0, 0]) / num_bins
-
-    return spec_val * prefactor
+    return gamma(particles, cme, np.array([eng_gam], dtype=np.float64),
+                 mat_elem_sqrd=mat_elem_sqrd, num_ps_pts=num_ps_pts,
+                 num_bins=num_bins, batched=batched, events=events,
+                 method=method)[0]
@@ -0,0 +1,315 @@
+"""
+Module for managing the pool of workers used by hazma's Monte-Carlo routines.
+
+A single executor is created lazily the first time it is needed and is reused
+by all subsequent calls (e.g. ``rambo.generate_phase_space`` and
+``gamma_ray_generator.gamma``), so that the cost of starting worker processes
+is only paid once. The module also provides the seed sequences from which
+independent random number streams are derived for each chunk of work, and
+the number of OpenMP threads used by the compiled decay-spectrum kernels.
+
+@author: Logan Morrison and Adam Coogan
+"""
+import atexit
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+# Problems with fewer than this many phase space points are run in the calling
+# process.
+SERIAL_THRESHOLD = 10000
+
+_executor = None
+_executor_pid = None
+_owns_executor = False
+_num_workers = None
+_num_threads = None
+_serial_threshold = SERIAL_THRESHOLD
+_forked = False
+
+
+def _mark_forked():
+    global _forked
+    _forked = True
+
+
+# OpenMP's thread pool does not survive a fork: a forked child entering a
+# multi-threaded region after the parent ran one deadlocks.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_mark_forked)
+
+
+def cpu_count():
+    """Returns the number of available cpus (at least one)."""
+    return max(os.cpu_count() or 1, 1)
+
+
+def default_num_workers():
+    """
+    Returns the default number of workers: 75% of the available cpus (at
+    least one).
+    """
+    return max(int(np.floor(cpu_count() * 0.75)), 1)
+
+
+def _shutdown_owned_executor():
+    global _executor, _executor_pid, _owns_executor
+    if _owns_executor and _executor is not None:
+        _executor.shutdown(wait=True)
+    _executor = None
+    _executor_pid = None
+    _owns_executor = False
+
+
+atexit.register(_shutdown_owned_executor)
+
+
+def get_executor():
+    """
+    Returns the executor used for parallel tasks, creating a process pool
+    with ``num_workers()`` workers if none exists yet.
+
+    Returns
+    -------
+    executor : concurrent.futures.Executor
+        The shared executor.
+    """
+    global _executor, _executor_pid, _owns_executor
+    # An executor inherited through a fork is unusable in the child.
+    if _executor is not None and _executor_pid != os.getpid():
+        _executor = None
+        _owns_executor = False
+    if _executor is None:
+        _executor = ProcessPoolExecutor(num_workers())
+        _executor_pid = os.getpid()
+        _owns_executor = True
+    return _executor
+
+
+def set_executor(executor=None, num_workers=None):
+    """
+    Set the executor used for parallel tasks.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor, optional
+        Executor to use. Must implement ``submit``. If None, the default
+        process pool will be lazily created the next time it is needed.
+    num_workers : int, optional
+        Number of workers available in `executor`. Determines how work is
+        divided. If None, the number of cpus is assumed, or 75% of the cpus
+        for the default pool.
+    """
+    global _executor, _executor_pid, _owns_executor, _num_workers
+    _shutdown_owned_executor()
+    _executor = executor
+    _executor_pid = os.getpid() if executor is not None else None
+    _owns_executor = False
+    if num_workers is None and executor is not None:
+        num_workers = cpu_count()
+    _num_workers = num_workers
+
+
+def set_serial_threshold(threshold):
+    """
+    Set the problem size below which tasks are run serially in the calling
+    process.
+
+    Parameters
+    ----------
+    threshold : int
+        Minimum number of phase space points for which the executor is used.
+    """
+    global _serial_threshold
+    _serial_threshold = int(threshold)
+
+
+def serial_threshold():
+    """Returns the problem size below which tasks are run serially."""
+    return _serial_threshold
+
+
+def num_workers():
+    """Returns the number of workers of the current executor."""
+    if _num_workers is None:
+        return default_num_workers()
+    return _num_workers
+
+
+def set_num_threads(num_threads=None):
+    """
+    Set the number of threads used by the compiled kernels computing decay
+    spectra at many photon energies. In processes forked from the one
+    importing hazma, such as the workers of the default pool, the kernels
+    always use a single thread, since OpenMP is not fork-safe.
+
+    Parameters
+    ----------
+    num_threads : int, optional
+        Number of threads. If None, all available cpus are used.
+    """
+    global _num_threads
+    if num_threads is not None and int(num_threads) < 1:
+        raise ValueError("Number of threads must be at least 1.")
+    _num_threads = None if num_threads is None else int(num_threads)
+
+
+def num_threads():
+    """Returns the number of threads used by the compiled kernels."""
+    if _forked:
+        return 1
+    if _num_threads is None:
+        return cpu_count()
+    return _num_threads
+
+
+@contextmanager
+def use_executor(executor, num_workers=None):
+    """
+    Context manager temporarily setting the executor used for parallel tasks.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor
+        Executor to use inside the context.
+    num_workers : int, optional
+        Number of workers available in `executor`. If None, the number of
+        cpus is assumed.
+
+    Examples
+    --------
+
+    Run RAMBO on four worker processes::
+
+        from concurrent.futures import ProcessPoolExecutor
+        from hazma import rambo
+        from hazma.parallel import use_executor
+
+        with ProcessPoolExecutor(4) as pool, use_executor(pool, 4):
+            rambo.generate_phase_space([0., 0., 0.], 100., num_ps_pts=10**6)
+
+    """
+    global _executor, _executor_pid, _owns_executor, _num_workers
+    saved = (_executor, _executor_pid, _owns_executor, _num_workers)
+    _executor = executor
+    _executor_pid = os.getpid()
+    _owns_executor = False
+    _num_workers = num_workers if num_workers is not None else cpu_count()
+    try:
+        yield executor
+    finally:
+        _executor, _executor_pid, _owns_executor, _num_workers = saved
+
+
+def parallel_map(fn, args_list, parallel=True):
+    """
+    Evaluate `fn(*args)` for each `args` in `args_list` using the shared
+    executor.
+
+    Parameters
+    ----------
+    fn : callable
+        Picklable function to evaluate.
+    args_list : list of tuple
+        Arguments for each call of `fn`.
+    parallel : bool, optional
+        If False, or if only one worker is available, the calls are made
+        serially in the calling process.
+
+    Returns
+    -------
+    results : list
+        Results of each call, in the order of `args_list`.
+    """
+    if not parallel or num_workers() == 1 or len(args_list) <= 1:
+        return [fn(*args) for args in args_list]
+    executor = get_executor()
+    futures = [executor.submit(fn, *args) for args in args_list]
+    return [future.result() for future in futures]
+
+
+def seed_sequence(seed=None):
+    """
+    Returns a ``numpy.random.SeedSequence`` used to derive the random number
+    streams of hazma's Monte-Carlo routines.
+
+    Parameters
+    ----------
+    seed : None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed. If None, fresh entropy is drawn from the operating system. A
+        ``SeedSequence`` is returned as is; note that spawning from it
+        advances its state.
+
+    Returns
+    -------
+    seed_seq : numpy.random.SeedSequence
+        The seed sequence.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def spawn_seeds(seed, n):
+    """
+    Returns `n` independent seed sequences derived from `seed`. The streams
+    generated from the children do not overlap, so they can safely be used by
+    different workers.
+
+    Parameters
+    ----------
+    seed : None, int, array_like[int] or numpy.random.SeedSequence
+        Seed. See ``seed_sequence``.
+    n : int
+        Number of seed sequences to spawn.
+
+    Returns
+    -------
+    seeds : list of numpy.random.SeedSequence
+        The child seed sequences.
+    """
+    return seed_sequence(seed).spawn(n)
+
+
+def parallel_imap(fn, args_iter, parallel=True, max_pending=None):
+    """
+    Lazily evaluate `fn(*args)` for each `args` in `args_iter` using the
+    shared executor, yielding the results in order. At most `max_pending`
+    calls are in flight at any time, so that memory usage stays bounded.
+
+    Parameters
+    ----------
+    fn : callable
+        Picklable function to evaluate.
+    args_iter : iterable of tuple
+        Arguments for each call of `fn`.
+    parallel : bool, optional
+        If False, or if only one worker is available, the calls are made
+        serially in the calling process.
+    max_pending : int, optional
+        Maximum number of submitted calls whose results have not been
+        yielded yet. Defaults to twice the number of workers.
+
+    Yields
+    ------
+    result
+        Result of each call, in the order of `args_iter`.
+    """
+    if not parallel or num_workers() == 1:
+        for args in args_iter:
+            yield fn(*args)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * num_workers()
+    executor = get_executor()
+    pending = deque()
+    for args in args_iter:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
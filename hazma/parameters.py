@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 import numpy as np
-from scipy.integrate import trapz
+from scipy import sparse
 from scipy.interpolate import InterpolatedUnivariateSpline, interp1d
+from scipy.special import erf
 
 """
 Physics constants and utility functions.
@@ -181,6 +184,340 @@ def spec_res_fn(ep, e, energy_res):
         )
 
 
+# Number of detector responses kept by ``DetectorResponse.get``
+DETECTOR_RESPONSE_CACHE_SIZE = 16
+
+# Width of the band of the Gaussian resolution kernel in units of its
+# standard deviation. The neglected tails of the kernel have a relative
+# weight below erfc(KERNEL_NUM_SIGMA / sqrt(2)) ~ 1e-15.
+KERNEL_NUM_SIGMA = 8.0
+
+
+def _energy_res_array(energy_res, es):
+    """
+    Evaluates an energy resolution at an array of energies, falling back to
+    one call per energy for functions which only accept floats.
+    """
+    try:
+        res = np.asarray(energy_res(es), dtype=np.float64)
+    except (TypeError, ValueError):
+        res = None
+    if res is None or res.shape not in [(), es.shape]:
+        res = np.array([energy_res(e) for e in es], dtype=np.float64)
+    return np.broadcast_to(res, es.shape)
+
+
+def _interp_matrix(es, es_src):
+    """
+    Returns the weights of ``np.interp`` from the grid `es_src` to `es` as
+    the row, column and value arrays of a sparse matrix.
+    """
+    cols = np.clip(np.searchsorted(es_src, es, side="right") - 1, 0, len(es_src) - 2)
+    ts = np.clip((es - es_src[cols]) / (es_src[cols + 1] - es_src[cols]), 0.0, 1.0)
+    rows = np.arange(len(es))
+    return (
+        np.concatenate([rows, rows]),
+        np.concatenate([cols, cols + 1]),
+        np.concatenate([1.0 - ts, ts]),
+    )
+
+
+def gaussian_kernel(es, es_src, energy_res):
+    r"""
+    Returns the matrix convolving a spectrum tabulated on a grid with a
+    Gaussian resolution function whose width is proportional to the observed
+    energy.
+
+    Each row holds the trapezoidal weights of the grid times the resolution
+    function at one of the energies, normalized to unit sum as in
+    ``spec_res_fn``. The resolution function is truncated at
+    ``KERNEL_NUM_SIGMA`` standard deviations, so that the matrix is banded.
+
+    Parameters
+    ----------
+    es : np.array
+        Energies at which to evaluate the convolved spectra.
+    es_src : np.array
+        Increasing grid of energies on which the spectra are tabulated.
+    energy_res : float -> float
+        The detector's energy resolution (Delta E / E) as a function of
+        photon energy in MeV.
+
+    Returns
+    -------
+    kernel : scipy.sparse.csr_matrix
+        Matrix of shape (len(es), len(es_src)). Where the resolution function
+        is narrower than the spacing of the grid, its rows interpolate the
+        spectra instead.
+    """
+    es = np.asarray(es, dtype=np.float64)
+    es_src = np.asarray(es_src, dtype=np.float64)
+
+    # Weights of the trapezoidal rule on the grid
+    widths = np.diff(es_src)
+    weights = np.zeros_like(es_src)
+    weights[:-1] += 0.5 * widths
+    weights[1:] += 0.5 * widths
+
+    sigmas = es * _energy_res_array(energy_res, es)
+    lo = np.searchsorted(es_src, es - KERNEL_NUM_SIGMA * sigmas, side="left")
+    hi = np.searchsorted(es_src, es + KERNEL_NUM_SIGMA * sigmas, side="right")
+
+    # Indices of the grid points inside of the band of each kernel, padded
+    # with masked points up to the widest band.
+    idxs = lo[:, np.newaxis] + np.arange(max(np.max(hi - lo), 1))
+    in_band = idxs < hi[:, np.newaxis]
+    idxs = np.where(in_band, idxs, 0)
+
+    # The normalization of the Gaussian cancels in the ratio.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.where(
+            in_band,
+            weights[idxs]
+            * np.exp(
+                -0.5 * ((es_src[idxs] - es[:, np.newaxis]) / sigmas[:, np.newaxis]) ** 2
+            ),
+            0.0,
+        )
+    norms = np.sum(values, axis=1)
+    resolved = norms > 0
+    values /= np.where(resolved, norms, 1.0)[:, np.newaxis]
+
+    keep = in_band & resolved[:, np.newaxis]
+    rows = np.broadcast_to(np.arange(len(es))[:, np.newaxis], idxs.shape)[keep]
+    cols = idxs[keep]
+    values = values[keep]
+
+    unresolved = np.nonzero(~resolved)[0]
+    if len(unresolved) > 0:
+        interp_rows, interp_cols, interp_values = _interp_matrix(es[unresolved], es_src)
+        rows = np.concatenate([rows, unresolved[interp_rows]])
+        cols = np.concatenate([cols, interp_cols])
+        values = np.concatenate([values, interp_values])
+
+    return sparse.csr_matrix((values, (rows, cols)), shape=(len(es), len(es_src)))
+
+
+def convolve_gaussian(es, es_src, dnde_src, energy_res):
+    r"""
+    Convolves a spectrum tabulated on a grid with a Gaussian resolution
+    function whose width is proportional to the observed energy.
+
+    The result at each energy is the trapezoidal integral of the spectrum
+    times the resolution function over the grid, divided by the trapezoidal
+    integral of the resolution function, as in ``spec_res_fn``. See
+    ``gaussian_kernel``.
+
+    Parameters
+    ----------
+    es : np.array
+        Energies at which to evaluate the convolved spectrum.
+    es_src : np.array
+        Increasing grid of energies on which the spectrum is tabulated.
+    dnde_src : np.array
+        Spectrum on the grid.
+    energy_res : float -> float
+        The detector's energy resolution (Delta E / E) as a function of
+        photon energy in MeV.
+
+    Returns
+    -------
+    dnde_conv : np.array
+        Convolved spectrum at `es`. Where the kernel is narrower than the
+        spacing of the grid, the spectrum is interpolated instead.
+    """
+    kernel = gaussian_kernel(es, es_src, energy_res)
+    return kernel @ np.asarray(dnde_src, dtype=np.float64)
+
+
+class DetectorResponse:
+    """
+    Response of a detector with a Gaussian energy resolution, built once and
+    applied to any number of spectra.
+
+    The spectra are tabulated on a grid padded by a decade on each side of
+    [e_min, e_max] to avoid edge effects, and smeared onto `n_pts`
+    logarithmically spaced energies in [e_min, e_max] by a sparse matrix.
+    See ``gaussian_kernel``.
+
+    Parameters
+    ----------
+    e_min : float
+        Lower bound of energy range over which to perform convolution.
+    e_max : float
+        Upper bound of energy range over which to perform convolution.
+    energy_res : float -> float
+        The detector's energy resolution (Delta E / E) as a function of
+        photon energy in MeV, e.g. ``gamma_ray_parameters.energy_res_comptel``.
+    n_pts : int {1000]
+        Number of points of the grids.
+    effective_area : float -> float {None]
+        Effective area of the detector as a function of the true photon
+        energy, e.g. ``gamma_ray_parameters.A_eff_comptel``. If given, the
+        spectra are multiplied by it before being smeared, which gives
+        the rates of photons per unit flux. The lines are not affected.
+
+    Attributes
+    ----------
+    energies : np.array
+        Energies at which the convolved spectra are computed.
+    source_energies : np.array
+        Energies at which the spectra must be tabulated.
+    kernel : scipy.sparse.csr_matrix
+        Matrix of shape (n_pts, n_pts) mapping spectra on `source_energies`
+        to the convolved spectra on `energies`.
+
+    Examples
+    --------
+
+    Convolving the spectra of a scan over dark matter masses with the
+    resolution of COMPTEL::
+
+        from hazma.gamma_ray_parameters import energy_res_comptel
+        response = DetectorResponse(0.3, 30.0, energy_res_comptel)
+        dnde_srcs = np.array(
+            [model(mx).total_spectrum(response.source_energies, 2.0 * mx)
+             for mx in mxs]
+        )
+        dnde_convs = response.apply(dnde_srcs)
+
+    """
+
+    def __init__(self, e_min, e_max, energy_res, n_pts=1000, effective_area=None):
+        self.e_min = e_min
+        self.e_max = e_max
+        self.energy_res = energy_res
+        self.n_pts = n_pts
+        self.effective_area = effective_area
+
+        self.energies = np.geomspace(e_min, e_max, n_pts)
+        self.source_energies = np.geomspace(0.1 * e_min, 10 * e_max, n_pts)
+        self.kernel = gaussian_kernel(self.energies, self.source_energies, energy_res)
+        if effective_area is not None:
+            areas = np.broadcast_to(
+                np.asarray(effective_area(self.source_energies), dtype=np.float64),
+                self.source_energies.shape,
+            )
+            self.kernel = (self.kernel @ sparse.diags(areas)).tocsr()
+
+    @classmethod
+    @lru_cache(maxsize=DETECTOR_RESPONSE_CACHE_SIZE)
+    def get(cls, e_min, e_max, energy_res, n_pts=1000, effective_area=None):
+        """
+        Returns the response for the given arguments, building it only the
+        first time. The most recently used ``DETECTOR_RESPONSE_CACHE_SIZE``
+        responses are kept.
+        """
+        return cls(e_min, e_max, energy_res, n_pts, effective_area)
+
+    def apply(self, dnde_srcs):
+        """
+        Convolves spectra tabulated on `source_energies`.
+
+        Parameters
+        ----------
+        dnde_srcs : np.array
+            Spectra with shape (..., n_pts).
+
+        Returns
+        -------
+        dnde_convs : np.array
+            Convolved spectra on `energies`, with the same shape as
+            `dnde_srcs`.
+        """
+        dnde_srcs = np.asarray(dnde_srcs, dtype=np.float64)
+        flat = dnde_srcs.reshape(-1, self.n_pts)
+        return (self.kernel @ flat.T).T.reshape(dnde_srcs.shape)
+
+    def lines(self, lines):
+        """
+        Returns the spectrum of lines as seen by the detector on `energies`.
+
+        Parameters
+        ----------
+        lines : dict
+            Information about spectral lines, in the format returned by
+            ``Theory.gamma_ray_lines``.
+        """
+        dnde = np.zeros(self.energies.shape)
+        for ch, line in lines.items():
+            dnde += (
+                line["bf"]
+                * spec_res_fn(self.energies, line["energy"], self.energy_res)
+                * (2.0 if ch == "g g" else 1.0)
+            )
+        return dnde
+
+    def spectrum_fn(self, spec_fn=None, lines=None):
+        """
+        Returns an interpolator of a continuum and line spectrum as seen by
+        the detector. See ``convolved_spectrum_fn``.
+        """
+        dnde_conv = np.zeros(self.energies.shape)
+        if spec_fn is not None:
+            dnde_src = spec_fn(self.source_energies)
+            if not np.all(dnde_src == 0):
+                dnde_conv += self.apply(dnde_src)
+        if lines is not None:
+            dnde_conv += self.lines(lines)
+        return InterpolatedUnivariateSpline(self.energies, dnde_conv, k=1, ext="raise")
+
+
+def line_integrals(lines, energy_res, e_lows, e_highs, effective_area=None):
+    r"""
+    Integrates spectral lines smeared by a detector's Gaussian resolution
+    function over energy windows.
+
+    The integral of the resolution function ``spec_res_fn`` of each line
+    over [e_low, e_high] is computed exactly in terms of error functions, so
+    the lines do not need to be resolved by any grid.
+
+    Parameters
+    ----------
+    lines : dict
+        Information about spectral lines, in the format returned by
+        ``Theory.gamma_ray_lines``.
+    energy_res : float -> float
+        The detector's energy resolution (Delta E / E) as a function of
+        photon energy in MeV.
+    e_lows, e_highs : np.array
+        Lower and upper bounds of the energy windows.
+    effective_area : float -> float {None]
+        Effective area of the detector as a function of photon energy. If
+        given, each line is weighted by the area at its energy.
+
+    Returns
+    -------
+    integrals : np.array
+        Number of photons from the lines in each window, per decay or
+        annihilation, with the shape of the broadcasted bounds.
+    """
+    e_lows = np.asarray(e_lows, dtype=np.float64)
+    e_highs = np.asarray(e_highs, dtype=np.float64)
+    integrals = np.zeros(np.broadcast(e_lows, e_highs).shape)
+
+    for ch, line in lines.items():
+        e_line = line["energy"]
+        weight = line["bf"] * (2.0 if ch == "g g" else 1.0)
+        if effective_area is not None:
+            weight *= float(effective_area(e_line))
+        if weight == 0:
+            continue
+
+        sigma = e_line * energy_res(e_line)
+        if sigma == 0:
+            integrals += weight * ((e_lows <= e_line) & (e_line < e_highs))
+        else:
+            scale = np.sqrt(2.0) * sigma
+            integrals += (
+                0.5
+                * weight
+                * (erf((e_highs - e_line) / scale) - erf((e_lows - e_line) / scale))
+            )
+
+    return integrals
+
+
 def convolved_spectrum_fn(
     e_min, e_max, energy_res, spec_fn=None, lines=None, n_pts=1000
 ):
@@ -210,36 +547,14 @@ def convolved_spectrum_fn(
         An interpolator giving the DM annihilation spectrum as seen by the
         detector. Using photon energies outside the range [e_min, e_max] will
         produce a ``bounds_errors``.
-    """
-    es = np.geomspace(e_min, e_max, n_pts)
-    dnde_conv = np.zeros(es.shape)
-
-    # Pad energy grid to avoid edge effects
-    es_padded = np.geomspace(0.1 * e_min, 10 * e_max, n_pts)
-    if spec_fn is not None:
-        dnde_src = spec_fn(es_padded)
-        if not np.all(dnde_src == 0):
-
-            def integral(e):
-                """
-                Performs the integration at given photon energy.
-                """
-                spec_res_fn_vals = spec_res_fn(es_padded, e, energy_res)
-                integrand_vals = (
-                    dnde_src * spec_res_fn_vals / trapz(spec_res_fn_vals, es_padded)
-                )
-
-                return trapz(integrand_vals, es_padded)
-
-            dnde_conv += np.vectorize(integral)(es)
-
-    # Line contribution
-    if lines is not None:
-        for ch, line in lines.items():
-            dnde_conv += (
-                line["bf"]
-                * spec_res_fn(es, line["energy"], energy_res)
-                * (2.0 if ch == "g g" else 1.0)
-            )
 
-    return InterpolatedUnivariateSpline(es, dnde_conv, k=1, ext="raise")
+    Notes
+    -----
+    The continuum is convolved by the ``DetectorResponse`` of the arguments,
+    which is only built on the first call. Since only the far tails of the
+    kernels are dropped, it agrees with the untruncated trapezoidal integrals
+    to better than 1e-13 times the maximum of the convolved spectrum.
+    """
+    return DetectorResponse.get(e_min, e_max, energy_res, n_pts).spectrum_fn(
+        spec_fn, lines
+    )
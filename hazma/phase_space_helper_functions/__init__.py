@@ -1 +1,12 @@
-__all__ = ["generator", "histogram", "modifiers"]
+__all__ = [
+    "dalitz",
+    "event_store",
+    "generator",
+    "histogram",
+    "modifiers",
+    "native",
+    "qmc",
+    "sequential",
+    "statistics",
+    "vegas",
+]
@@ -0,0 +1,230 @@
+"""
+Deterministic quadrature rules over two- and three-body phase space.
+
+Two-body phase space is parametrized by the direction (cos(theta), phi) of
+the first particle. Three-body phase space is parametrized by the Mandelstam
+variables s = (P - p_1)^2 and t = (P - p_2)^2, which cover the Dalitz plot,
+and by the three Euler angles of the orientation of the final state. The
+Dalitz plot is covered with a Gauss-Legendre rule in t at fixed s and a
+Gauss-Legendre rule in the angle u, where s = s_min + (s_max - s_min) *
+(1 - cos(u)) / 2. The substitution removes the square-root behavior of the
+boundary of the Dalitz plot at s_min and s_max. Polar angles use
+Gauss-Legendre rules in their cosine and azimuthal angles use the
+trapezoidal rule.
+
+The rules are returned as phase space points in the format of
+``generator.generate_space``, with weights chosen such that the sum of the
+weights times the squared matrix element is the integral over phase space.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import numpy as np
+
+from hazma.field_theory_helper_functions.three_body_phase_space import (
+    phase_space_prefactor,
+    s_max,
+    s_min,
+)
+
+
+def __kallen_lambda(a, b, c):
+    return a ** 2 + b ** 2 + c ** 2 - 2.0 * (a * b + a * c + b * c)
+
+
+def __gauss_legendre(n, a, b):
+    """
+    Returns the nodes and weights of the `n`-point Gauss-Legendre rule on
+    [a, b]. Both `a` and `b` may be arrays, in which case the nodes and
+    weights have shape ``np.shape(a) + (n,)``.
+    """
+    xs, ws = np.polynomial.legendre.leggauss(n)
+    a = np.asarray(a, dtype=np.float64)[..., np.newaxis]
+    b = np.asarray(b, dtype=np.float64)[..., np.newaxis]
+    return 0.5 * (b - a) * xs + 0.5 * (b + a), 0.5 * (b - a) * ws
+
+
+def __periodic(n):
+    """
+    Returns the nodes and weights of the `n`-point trapezoidal rule on
+    [0, 2 pi), normalized to unit total weight.
+    """
+    return 2.0 * np.pi * (np.arange(n) + 0.5) / n, np.full(n, 1.0 / n)
+
+
+def __rot_y(angles):
+    c, s = np.cos(angles), np.sin(angles)
+    rot = np.zeros(angles.shape + (3, 3))
+    rot[..., 0, 0] = c
+    rot[..., 0, 2] = s
+    rot[..., 1, 1] = 1.0
+    rot[..., 2, 0] = -s
+    rot[..., 2, 2] = c
+    return rot
+
+
+def __rot_z(angles):
+    c, s = np.cos(angles), np.sin(angles)
+    rot = np.zeros(angles.shape + (3, 3))
+    rot[..., 0, 0] = c
+    rot[..., 0, 1] = -s
+    rot[..., 1, 0] = s
+    rot[..., 1, 1] = c
+    rot[..., 2, 2] = 1.0
+    return rot
+
+
+def __orientations(num_angle_pts):
+    """
+    Returns rotation matrices R = R_z(alpha) R_y(beta) R_z(gamma) and the
+    weights of a quadrature rule for the average over all orientations.
+    """
+    alphas, walphas = __periodic(num_angle_pts)
+    cbs, wcbs = __gauss_legendre(num_angle_pts, -1.0, 1.0)
+    gammas, wgammas = __periodic(num_angle_pts)
+
+    alphas, cbs, gammas = (
+        x.ravel() for x in np.meshgrid(alphas, cbs, gammas, indexing="ij")
+    )
+    weights = np.einsum("i,j,k->ijk", walphas, 0.5 * wcbs, wgammas).ravel()
+    rots = __rot_z(alphas) @ __rot_y(np.arccos(cbs)) @ __rot_z(gammas)
+    return rots, weights
+
+
+def __to_points(energies, momenta, weights):
+    """
+    Combine energies of shape (n, num_fsp), three-momenta of shape
+    (n, num_fsp, 3) and weights of shape (n,) into phase space points.
+    """
+    num_pts, num_fsp = energies.shape
+    points = np.empty((num_pts, 4 * num_fsp + 1))
+    fvs = points[:, : 4 * num_fsp].reshape(num_pts, num_fsp, 4)
+    fvs[:, :, 0] = energies
+    fvs[:, :, 1:] = momenta
+    points[:, 4 * num_fsp] = weights
+    return points
+
+
+def two_body_space(masses, cme, num_pts=16, num_angle_pts=1):
+    """
+    Returns the nodes of a quadrature rule over two-body phase space.
+
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of the two masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_pts : int {16]
+        Number of Gauss-Legendre nodes in the cosine of the polar angle of
+        the first particle.
+    num_angle_pts : int {1]
+        Number of trapezoidal nodes in the azimuthal angle of the first
+        particle.
+
+    Returns
+    -------
+    phase_space_points : numpy.ndarray
+        Array of shape (num_pts * num_angle_pts, 9) with the four-momenta
+        and weights of the nodes.
+    """
+    m1, m2 = masses
+    pmag = np.sqrt(__kallen_lambda(cme ** 2, m1 ** 2, m2 ** 2)) / (2.0 * cme)
+    e1 = np.hypot(pmag, m1)
+    e2 = np.hypot(pmag, m2)
+
+    cts, wcts = __gauss_legendre(num_pts, -1.0, 1.0)
+    phis, wphis = __periodic(num_angle_pts)
+    cts, phis = (x.ravel() for x in np.meshgrid(cts, phis, indexing="ij"))
+    weights = np.outer(0.5 * wcts, wphis).ravel()
+    sts = np.sqrt(1.0 - cts ** 2)
+
+    p1 = pmag * np.stack([sts * np.cos(phis), sts * np.sin(phis), cts], axis=-1)
+    energies = np.empty((len(cts), 2))
+    energies[:, 0] = e1
+    energies[:, 1] = e2
+    momenta = np.stack([p1, -p1], axis=1)
+
+    # The volume of two-body phase space is |p| / (4 pi cme).
+    return __to_points(energies, momenta, weights * pmag / (4.0 * np.pi * cme))
+
+
+def three_body_space(masses, cme, num_pts=16, num_angle_pts=1):
+    """
+    Returns the nodes of a quadrature rule over three-body phase space.
+
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of the three masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_pts : int {16]
+        Number of Gauss-Legendre nodes along each of the two directions of
+        the Dalitz plot.
+    num_angle_pts : int {1]
+        Number of nodes along each of the three Euler angles of the
+        orientation of the final state. Use 1 if the squared matrix element
+        does not depend on the orientation of the final state.
+
+    Returns
+    -------
+    phase_space_points : numpy.ndarray
+        Array of shape (num_pts**2 * num_angle_pts**3, 13) with the
+        four-momenta and weights of the nodes.
+    """
+    m1, m2, m3 = masses
+    smin = s_min(m1, m2, m3, cme)
+    smax = s_max(m1, m2, m3, cme)
+
+    us, wus = __gauss_legendre(num_pts, 0.0, np.pi)
+    ss = smin + 0.5 * (smax - smin) * (1.0 - np.cos(us))
+    wss = wus * 0.5 * (smax - smin) * np.sin(us)
+
+    # Boundaries of the Dalitz plot in t = m_13^2 at fixed s = m_23^2, from
+    # the energies of particles 1 and 3 in the rest frame of m_23.
+    e1s = (cme ** 2 - ss - m1 ** 2) / (2.0 * np.sqrt(ss))
+    e3s = (ss - m2 ** 2 + m3 ** 2) / (2.0 * np.sqrt(ss))
+    k1s = np.sqrt(np.maximum(e1s ** 2 - m1 ** 2, 0.0))
+    k3s = np.sqrt(np.maximum(e3s ** 2 - m3 ** 2, 0.0))
+    t_min = m1 ** 2 + m3 ** 2 + 2.0 * (e1s * e3s - k1s * k3s)
+    t_max = m1 ** 2 + m3 ** 2 + 2.0 * (e1s * e3s + k1s * k3s)
+    ts, wts = __gauss_legendre(num_pts, t_min, t_max)
+    ss = np.broadcast_to(ss[:, np.newaxis], ts.shape).ravel()
+    ts = ts.ravel()
+    dalitz_weights = (wss[:, np.newaxis] * wts).ravel()
+
+    e1 = (cme ** 2 + m1 ** 2 - ss) / (2.0 * cme)
+    e2 = (cme ** 2 + m2 ** 2 - ts) / (2.0 * cme)
+    e3 = cme - e1 - e2
+    k1 = np.sqrt(np.maximum(e1 ** 2 - m1 ** 2, 0.0))
+    k2 = np.sqrt(np.maximum(e2 ** 2 - m2 ** 2, 0.0))
+    k3sq = np.maximum(e3 ** 2 - m3 ** 2, 0.0)
+    # Put p_1 along z and p_2 in the xz-plane.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        c12 = (k3sq - k1 ** 2 - k2 ** 2) / (2.0 * k1 * k2)
+    c12 = np.clip(np.nan_to_num(c12), -1.0, 1.0)
+    body = np.zeros((len(ss), 3, 3))
+    body[:, 0, 2] = k1
+    body[:, 1, 0] = k2 * np.sqrt(1.0 - c12 ** 2)
+    body[:, 1, 2] = k2 * c12
+    body[:, 2] = -body[:, 0] - body[:, 1]
+
+    rots, orient_weights = __orientations(num_angle_pts)
+    momenta = np.einsum("kab,nib->knia", rots, body).reshape(-1, 3, 3)
+    energies = np.tile(np.stack([e1, e2, e3], axis=-1), (len(rots), 1))
+    weights = np.outer(orient_weights, dalitz_weights).ravel()
+
+    return __to_points(energies, momenta, weights * phase_space_prefactor(cme))
+
+
+def generate_space(masses, cme, num_pts=16, num_angle_pts=1):
+    """
+    Returns the nodes of a quadrature rule over two- or three-body phase
+    space. See ``two_body_space`` and ``three_body_space``.
+    """
+    masses = np.asarray(masses, dtype=np.float64)
+    if len(masses) == 2:
+        return two_body_space(masses, cme, num_pts, num_angle_pts)
+    if len(masses) == 3:
+        return three_body_space(masses, cme, num_pts, num_angle_pts)
+    raise ValueError("Only two- and three-body phase space is supported.")
@@ -0,0 +1,305 @@
+"""
+Stores of RAMBO events which can be reweighted by different matrix elements.
+
+When scanning the couplings of a model, the kinematics of a final state (its
+masses and center-of-mass energy) stay fixed. An ``EventStore`` generates the
+phase space points once and keeps them, optionally in a ``.npy`` file which
+is memory-mapped and shared between sessions. Integrals and histograms for
+a new matrix element then only cost one pass of the matrix element over the
+stored points.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from hazma import parallel
+from hazma import rambo
+from hazma.hazma_errors import RamboCMETooSmall
+from hazma.phase_space_helper_functions import histogram
+from hazma.phase_space_helper_functions import statistics
+
+# Version of the file format of stored events. Bump it when the way events
+# are generated changes, so that stale files are not reused.
+EVENT_STORE_VERSION = 1
+
+
+class EventStore:
+    """
+    Phase space points of a final state, generated once with RAMBO and
+    reweighted by matrix elements on demand.
+
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_ps_pts : int {10000]
+        Number of phase space points to generate.
+    seed : int or array_like[int] {0]
+        Seed for the random number generators (see
+        ``rambo.generate_phase_space``). Stores with the same masses, energy,
+        number of points and seed contain identical events.
+    cache_dir : str {None]
+        Directory in which the events are saved as a ``.npy`` file named
+        after their key. If the file exists, the events are memory-mapped
+        from it instead of being generated. If None, the events are kept in
+        memory.
+    unweighted : bool {False]
+        If true, the events are unweighted by hit-or-miss sampling, so that
+        they all have the same phase space weight (the mean weight of the
+        generated points). Fewer than `num_ps_pts` events are kept, unless
+        the weights are constant, e.g. for massless final states.
+    num_cpus : int {None]
+        Number of cpus used to generate the events. See
+        ``rambo.generate_phase_space``.
+
+    Examples
+    --------
+
+    Scanning the coupling of the pseudo-scalar mediator to up quarks, using
+    the same events for each value::
+
+        from hazma.gamma_ray import gamma_ray_decay
+        particles = ["charged_pion", "charged_pion", "neutral_pion"]
+        events = EventStore([mpi, mpi, mpi0], cme, 10000, seed=1)
+        for gpuu in np.linspace(0.1, 1.0, 10):
+            model.gpuu = gpuu
+            gamma_ray_decay(
+                particles,
+                cme,
+                egams,
+                mat_elem_sqrd=model.native_msqrd("pm0"),
+                events=events,
+            )
+
+    """
+
+    def __init__(
+        self,
+        masses,
+        cme,
+        num_ps_pts=10000,
+        seed=0,
+        cache_dir=None,
+        unweighted=False,
+        num_cpus=None,
+    ):
+        if not hasattr(masses, "__len__"):
+            masses = [masses]
+        self.masses = np.array(masses, dtype=np.float64)
+        self.cme = float(cme)
+        self.num_ps_pts = int(num_ps_pts)
+        self.seed = seed
+        self.unweighted = unweighted
+        self.num_fsp = len(self.masses)
+
+        if self.cme < np.sum(self.masses):
+            raise RamboCMETooSmall()
+        if cache_dir is not None and seed is None:
+            raise ValueError("Events can only be cached for a fixed seed.")
+
+        if cache_dir is None:
+            self.path = None
+            self.events = self._generate(num_cpus)
+        else:
+            self.path = os.path.join(cache_dir, "rambo-{}.npy".format(self.key))
+            if not os.path.exists(self.path):
+                os.makedirs(cache_dir, exist_ok=True)
+                self._save(num_cpus)
+            self.events = np.load(self.path, mmap_mode="r")
+
+    @property
+    def key(self):
+        """
+        Key identifying the events, computed from the masses, the
+        center-of-mass energy, the number of points, the seed and whether
+        the events are unweighted.
+        """
+        seed = None if self.seed is None else np.asarray(self.seed).tolist()
+        spec = repr(
+            (
+                EVENT_STORE_VERSION,
+                self.masses.tolist(),
+                self.cme,
+                self.num_ps_pts,
+                seed,
+                bool(self.unweighted),
+            )
+        )
+        return hashlib.sha1(spec.encode()).hexdigest()[:16]
+
+    @property
+    def num_events(self):
+        """Number of stored events."""
+        return self.events.shape[0]
+
+    def _generate(self, num_cpus):
+        events = rambo.generate_phase_space(
+            self.masses,
+            self.cme,
+            self.num_ps_pts,
+            num_cpus=num_cpus,
+            seed=self.seed,
+        )
+        if not self.unweighted:
+            return events
+
+        weights = events[:, -1]
+        mean, wmax = np.mean(weights), np.max(weights)
+        # Use a stream independent of those of the chunks of points.
+        num_chunks = -(-self.num_ps_pts // rambo.RNG_CHUNK_SIZE)
+        seed = parallel.spawn_seeds(self.seed, num_chunks + 1)[-1]
+        rng = np.random.default_rng(seed)
+        keep = rng.uniform(size=len(weights)) * wmax <= weights
+        events = events[keep]
+        events[:, -1] = mean
+        return events
+
+    def _save(self, num_cpus):
+        # Write to a temporary file first, so that concurrent sessions never
+        # see a partially written file.
+        fd, tmp = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(self.path))
+        os.close(fd)
+        try:
+            if self.unweighted:
+                np.save(tmp, self._generate(num_cpus))
+            else:
+                # Stream the points to the file in bounded memory.
+                events = np.lib.format.open_memmap(
+                    tmp,
+                    mode="w+",
+                    dtype=np.float64,
+                    shape=(self.num_ps_pts, 4 * self.num_fsp + 1),
+                )
+                start = 0
+                for points in rambo.generate_phase_space_chunks(
+                    self.masses,
+                    self.cme,
+                    self.num_ps_pts,
+                    num_cpus=num_cpus,
+                    seed=self.seed,
+                ):
+                    events[start : start + len(points)] = points
+                    start += len(points)
+                events.flush()
+                del events
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def check_kinematics(self, masses, cme):
+        """
+        Raise a ValueError if the events do not describe the final state
+        with the given masses and center-of-mass energy.
+        """
+        masses = np.atleast_1d(np.asarray(masses, dtype=np.float64))
+        if (
+            masses.shape != self.masses.shape
+            or not np.allclose(masses, self.masses, rtol=1e-12, atol=0.0)
+            or not np.isclose(cme, self.cme, rtol=1e-12, atol=0.0)
+        ):
+            raise ValueError(
+                "The events were generated for masses {} and cme {}.".format(
+                    self.masses, self.cme
+                )
+            )
+
+    def reweighted_chunks(self, mat_elem_sqrd=lambda momenta: 1, batched=None):
+        """
+        Yield the stored events in chunks of at most ``rambo.RNG_CHUNK_SIZE``
+        points, with their weights multiplied by a squared matrix element.
+
+        Parameters
+        ----------
+        mat_elem_sqrd : (double)(numpy.ndarray) {lambda momenta: 1]
+            Function for the matrix element squared. Batched and native
+            matrix elements are evaluated with one vectorized pass over each
+            chunk.
+        batched : bool {None]
+            See ``rambo.generate_phase_space``.
+
+        Yields
+        ------
+        points : numpy.ndarray
+            Copy of a chunk of the events with new weights.
+        """
+        is_batched = rambo._is_batched(mat_elem_sqrd, batched)
+        for start in range(0, self.num_events, rambo.RNG_CHUNK_SIZE):
+            points = np.array(self.events[start : start + rambo.RNG_CHUNK_SIZE])
+            yield rambo._apply_matrix_elem(
+                points, self.num_fsp, mat_elem_sqrd, is_batched
+            )
+
+    def weights(self, mat_elem_sqrd=lambda momenta: 1, batched=None):
+        """
+        Returns the weights of the events reweighted by a squared matrix
+        element.
+        """
+        chunks = self.reweighted_chunks(mat_elem_sqrd, batched)
+        return np.concatenate([points[:, -1] for points in chunks])
+
+    def integrate(self, mat_elem_sqrd=lambda momenta: 1, batched=None):
+        """
+        Returns the integral over phase space of a squared matrix element,
+        computed from the stored events.
+
+        Returns
+        -------
+        integral : float
+            The result of the integral over phase space.
+        std : float
+            The estimated error in the integral over phase space.
+        """
+        stats = statistics.WeightStatistics()
+        for points in self.reweighted_chunks(mat_elem_sqrd, batched):
+            stats.update(points[:, -1])
+        return stats.mean, stats.std_of_mean
+
+    def energy_histogram(
+        self, mat_elem_sqrd=lambda momenta: 1, num_bins=25, density=False, batched=None
+    ):
+        """
+        Returns energy histograms of the final state particles reweighted by a
+        squared matrix element, in the format of
+        ``rambo.generate_energy_histogram``.
+        """
+        hist = statistics.EnergyHistogram(self.masses, self.cme, num_bins)
+        for points in self.reweighted_chunks(mat_elem_sqrd, batched):
+            hist.update(points)
+        return hist.result(density=density)
+
+    def energy_sample(self, mat_elem_sqrd=lambda momenta: 1, batched=None):
+        """
+        Returns the energies of the final state particles and the weights of
+        the events reweighted by a squared matrix element, in the format of
+        ``rambo.generate_energy_sample``.
+        """
+        sample = statistics.EnergySample(self.num_fsp)
+        for points in self.reweighted_chunks(mat_elem_sqrd, batched):
+            sample.update(points)
+        return sample.result()
+
+    def histograms(
+        self,
+        observables,
+        bins=25,
+        mat_elem_sqrd=lambda momenta: 1,
+        density=False,
+        batched=None,
+    ):
+        """
+        Returns histograms of several observables reweighted by a squared
+        matrix element, in the format of ``rambo.generate_histograms``.
+        """
+        edges, clip = rambo._histogram_edges(observables, bins, self.masses, self.cme)
+        hist = histogram.WeightedHistogram(observables, edges, self.num_fsp, clip=clip)
+        for points in self.reweighted_chunks(mat_elem_sqrd, batched):
+            hist.update(points)
+        return hist.result(density=density)
@@ -1,10 +1,28 @@
 import numpy as np
 cimport numpy as np
+from libcpp.vector cimport vector
 
-cdef extern from "<vector>" namespace "std":
-    cdef cppclass vector[T]:
-        void push_back(T&) nogil except+
-        size_t size() nogil
-        T& operator[](size_t)
+cdef extern from "<random>" namespace "std":
+    cdef cppclass seed_seq nogil:
+        seed_seq() except +
+        seed_seq(vector[unsigned int].iterator, vector[unsigned int].iterator) except +
 
-cdef vector[vector[double]] c_generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fsp)
+    cdef cppclass mt19937 nogil:
+        mt19937() nogil
+        mt19937(unsigned int seed) nogil
+        void seed(seed_seq&) nogil
+
+    cdef cppclass random_device nogil:
+        random_device() except +
+        unsigned int operator()()
+
+    cdef cppclass uniform_real_distribution[T] nogil:
+        uniform_real_distribution() nogil
+        uniform_real_distribution(T a, T b) nogil
+        T operator()(mt19937 gen) nogil
+
+cdef mt19937 c_make_rng(vector[unsigned int] &seed)
+cdef vector[unsigned int] seed_words(seed)
+cdef mt19937 make_rng(seed)
+cdef vector[double] c_generate_point(vector[double] masses, double cme, int num_fsp, mt19937 &rng) nogil
+cdef vector[vector[double]] c_generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fsp, mt19937 &rng) nogil
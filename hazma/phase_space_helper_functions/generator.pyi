@@ -2,9 +2,17 @@ import numpy as np
 import numpy.typing as npt
 
 
-def generate_point(masses: npt.ArrayLike, cme: float, num_fsp: int):
+def generate_point(masses: npt.ArrayLike, cme: float, num_fsp: int, seed=None):
     ...
 
 
-def generate_space(num_ps_pts: int, masses: npt.ArrayLike, cme: float, num_fsp: int):
+def generate_space(
+    num_ps_pts: int, masses: npt.ArrayLike, cme: float, num_fsp: int, seed=None
+):
+    ...
+
+
+def generate_space_from_uniform(
+    rands: npt.NDArray[np.float64], masses: npt.ArrayLike, cme: float, num_fsp: int
+) -> npt.NDArray[np.float64]:
     ...
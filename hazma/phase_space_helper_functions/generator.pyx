@@ -9,35 +9,62 @@ import numpy as np
 cimport numpy as np
 from libc.math cimport log, M_PI, sqrt, tgamma, fabs, pow, cos, sin
 from libcpp cimport bool
+from libcpp.vector cimport vector
+from cython.operator cimport dereference as deref
 import cython
 
-cdef extern from "<random>" namespace "std":
-    cdef cppclass mt19937 nogil:
-        mt19937() nogil
-        mt19937(unsigned int seed) nogil
-
-    cdef cppclass random_device nogil:
-        random_device() except +
-        unsigned int operator()()
-
-    cdef cppclass uniform_real_distribution[T] nogil:
-        uniform_real_distribution() nogil
-        uniform_real_distribution(T a, T b) nogil
-        T operator()(mt19937 gen) nogil
+from hazma.parallel import seed_sequence
 
 cdef uniform_real_distribution[double] uniform \
     = uniform_real_distribution[double](0., 1.)
 
-cdef mt19937 rng
+# Number of 32-bit words used to seed each random number generator.
+cdef int SEED_SIZE = 8
+
+
+cdef mt19937 c_make_rng(vector[unsigned int] &seed):
+    """
+    Create a Mersenne-Twister random number generator.
+
+    Parameters
+    ----------
+    seed : vector[unsigned int]
+        32-bit words used to seed the generator through a ``std::seed_seq``.
+        If empty, the generator is seeded using ``std::random_device``.
+
+    Returns
+    -------
+    rng : mt19937
+        The seeded random number generator.
+    """
+    cdef random_device rd
+    cdef mt19937 rng
+    cdef seed_seq *seq
+
+    if seed.size() == 0:
+        rng = mt19937(rd())
+    else:
+        seq = new seed_seq(seed.begin(), seed.end())
+        rng.seed(deref(seq))
+        del seq
+    return rng
+
+
+cdef vector[unsigned int] seed_words(seed):
+    """
+    Convert any seed accepted by ``hazma.parallel.seed_sequence`` into the
+    32-bit words used by ``c_make_rng``.
+    """
+    return seed_sequence(seed).generate_state(SEED_SIZE)
 
-cdef extern from "<vector>" namespace "std":
-    cdef cppclass vector[T]:
-        void push_back(T&) nogil except+
-        size_t size() nogil
-        T& operator[](size_t)
 
-cdef extern from "random" namespace "std":
-    cdef cppclass random
+cdef mt19937 make_rng(seed):
+    """
+    Create a random number generator from any seed accepted by
+    ``hazma.parallel.seed_sequence``.
+    """
+    cdef vector[unsigned int] words = seed_words(seed)
+    return c_make_rng(words)
 
 
 @cython.boundscheck(False)
@@ -188,19 +215,17 @@ cdef double __get_mass(vector[double] fv) nogil:
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef vector[double] __generate_qs(vector[double] masses, double cme, int num_fsp):
+cdef vector[double] __generate_qs_from_uniform(int num_fsp, vector[double] &rands) nogil:
     """
-    Computes isotropic, random four-vectors with energies, q_0, distributed
-    according to q_0 * exp(-q_0).
+    Computes isotropic four-vectors with energies, q_0, distributed according
+    to q_0 * exp(-q_0) from a set of numbers uniformly distributed on (0,1).
 
     Parameters
     ----------
-    masses : double[:]
-        List of masses of the final state particles.
-    cme : double
-        Center of mass energy of the process.
+    num_fsp : int
+        Number of final state particles.
     rands : double[:]
-        List of the random numbers uniformly distributed on (0,1).
+        List of 4 * num_fsp numbers uniformly distributed on (0,1).
 
     Returns
     -------
@@ -212,17 +237,13 @@ cdef vector[double] __generate_qs(vector[double] masses, double cme, int num_fsp
     cdef double c, phi
     cdef double q_e, q_x, q_y, q_z
 
-    # cdef double[:] qs = np.empty(num_fsp * 4 + 1, dtype=np.float64)
-    cdef vector[double] qs
-
-    for _ in range(num_fsp * 4 + 1):
-        qs.push_back(0)
+    cdef vector[double] qs = vector[double](num_fsp * 4 + 1, 0.0)
 
     for i in range(num_fsp):
-        rho_1 = uniform(rng)
-        rho_2 = uniform(rng)
-        rho_3 = uniform(rng)
-        rho_4 = uniform(rng)
+        rho_1 = rands[4 * i + 0]
+        rho_2 = rands[4 * i + 1]
+        rho_3 = rands[4 * i + 2]
+        rho_4 = rands[4 * i + 3]
 
         c = 2.0 * rho_1 - 1.0
         phi = 2.0 * M_PI * rho_2
@@ -243,7 +264,38 @@ cdef vector[double] __generate_qs(vector[double] masses, double cme, int num_fsp
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef vector[double] __generate_ps(vector[double] masses, double cme, int num_fsp, vector[double] qs):
+cdef vector[double] __generate_qs(vector[double] masses, double cme, int num_fsp, mt19937 &rng) nogil:
+    """
+    Computes isotropic, random four-vectors with energies, q_0, distributed
+    according to q_0 * exp(-q_0).
+
+    Parameters
+    ----------
+    masses : double[:]
+        List of masses of the final state particles.
+    cme : double
+        Center of mass energy of the process.
+    rng : mt19937
+        Random number generator.
+
+    Returns
+    -------
+    qs : double[:]
+        List of the massless four-momenta.
+    """
+    cdef int i
+    cdef vector[double] rands = vector[double](4 * num_fsp)
+
+    for i in range(4 * num_fsp):
+        rands[i] = uniform(rng)
+
+    return __generate_qs_from_uniform(num_fsp, rands)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef vector[double] __generate_ps(vector[double] masses, double cme, int num_fsp, vector[double] qs) nogil:
     """
     Generates a list of four-momentum with correct center of mass energy from
     isotropic, random four-momentum with energies, q_0,  distributed according
@@ -322,7 +374,7 @@ cdef vector[double] __generate_ps(vector[double] masses, double cme, int num_fsp
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef vector[double] __generate_ks(vector[double] masses, double cme, int num_fsp, vector[double] ps):
+cdef vector[double] __generate_ks(vector[double] masses, double cme, int num_fsp, vector[double] ps) nogil:
     """
     Generates a list of four-momentum with correct masses from massless
     four-momenta.
@@ -380,7 +432,7 @@ cdef vector[double] __generate_ks(vector[double] masses, double cme, int num_fsp
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def generate_point(vector[double] masses, double cme, int num_fsp):
+def generate_point(vector[double] masses, double cme, int num_fsp, seed=None):
     """
     Generate a single relativistic phase space point.
 
@@ -390,8 +442,9 @@ def generate_point(vector[double] masses, double cme, int num_fsp):
         List of masses of the final state particles.
     cme : double
         Center of mass energy of the process.
-    rands : double[:]
-        List of random numbers.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence
+        Seed for the random number generator. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
@@ -399,29 +452,27 @@ def generate_point(vector[double] masses, double cme, int num_fsp):
         List of four momenta and a event weight. The returned numpy array is of
         the form {ke1, kx1, ky1, kz1, ..., keN, kxN, kyN, kzN, weight}.
     """
-    global rng
-    cdef random_device rd
-    rng = mt19937(rd())
-    return c_generate_point(masses, cme, num_fsp)
+    cdef mt19937 rng = make_rng(seed)
+    return c_generate_point(masses, cme, num_fsp, rng)
 
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef vector[double] c_generate_point(vector[double] masses, double cme, int num_fsp):
+cdef vector[double] c_generate_point(vector[double] masses, double cme, int num_fsp, mt19937 &rng) nogil:
     """
     c version of generate_point.
     """
 
     return __generate_ks(masses, cme, num_fsp,
                          __generate_ps(masses, cme, num_fsp,
-                                        __generate_qs(masses, cme, num_fsp)))
+                                        __generate_qs(masses, cme, num_fsp, rng)))
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fsp):
+def generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fsp, seed=None):
     """
     Generate a specified number of phase space points given a set of
     final state particles and a given center of mass energy.
@@ -434,8 +485,9 @@ def generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fs
         List of masses of the final state particles.
     cme : double
         Center-of-mass-energy of the process.
-    mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1}
-        Function for the matrix element squared.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence
+        Seed for the random number generator. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
@@ -447,7 +499,8 @@ def generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fs
             .
          {ke1N, kx1N, ky1N, kz1N, ..., keNN, kxNN, kyNN, kzNN, weightN}}
     """
-    return c_generate_space(num_ps_pts, masses, cme, num_fsp)
+    cdef mt19937 rng = make_rng(seed)
+    return c_generate_space(num_ps_pts, masses, cme, num_fsp, rng)
 
 
 
@@ -455,7 +508,8 @@ def generate_space(int num_ps_pts, vector[double] masses, double cme, int num_fs
 @cython.wraparound(False)
 cdef vector[vector[double]] c_generate_space(int num_ps_pts,
                                              vector[double] masses,
-                                             double cme, int num_fsp):
+                                             double cme, int num_fsp,
+                                             mt19937 &rng) nogil:
     """
     Generate a specified number of phase space points given a set of
     final state particles and a given center of mass energy.
@@ -468,8 +522,8 @@ cdef vector[vector[double]] c_generate_space(int num_ps_pts,
         List of masses of the final state particles.
     cme : double
         Center-of-mass-energy of the process.
-    mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1}
-        Function for the matrix element squared.
+    rng : mt19937
+        Random number generator used to generate the points.
 
     Returns
     -------
@@ -482,15 +536,63 @@ cdef vector[vector[double]] c_generate_space(int num_ps_pts,
          {ke1N, kx1N, ky1N, kz1N, ..., keNN, kxNN, kyNN, kzNN, weightN}}
     """
     cdef int i
-
-    global rng
-    cdef random_device rd
-    rng = mt19937(rd())
-
     cdef vector[vector[double]] space
 
     for i in range(num_ps_pts):
-        space.push_back(c_generate_point(masses, cme, num_fsp))
+        space.push_back(c_generate_point(masses, cme, num_fsp, rng))
+
+
+    return space
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def generate_space_from_uniform(np.ndarray[np.float64_t, ndim=2] rands,
+                                vector[double] masses, double cme,
+                                int num_fsp):
+    """
+    Generate phase space points from user supplied numbers in (0,1) instead
+    of the internal random number generator, e.g. from a quasi-random
+    sequence.
+
+    Parameters
+    ----------
+    rands : numpy.ndarray
+        Array of shape (num_ps_pts, 4 * num_fsp) of numbers in (0,1). The
+        numbers 4i, ..., 4i+3 of each row determine the direction and energy
+        of the i-th massless momentum.
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_fsp : int
+        Number of final state particles.
+
+    Returns
+    -------
+    phase_space_points : numpy.ndarray
+        Array of shape (num_ps_pts, 4 * num_fsp + 1) containing the phase
+        space points, in the same format as ``generate_space``.
+    """
+    cdef int i, j
+    cdef int num_ps_pts = rands.shape[0]
+    cdef vector[double] row = vector[double](4 * num_fsp)
+    cdef vector[double] point
+    cdef np.ndarray[np.float64_t, ndim=2] space = \
+        np.empty((num_ps_pts, 4 * num_fsp + 1), dtype=np.float64)
+
+    if rands.shape[1] != 4 * num_fsp:
+        raise ValueError("`rands` must have shape (num_ps_pts, 4 * num_fsp).")
+
+    for i in range(num_ps_pts):
+        for j in range(4 * num_fsp):
+            row[j] = rands[i, j]
+        point = __generate_ks(
+            masses, cme, num_fsp,
+            __generate_ps(masses, cme, num_fsp,
+                          __generate_qs_from_uniform(num_fsp, row))
+        )
+        for j in range(4 * num_fsp + 1):
+            space[i, j] = point[j]
+
     return space
@@ -1,6 +1,73 @@
+from typing import List, Sequence, Tuple, Union
+
 import numpy as np
 import numpy.typing as npt
 
+Observable = Tuple
+
+
+def linear_bins(lo: float, hi: float, num_bins: int) -> npt.NDArray[np.float64]:
+    ...
+
+
+def log_bins(lo: float, hi: float, num_bins: int) -> npt.NDArray[np.float64]:
+    ...
+
+
+def kinematic_range(
+    observable: Observable, masses: npt.ArrayLike, cme: float
+) -> Tuple[float, float]:
+    ...
+
+
+class WeightedHistogram:
+    observables: Tuple[Observable, ...]
+    num_fsp: int
+    clip: Tuple[bool, ...]
+    count: int
+
+    def __init__(
+        self,
+        observables: Sequence[Observable],
+        edges: Sequence[npt.ArrayLike],
+        num_fsp: int,
+        clip: Union[bool, Sequence[bool]] = False,
+    ) -> None:
+        ...
+
+    @property
+    def edges(self) -> List[npt.NDArray[np.float64]]:
+        ...
+
+    @property
+    def sum_weights(self) -> List[npt.NDArray[np.float64]]:
+        ...
+
+    @property
+    def sum_weights_sqrd(self) -> List[npt.NDArray[np.float64]]:
+        ...
+
+    def update(self, pts: npt.NDArray[np.float64]) -> None:
+        ...
+
+    def merge_sums(
+        self,
+        count: int,
+        sum_weights: npt.NDArray[np.float64],
+        sum_weights_sqrd: npt.NDArray[np.float64],
+    ) -> None:
+        ...
+
+    def merge(self, other: "WeightedHistogram") -> None:
+        ...
+
+    def result(
+        self, density: bool = False
+    ) -> List[
+        Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]
+    ]:
+        ...
+
 
 def space_to_energy_hist(
     pts: npt.NDArray[np.float64],
@@ -8,5 +75,5 @@ def space_to_energy_hist(
     num_fsp: int,
     num_bins: int,
     density: bool = False,
-) -> npt.NDArray[np.float64]:
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
     ...
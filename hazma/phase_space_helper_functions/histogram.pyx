@@ -1,5 +1,12 @@
 """
-Generate histograms of the energies of particles.
+Weighted histograms of observables of phase space points.
+
+``WeightedHistogram`` fills histograms of any number of observables (the
+energies of the final state particles, invariant masses and angles of pairs
+of particles, ...) in a single pass over a chunk of phase space points,
+accumulating the sum of the weights and of the squared weights in each bin.
+Partial histograms, e.g. from different workers, can be combined with
+``merge``.
 
 * Author - Logan A. Morrison and Adam Coogan
 * Date - December 2017
@@ -8,70 +15,459 @@ Generate histograms of the energies of particles.
 import numpy as np
 cimport numpy as np
 import cython
+from libc.math cimport floor, log, sqrt
+from libcpp.vector cimport vector
+from libcpp.algorithm cimport upper_bound
+
+# Kinds of observables
+cdef enum:
+    ENERGY = 0
+    INVARIANT_MASS = 1
+    COS_ANGLE = 2
+    COS_THETA = 3
+
+# Kinds of bins
+cdef enum:
+    LINEAR_BINS = 0
+    LOG_BINS = 1
+    CUSTOM_BINS = 2
+
+OBSERVABLES = {
+    "energy": (ENERGY, 1),
+    "invariant_mass": (INVARIANT_MASS, 2),
+    "cos_angle": (COS_ANGLE, 2),
+    "cos_theta": (COS_THETA, 1),
+}
+
+
+def linear_bins(lo, hi, num_bins):
+    """
+    Returns `num_bins` equally spaced bins between `lo` and `hi`.
+    """
+    return np.linspace(lo, hi, num_bins + 1)
+
+
+def log_bins(lo, hi, num_bins):
+    """
+    Returns `num_bins` logarithmically spaced bins between `lo` and `hi`.
+    """
+    return np.geomspace(lo, hi, num_bins + 1)
+
+
+def kinematic_range(observable, masses, cme):
+    """
+    Returns the kinematically allowed range of an observable.
+
+    Parameters
+    ----------
+    observable : tuple
+        Observable, in the format used by ``WeightedHistogram``.
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+
+    Returns
+    -------
+    lo, hi : float
+        Smallest and largest values of the observable.
+    """
+    masses = np.asarray(masses, dtype=np.float64)
+    msum = np.sum(masses)
+    name = observable[0]
+    if name == "energy":
+        m = masses[observable[1]]
+        return m, (cme ** 2 + m ** 2 - (msum - m) ** 2) / (2.0 * cme)
+    if name == "invariant_mass":
+        m12 = masses[observable[1]] + masses[observable[2]]
+        return m12, cme - (msum - m12)
+    if name in ("cos_angle", "cos_theta"):
+        return -1.0, 1.0
+    raise ValueError(
+        "Unknown observable {!r}. Available: {}.".format(name, sorted(OBSERVABLES))
+    )
+
+
+def _bin_kind(edges):
+    """
+    Determine whether the bin edges are linearly or logarithmically spaced,
+    so that the bin of a value can be computed directly.
+    """
+    widths = np.diff(edges)
+    if np.allclose(widths, widths[0], rtol=1e-12, atol=0.0):
+        return LINEAR_BINS
+    if edges[0] > 0.0:
+        ratios = edges[1:] / edges[:-1]
+        if np.allclose(ratios, ratios[0], rtol=1e-12, atol=0.0):
+            return LOG_BINS
+    return CUSTOM_BINS
+
+
+def _rebuild(observables, edges, num_fsp, clip, count, sum_weights,
+             sum_weights_sqrd):
+    """
+    Reconstruct a pickled ``WeightedHistogram``.
+    """
+    hist = WeightedHistogram(observables, edges, num_fsp, clip=clip)
+    hist.merge_sums(count, sum_weights, sum_weights_sqrd)
+    return hist
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def space_to_energy_hist(np.ndarray[np.float64_t, ndim=2] pts, int num_ps_pts,
-                         int num_fsp, int num_bins, density=False):
+cdef double c_observable(double[:, ::1] pts, int n, int kind, int i,
+                         int j) nogil:
     """
+    Compute an observable of the `n`th phase space point.
     """
-    cdef int i, j
-    cdef int weight_index = 4 * num_fsp
+    cdef int k
+    cdef double e, p2, pi2, pj2, pipj
 
-    # Define arrays for various information.
-    cdef np.ndarray[np.float64_t, ndim=1] weights
-    cdef np.ndarray[np.float64_t, ndim=2] bins
-    cdef np.ndarray[np.float64_t, ndim=2] engs
-    cdef np.ndarray[np.float64_t, ndim=3] probs
+    if kind == ENERGY:
+        return pts[n, 4 * i]
+    if kind == INVARIANT_MASS:
+        e = pts[n, 4 * i] + pts[n, 4 * j]
+        p2 = 0.0
+        for k in range(1, 4):
+            p2 += (pts[n, 4 * i + k] + pts[n, 4 * j + k]) ** 2
+        return sqrt(e * e - p2) if e * e > p2 else 0.0
+    if kind == COS_ANGLE:
+        pi2 = 0.0
+        pj2 = 0.0
+        pipj = 0.0
+        for k in range(1, 4):
+            pi2 += pts[n, 4 * i + k] ** 2
+            pj2 += pts[n, 4 * j + k] ** 2
+            pipj += pts[n, 4 * i + k] * pts[n, 4 * j + k]
+        if pi2 == 0.0 or pj2 == 0.0:
+            return 0.0
+        return pipj / sqrt(pi2 * pj2)
+    # COS_THETA
+    pi2 = 0.0
+    for k in range(1, 4):
+        pi2 += pts[n, 4 * i + k] ** 2
+    if pi2 == 0.0:
+        return 0.0
+    return pts[n, 4 * i + 3] / sqrt(pi2)
 
-    cdef np.ndarray[np.float64_t, ndim=2] means
-    cdef np.ndarray[np.float64_t, ndim=2] vars
-    cdef np.ndarray[np.float64_t, ndim=2] errs
 
-    # Allocate arrays to store various information.
-    weights = np.zeros(num_ps_pts, dtype=np.float64)
-    bins = np.zeros((num_fsp, num_bins + 1), dtype=np.float64)
-    engs = np.zeros((num_fsp, num_bins), dtype=np.float64)
-    probs = np.zeros((num_fsp, 2, num_bins), dtype=np.float64)
+cdef class WeightedHistogram:
+    """
+    Weighted histograms of several observables of phase space points,
+    filled in a single pass over the points.
 
-    means = np.zeros((num_fsp, num_bins), dtype=np.float64)
-    vars = np.zeros((num_fsp, num_bins), dtype=np.float64)
-    errs = np.zeros((num_fsp, num_bins), dtype=np.float64)
+    Parameters
+    ----------
+    observables : list of tuple
+        Observables to histogram. Each is a tuple of a name and the indices
+        of the final state particles it depends on:
 
-    # Extract the weights from phase space points.
-    for i in range(num_ps_pts):
-        weights[i] = pts[i, weight_index]
+            ("energy", i): energy of particle i,
+            ("invariant_mass", i, j): invariant mass of particles i and j,
+            ("cos_angle", i, j): cosine of the angle between the
+            three-momenta of particles i and j,
+            ("cos_theta", i): cosine of the polar angle of particle i.
 
-    for i in range(num_fsp):
+    edges : list of numpy.ndarray
+        Bin edges of each observable. See ``linear_bins`` and ``log_bins``.
+        Any increasing edges can be used.
+    num_fsp : int
+        Number of final state particles.
+    clip : bool or list of bool {False]
+        If true, values outside of the bins are put into the first or last
+        bin. This is useful when the bins span the kinematic limits of the
+        observables, which values may exceed due to round-off errors.
+        Otherwise, they are dropped. A list sets this for each observable.
+    """
 
-        means[i, :], bins[i, :] = np.histogram(pts[:, 4 * i], bins=num_bins,
-                                               weights=weights, density=density)
+    cdef readonly tuple observables
+    cdef readonly int num_fsp
+    cdef readonly tuple clip
+    cdef readonly long count
+    cdef vector[int] c_kinds
+    cdef vector[int] c_particles
+    cdef vector[int] c_bin_kinds
+    cdef vector[int] c_clip
+    cdef vector[int] c_offsets
+    cdef vector[double] c_edges
+    cdef np.ndarray c_sum_weights
+    cdef np.ndarray c_sum_weights_sqrd
 
-        vars[i, :] = np.histogram(pts[:, 4 * i], bins=num_bins,
-                                  weights=weights * weights, density=density)[0]
+    def __init__(self, observables, edges, int num_fsp, clip=False):
+        cdef int k
+        if len(observables) != len(edges):
+            raise ValueError("Each observable needs its own bin edges.")
 
-        errs[i, :] = np.sqrt((vars[i, :] - means[i, :]**2))
+        self.observables = tuple(tuple(obs) for obs in observables)
+        self.num_fsp = num_fsp
+        if np.ndim(clip) == 0:
+            clip = [clip] * len(observables)
+        if len(clip) != len(observables):
+            raise ValueError("clip must be given for each observable.")
+        self.clip = tuple(bool(c) for c in clip)
+        self.count = 0
+        self.c_offsets.push_back(0)
 
-        # Normalize the distributions by the number of phase space points,
-        # but only if density is False, otherwise the density is True case
-        # will not be normalized to 1.
-        if density is False:
-            means[i, :] = means[i, :] * (1.0 / num_ps_pts)
-            vars[i, :] = vars[i, :] * (1.0 / num_ps_pts)
-            errs[i, :] = errs[i, :] * (1.0 / num_ps_pts)
+        for obs, obs_edges, obs_clip in zip(self.observables, edges, self.clip):
+            if obs[0] not in OBSERVABLES:
+                raise ValueError(
+                    "Unknown observable {!r}. Available: {}.".format(
+                        obs[0], sorted(OBSERVABLES)
+                    )
+                )
+            kind, num_particles = OBSERVABLES[obs[0]]
+            if len(obs) != num_particles + 1:
+                raise ValueError(
+                    "{!r} depends on {} particles.".format(obs[0], num_particles)
+                )
+            particles = list(obs[1:]) + [obs[1]] * (2 - num_particles)
+            if any(not 0 <= p < num_fsp for p in particles):
+                raise ValueError("Invalid particle indices in {!r}.".format(obs))
 
-    for i in range(num_fsp):
-        for j in range(num_bins):
-            engs[i, j] = (bins[i, j+1] + bins[i, j]) / 2
+            obs_edges = np.asarray(obs_edges, dtype=np.float64)
+            if obs_edges.ndim != 1 or len(obs_edges) < 2:
+                raise ValueError("Bin edges must be arrays of length >= 2.")
+            if np.any(np.diff(obs_edges) <= 0.0):
+                raise ValueError("Bin edges must be increasing.")
 
-    for i in range(num_fsp):
-        for j in range(num_bins):
-            probs[i, 0, j] = engs[i, j]
-            if density is True:
-                probs[i, 1, j] = means[i, j]
+            self.c_kinds.push_back(kind)
+            for p in particles:
+                self.c_particles.push_back(p)
+            self.c_bin_kinds.push_back(_bin_kind(obs_edges))
+            self.c_clip.push_back(obs_clip)
+            for k in range(len(obs_edges)):
+                self.c_edges.push_back(obs_edges[k])
+            self.c_offsets.push_back(self.c_edges.size())
+
+        num_bins = self.c_edges.size() - len(self.observables)
+        self.c_sum_weights = np.zeros(num_bins, dtype=np.float64)
+        self.c_sum_weights_sqrd = np.zeros(num_bins, dtype=np.float64)
+
+    def __reduce__(self):
+        return (
+            _rebuild,
+            (
+                self.observables,
+                self.edges,
+                self.num_fsp,
+                self.clip,
+                self.count,
+                self.c_sum_weights,
+                self.c_sum_weights_sqrd,
+            ),
+        )
+
+    def _split(self, values):
+        """Split an array over all bins into one array per observable."""
+        return [
+            values[self.c_offsets[k] - k : self.c_offsets[k + 1] - k - 1]
+            for k in range(len(self.observables))
+        ]
+
+    @property
+    def edges(self):
+        """Bin edges of each observable."""
+        edges = np.array(self.c_edges, dtype=np.float64)
+        return [
+            edges[self.c_offsets[k] : self.c_offsets[k + 1]]
+            for k in range(len(self.observables))
+        ]
+
+    @property
+    def sum_weights(self):
+        """Sums of the weights in the bins of each observable."""
+        return self._split(self.c_sum_weights)
+
+    @property
+    def sum_weights_sqrd(self):
+        """Sums of the squared weights in the bins of each observable."""
+        return self._split(self.c_sum_weights_sqrd)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    def update(self, double[:, ::1] pts):
+        """
+        Add a chunk of phase space points.
+
+        Parameters
+        ----------
+        pts : numpy.ndarray
+            Phase space points in the format returned by
+            ``rambo.generate_phase_space``.
+        """
+        cdef int n, k, idx, num_bins
+        cdef int num_obs = self.c_kinds.size()
+        cdef int weight_index = 4 * self.num_fsp
+        cdef double x, w, lo, hi
+        cdef double *edges
+        cdef double[::1] sw = self.c_sum_weights
+        cdef double[::1] sw2 = self.c_sum_weights_sqrd
+
+        if pts.shape[1] != weight_index + 1:
+            raise ValueError(
+                "Expected phase space points of {} particles.".format(
+                    self.num_fsp
+                )
+            )
+
+        with nogil:
+            for n in range(pts.shape[0]):
+                w = pts[n, weight_index]
+                for k in range(num_obs):
+                    x = c_observable(
+                        pts,
+                        n,
+                        self.c_kinds[k],
+                        self.c_particles[2 * k],
+                        self.c_particles[2 * k + 1],
+                    )
+                    edges = &self.c_edges[self.c_offsets[k]]
+                    num_bins = self.c_offsets[k + 1] - self.c_offsets[k] - 1
+                    lo = edges[0]
+                    hi = edges[num_bins]
+
+                    if x < lo or x > hi or x != x:
+                        if not self.c_clip[k] or x != x:
+                            continue
+                        idx = 0 if x < lo else num_bins - 1
+                    elif self.c_bin_kinds[k] == LINEAR_BINS:
+                        idx = <int>floor((x - lo) / (hi - lo) * num_bins)
+                    elif self.c_bin_kinds[k] == LOG_BINS:
+                        idx = <int>floor(log(x / lo) / log(hi / lo) * num_bins)
+                    else:
+                        idx = upper_bound(edges, edges + num_bins + 1, x) - edges - 1
+                    # The last bin includes its upper edge.
+                    if idx > num_bins - 1:
+                        idx = num_bins - 1
+                    if idx < 0:
+                        idx = 0
+
+                    idx += self.c_offsets[k] - k
+                    sw[idx] += w
+                    sw2[idx] += w * w
+
+        self.count += pts.shape[0]
+
+    def merge_sums(self, long count, sum_weights, sum_weights_sqrd):
+        """
+        Add the number of points and sums of (squared) weights of a partial
+        histogram with the same bins, flattened over all observables.
+        """
+        self.count += count
+        self.c_sum_weights += sum_weights
+        self.c_sum_weights_sqrd += sum_weights_sqrd
+
+    def merge(self, WeightedHistogram other):
+        """
+        Merge the histograms of another accumulator with the same
+        observables and bins into this one.
+
+        Parameters
+        ----------
+        other : WeightedHistogram
+            Accumulator to merge.
+        """
+        if (
+            other.observables != self.observables
+            or other.c_edges.size() != self.c_edges.size()
+            or not np.array_equal(
+                np.array(other.c_edges), np.array(self.c_edges)
+            )
+        ):
+            raise ValueError("Only histograms with the same bins can be merged.")
+        self.merge_sums(
+            other.count, other.c_sum_weights, other.c_sum_weights_sqrd
+        )
+
+    def result(self, density=False):
+        """
+        Returns the histograms of the observables and their errors.
+
+        Parameters
+        ----------
+        density : bool
+            If true, the histograms are normalized to have unit area.
+            Otherwise, they are estimates of the differential integral of
+            the weights with respect to the observables.
+
+        Returns
+        -------
+        histograms : list of tuple
+            For each observable, a tuple (edges, values, errors) of the bin
+            edges and the values and estimated errors of the histogram.
+        """
+        histograms = []
+        count = max(self.count, 1)
+        for edges, sw, sw2 in zip(
+            self.edges, self.sum_weights, self.sum_weights_sqrd
+        ):
+            widths = np.diff(edges)
+            if density:
+                total = np.sum(sw)
+                values = sw / (total * widths)
+                errs = np.sqrt(sw2) / (total * widths)
             else:
-                probs[i, 1, j] = means[i, j] / (bins[i, j+1] - bins[i, j])
+                means = sw / count
+                var = np.maximum(sw2 / count - means ** 2, 0.0)
+                errs = np.sqrt(var / count) / widths
+                values = means / widths
+            histograms.append((edges, values, errs))
+        return histograms
+
+
+def space_to_energy_hist(np.ndarray[np.float64_t, ndim=2] pts, int num_ps_pts,
+                         int num_fsp, int num_bins, density=False):
+    """
+    Compute histograms of the energies of the final state particles.
+
+    Parameters
+    ----------
+    pts : numpy.ndarray
+        Phase space points in the format returned by
+        ``rambo.generate_phase_space``.
+    num_ps_pts : int
+        Number of phase space points.
+    num_fsp : int
+        Number of final state particles.
+    num_bins : int
+        Number of energy bins to use for each of the final state particles.
+        The bins of each particle span the range of its energies.
+    density : bool {False]
+        If true, the histograms are normalized to have unit area.
+
+    Returns
+    -------
+    probs : numpy.ndarray
+        Array of shape (num_fsp, 2, num_bins) containing the bin centers and
+        the values of the histograms.
+    errs : numpy.ndarray
+        Array of shape (num_fsp, num_bins) with the estimated errors of the
+        values of the histograms.
+    """
+    cdef int i
+    cdef np.ndarray[np.float64_t, ndim=3] probs
+    cdef np.ndarray[np.float64_t, ndim=2] errs
+
+    pts = np.ascontiguousarray(pts[:num_ps_pts])
+    edges = []
+    for i in range(num_fsp):
+        lo, hi = np.min(pts[:, 4 * i]), np.max(pts[:, 4 * i])
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        edges.append(linear_bins(lo, hi, num_bins))
+
+    hist = WeightedHistogram(
+        [("energy", i) for i in range(num_fsp)], edges, num_fsp, clip=True
+    )
+    hist.update(pts)
+
+    probs = np.empty((num_fsp, 2, num_bins), dtype=np.float64)
+    errs = np.empty((num_fsp, num_bins), dtype=np.float64)
+    for i, (bins, values, bin_errs) in enumerate(hist.result(density=density)):
+        probs[i, 0] = 0.5 * (bins[1:] + bins[:-1])
+        probs[i, 1] = values
+        errs[i] = bin_errs
 
     return probs, errs
@@ -7,3 +7,9 @@ def apply_matrix_elem(
     pts: npt.NDArray[np.float64], num_ps_pts: int, num_fsp: int, mat_elem_sqrd: Callable
 ):
     ...
+
+
+def apply_matrix_elem_batched(
+    pts: npt.NDArray[np.float64], num_ps_pts: int, num_fsp: int, mat_elem_sqrd: Callable
+):
+    ...
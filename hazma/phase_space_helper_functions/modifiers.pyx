@@ -41,3 +41,28 @@ def apply_matrix_elem(np.ndarray[DBL_T, ndim=2] pts, int num_ps_pts,
             warnings.warn('Negative matrix element squared encountered...')
         pts[i, 4 * num_fsp] = pts[i, 4 * num_fsp] * mat_elem2
     return pts
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def apply_matrix_elem_batched(np.ndarray[DBL_T, ndim=2] pts, int num_ps_pts,
+                              int num_fsp, mat_elem_sqrd):
+    """
+    Applies a batched matrix element squared to the weights.
+
+    The matrix element is called once with all of the four-momenta, stored
+    in an array of shape (num_ps_pts, num_fsp, 4), and must return an array
+    of `num_ps_pts` squared matrix elements (scalars are broadcast).
+    """
+    cdef np.ndarray[DBL_T, ndim=3] momenta
+    cdef np.ndarray[DBL_T, ndim=1] mat_elem2
+
+    momenta = pts[:, :4 * num_fsp].reshape(num_ps_pts, num_fsp, 4)
+    mat_elem2 = np.broadcast_to(
+        np.asarray(mat_elem_sqrd(momenta), dtype=np.float64), (num_ps_pts,)
+    ).copy()
+
+    if np.any(mat_elem2 < 0):
+        warnings.warn('Negative matrix element squared encountered...')
+    pts[:, 4 * num_fsp] = pts[:, 4 * num_fsp] * mat_elem2
+    return pts
@@ -0,0 +1,19 @@
+from libcpp.vector cimport vector
+
+# Squared matrix element evaluated without the GIL. The first argument holds
+# the four-momenta of the final state particles, the second the parameters.
+ctypedef double (*msqrd_type_vector)(vector[vector[double]]&, vector[double]&) nogil
+
+
+cdef class NativeMatrixElement:
+    cdef msqrd_type_vector fn
+    cdef vector[double] c_params
+    cdef readonly str name
+    cdef readonly int num_fsp
+    cdef readonly tuple param_names
+    cdef readonly str module
+
+
+cdef NativeMatrixElement register_matrix_element(
+    str name, msqrd_type_vector fn, int num_fsp, tuple param_names, str module
+)
@@ -0,0 +1,42 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+
+class NativeMatrixElement:
+    name: str
+    num_fsp: int
+    param_names: Tuple[str, ...]
+    module: str
+
+    @property
+    def params(self) -> npt.NDArray[np.float64]:
+        ...
+
+    def __call__(self, momenta: npt.ArrayLike):
+        ...
+
+    def apply(self, points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        ...
+
+
+def get_matrix_element(
+    name: str, params: Sequence[float] = ()
+) -> NativeMatrixElement:
+    ...
+
+
+def registered_matrix_elements() -> List[str]:
+    ...
+
+
+def generate_space(
+    num_ps_pts: int,
+    masses: npt.ArrayLike,
+    cme: float,
+    num_fsp: int,
+    seed,
+    msqrd: NativeMatrixElement,
+) -> npt.NDArray[np.float64]:
+    ...
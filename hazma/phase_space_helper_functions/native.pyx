@@ -0,0 +1,264 @@
+"""
+Registry of squared matrix elements implemented in Cython/C.
+
+Squared matrix elements registered here are plain C functions of the
+four-momenta of the final state particles and a vector of parameters (see
+``msqrd_type_vector`` in ``native.pxd``). They are registered from the Cython
+module defining them with ``register_matrix_element`` and looked up by name
+with ``get_matrix_element``, which binds the values of their parameters.
+When a bound matrix element is passed to the functions in ``hazma.rambo``,
+the phase space points are generated and weighted by the matrix element in
+a single loop that runs without the GIL.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import importlib
+
+import numpy as np
+cimport numpy as np
+import cython
+from libcpp.vector cimport vector
+
+from hazma.phase_space_helper_functions.generator cimport (
+    c_generate_point,
+    make_rng,
+    mt19937,
+)
+
+# Maps the names of the registered matrix elements to unbound prototypes.
+_REGISTRY = {}
+
+
+cdef NativeMatrixElement register_matrix_element(
+    str name, msqrd_type_vector fn, int num_fsp, tuple param_names, str module
+):
+    """
+    Register a squared matrix element.
+
+    Parameters
+    ----------
+    name : str
+        Name under which the matrix element is registered.
+    fn : msqrd_type_vector
+        C function computing the squared matrix element.
+    num_fsp : int
+        Number of final state particles.
+    param_names : tuple of str
+        Names of the parameters, in the order in which `fn` expects them.
+    module : str
+        Name of the module registering the matrix element. It is imported
+        when a matrix element is unpickled, e.g. in a worker process.
+
+    Returns
+    -------
+    msqrd : NativeMatrixElement
+        The registered, unbound matrix element.
+    """
+    cdef NativeMatrixElement msqrd = NativeMatrixElement.__new__(NativeMatrixElement)
+    msqrd.fn = fn
+    msqrd.name = name
+    msqrd.num_fsp = num_fsp
+    msqrd.param_names = param_names
+    msqrd.module = module
+    _REGISTRY[name] = msqrd
+    return msqrd
+
+
+def get_matrix_element(name, params=()):
+    """
+    Returns a registered squared matrix element with bound parameters.
+
+    Parameters
+    ----------
+    name : str
+        Name of the matrix element. See ``registered_matrix_elements``.
+    params : array_like
+        Values of the parameters of the matrix element, in the order given
+        by its `param_names`.
+
+    Returns
+    -------
+    msqrd : NativeMatrixElement
+        The matrix element.
+    """
+    cdef NativeMatrixElement proto
+    cdef NativeMatrixElement msqrd
+
+    if name not in _REGISTRY:
+        raise KeyError(
+            "No matrix element named {!r}. Available: {}.".format(
+                name, registered_matrix_elements()
+            )
+        )
+    proto = _REGISTRY[name]
+    if len(params) != len(proto.param_names):
+        raise ValueError(
+            "{} expects the parameters {}.".format(name, proto.param_names)
+        )
+
+    msqrd = NativeMatrixElement.__new__(NativeMatrixElement)
+    msqrd.fn = proto.fn
+    msqrd.name = proto.name
+    msqrd.num_fsp = proto.num_fsp
+    msqrd.param_names = proto.param_names
+    msqrd.module = proto.module
+    msqrd.c_params = [float(p) for p in params]
+    return msqrd
+
+
+def registered_matrix_elements():
+    """
+    Returns the names of the registered squared matrix elements.
+    """
+    return sorted(_REGISTRY)
+
+
+def _load_matrix_element(module, name, params):
+    """
+    Import `module` and return the matrix element `name` with bound
+    parameters. Used to unpickle matrix elements.
+    """
+    importlib.import_module(module)
+    return get_matrix_element(name, params)
+
+
+cdef class NativeMatrixElement:
+    """
+    Squared matrix element implemented in C with bound parameters. Instances
+    are obtained from ``get_matrix_element``.
+
+    Calling the matrix element with the four-momenta of a single phase space
+    point, an array of shape (num_fsp, 4), returns the squared matrix
+    element. An array of shape (n, num_fsp, 4) returns `n` values.
+    """
+
+    def __call__(self, momenta):
+        cdef np.ndarray[np.float64_t, ndim=3] moms
+        cdef np.ndarray[np.float64_t, ndim=2] points
+
+        momenta = np.asarray(momenta, dtype=np.float64)
+        single = momenta.ndim == 2
+        moms = np.ascontiguousarray(momenta[np.newaxis] if single else momenta)
+        if moms.shape[1] != self.num_fsp or moms.shape[2] != 4:
+            raise ValueError(
+                "{} expects the four-momenta of {} particles.".format(
+                    self.name, self.num_fsp
+                )
+            )
+
+        points = np.ones((moms.shape[0], 4 * self.num_fsp + 1), dtype=np.float64)
+        points[:, : 4 * self.num_fsp] = moms.reshape(moms.shape[0], -1)
+        self.apply(points)
+        if single:
+            return points[0, 4 * self.num_fsp]
+        return points[:, 4 * self.num_fsp]
+
+    def __reduce__(self):
+        return (_load_matrix_element, (self.module, self.name, list(self.params)))
+
+    def __repr__(self):
+        return "NativeMatrixElement({!r}, {})".format(self.name, list(self.params))
+
+    @property
+    def params(self):
+        """Values of the bound parameters."""
+        return np.array(self.c_params, dtype=np.float64)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def apply(self, double[:, ::1] points):
+        """
+        Multiply the weights of phase space points, in the format of
+        ``generator.generate_space``, by the squared matrix element, in
+        place and without the GIL.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Array of shape (num_ps_pts, 4 * num_fsp + 1).
+
+        Returns
+        -------
+        points : numpy.ndarray
+            The same array.
+        """
+        cdef int i, j, k
+        cdef int num_fsp = self.num_fsp
+        cdef vector[vector[double]] momenta = vector[vector[double]](
+            num_fsp, vector[double](4)
+        )
+
+        if points.shape[1] != 4 * num_fsp + 1:
+            raise ValueError(
+                "{} expects the four-momenta of {} particles.".format(
+                    self.name, num_fsp
+                )
+            )
+
+        with nogil:
+            for i in range(points.shape[0]):
+                for j in range(num_fsp):
+                    for k in range(4):
+                        momenta[j][k] = points[i, 4 * j + k]
+                points[i, 4 * num_fsp] *= self.fn(momenta, self.c_params)
+
+        return points.base
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def generate_space(int num_ps_pts, vector[double] masses, double cme,
+                   int num_fsp, seed, NativeMatrixElement msqrd):
+    """
+    Generate phase space points weighted by a native squared matrix element.
+    The points are generated and weighted in a single loop which runs
+    without the GIL.
+
+    Parameters
+    ----------
+    num_ps_pts : int
+        Total number of phase space points to generate.
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_fsp : int
+        Number of final state particles.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence
+        Seed for the random number generator. The points are identical to
+        those of ``generator.generate_space`` for the same seed.
+    msqrd : NativeMatrixElement
+        Squared matrix element.
+
+    Returns
+    -------
+    phase_space_points : numpy.ndarray
+        Array of shape (num_ps_pts, 4 * num_fsp + 1) containing the phase
+        space points, in the same format as ``generator.generate_space``.
+    """
+    cdef int i, j, k
+    cdef mt19937 rng = make_rng(seed)
+    cdef vector[double] point
+    cdef vector[vector[double]] momenta = vector[vector[double]](
+        num_fsp, vector[double](4)
+    )
+    cdef np.ndarray[np.float64_t, ndim=2] space = \
+        np.empty((num_ps_pts, 4 * num_fsp + 1), dtype=np.float64)
+    cdef double[:, ::1] space_view = space
+
+    if msqrd.num_fsp != num_fsp:
+        raise ValueError(
+            "{} expects {} final state particles.".format(msqrd.name, msqrd.num_fsp)
+        )
+
+    with nogil:
+        for i in range(num_ps_pts):
+            point = c_generate_point(masses, cme, num_fsp, rng)
+            for j in range(num_fsp):
+                for k in range(4):
+                    momenta[j][k] = point[4 * j + k]
+                    space_view[i, 4 * j + k] = point[4 * j + k]
+            space_view[i, 4 * num_fsp] = \
+                point[4 * num_fsp] * msqrd.fn(momenta, msqrd.c_params)
+
+    return space
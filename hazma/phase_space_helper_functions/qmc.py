@@ -0,0 +1,68 @@
+"""
+Quasi-Monte-Carlo phase space generation.
+
+RAMBO maps 4n numbers in (0,1) onto the phase space of n particles. Feeding
+it scrambled Sobol' points instead of pseudo-random numbers makes the error
+of smooth integrands decrease faster than 1/sqrt(N). Each scrambling is an
+independent randomization, so error estimates are obtained from the spread
+of the results of several independently scrambled sequences.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import warnings
+
+import numpy as np
+from scipy.stats import qmc
+
+from hazma.phase_space_helper_functions import generator
+
+
+def generate_space_sobol(num_ps_pts, masses, cme, num_fsp, seed, start=0):
+    """
+    Generate phase space points from a scrambled Sobol' sequence.
+
+    Parameters
+    ----------
+    num_ps_pts : int
+        Number of phase space points to generate.
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_fsp : int
+        Number of final state particles.
+    seed : int, array_like[int] or numpy.random.SeedSequence
+        Seed determining the scrambling of the sequence.
+    start : int, optional
+        Index of the first point of the sequence to use. Calls with the same
+        seed and consecutive ranges of points produce consecutive parts of a
+        single sequence.
+
+    Notes
+    -----
+    Sequences whose total number of points is a power of two have the best
+    balance properties, but any number of points is allowed so that the
+    requested number of phase space points is honored exactly. The
+    corresponding warning of ``scipy.stats.qmc.Sobol`` is suppressed.
+
+    Returns
+    -------
+    phase_space_points : numpy.ndarray
+        Array of shape (num_ps_pts, 4 * num_fsp + 1) containing the phase
+        space points, in the format returned by ``generator.generate_space``.
+    """
+    engine = qmc.Sobol(4 * num_fsp, scramble=True, seed=np.random.default_rng(seed))
+    if start > 0:
+        engine.fast_forward(start)
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore",
+            message="The balance properties of Sobol' points",
+            category=UserWarning,
+        )
+        rands = engine.random(num_ps_pts)
+    # Guard against log(0) in the RAMBO energies.
+    np.clip(rands, np.finfo(np.float64).tiny, None, out=rands)
+    return generator.generate_space_from_uniform(
+        rands, np.asarray(masses, dtype=np.float64), cme, num_fsp
+    )
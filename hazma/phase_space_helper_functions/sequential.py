@@ -0,0 +1,120 @@
+"""
+Phase space generation using a chain of two-body decays.
+
+The final state P -> p_1 + ... + p_n is built from the sequence of decays
+M_n -> M_{n-1} + p_n, ..., M_2 -> p_1 + p_2, where M_k is the invariant mass
+of the first k particles. The phase space is parametrized by 3n-4 numbers in
+the unit hypercube: the squared invariant masses M_2^2, ..., M_{n-1}^2 and the
+decay angles in the rest frame of each M_k. Unlike the 4n random numbers used
+by RAMBO, the invariant masses are coordinates, which makes this
+parametrization well suited for adaptive importance sampling of resonant
+matrix elements.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import numpy as np
+
+
+def __kallen_lambda(a, b, c):
+    return a ** 2 + b ** 2 + c ** 2 - 2.0 * (a * b + a * c + b * c)
+
+
+def __boost(ps, qs, ms):
+    """
+    Boost the four-momenta `ps` from the rest frame of `qs` (with masses
+    `ms`) into the frame in which `qs` is given.
+    """
+    q_dot_p = np.sum(qs[:, 1:] * ps[:, 1:], axis=1)
+    es = (qs[:, 0] * ps[:, 0] + q_dot_p) / ms
+    fac = (q_dot_p / (qs[:, 0] + ms) + ps[:, 0]) / ms
+    out = np.empty_like(ps)
+    out[:, 0] = es
+    out[:, 1:] = ps[:, 1:] + fac[:, np.newaxis] * qs[:, 1:]
+    return out
+
+
+def num_dims(num_fsp):
+    """
+    Returns the number of random numbers needed to generate a phase space
+    point with `num_fsp` final state particles.
+    """
+    return 3 * num_fsp - 4
+
+
+def generate_space_from_unit_cube(ys, masses, cme):
+    """
+    Generate phase space points from points in the unit hypercube.
+
+    Parameters
+    ----------
+    ys : numpy.ndarray
+        Array of shape (num_ps_pts, 3 * num_fsp - 4) of numbers in [0,1).
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+
+    Returns
+    -------
+    phase_space_points : numpy.ndarray
+        Array of shape (num_ps_pts, 4 * num_fsp + 1) with the four-momenta
+        and weights of the points, in the same format as
+        ``generator.generate_space``. The weights are normalized such that
+        their average over uniformly distributed `ys` is the phase space
+        volume.
+    """
+    masses = np.asarray(masses, dtype=np.float64)
+    num_fsp = len(masses)
+    num_pts = ys.shape[0]
+
+    if num_fsp < 2:
+        raise ValueError("At least two final state particles are required.")
+
+    # Invariant masses of the first k particles: msys[:, k-1] = M_k.
+    msys = np.empty((num_pts, num_fsp))
+    msys[:, num_fsp - 1] = cme
+    msys[:, 0] = masses[0]
+    weights = np.ones(num_pts)
+    for k in range(num_fsp - 1, 1, -1):
+        lo = np.sum(masses[:k])
+        hi = msys[:, k] - masses[k]
+        u = ys[:, k - 2]
+        s = lo ** 2 + u * (hi ** 2 - lo ** 2)
+        msys[:, k - 1] = np.sqrt(s)
+        weights *= (hi ** 2 - lo ** 2) / (2.0 * np.pi)
+
+    points = np.empty((num_pts, 4 * num_fsp + 1))
+    # Four-momentum of the subsystem of the first k particles.
+    qs = np.zeros((num_pts, 4))
+    qs[:, 0] = cme
+    offset = num_fsp - 2
+    for k in range(num_fsp, 1, -1):
+        mk = msys[:, k - 1]
+        mkm1 = msys[:, k - 2]
+        mi = masses[k - 1]
+        pmag = np.sqrt(
+            np.maximum(__kallen_lambda(mk ** 2, mkm1 ** 2, mi ** 2), 0.0)
+        ) / (2.0 * mk)
+        weights *= pmag / (4.0 * np.pi * mk)
+
+        ct = 2.0 * ys[:, offset] - 1.0
+        phi = 2.0 * np.pi * ys[:, offset + 1]
+        offset += 2
+        st = np.sqrt(1.0 - ct ** 2)
+
+        # Momenta in the rest frame of the subsystem.
+        pi = np.empty((num_pts, 4))
+        pi[:, 0] = np.sqrt(pmag ** 2 + mi ** 2)
+        pi[:, 1] = pmag * st * np.cos(phi)
+        pi[:, 2] = pmag * st * np.sin(phi)
+        pi[:, 3] = pmag * ct
+        prest = np.empty((num_pts, 4))
+        prest[:, 0] = np.sqrt(pmag ** 2 + mkm1 ** 2)
+        prest[:, 1:] = -pi[:, 1:]
+
+        points[:, 4 * (k - 1) : 4 * k] = __boost(pi, qs, mk)
+        qs = __boost(prest, qs, mk)
+
+    points[:, 0:4] = qs
+    points[:, 4 * num_fsp] = weights
+    return points
@@ -0,0 +1,294 @@
+"""
+Streaming accumulators for phase space weights.
+
+The accumulators are updated chunk by chunk, so that integrals and energy
+histograms can be computed from an arbitrary number of phase space points
+in bounded memory. Partial results (e.g. from different workers) can be
+combined with ``merge``.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import numpy as np
+
+from hazma.phase_space_helper_functions.histogram import (
+    WeightedHistogram,
+    linear_bins,
+)
+
+
+class WeightStatistics:
+    """
+    Running count, mean and variance of the weights of phase space points,
+    computed using Welford's algorithm (with Chan et al.'s update for
+    chunks).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, weights):
+        """
+        Add a chunk of weights.
+
+        Parameters
+        ----------
+        weights : numpy.ndarray
+            Weights of the new phase space points.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        count = weights.size
+        if count == 0:
+            return
+        mean = np.mean(weights)
+        m2 = np.sum((weights - mean) ** 2)
+        self._combine(count, mean, m2)
+
+    def merge(self, other):
+        """
+        Merge the statistics of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : WeightStatistics
+            Accumulator to merge.
+        """
+        if other.count > 0:
+            self._combine(other.count, other.mean, other.m2)
+
+    def _combine(self, count, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    @property
+    def variance(self):
+        """Population variance of the weights."""
+        if self.count == 0:
+            return 0.0
+        return self.m2 / self.count
+
+    @property
+    def std_of_mean(self):
+        """Estimated error of the mean of the weights."""
+        if self.count == 0:
+            return 0.0
+        return np.sqrt(self.variance / self.count)
+
+
+class EnergyHistogram:
+    """
+    Weighted histograms of the energies of the final state particles.
+
+    The energy range of each particle is fixed to its kinematic limits, so
+    that histograms of different chunks share the same bins. The histograms
+    of all particles are filled in a single pass over each chunk by
+    ``histogram.WeightedHistogram``.
+
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_bins : int
+        Number of energy bins to use for each of the final state particles.
+    """
+
+    def __init__(self, masses, cme, num_bins):
+        masses = np.asarray(masses, dtype=np.float64)
+        self.num_fsp = len(masses)
+        self.num_bins = num_bins
+
+        e_mins = masses
+        e_maxs = np.array(
+            [
+                (cme ** 2 + m ** 2 - (np.sum(masses) - m) ** 2) / (2.0 * cme)
+                for m in masses
+            ]
+        )
+        # At threshold, the energies of the particles are fixed.
+        e_maxs = np.where(e_maxs > e_mins, e_maxs, e_mins + 1e-12 * cme)
+        self.bins = np.array(
+            [linear_bins(lo, hi, num_bins) for lo, hi in zip(e_mins, e_maxs)]
+        )
+        self.hist = WeightedHistogram(
+            [("energy", i) for i in range(self.num_fsp)],
+            self.bins,
+            self.num_fsp,
+            clip=True,
+        )
+
+    @property
+    def count(self):
+        """Number of phase space points added."""
+        return self.hist.count
+
+    @property
+    def sum_weights(self):
+        """Sums of the weights in each bin, with shape (num_fsp, num_bins)."""
+        return np.array(self.hist.sum_weights)
+
+    @property
+    def sum_weights_sqrd(self):
+        """
+        Sums of the squared weights in each bin, with shape
+        (num_fsp, num_bins).
+        """
+        return np.array(self.hist.sum_weights_sqrd)
+
+    def update(self, pts):
+        """
+        Add a chunk of phase space points.
+
+        Parameters
+        ----------
+        pts : numpy.ndarray
+            Phase space points in the format returned by
+            ``rambo.generate_phase_space``.
+        """
+        self.hist.update(np.ascontiguousarray(pts, dtype=np.float64))
+
+    def merge(self, other):
+        """
+        Merge the histograms of another accumulator with the same bins into
+        this one.
+
+        Parameters
+        ----------
+        other : EnergyHistogram
+            Accumulator to merge.
+        """
+        self.hist.merge(other.hist)
+
+    def result(self, density=False):
+        """
+        Returns the energy histograms and their errors.
+
+        Parameters
+        ----------
+        density : bool
+            If true, the histograms are normalized to have unit area.
+
+        Returns
+        -------
+        probs : numpy.ndarray
+            Array of shape (num_fsp, 2, num_bins) containing the bin centers
+            and the values of the histograms, in the format returned by
+            ``histogram.space_to_energy_hist``.
+        errs : numpy.ndarray
+            Array of shape (num_fsp, num_bins) with the estimated errors of
+            the values of the histograms.
+        """
+        probs = np.empty((self.num_fsp, 2, self.num_bins))
+        errs = np.empty((self.num_fsp, self.num_bins))
+        for i, (_, values, bin_errs) in enumerate(self.hist.result(density)):
+            probs[i, 0, :] = 0.5 * (self.bins[i, 1:] + self.bins[i, :-1])
+            probs[i, 1, :] = values
+            errs[i, :] = bin_errs
+        return probs, errs
+
+
+class EnergySample:
+    """
+    Energies of the final state particles and weights of the phase space
+    points. Unlike ``EnergyHistogram``, the energies are kept exactly, so
+    that the energy distributions can be integrated over without binning.
+    The memory therefore grows with the number of points.
+
+    Parameters
+    ----------
+    num_fsp : int
+        Number of final state particles.
+    """
+
+    def __init__(self, num_fsp):
+        self.num_fsp = num_fsp
+        self.energies = []
+        self.weights = []
+
+    @property
+    def count(self):
+        """Number of phase space points added."""
+        return sum(len(weights) for weights in self.weights)
+
+    def update(self, pts):
+        """
+        Add a chunk of phase space points.
+
+        Parameters
+        ----------
+        pts : numpy.ndarray
+            Phase space points in the format returned by
+            ``rambo.generate_phase_space``.
+        """
+        pts = np.asarray(pts, dtype=np.float64)
+        self.energies.append(np.array(pts[:, 0 : 4 * self.num_fsp : 4]))
+        self.weights.append(np.array(pts[:, -1]))
+
+    def merge(self, other):
+        """
+        Merge the points of another accumulator into this one.
+
+        Parameters
+        ----------
+        other : EnergySample
+            Accumulator to merge.
+        """
+        self.energies.extend(other.energies)
+        self.weights.extend(other.weights)
+
+    def result(self):
+        """
+        Returns the energies and weights of the points.
+
+        Returns
+        -------
+        energies : numpy.ndarray
+            Energies of the final state particles, with shape
+            (num_pts, num_fsp).
+        weights : numpy.ndarray
+            Weights of the points, with shape (num_pts,).
+        """
+        if not self.weights:
+            return np.empty((0, self.num_fsp)), np.empty(0)
+        return np.concatenate(self.energies), np.concatenate(self.weights)
+
+
+def quantile_nodes(values, weights, num_nodes):
+    """
+    Returns the nodes of the midpoint rule in the cumulative probability of
+    a weighted sample, i.e. the quantiles of the sample at the probabilities
+    (k + 1/2) / num_nodes. Integrals over the distribution of the sample are
+    then approximated by the means of the integrands at the nodes.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Values of the sample.
+    weights : numpy.ndarray
+        Non-negative weights of the values.
+    num_nodes : int
+        Number of nodes.
+
+    Returns
+    -------
+    nodes : numpy.ndarray
+        The quantiles of the sample, interpolated linearly between the
+        midpoints of the steps of its cumulative distribution.
+    cells : numpy.ndarray
+        Index of the node whose interval of probability contains each value.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    probs = np.asarray(weights, dtype=np.float64) / np.sum(weights)
+    order = np.argsort(values, kind="stable")
+    cdf = np.cumsum(probs[order]) - 0.5 * probs[order]
+    nodes = np.interp(
+        (np.arange(num_nodes) + 0.5) / num_nodes, cdf, values[order]
+    )
+    cells = np.empty(len(values), dtype=np.intp)
+    cells[order] = np.minimum((cdf * num_nodes).astype(np.intp), num_nodes - 1)
+    return nodes, cells
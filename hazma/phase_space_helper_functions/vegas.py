@@ -0,0 +1,135 @@
+"""
+Adaptive (VEGAS) sampling grid over the unit hypercube.
+
+The grid is used by ``hazma.rambo.integrate_over_phase_space_adaptive`` to
+importance sample the uniform random numbers which RAMBO maps onto phase
+space.
+
+* Author - Logan A. Morrison and Adam Coogan
+"""
+import numpy as np
+
+
+class VegasGrid:
+    """
+    Separable VEGAS grid on the unit hypercube.
+
+    Each dimension is divided into `num_bins` increments which all receive
+    the same probability. Refining the grid moves the increment edges so that
+    regions contributing most to the variance get smaller increments, i.e.
+    are sampled more densely.
+
+    Parameters
+    ----------
+    ndim : int
+        Number of dimensions.
+    num_bins : int
+        Number of increments per dimension.
+    alpha : float
+        Damping exponent controlling how fast the grid adapts. Smaller values
+        give slower but more stable adaptation.
+    min_weight : float
+        Smallest weight of an increment relative to the mean weight when
+        refining. This keeps increments in which the integrand was sampled
+        badly, or not at all, from shrinking to nothing.
+    min_pts_per_bin : int
+        Number of points per increment that are accumulated before the grid
+        is refined. Refining on fewer points adapts the grid to noise.
+    """
+
+    def __init__(
+        self, ndim, num_bins=50, alpha=1.5, min_weight=0.1, min_pts_per_bin=20
+    ):
+        self.ndim = ndim
+        self.num_bins = num_bins
+        self.alpha = alpha
+        self.min_weight = min_weight
+        self.min_pts_per_bin = min_pts_per_bin
+        self.edges = np.tile(np.linspace(0.0, 1.0, num_bins + 1), (ndim, 1))
+        self._pending = []
+
+    def map(self, ys):
+        """
+        Map uniformly distributed points onto the grid.
+
+        Parameters
+        ----------
+        ys : numpy.ndarray
+            Array of shape (num_pts, ndim) of points in the unit hypercube.
+
+        Returns
+        -------
+        xs : numpy.ndarray
+            Mapped points with shape (num_pts, ndim).
+        jac : numpy.ndarray
+            Jacobian of the map at each point.
+        bins : numpy.ndarray
+            Integer array of shape (num_pts, ndim) giving the increment of
+            each coordinate.
+        """
+        scaled = ys * self.num_bins
+        bins = np.minimum(scaled.astype(np.int64), self.num_bins - 1)
+        frac = scaled - bins
+        dims = np.arange(self.ndim)
+        lower = self.edges[dims, bins]
+        widths = self.edges[dims, bins + 1] - lower
+        xs = lower + frac * widths
+        jac = np.prod(self.num_bins * widths, axis=1)
+        return xs, jac, bins
+
+    def refine(self, bins, fs):
+        """
+        Adapt the increments using the integrand values from an iteration.
+        The points are accumulated until there are `min_pts_per_bin` points
+        per increment.
+
+        Parameters
+        ----------
+        bins : numpy.ndarray
+            Increments of the sampled points, as returned by ``map``.
+        fs : numpy.ndarray
+            Values of the integrand times the Jacobian at the sampled points.
+
+        Returns
+        -------
+        refined : bool
+            True if the increments were moved.
+        """
+        self._pending.append((bins, fs))
+        num_pending = sum(len(f) for _, f in self._pending)
+        if num_pending < self.min_pts_per_bin * self.num_bins:
+            return False
+        bins = np.concatenate([b for b, _ in self._pending])
+        fs = np.concatenate([f for _, f in self._pending])
+        self._pending = []
+
+        f2 = fs ** 2
+        new_edges = np.empty_like(self.edges)
+        for dim in range(self.ndim):
+            d = np.bincount(bins[:, dim], weights=f2, minlength=self.num_bins)
+            if not np.any(d > 0):
+                new_edges[dim] = self.edges[dim]
+                continue
+            # Smooth the contributions of neighbouring increments.
+            smoothed = np.empty_like(d)
+            smoothed[0] = (7.0 * d[0] + d[1]) / 8.0
+            smoothed[-1] = (d[-2] + 7.0 * d[-1]) / 8.0
+            smoothed[1:-1] = (6.0 * d[1:-1] + d[:-2] + d[2:]) / 8.0
+            smoothed /= np.sum(smoothed)
+            # Damp the adaptation to avoid rapid, unstable changes.
+            with np.errstate(divide="ignore", invalid="ignore"):
+                weights = np.where(
+                    smoothed > 0.0,
+                    ((1.0 - smoothed) / np.log(1.0 / smoothed)) ** self.alpha,
+                    0.0,
+                )
+            weights = np.where(smoothed >= 1.0, 1.0, weights)
+            weights = np.maximum(weights, self.min_weight * np.mean(weights))
+            # New edges give each increment an equal share of the weights.
+            cum = np.concatenate(([0.0], np.cumsum(weights)))
+            targets = np.linspace(0.0, cum[-1], self.num_bins + 1)
+            new_edges[dim] = np.interp(targets, cum, self.edges[dim])
+            new_edges[dim, 0] = 0.0
+            new_edges[dim, -1] = 1.0
+        self.edges = new_edges
+        return True
@@ -1,5 +1,6 @@
 import numpy as np
 cimport numpy as np
 
-cdef double c_charged_pion_positron_spectrum_point(double, double)
+cdef double c_charged_pion_positron_spectrum_point(double, double) nogil
 cdef np.ndarray[np.float64_t,ndim=1] c_charged_pion_positron_spectrum_array(np.ndarray[np.float64_t,ndim=1], double)
+cdef np.ndarray[np.float64_t,ndim=2] c_charged_pion_positron_spectrum_matrix(np.ndarray[np.float64_t,ndim=1], np.ndarray[np.float64_t,ndim=1])
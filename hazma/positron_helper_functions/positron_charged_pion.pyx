@@ -1,6 +1,11 @@
 from hazma.positron_helper_functions.positron_muon cimport c_muon_positron_spectrum_array as muspec
+from hazma.decay_helper_functions.rest_frame_spectra cimport LogGridSpectrum, RestFrameSpectra
+from hazma.decay_helper_functions.rest_frame_spectra cimport boost_by_quad, interp_log_grid
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTable, DecaySpectrumTables
+from hazma.parallel import num_threads
 from scipy.integrate import quad
 from libc.math cimport sqrt, pow, log10
+from cython.parallel cimport prange
 import numpy as np
 cimport numpy as np
 import cython
@@ -21,53 +26,143 @@ cdef double eng_p_max_pi_rf = eng_p_max_mu_rf * gamma_mu * (1.0 + beta_mu)
 
 cdef np.ndarray eng_ps_mu = np.logspace(log10(me), log10(eng_p_max_pi_rf), num=500, dtype=np.float64)
 cdef np.ndarray __muspec = muspec(eng_ps_mu, eng_mu_pi_rf)
+cdef RestFrameSpectra __muspectra = RestFrameSpectra(eng_ps_mu, [__muspec])
+cdef LogGridSpectrum __muspec_grid = __muspectra.c_spectrum(1)
+
+
+cdef struct BoostArgs:
+    double eng_p
+    double eng_pi
 
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double __muon_spectrum(double eng_p):
+cdef double __muon_spectrum(double eng_p) nogil:
     """Returns the muon spectrum in the pion rest frame."""
-    return np.interp(eng_p, eng_ps_mu, __muspec)
+    return interp_log_grid(&__muspec_grid, eng_p)
 
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double __integrand(double cl, double eng_p, double eng_pi):
+cdef double __integrand(double cl, double eng_p, double eng_pi) nogil:
     """Returns the integrand of the boost integral at a given angle."""
     if eng_p < me:
         return 0.0
     cdef double p = sqrt(eng_p * eng_p - me * me)
-    cdef double gamma = eng_pi / mpi
-    cdef double beta = sqrt(1.0 - pow(mpi / eng_pi, 2))
-    cdef double jac = p / (2. * sqrt((1 + pow(beta * cl, 2)) * eng_p * eng_p -
-                                     (1 + beta * beta * (-1 + cl * cl)) *
-                                     me * me -
-                                     2 * beta * cl * eng_p * p) * gamma)
-    cdef double eng_p_pi_rf = gamma * (eng_p - p * beta * cl)
+    cdef double eng_p_pi_rf = rest_frame_energy(eng_p, me, eng_pi, mpi, cl)
+    if eng_p_pi_rf <= me:
+        return 0.0
+    cdef double jac = p / (2.0 * sqrt((eng_p_pi_rf - me) * (eng_p_pi_rf + me)))
     return BR_PI_TO_MUNU * jac * __muon_spectrum(eng_p_pi_rf)
 
 
+cdef double __gk_integrand(double cl, void* args) nogil:
+    cdef BoostArgs* boost = <BoostArgs*>args
+    return __integrand(cl, boost.eng_p, boost.eng_pi)
+
+
+def __quad_integrand(double cl, double eng_p, double eng_pi):
+    return __integrand(cl, eng_p, eng_pi)
+
+
 @cython.boundscheck(True)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double c_charged_pion_positron_spectrum_point(double eng_p, double eng_pi):
-    if eng_pi < mpi:
+cdef double __boosted_spectrum_point(double eng_p, double eng_pi) nogil:
+    cdef BoostArgs args
+    cdef double points[3]
+    cdef int num_points = 2
+    cdef double p, cl
+
+    if eng_pi < mpi or eng_p < me:
         return 0.0
 
-    return quad(__integrand, -1.0, 1.0, points=[-1.0, 1.0],
-                args=(eng_p, eng_pi), epsabs=1e-10, epsrel=1e-4)[0]
+    if boost_by_quad():
+        with gil:
+            return quad(__quad_integrand, -1.0, 1.0, points=[-1.0, 1.0],
+                        args=(eng_p, eng_pi), epsabs=1e-10, epsrel=1e-4)[0]
+
+    # Only positrons at angles inside of the one reaching the maximum
+    # energy in the pion rest frame contribute.
+    p = sqrt(eng_p * eng_p - me * me)
+    cl = (eng_p - eng_p_max_pi_rf * mpi / eng_pi) / (p * beta(eng_pi, mpi))
+    points[0] = -1.0
+    if -1.0 < cl < 1.0:
+        points[1] = cl
+        points[2] = 1.0
+        num_points = 3
+    else:
+        points[1] = 1.0
+
+    args.eng_p = eng_p
+    args.eng_pi = eng_pi
+    return gauss_kronrod(__gk_integrand, &args, points, num_points, 1e-10, 1e-4)
 
-@cython.boundscheck(True)
+@cython.boundscheck(False)
 @cython.wraparound(False)
-@cython.cdivision(True)
+cdef np.ndarray[np.float64_t,ndim=1] __spectrum_array(double[:] eng_ps, double eng_pi, DecaySpectrumTable table):
+    """
+    Returns the spectrum at many positron energies, interpolated from
+    `table` where possible. The positron energies are distributed over
+    ``hazma.parallel.num_threads()`` threads, unless the boost is computed
+    by quadrature.
+    """
+    cdef int i
+    cdef int npts = eng_ps.shape[0]
+    cdef int nthreads = 1 if boost_by_quad() else num_threads()
+    cdef bint use_table = table is not None
+    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros(npts, dtype=np.float64)
+    cdef double[:] spec_view = spec
+    for i in prange(npts, nogil=True, num_threads=nthreads):
+        if not (use_table and table.c_interp(eng_ps[i], eng_pi, &spec_view[i])):
+            spec_view[i] = __boosted_spectrum_point(eng_ps[i], eng_pi)
+    return spec
+
+
+def _boosted_spectrum(np.ndarray[np.float64_t,ndim=1] eng_ps, double eng_pi, int mode):
+    """
+    Returns the spectrum boosted from the rest frame. Used to build the decay
+    tables.
+    """
+    return __spectrum_array(eng_ps, eng_pi, None)
+
+
+cdef DecaySpectrumTables __tables = DecaySpectrumTables(
+    "charged_pion_positron", mpi, eng_p_max_pi_rf, _boosted_spectrum
+)
+
+
+cdef double c_charged_pion_positron_spectrum_point(double eng_p, double eng_pi) nogil:
+    return __boosted_spectrum_point(eng_p, eng_pi)
+
+
 cdef np.ndarray[np.float64_t,ndim=1] c_charged_pion_positron_spectrum_array(np.ndarray[np.float64_t,ndim=1] eng_ps, double eng_pi):
     """Returns the positron spectrum from a charged pion for many positron energies."""
-    cdef int npts = eng_ps.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(eng_ps)
-    for i in range(npts):
-        spec[i] = c_charged_pion_positron_spectrum_point(eng_ps[i], eng_pi)
+    return __spectrum_array(eng_ps, eng_pi, __tables.c_table(1))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_charged_pion_positron_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] eng_ps, np.ndarray[np.float64_t,ndim=1] eparents):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(eng_ps)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_ps = eng_ps.shape[0]
+    cdef int nthreads = 1 if boost_by_quad() else num_threads()
+    cdef DecaySpectrumTable table = __tables.c_table(1)
+    cdef bint use_table = table is not None
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_ps), dtype=np.float64)
+    cdef double[:, :] spec_view = spec
+
+    for i in prange(num_parents, nogil=True, num_threads=nthreads):
+        for j in range(num_ps):
+            if not (use_table and table.c_interp(eng_ps[j], eparents[i], &spec_view[i, j])):
+                spec_view[i, j] = __boosted_spectrum_point(eng_ps[j], eparents[i])
     return spec
 
 
@@ -83,12 +178,25 @@ def charged_pion_positron_spectrum(epos, epi):
     ----------
     epos: float or array-like
         Positron energy.
-    epi: float 
-        Energy of the pion.
+    epi: float or array-like
+        Energy of the pion. For an array of energies, the spectra are
+        returned as an array of shape (len(epi), len(epos)).
     """
+    cdef double value
+
+    if hasattr(epi, '__len__'):
+        parent_energies = np.array(epi, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(epos, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Positron energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_charged_pion_positron_spectrum_matrix(energies, parent_energies)
+        return c_charged_pion_positron_spectrum_matrix(np.atleast_1d(energies), parent_energies)[:, 0]
+
     if hasattr(epos, '__len__'):
-        energies = np.array(epos)
+        energies = np.array(epos, dtype=np.float64)
         assert len(energies.shape) == 1, "Positron energies must be 0 or 1-dimensional."
         return c_charged_pion_positron_spectrum_array(energies, epi)
-    else:
-        return c_charged_pion_positron_spectrum_point(epos, epi)
+    if __tables.c_lookup(epos, epi, 1, &value):
+        return value
+    return c_charged_pion_positron_spectrum_point(epos, epi)
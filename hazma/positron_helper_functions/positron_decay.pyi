@@ -5,5 +5,6 @@ def positron(
     mat_elem_sqrd=lambda k_list: 1.0,
     num_ps_pts=10000,
     num_bins=25,
+    events=None,
 ):
     ...
@@ -12,9 +12,9 @@ from hazma import rambo
 from hazma.rambo import compute_annihilation_cross_section
 from hazma.rambo import compute_decay_width
 from hazma.positron_helper_functions.positron_muon cimport c_muon_positron_spectrum_array
-from hazma.positron_helper_functions.positron_muon cimport c_muon_positron_spectrum_point
+from hazma.positron_helper_functions.positron_muon cimport c_muon_positron_spectrum_matrix
 from hazma.positron_helper_functions.positron_charged_pion cimport c_charged_pion_positron_spectrum_array
-from hazma.positron_helper_functions.positron_charged_pion cimport c_charged_pion_positron_spectrum_point
+from hazma.positron_helper_functions.positron_charged_pion cimport c_charged_pion_positron_spectrum_matrix
 
 include "../decay_helper_functions/common.pxd"
 
@@ -28,7 +28,7 @@ cdef int ID_E = 3
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] id_to_mass(int ident):
+cdef double id_to_mass(int ident):
     if ident == ID_MU:
         return MASS_MU
     elif ident == ID_PI:
@@ -55,29 +55,35 @@ cdef np.ndarray[np.float64_t,ndim=1] id_to_masses(np.ndarray[np.int_t,ndim=1] id
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] c_positron_array_two_body(int id1, int id2, double cme, np.ndarray[np.int_t,ndim=1] eng_ps):
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(eng_ps)
-    cdef int npts = eng_ps.shape[0]
+cdef np.ndarray[np.float64_t,ndim=1] c_positron_array_single(int ident, double eng, np.ndarray[np.float64_t,ndim=1] eng_ps):
+    if ident == ID_MU:
+        return c_muon_positron_spectrum_array(eng_ps, eng)
+    elif ident == ID_PI:
+        return c_charged_pion_positron_spectrum_array(eng_ps, eng)
+    return np.zeros_like(eng_ps)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef np.ndarray[np.float64_t,ndim=2] c_positron_matrix(int ident, np.ndarray[np.float64_t,ndim=1] engs, np.ndarray[np.float64_t,ndim=1] eng_ps):
+    if ident == ID_MU:
+        return c_muon_positron_spectrum_matrix(eng_ps, engs)
+    elif ident == ID_PI:
+        return c_charged_pion_positron_spectrum_matrix(eng_ps, engs)
+    return np.zeros((engs.shape[0], eng_ps.shape[0]), dtype=np.float64)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef np.ndarray[np.float64_t,ndim=1] c_positron_array_two_body(int id1, int id2, double cme, np.ndarray[np.float64_t,ndim=1] eng_ps):
     cdef double m1 = id_to_mass(id1)
     cdef double m2 = id_to_mass(id2)
     cdef double E1 = (cme * cme + m1 * m1 - m2 * m2) / (2 * cme)
     cdef double E2 = (cme * cme - m1 * m1 + m2 * m2) / (2 * cme)
-   
-    if id1 == ID_MU:
-        for i in range(npts):
-            spec[i] += c_muon_positron_spectrum_point(eng_ps[i], E1)
-    elif id1 == ID_PI:
-        for i in range(npts):
-            spec[i] += c_charged_pion_positron_spectrum_point(eng_ps[i], E1)
-
-    if id2 == ID_MU:
-        for i in range(npts):
-            spec[i] += c_muon_positron_spectrum_point(eng_ps[i], E2)
-    elif id2 == ID_PI:
-        for i in range(npts):
-            spec[i] += c_charged_pion_positron_spectrum_point(eng_ps[i], E2)
 
-    return spec
+    return c_positron_array_single(id1, E1, eng_ps) + c_positron_array_single(id2, E2, eng_ps)
 
 
 @cython.boundscheck(False)
@@ -89,50 +95,49 @@ cdef np.ndarray[np.float64_t,ndim=1] c_positron_array(
     np.ndarray[np.float64_t,ndim=1] eng_ps,
     mat_elem_sqrd,
     int num_ps_pts,
-    int num_bins
+    int num_bins,
+    events=None
 ):
     cdef np.ndarray[np.float64_t,ndim=1] masses = id_to_masses(ids)
     cdef int num_fsp  = ids.shape[0]
-    cdef int num_engs = eng_ps.shape[0]
     cdef np.ndarray hist
+    cdef np.ndarray norms
     cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(eng_ps)
 
     if num_fsp == 1:
-        if ids[0] == ID_MU:
-            return c_muon_positron_spectrum_array(eng_ps, cme)
-        elif ids[0] == ID_PI:
-            return c_charged_pion_positron_spectrum_array(eng_ps, cme)
-        else:
-            return np.zeros_like(eng_ps)
+        return c_positron_array_single(ids[0], cme, eng_ps)
     elif num_fsp == 2:
         return c_positron_array_two_body(ids[0], ids[1], cme, eng_ps)
 
-    hist = rambo.generate_energy_histogram(masses, cme, num_ps_pts, mat_elem_sqrd, num_bins, density=True)[0]
-
-    for i in range(num_bins):
-        for j in range(num_fsp):
-            eng = hist[j, 0, i]
-            # Normalize spectrum: Need to multiply by the probability of
-            # particle having energy part_eng. Since we are essentially
-            # integrating over the energy probability distribution, we need to
-            # multiply by (b - a) / N, where a = e_min, b = e_max and
-            # N = num_bins.
-            norm = (hist[j, 0, num_bins-1] - hist[j, 0, 0]) / num_bins * hist[j, 1, i]
-
-            if ids[j] == ID_MU:
-                for k in range(num_engs):
-                    spec[i] += norm * c_muon_positron_spectrum_point(eng_ps[k], eng)
-
-            elif ids[j] == ID_PI:
-                for k in range(num_engs):
-                    spec[i] += norm * c_charged_pion_positron_spectrum_point(eng_ps[k], eng)
+    if events is None:
+        hist = rambo.generate_energy_histogram(masses, cme, num_ps_pts, mat_elem_sqrd, num_bins, density=True)[0]
+    else:
+        events.check_kinematics(masses, cme)
+        hist = events.energy_histogram(mat_elem_sqrd, num_bins, density=True)[0]
+
+    # Normalize spectrum: Need to multiply by the probability of particle
+    # having energy part_eng. Since we are essentially integrating over the
+    # energy probability distribution, we need to multiply by (b - a) / N,
+    # where a = e_min, b = e_max and N = num_bins.
+    norms = (hist[:, 0, -1] - hist[:, 0, 0])[:, np.newaxis] / num_bins * hist[:, 1, :]
+
+    # Compute the spectra of each species for all of the energies of its
+    # particles in a single call. The convolution with the energy
+    # distributions is then a matrix-vector product.
+    for ident in np.unique(ids):
+        if ident != ID_MU and ident != ID_PI:
+            continue
+        idxs = np.nonzero(ids == ident)[0]
+        part_engs, inv = np.unique(hist[idxs, 0, :].ravel(), return_inverse=True)
+        weights = np.bincount(inv, weights=norms[idxs].ravel(), minlength=len(part_engs))
+        spec += weights @ c_positron_matrix(ident, part_engs, eng_ps)
 
     return spec
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def positron(particles, cme, eng_ps, mat_elem_sqrd=lambda k_list: 1.0, num_ps_pts=10000, num_bins=25):
+def positron(particles, cme, eng_ps, mat_elem_sqrd=lambda k_list: 1.0, num_ps_pts=10000, num_bins=25, events=None):
     """Returns total gamma ray spectrum from final state particles.
 
     Parameters
@@ -152,6 +157,9 @@ def positron(particles, cme, eng_ps, mat_elem_sqrd=lambda k_list: 1.0, num_ps_pt
         Number of phase space points to use.
     num_bins : int
         Number of bins to use.
+    events : EventStore
+        Stored events of the final state to reweight by ``mat_elem_sqrd``
+        instead of generating new ones. ``num_ps_pts`` is then ignored.
 
     Returns
     -------
@@ -172,13 +180,13 @@ def positron(particles, cme, eng_ps, mat_elem_sqrd=lambda k_list: 1.0, num_ps_pt
         else:
             raise ValueError("Invalid particle " + particle + ".")
         
-    energies = np.array(eng_ps)
+    energies = np.array(eng_ps, dtype=np.float64)
     assert len(energies.shape) == 1, "Positron energies must be 0 or 1-dimensional."
 
     if len(energies) > 1:
-        return c_positron_array(ids, cme, energies, mat_elem_sqrd, num_ps_pts, num_bins)
+        return c_positron_array(ids, cme, energies, mat_elem_sqrd, num_ps_pts, num_bins, events)
     else:
-        spec = c_positron_array(ids, cme, eng_ps, mat_elem_sqrd, num_ps_pts, num_bins)
+        spec = c_positron_array(ids, cme, energies, mat_elem_sqrd, num_ps_pts, num_bins, events)
         return spec[0]
 
 
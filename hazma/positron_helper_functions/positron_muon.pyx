@@ -1,14 +1,26 @@
 import numpy as np
 cimport numpy as np
 import cython
-from libc.math cimport sqrt
+from cython.parallel cimport prange
+from libc.math cimport sqrt, pow
 from scipy.integrate import quad
+from hazma.decay_helper_functions.rest_frame_spectra cimport boost_by_quad
+from hazma.decay_helper_functions.decay_tables cimport DecaySpectrumTable, DecaySpectrumTables
+from hazma.parallel import num_threads
 
 include "../decay_helper_functions/common.pxd"
 
 cdef double mmu = MASS_MU
 cdef double me = MASS_E
 
+# Maximum energy of the positron in the muon rest frame
+cdef double eng_p_max_mu_rf = (me * me + mmu * mmu) / (2.0 * mmu)
+
+
+cdef struct BoostArgs:
+    double eng_p
+    double eng_mu
+
 # ===================================================================
 # ---- Cython API ---------------------------------------------------
 # ===================================================================
@@ -16,7 +28,7 @@ cdef double me = MASS_E
 @cython.boundscheck(True)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double __spectrum_rf(double eng_p):
+cdef double __spectrum_rf(double eng_p) nogil:
     cdef double r = me / mmu
     cdef double s = me * me - 2. * eng_p * mmu + mmu * mmu
     cdef double smax = (mmu - me) * (mmu - me)
@@ -26,45 +38,127 @@ cdef double __spectrum_rf(double eng_p):
 
     return 2 * mmu * (2 * (pow(mmu, 4) * pow(-1 + r * r, 2) + mmu * mmu *
                            (1 + r * r) * s - 2 * s * s) *
-                      np.sqrt(pow(mmu, 4) * pow(-1 + r * r, 2) -
-                              2 * mmu**2 * (1 + r * r) * s + s * s)) / pow(mmu, 8)
+                      sqrt(pow(mmu, 4) * pow(-1 + r * r, 2) -
+                           2 * mmu**2 * (1 + r * r) * s + s * s)) / pow(mmu, 8)
 
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double __integrand(double cl, double eng_p, double eng_mu):
+cdef double __integrand(double cl, double eng_p, double eng_mu) nogil:
     if eng_p < me:
         return 0.0
     cdef double p = sqrt(eng_p * eng_p - me * me)
-    cdef double gamma = eng_mu / mmu
-    cdef double beta = sqrt(1.0 - pow(mmu / eng_mu, 2))
-    cdef double emurf = gamma * (eng_p - p * beta * cl)
-    cdef double jac = p / (2. * sqrt((1 + pow(beta * cl, 2)) * eng_p * eng_p -
-                                     (1 + beta * beta * (-1 + cl * cl)) *
-                                     me * me -
-                                     2 * beta * cl * eng_p * p) * gamma)
-    return __spectrum_rf(emurf) * jac
+    cdef double emurf = rest_frame_energy(eng_p, me, eng_mu, mmu, cl)
+    if emurf <= me:
+        return 0.0
+    return __spectrum_rf(emurf) * p / (2.0 * sqrt((emurf - me) * (emurf + me)))
+
+
+cdef double __gk_integrand(double cl, void* args) nogil:
+    cdef BoostArgs* boost = <BoostArgs*>args
+    return __integrand(cl, boost.eng_p, boost.eng_mu)
+
+
+def __quad_integrand(double cl, double eng_p, double eng_mu):
+    return __integrand(cl, eng_p, eng_mu)
 
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
 @cython.cdivision(True)
-cdef double c_muon_positron_spectrum_point(double eng_p, double eng_mu):
-    if eng_mu < mmu:
+cdef double __boosted_spectrum_point(double eng_p, double eng_mu) nogil:
+    cdef BoostArgs args
+    cdef double points[3]
+    cdef int num_points = 2
+    cdef double p, cl
+
+    if eng_mu < mmu or eng_p < me:
         return 0.0
-    return quad(__integrand, -1., 1., points=[-1.0, 1.0],
-                args=(eng_p, eng_mu), epsabs=1e-10, epsrel=1e-4)[0]
 
+    if boost_by_quad():
+        with gil:
+            return quad(__quad_integrand, -1., 1., points=[-1.0, 1.0],
+                        args=(eng_p, eng_mu), epsabs=1e-10, epsrel=1e-4)[0]
 
-@cython.boundscheck(True)
+    # Only positrons at angles inside of the one reaching the maximum
+    # energy in the muon rest frame contribute.
+    p = sqrt(eng_p * eng_p - me * me)
+    cl = (eng_p - eng_p_max_mu_rf * mmu / eng_mu) / (p * beta(eng_mu, mmu))
+    points[0] = -1.0
+    if -1.0 < cl < 1.0:
+        points[1] = cl
+        points[2] = 1.0
+        num_points = 3
+    else:
+        points[1] = 1.0
+
+    args.eng_p = eng_p
+    args.eng_mu = eng_mu
+    return gauss_kronrod(__gk_integrand, &args, points, num_points, 1e-10, 1e-4)
+
+
+@cython.boundscheck(False)
 @cython.wraparound(False)
-@cython.cdivision(True)
+cdef np.ndarray[np.float64_t,ndim=1] __spectrum_array(double[:] eng_ps, double eng_mu, DecaySpectrumTable table):
+    """
+    Returns the spectrum at many positron energies, interpolated from
+    `table` where possible. The positron energies are distributed over
+    ``hazma.parallel.num_threads()`` threads, unless the boost is computed
+    by quadrature.
+    """
+    cdef int i
+    cdef int npts = eng_ps.shape[0]
+    cdef int nthreads = 1 if boost_by_quad() else num_threads()
+    cdef bint use_table = table is not None
+    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros(npts, dtype=np.float64)
+    cdef double[:] spec_view = spec
+    for i in prange(npts, nogil=True, num_threads=nthreads):
+        if not (use_table and table.c_interp(eng_ps[i], eng_mu, &spec_view[i])):
+            spec_view[i] = __boosted_spectrum_point(eng_ps[i], eng_mu)
+    return spec
+
+
+def _boosted_spectrum(np.ndarray[np.float64_t,ndim=1] eng_ps, double eng_mu, int mode):
+    """
+    Returns the spectrum boosted from the rest frame. Used to build the decay
+    tables.
+    """
+    return __spectrum_array(eng_ps, eng_mu, None)
+
+
+cdef DecaySpectrumTables __tables = DecaySpectrumTables(
+    "muon_positron", mmu, eng_p_max_mu_rf, _boosted_spectrum
+)
+
+
+cdef double c_muon_positron_spectrum_point(double eng_p, double eng_mu) nogil:
+    return __boosted_spectrum_point(eng_p, eng_mu)
+
+
 cdef np.ndarray[np.float64_t,ndim=1] c_muon_positron_spectrum_array(np.ndarray[np.float64_t,ndim=1] engs_p, double eng_mu):
-    cdef int npts = engs_p.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(engs_p)
-    for i in range(npts):
-        spec[i] = c_muon_positron_spectrum_point(engs_p[i], eng_mu)
+    """Returns the positron spectrum from a muon for many positron energies."""
+    return __spectrum_array(engs_p, eng_mu, __tables.c_table(1))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef np.ndarray[np.float64_t,ndim=2] c_muon_positron_spectrum_matrix(np.ndarray[np.float64_t,ndim=1] eng_ps, np.ndarray[np.float64_t,ndim=1] eparents):
+    """
+    Returns the spectra for each parent energy, with shape
+    (len(eparents), len(eng_ps)).
+    """
+    cdef int i, j
+    cdef int num_parents = eparents.shape[0]
+    cdef int num_ps = eng_ps.shape[0]
+    cdef int nthreads = 1 if boost_by_quad() else num_threads()
+    cdef DecaySpectrumTable table = __tables.c_table(1)
+    cdef bint use_table = table is not None
+    cdef np.ndarray[np.float64_t,ndim=2] spec = np.zeros((num_parents, num_ps), dtype=np.float64)
+    cdef double[:, :] spec_view = spec
+
+    for i in prange(num_parents, nogil=True, num_threads=nthreads):
+        for j in range(num_ps):
+            if not (use_table and table.c_interp(eng_ps[j], eparents[i], &spec_view[i, j])):
+                spec_view[i, j] = __boosted_spectrum_point(eng_ps[j], eparents[i])
     return spec
 
 
@@ -80,12 +174,25 @@ def muon_positron_spectrum(epos, emu):
     ----------
     epos: float or array-like
         Positron energy.
-    emu: float 
-        Energy of the muon.
+    emu: float or array-like
+        Energy of the muon. For an array of energies, the spectra are
+        returned as an array of shape (len(emu), len(epos)).
     """
+    cdef double value
+
+    if hasattr(emu, '__len__'):
+        parent_energies = np.array(emu, dtype=np.float64)
+        assert len(parent_energies.shape) == 1, "Parent energies must be 0 or 1-dimensional."
+        energies = np.array(epos, dtype=np.float64)
+        assert len(energies.shape) <= 1, "Positron energies must be 0 or 1-dimensional."
+        if len(energies.shape) == 1:
+            return c_muon_positron_spectrum_matrix(energies, parent_energies)
+        return c_muon_positron_spectrum_matrix(np.atleast_1d(energies), parent_energies)[:, 0]
+
     if hasattr(epos, '__len__'):
-        energies = np.array(epos)
+        energies = np.array(epos, dtype=np.float64)
         assert len(energies.shape) == 1, "Positron energies must be 0 or 1-dimensional."
         return c_muon_positron_spectrum_array(energies, emu)
-    else:
-        return c_muon_positron_spectrum_point(epos, emu)
+    if __tables.c_lookup(epos, emu, 1, &value):
+        return value
+    return c_muon_positron_spectrum_point(epos, emu)
@@ -5,6 +5,8 @@ Module for computing positron spectra.
 
 import numpy as np
 
+from hazma.decay_helper_functions.decay_tables import disable_tables  # noqa: F401
+from hazma.decay_helper_functions.decay_tables import enable_tables  # noqa: F401
 from hazma.positron_helper_functions import positron_charged_pion, positron_muon
 from hazma.positron_helper_functions.positron_decay import positron
 
@@ -18,13 +20,15 @@ def muon(positron_energies, muon_energy):
     positron_energies : float or numpy.array
         Energy(ies) of the positron/electron.
     muon_energy : float or array-like
-        Energy of the muon.
+        Energy(ies) of the muon.
 
     Returns
     -------
     dnde : float or numpy.array
         The value of the spectrum given a positron energy(ies)
-        ``positron_energies`` and muon energy ``muon_energy``.
+        ``positron_energies`` and muon energy ``muon_energy``. For an array
+        of muon energies, the spectra have shape
+        (len(muon_energy), len(positron_energies)).
     """
     return positron_muon.muon_positron_spectrum(positron_energies, muon_energy)
 
@@ -38,13 +42,15 @@ def charged_pion(positron_energies, pion_energy):
     positron_energies : float or numpy.array
         Energy(ies) of the positron/electron.
     pion_energy : float or numpy.array
-        Energy of the charged pion.
+        Energy(ies) of the charged pion.
 
     Returns
     -------
     dnde : float or numpy.array
         The value of the spectrum given a positron energy(ies)
-        ``positron_energies`` and charged pion energy ``pion_energy``.
+        ``positron_energies`` and charged pion energy ``pion_energy``. For an
+        array of pion energies, the spectra have shape
+        (len(pion_energy), len(positron_energies)).
     """
     return positron_charged_pion.charged_pion_positron_spectrum(
         positron_energies, pion_energy
@@ -58,6 +64,7 @@ def positron_decay(
     mat_elem_sqrd=lambda _: 1.0,
     num_ps_pts=1000,
     num_bins=25,
+    events=None,
 ):
     r"""Returns total gamma ray spectrum from a set of particles.
 
@@ -78,6 +85,11 @@ def positron_decay(
         Number of phase space points to use.
     num_bins : int {25}, optional
         Number of bins to use.
+    events: EventStore, optional
+        Stored RAMBO events of the final state (see
+        ``hazma.phase_space_helper_functions.event_store``). If given, they
+        are reweighted by `mat_elem_sqrd` instead of generating new events.
+        `num_ps_pts` is then ignored.
 
     Returns
     -------
@@ -124,4 +136,5 @@ def positron_decay(
         mat_elem_sqrd=mat_elem_sqrd,
         num_ps_pts=num_ps_pts,
         num_bins=num_bins,
+        events=events,
     )
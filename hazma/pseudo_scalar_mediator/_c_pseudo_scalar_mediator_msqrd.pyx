@@ -0,0 +1,160 @@
+"""
+Native squared matrix elements of the pseudo-scalar mediator model for
+RAMBO. These are C versions of the matrix elements in
+``_pseudo_scalar_mediator_msqrd_rambo.py`` and are registered in
+``hazma.phase_space_helper_functions.native``. The parameters are, in order,
+(mx, mp, gpxx, gpuu, gpdd, gpGG, beta, width_p).
+"""
+import cython
+from libcpp.vector cimport vector
+
+from hazma.phase_space_helper_functions.native cimport register_matrix_element
+from hazma.parameters import b0 as _b0
+from hazma.parameters import fpi as _fpi
+from hazma.parameters import vh as _vh
+from hazma.parameters import up_quark_mass as _muq
+from hazma.parameters import down_quark_mass as _mdq
+from hazma.parameters import charged_pion_mass as _mpi
+from hazma.parameters import neutral_pion_mass as _mpi0
+
+cdef double b0 = _b0
+cdef double fpi = _fpi
+cdef double vh = _vh
+cdef double muq = _muq
+cdef double mdq = _mdq
+cdef double mpi = _mpi
+cdef double mpi0 = _mpi0
+
+PARAM_NAMES = ("mx", "mp", "gpxx", "gpuu", "gpdd", "gpGG", "beta", "width_p")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double ldot(vector[double] &fv1, vector[double] &fv2) nogil:
+    return fv1[0] * fv2[0] - fv1[1] * fv2[1] - fv1[2] * fv2[2] - fv1[3] * fv2[3]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double msqrd_xx_to_p_to_pm0(vector[vector[double]] &momenta,
+                                 vector[double] &params) nogil:
+    """
+    Squared matrix element for dark matter annihilating into two charged pions
+    and a neutral pion through a pseudo-scalar mediator. Momenta are ordered
+    as follows: {pi+, pi-, pi0}.
+    """
+    cdef double mx = params[0]
+    cdef double mp = params[1]
+    cdef double gpxx = params[2]
+    cdef double gpuu = params[3]
+    cdef double gpdd = params[4]
+    cdef double gpGG = params[5]
+    cdef double beta = params[6]
+    cdef double widthp = params[7]
+
+    cdef double p12 = ldot(momenta[0], momenta[1])
+    cdef double p13 = ldot(momenta[0], momenta[2])
+    cdef double p23 = ldot(momenta[1], momenta[2])
+    cdef double e_cm = momenta[0][0] + momenta[1][0] + momenta[2][0]
+    # mx^2 + px.pxbar for incoming DM along the z-axis in the CM frame.
+    cdef double xx = e_cm ** 2 / 2.0
+
+    cdef double c = (
+        -(b0 * fpi * gpGG * mdq)
+        + b0 * fpi * gpGG * muq
+        - b0 * fpi * gpdd * vh
+        + b0 * fpi * gpuu * vh
+    )
+    cdef double d = (
+        b0 * mdq * vh
+        + 2 * mpi ** 2 * vh
+        - 2 * mpi0 ** 2 * vh
+        + b0 * muq * vh
+        + 4 * vh * p12
+        - 2 * vh * p13
+        - 2 * vh * p23
+    )
+    cdef double den = (
+        9.0
+        * fpi ** 4
+        * vh ** 2
+        * (
+            (-mp ** 2 + 2 * mpi ** 2 + mpi0 ** 2) ** 2
+            + mp ** 2 * widthp ** 2
+            - 4
+            * (mp ** 2 - 2 * mpi ** 2 - mpi0 ** 2 - p12 - p13 - p23)
+            * (p12 + p13 + p23)
+        )
+    )
+
+    return (
+        gpxx ** 2
+        * xx
+        * (c ** 2 + 2 * beta * c * d + beta ** 2 * (d ** 2 - 5 * c ** 2))
+        / den
+    )
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double msqrd_xx_to_p_to_000(vector[vector[double]] &momenta,
+                                 vector[double] &params) nogil:
+    """
+    Squared matrix element for dark matter annihilating into three neutral
+    pions through a pseudo-scalar mediator.
+    """
+    cdef double mx = params[0]
+    cdef double mp = params[1]
+    cdef double gpxx = params[2]
+    cdef double gpuu = params[3]
+    cdef double gpdd = params[4]
+    cdef double gpGG = params[5]
+    cdef double beta = params[6]
+    cdef double widthp = params[7]
+
+    cdef double p12 = ldot(momenta[0], momenta[1])
+    cdef double p13 = ldot(momenta[0], momenta[2])
+    cdef double p23 = ldot(momenta[1], momenta[2])
+    cdef double e_cm = momenta[0][0] + momenta[1][0] + momenta[2][0]
+    # mx^2 + px.pxbar for incoming DM along the z-axis in the CM frame.
+    cdef double xx = e_cm ** 2 / 2.0
+
+    cdef double e = (
+        fpi * gpGG * mdq - fpi * gpGG * muq + fpi * gpdd * vh - fpi * gpuu * vh
+    )
+    cdef double q = mdq * vh + muq * vh
+    cdef double den = (
+        fpi ** 4
+        * vh ** 2
+        * (
+            (mp ** 2 - 3 * mpi0 ** 2) ** 2
+            + mp ** 2 * widthp ** 2
+            - 4 * (mp ** 2 - 3 * mpi0 ** 2 - p12 - p13 - p23) * (p12 + p13 + p23)
+        )
+    )
+
+    return (
+        b0 ** 2
+        * gpxx ** 2
+        * xx
+        * (e ** 2 - 2 * beta * e * q + beta ** 2 * (q ** 2 - 11 * e ** 2))
+        / den
+    )
+
+
+register_matrix_element(
+    "pseudo_scalar_mediator.xx_to_p_to_pm0",
+    msqrd_xx_to_p_to_pm0,
+    3,
+    PARAM_NAMES,
+    __name__,
+)
+register_matrix_element(
+    "pseudo_scalar_mediator.xx_to_p_to_000",
+    msqrd_xx_to_p_to_000,
+    3,
+    PARAM_NAMES,
+    __name__,
+)
@@ -5,11 +5,44 @@ from hazma.parameters import neutral_pion_mass as mpi0
 from hazma.parameters import up_quark_mass as muq
 from hazma.parameters import down_quark_mass as mdq
 from hazma.parameters import b0, vh, fpi, qe
+from hazma.phase_space_helper_functions import native
+
+# Registers the native versions of the matrix elements.
+from hazma.pseudo_scalar_mediator import _c_pseudo_scalar_mediator_msqrd  # noqa
 
 import numpy as np
 
 
 class PseudoScalarMediatorMSqrdRambo:
+    def native_msqrd(self, final_state):
+        """
+        Returns the native version of ``msqrd_xx_to_p_to_<final_state>``,
+        which RAMBO evaluates without the GIL.
+
+        Parameters
+        ----------
+        final_state : str {"pm0", "000"}
+            Final state of the matrix element.
+
+        Returns
+        -------
+        msqrd : hazma.phase_space_helper_functions.native.NativeMatrixElement
+            Squared matrix element with the current parameters of the model.
+        """
+        return native.get_matrix_element(
+            "pseudo_scalar_mediator.xx_to_p_to_" + final_state,
+            [
+                self.mx,
+                self.mp,
+                self.gpxx,
+                self.gpuu,
+                self.gpdd,
+                self.gpGG,
+                self.beta,
+                self.width_p,
+            ],
+        )
+
     def msqrd_xx_to_p_to_pm0(self, momenta):
         """
         Returns the squared matrix element for dark matter annihilating into
@@ -17,7 +17,7 @@ class PseudoScalarMediatorPositronSpectra:
             cme,
             eng_ps,
             num_ps_pts=1000,
-            mat_elem_sqrd=self.msqrd_xx_to_p_to_pm0,
+            mat_elem_sqrd=self.native_msqrd("pm0"),
         )
 
     def dnde_pos_mumu(eng_ps, cme):
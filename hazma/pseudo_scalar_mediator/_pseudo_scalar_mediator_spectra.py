@@ -102,18 +102,15 @@ class PseudoScalarMediatorSpectra:
 
             return np.array([0.0 for _ in range(len(egams))])
         elif spectrum_type == "decay":
-            # Define the matrix element squared for RAMBO. This needs to be
-            # of the form double(*func)(np.ndarray) where the np.ndarray is
-            # a list of 4-momenta. Note msqrd_xx_to_p_to_pm0 takes params as
-            # the second argument. The first and second FS particles must be
-            # the charged pions and the third a neutral pion.
-
+            # Use the native matrix element, which RAMBO evaluates without
+            # the GIL. The first and second FS particles must be the charged
+            # pions and the third a neutral pion.
             return gamma_ray_decay(
                 ["charged_pion", "charged_pion", "neutral_pion"],
                 cme,
                 egams,
                 num_ps_pts=1000,
-                mat_elem_sqrd=self.msqrd_xx_to_p_to_pm0,
+                mat_elem_sqrd=self.native_msqrd("pm0"),
             )
         else:
             raise ValueError(
@@ -140,19 +137,12 @@ class PseudoScalarMediatorSpectra:
         elif spectrum_type == "fsr":
             return np.array([0.0 for _ in range(len(egams))])
         elif spectrum_type == "decay":
-            # Define the matrix element squared for RAMBO. This needs to be
-            # of the form double(*func)(np.ndarray) where the np.ndarray is
-            # a list of 4-momenta. Note msqrd_xx_to_p_to_000 takes params as
-            # the second argument.
-            def msqrd_tree(momenta):
-                return self.msqrd_xx_to_p_to_000(momenta)
-
             return gamma_ray_decay(
                 ["neutral_pion", "neutral_pion", "neutral_pion"],
                 cme,
                 egams,
                 num_ps_pts=1000,
-                mat_elem_sqrd=msqrd_tree,
+                mat_elem_sqrd=self.native_msqrd("000"),
             )
         else:
             raise ValueError(
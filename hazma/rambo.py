@@ -4,27 +4,99 @@
 # Authors: Logan Morrison and Adam Coogan
 # Date: December 2017
 
-TODO: Code up specific functions for cross-section
-      functions for 2->2 processes.
-TODO: Code up specific functions for cross-section
-      functions for 2->3 processes.
-
 """
+from hazma.phase_space_helper_functions import dalitz
 from hazma.phase_space_helper_functions import generator
 from hazma.phase_space_helper_functions import histogram
-from hazma.phase_space_helper_functions.modifiers import apply_matrix_elem
+from hazma.phase_space_helper_functions import native
+from hazma.phase_space_helper_functions import qmc
+from hazma.phase_space_helper_functions import sequential
+from hazma.phase_space_helper_functions import statistics
+from hazma.phase_space_helper_functions import vegas
+from hazma.phase_space_helper_functions.modifiers import (
+    apply_matrix_elem,
+    apply_matrix_elem_batched,
+)
 import numpy as np
-import multiprocessing as mp
 import warnings
+from scipy import stats
 
+from hazma import parallel
 from hazma.hazma_errors import RamboCMETooSmall
 
 from hazma.field_theory_helper_functions.common_functions import (
     cross_section_prefactor,
 )
 
+# Number of phase space points generated from each random number stream.
+RNG_CHUNK_SIZE = 2 ** 14
+# Sampling modes understood by the phase space generators.
+SAMPLING_MODES = ("pseudo", "sobol")
+# Largest relative error of the quadrature over two- and three-body phase
+# space accepted by the "auto" integration method before falling back to
+# RAMBO.
+DALITZ_RTOL = 1e-3
+# Estimates of the adaptive integrator from earlier grids are discarded if
+# their chi^2 is less likely than this.
+VEGAS_MIN_CHI2_PVALUE = 1e-3
+
+
+def batched_matrix_element(mat_elem_sqrd):
+    """
+    Mark a squared matrix element as batched.
+
+    A batched squared matrix element takes all of the four-momenta at once,
+    as an array of shape (num_ps_pts, num_fsp, 4), and returns an array of
+    `num_ps_pts` squared matrix elements. Functions marked with this
+    decorator are automatically evaluated in a single call by the functions
+    in this module.
+
+    Parameters
+    ----------
+    mat_elem_sqrd : callable
+        Batched squared matrix element.
+
+    Returns
+    -------
+    mat_elem_sqrd : callable
+        The same function, marked as batched.
+
+    Examples
+    --------
+
+    Squared matrix element for mu -> e nu nu evaluated on all phase space
+    points at once::
+
+        import numpy as np
+        from hazma.parameters import GF
+        from hazma.rambo import batched_matrix_element
+
+        @batched_matrix_element
+        def msqrd(momenta):
+            pe = momenta[:, 0]
+            pve = momenta[:, 1]
+            pvmu = momenta[:, 2]
+            pmu = momenta.sum(axis=1)
+            dot = lambda p1, p2: p1[:, 0] * p2[:, 0] - np.sum(
+                p1[:, 1:] * p2[:, 1:], axis=1)
+            return 64. * GF**2 * dot(pe, pvmu) * dot(pmu, pve)
+
+    """
+    mat_elem_sqrd.batched = True
+    return mat_elem_sqrd
+
+
+def _is_batched(mat_elem_sqrd, batched=None):
+    """
+    Determine if a squared matrix element is batched. If `batched` is None,
+    the `batched` attribute set by `batched_matrix_element` is used.
+    """
+    if batched is None:
+        return getattr(mat_elem_sqrd, "batched", False)
+    return batched
+
 
-def generate_phase_space_point(masses, cme):
+def generate_phase_space_point(masses, cme, seed=None):
     """
     Generate a phase space point given a set of final state particles and a
     given center of mass energy.
@@ -35,6 +107,9 @@ def generate_phase_space_point(masses, cme):
         List of masses of the final state particles.
     cme : double
         Center-of-mass-energy of the process.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generator. If None, fresh entropy is drawn
+        from the operating system.
 
     Returns
     -------
@@ -50,11 +125,19 @@ def generate_phase_space_point(masses, cme):
         masses = [masses]
 
     masses = np.array(masses)
-    return generator.generate_point(masses, cme, len(masses))
+    return generator.generate_point(masses, cme, len(masses), seed=seed)
 
 
 def generate_phase_space(
-    masses, cme, num_ps_pts=10000, mat_elem_sqrd=lambda klist: 1, num_cpus=None
+    masses,
+    cme,
+    num_ps_pts=10000,
+    mat_elem_sqrd=lambda klist: 1,
+    num_cpus=None,
+    batched=None,
+    seed=None,
+    sampling="pseudo",
+    num_randomizations=8,
 ):
     """
     Generate a specified number of phase space points given a set of
@@ -71,9 +154,37 @@ def generate_phase_space(
         Total number of phase space points to generate.
     mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1]
         Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
     num_cpus : int {None]
-        Number of cpus to use in parallel with rambo. If not specified, 75% of
-        the cpus will be used.
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per chunk of points with an
+        array of four-momenta of shape (n, num_fsp, 4) and must return `n`
+        values. If False, it is called once per phase space point with an
+        array of shape (num_fsp, 4). If not specified, functions decorated
+        with `batched_matrix_element` are treated as batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generators. Independent, non-overlapping
+        streams are derived from it for each chunk of
+        ``RNG_CHUNK_SIZE`` points, so results are reproducible for a given
+        seed regardless of the number of cpus. If None, fresh entropy is
+        drawn from the operating system.
+    sampling : str {"pseudo"]
+        How the phase space is sampled. With "pseudo", the points are
+        generated from pseudo-random numbers. With "sobol", RAMBO is driven
+        by `num_randomizations` independently scrambled Sobol' sequences of
+        about ``num_ps_pts / num_randomizations`` points each, which
+        converges faster for smooth integrands. Powers of two points per
+        sequence give the best balance.
+    num_randomizations : int {8]
+        Number of independently scrambled Sobol' sequences used when
+        `sampling` is "sobol". Errors are estimated from the spread of the
+        results of the different sequences, so at least two are needed for
+        finite errors. Ignored for "pseudo" sampling.
 
     Returns
     -------
@@ -96,6 +207,101 @@ def generate_phase_space(
         num_ps_pts = 100000
         rambo.generate_phase_space(masses, cme, num_ps_pts=num_ps_pts)
 
+    """
+    chunks = generate_phase_space_chunks(
+        masses,
+        cme,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched=batched,
+        seed=seed,
+        sampling=sampling,
+        num_randomizations=num_randomizations,
+    )
+    return np.concatenate(list(chunks))
+
+
+def generate_phase_space_chunks(
+    masses,
+    cme,
+    num_ps_pts=10000,
+    mat_elem_sqrd=lambda klist: 1,
+    num_cpus=None,
+    batched=None,
+    seed=None,
+    sampling="pseudo",
+    num_randomizations=8,
+):
+    """
+    Lazily generate a specified number of phase space points given a set of
+    final state particles and a given center of mass energy, in chunks of at
+    most ``RNG_CHUNK_SIZE`` points. Only a bounded number of chunks is held in
+    memory at any time, so arbitrarily many points can be processed.
+    Concatenating the chunks gives the same points as
+    ``generate_phase_space`` for the same seed.
+
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_ps_pts : int {10000]
+        Total number of phase space points to generate.
+    mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1]
+        Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
+    num_cpus : int {None]
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per chunk of points with an
+        array of four-momenta of shape (n, num_fsp, 4) and must return `n`
+        values. If False, it is called once per phase space point with an
+        array of shape (num_fsp, 4). If not specified, functions decorated
+        with `batched_matrix_element` are treated as batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generators. Independent, non-overlapping
+        streams are derived from it for each chunk of
+        ``RNG_CHUNK_SIZE`` points, so results are reproducible for a given
+        seed regardless of the number of cpus. If None, fresh entropy is
+        drawn from the operating system.
+    sampling : str {"pseudo"]
+        How the phase space is sampled. With "pseudo", the points are
+        generated from pseudo-random numbers. With "sobol", RAMBO is driven
+        by `num_randomizations` independently scrambled Sobol' sequences of
+        about ``num_ps_pts / num_randomizations`` points each, which
+        converges faster for smooth integrands. Powers of two points per
+        sequence give the best balance.
+    num_randomizations : int {8]
+        Number of independently scrambled Sobol' sequences used when
+        `sampling` is "sobol". Errors are estimated from the spread of the
+        results of the different sequences, so at least two are needed for
+        finite errors. Ignored for "pseudo" sampling.
+
+    Yields
+    ------
+    phase_space_points : numpy.ndarray
+        Chunk of phase space points in the format returned by
+        ``generate_phase_space``.
+
+    Examples
+    --------
+
+    Compute the average weight of 10^8 phase space points::
+
+        from hazma import rambo
+        total, count = 0.0, 0
+        for chunk in rambo.generate_phase_space_chunks(
+                [0., 0., 0.], 100., num_ps_pts=10**8):
+            total += chunk[:, -1].sum()
+            count += len(chunk)
+        total / count
+
     """
     if not hasattr(masses, "__len__"):
         masses = [masses]
@@ -103,57 +309,148 @@ def generate_phase_space(
     if cme < sum(masses):
         raise RamboCMETooSmall()
 
+    _check_arguments(num_ps_pts, sampling, num_randomizations)
+
+    return (
+        points
+        for _, points in _phase_space_chunks(
+            masses,
+            cme,
+            num_ps_pts,
+            mat_elem_sqrd,
+            num_cpus,
+            batched,
+            seed,
+            sampling,
+            num_randomizations,
+        )
+    )
+
+
+def _check_arguments(num_ps_pts, sampling, num_randomizations):
+    if num_ps_pts < 1:
+        raise ValueError("num_ps_pts must be at least 1.")
+    if sampling not in SAMPLING_MODES:
+        raise ValueError(
+            "Invalid sampling {!r}. Must be one of {}.".format(
+                sampling, SAMPLING_MODES
+            )
+        )
+    if sampling == "sobol" and num_randomizations < 1:
+        raise ValueError("num_randomizations must be positive.")
+
+
+def _phase_space_chunks(
+    masses,
+    cme,
+    num_ps_pts,
+    mat_elem_sqrd,
+    num_cpus,
+    batched,
+    seed,
+    sampling="pseudo",
+    num_randomizations=8,
+):
+    """
+    Generator used by ``generate_phase_space_chunks`` once the arguments have
+    been validated. Yields pairs of the index of the randomization the chunk
+    belongs to (always 0 for "pseudo" sampling) and the chunk of points.
+    """
     num_fsp = len(masses)
-    # If the user doesn't specify the number of cpus to use,
-    # use 75% of them.
+    # If the user doesn't specify the number of cpus to use, use all of the
+    # workers of the shared executor.
     if num_cpus is not None:
-        if num_cpus > num_ps_pts:
-            num_cpus = num_ps_pts
-        if num_cpus > mp.cpu_count():
-            num_cpus = int(np.floor(mp.cpu_count() * 0.75))
+        if num_cpus > parallel.cpu_count():
+            num_cpus = parallel.default_num_workers()
             warnings.warn(
                 """You only have {} cpus.
                           Using {} cpus instead.
                           """.format(
-                    mp.cpu_count(), num_cpus
+                    parallel.cpu_count(), num_cpus
                 )
             )
     else:
-        # Use 75% of the cpu power.
-        num_cpus = int(np.floor(mp.cpu_count() * 0.75))
-        # If user wants a number of phase space points which is less
-        # than the number of cpus available, use num_ps_pts cpus instead.
-        if num_cpus > num_ps_pts:
-            num_cpus = num_ps_pts
-
-    # Instantiate `num_cpus` number of workers and divide num_ps_pts among the
-    # the workers to speed up phase space generation.
-    pool = mp.Pool(num_cpus)
-    num_ps_pts_per_cpu = int(num_ps_pts / num_cpus)
-    # If num_ps_pts % num_cpus !=0, then we need to compute the actual number
-    # of phase space points.
-    actual_num_ps_pts = num_ps_pts_per_cpu * num_cpus
-    # Create a container to store the results from the workers
-    job_results = []
-    # Run the jobs on 75% of the cpus.
-    for i in range(num_cpus):
-        job_results.append(
-            pool.apply_async(
-                generator.generate_space,
-                (num_ps_pts_per_cpu, masses, cme, num_fsp),
-            )
+        num_cpus = parallel.num_workers()
+    # If user wants a number of phase space points which is less than the
+    # number of cpus available, use num_ps_pts cpus instead.
+    num_cpus = max(min(num_cpus, num_ps_pts), 1)
+
+    if sampling == "sobol":
+        # Each randomization is a single scrambled Sobol' sequence, split
+        # into consecutive chunks which the workers fast-forward to.
+        num_randomizations = min(num_randomizations, max(num_ps_pts, 1))
+        sizes = [
+            num_ps_pts // num_randomizations
+            + (1 if r < num_ps_pts % num_randomizations else 0)
+            for r in range(num_randomizations)
+        ]
+        seeds = parallel.spawn_seeds(seed, num_randomizations)
+        tasks = [
+            (r, (min(RNG_CHUNK_SIZE, size - start), masses, cme, num_fsp, s, start))
+            for r, (size, s) in enumerate(zip(sizes, seeds))
+            for start in range(0, size, RNG_CHUNK_SIZE)
+        ]
+        fn = qmc.generate_space_sobol
+    else:
+        # Split the points into fixed-size chunks, each with its own random
+        # number stream, so that the result for a given seed does not depend
+        # on the number of workers.
+        chunk_sizes = [
+            min(RNG_CHUNK_SIZE, num_ps_pts - start)
+            for start in range(0, num_ps_pts, RNG_CHUNK_SIZE)
+        ]
+        seeds = parallel.spawn_seeds(seed, len(chunk_sizes))
+        tasks = [
+            (0, (n, masses, cme, num_fsp, s)) for n, s in zip(chunk_sizes, seeds)
+        ]
+        fn = generator.generate_space
+        if isinstance(mat_elem_sqrd, native.NativeMatrixElement):
+            # Generate and weight the points in one loop without the GIL.
+            tasks = [(r, args + (mat_elem_sqrd,)) for r, args in tasks]
+            fn = native.generate_space
+    is_weighted = fn is native.generate_space
+    is_batched = _is_batched(mat_elem_sqrd, batched)
+    # Small problems are not worth shipping to the workers. Keeping at most
+    # `num_cpus` tasks in flight limits the number of busy workers.
+    job_results = parallel.parallel_imap(
+        fn,
+        (args for _, args in tasks),
+        parallel=num_cpus > 1 and num_ps_pts >= parallel.serial_threshold(),
+        max_pending=num_cpus,
+    )
+    for (replica, _), result in zip(tasks, job_results):
+        points = np.array(result).reshape(-1, 4 * num_fsp + 1)
+        # Resize the weights to have the correct cross section.
+        if not is_weighted:
+            points = _apply_matrix_elem(points, num_fsp, mat_elem_sqrd, is_batched)
+        yield replica, points
+
+
+def _apply_matrix_elem(points, num_fsp, mat_elem_sqrd, is_batched):
+    """
+    Multiply the weights of `points` by the squared matrix element, using the
+    native, batched or point-by-point evaluation as appropriate.
+    """
+    if isinstance(mat_elem_sqrd, native.NativeMatrixElement):
+        return mat_elem_sqrd.apply(points)
+    if is_batched:
+        return apply_matrix_elem_batched(
+            points, points.shape[0], num_fsp, mat_elem_sqrd
         )
-    # Close the pool and wait for results to finish
-    pool.close()
-    pool.join()
-    # Put results in a numpy array.
-    points = np.array([result.get() for result in job_results])
-    # Flatten the outer axis to have a list of phase space points.
-    points = points.reshape(actual_num_ps_pts, 4 * num_fsp + 1)
-    # Resize the weights to have the correct cross section.
-    points = apply_matrix_elem(points, actual_num_ps_pts, num_fsp, mat_elem_sqrd)
+    return apply_matrix_elem(points, points.shape[0], num_fsp, mat_elem_sqrd)
 
-    return points
+
+def _randomization_estimate(values):
+    """
+    Combine the results of independent randomizations of a quasi-Monte-Carlo
+    estimate into their mean and the estimated error of the mean.
+    """
+    values = np.asarray(values)
+    if len(values) < 2:
+        return values[0], np.full_like(values[0], np.nan)
+    mean = np.mean(values, axis=0)
+    err = np.std(values, axis=0, ddof=1) / np.sqrt(len(values))
+    return mean, err
 
 
 def generate_energy_histogram(
@@ -164,6 +461,10 @@ def generate_energy_histogram(
     num_bins=25,
     num_cpus=None,
     density=False,
+    batched=None,
+    seed=None,
+    sampling="pseudo",
+    num_randomizations=8,
 ):
     """
     Generate energy histograms for each of the final state particles.
@@ -178,11 +479,39 @@ def generate_energy_histogram(
         Center-of-mass-energy of the process.
     mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1]
         Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
     num_bins : int
         Number of energy bins to use for each of the final state particles.
     num_cpus : int {None]
-        Number of cpus to use in parallel with rambo. If not specified, 75% of
-        the cpus will be used.
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per chunk of points with an
+        array of four-momenta of shape (n, num_fsp, 4) and must return `n`
+        values. If False, it is called once per phase space point with an
+        array of shape (num_fsp, 4). If not specified, functions decorated
+        with `batched_matrix_element` are treated as batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generators. Independent, non-overlapping
+        streams are derived from it for each chunk of
+        ``RNG_CHUNK_SIZE`` points, so results are reproducible for a given
+        seed regardless of the number of cpus. If None, fresh entropy is
+        drawn from the operating system.
+    sampling : str {"pseudo"]
+        How the phase space is sampled. With "pseudo", the points are
+        generated from pseudo-random numbers. With "sobol", RAMBO is driven
+        by `num_randomizations` independently scrambled Sobol' sequences of
+        about ``num_ps_pts / num_randomizations`` points each, which
+        converges faster for smooth integrands. Powers of two points per
+        sequence give the best balance.
+    num_randomizations : int {8]
+        Number of independently scrambled Sobol' sequences used when
+        `sampling` is "sobol". Errors are estimated from the spread of the
+        results of the different sequences, so at least two are needed for
+        finite errors. Ignored for "pseudo" sampling.
     density: Bool
         If true, the histograms will be normalized to have unit area underneath
         the curves, i.e. they will be probability density functions.
@@ -197,6 +526,10 @@ def generate_energy_histogram(
              ...
              [[EN1, EN2, ....], [histM1, histN2, ...]]]
 
+        The bins of each particle span its kinematically allowed energies.
+    errors : numpy.ndarray
+        Estimated errors of the histograms, with shape (num_fsp, num_bins).
+
     Examples
     --------
 
@@ -223,15 +556,245 @@ def generate_energy_histogram(
     if cme < sum(masses):
         raise RamboCMETooSmall()
 
-    num_fsp = len(masses)
+    _check_arguments(num_ps_pts, sampling, num_randomizations)
 
-    pts = generate_phase_space(masses, cme, num_ps_pts, mat_elem_sqrd, num_cpus)
+    # Fill the histograms chunk by chunk to keep memory usage bounded. For
+    # "sobol" sampling, each randomization gets its own histograms.
+    hists = {}
+    for replica, pts in _phase_space_chunks(
+        masses,
+        cme,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched,
+        seed,
+        sampling,
+        num_randomizations,
+    ):
+        if replica not in hists:
+            hists[replica] = statistics.EnergyHistogram(masses, cme, num_bins)
+        hists[replica].update(pts)
+
+    if sampling == "pseudo":
+        return hists[0].result(density=density)
+
+    results = [hists[r].result(density=density)[0] for r in sorted(hists)]
+    probs, errs = _randomization_estimate(results)
+    return probs, errs[:, 1, :]
+
+
+def generate_energy_sample(
+    masses,
+    cme,
+    num_ps_pts=10000,
+    mat_elem_sqrd=lambda klist: 1,
+    num_cpus=None,
+    batched=None,
+    seed=None,
+    sampling="pseudo",
+    num_randomizations=8,
+):
+    """
+    Generate the energies of the final state particles and the weights of
+    the phase space points, without binning them.
 
-    actual_num_ps_pts = pts.shape[0]
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    num_ps_pts : int
+        Total number of phase space points to generate.
+    mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1]
+        Function for the matrix element squared.
+    num_cpus : int {None]
+        See ``generate_energy_histogram``.
+    batched : bool {None]
+        See ``generate_energy_histogram``.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        See ``generate_energy_histogram``.
+    sampling : str {"pseudo"]
+        See ``generate_energy_histogram``. The points of all randomizations
+        are pooled.
+    num_randomizations : int {8]
+        See ``generate_energy_histogram``.
 
-    return histogram.space_to_energy_hist(
-        pts, actual_num_ps_pts, num_fsp, num_bins, density=density
-    )
+    Returns
+    -------
+    energies : numpy.ndarray
+        Energies of the final state particles, with shape
+        (num_ps_pts, len(masses)).
+    weights : numpy.ndarray
+        Weights of the phase space points, with shape (num_ps_pts,).
+    """
+    if not hasattr(masses, "__len__"):
+        masses = [masses]
+
+    if cme < sum(masses):
+        raise RamboCMETooSmall()
+
+    _check_arguments(num_ps_pts, sampling, num_randomizations)
+
+    sample = statistics.EnergySample(len(masses))
+    for _, pts in _phase_space_chunks(
+        masses,
+        cme,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched,
+        seed,
+        sampling,
+        num_randomizations,
+    ):
+        sample.update(pts)
+    return sample.result()
+
+
+def _histogram_edges(observables, bins, masses, cme):
+    """
+    Returns the bin edges of the observables and whether values outside of
+    them are clipped, given the number of bins or bin edges. See
+    ``generate_histograms``.
+    """
+    if not hasattr(bins, "__len__"):
+        bins = [bins] * len(observables)
+    if len(bins) != len(observables):
+        raise ValueError("Each observable needs its own bins.")
+    # Only values outside of the kinematic limits due to round-off errors
+    # fall outside of automatically chosen bins, so they are clipped.
+    clip = [np.ndim(obs_bins) == 0 for obs_bins in bins]
+    edges = []
+    for obs, obs_bins in zip(observables, bins):
+        if np.ndim(obs_bins) == 0:
+            lo, hi = histogram.kinematic_range(obs, masses, cme)
+            obs_bins = histogram.linear_bins(lo, max(hi, lo + 1e-12 * cme), obs_bins)
+        edges.append(obs_bins)
+    return edges, clip
+
+
+def generate_histograms(
+    masses,
+    cme,
+    observables,
+    bins=25,
+    num_ps_pts=10000,
+    mat_elem_sqrd=lambda klist: 1,
+    num_cpus=None,
+    density=False,
+    batched=None,
+    seed=None,
+    sampling="pseudo",
+    num_randomizations=8,
+):
+    """
+    Generate histograms of several observables of the final state particles,
+    filled in a single pass over the phase space points.
+
+    Parameters
+    ----------
+    masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    observables : list of tuple
+        Observables to histogram, e.g. ("energy", 0), ("invariant_mass", 0, 1)
+        or ("cos_angle", 0, 1). See
+        ``phase_space_helper_functions.histogram.WeightedHistogram``.
+    bins : int or list {25]
+        Either the number of bins used for every observable, which then
+        span the kinematic limits of the observables, or a list with the bin
+        edges (e.g. from ``histogram.log_bins``) or number of bins of each
+        observable.
+    num_ps_pts : int
+        Total number of phase space points to generate.
+    mat_elem_sqrd : (double)(numpy.ndarray) {lambda klist: 1]
+        Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
+    num_cpus : int {None]
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    density: Bool
+        If true, the histograms will be normalized to have unit area underneath
+        the curves, i.e. they will be probability density functions.
+    batched : bool {None]
+        See ``generate_energy_histogram``.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        See ``generate_energy_histogram``.
+    sampling : str {"pseudo"]
+        See ``generate_energy_histogram``.
+    num_randomizations : int {8]
+        See ``generate_energy_histogram``.
+
+    Returns
+    -------
+    histograms : list of tuple
+        For each observable, a tuple (edges, values, errors) of the bin
+        edges, the values of the histogram (the differential integral with
+        respect to the observable, or a probability density if `density` is
+        true) and their estimated errors.
+
+    Examples
+    --------
+
+    Histogramming the energy of the electron and the invariant mass of the
+    neutrinos in muon decay, with logarithmic energy bins::
+
+        from hazma import rambo
+        from hazma.phase_space_helper_functions.histogram import log_bins
+        masses = np.array([me, 0.0, 0.0])
+        (edges, dnde, _), (_, dndm, _) = rambo.generate_histograms(
+            masses,
+            mmu,
+            [("energy", 0), ("invariant_mass", 1, 2)],
+            bins=[log_bins(me, mmu / 2.0, 50), 50],
+        )
+
+    """
+    if not hasattr(masses, "__len__"):
+        masses = [masses]
+
+    if cme < sum(masses):
+        raise RamboCMETooSmall()
+
+    _check_arguments(num_ps_pts, sampling, num_randomizations)
+
+    edges, clip = _histogram_edges(observables, bins, masses, cme)
+
+    # Fill the histograms chunk by chunk to keep memory usage bounded. For
+    # "sobol" sampling, each randomization gets its own histograms.
+    hists = {}
+    for replica, pts in _phase_space_chunks(
+        masses,
+        cme,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched,
+        seed,
+        sampling,
+        num_randomizations,
+    ):
+        if replica not in hists:
+            hists[replica] = histogram.WeightedHistogram(
+                observables, edges, len(masses), clip=clip
+            )
+        hists[replica].update(pts)
+
+    if sampling == "pseudo":
+        return hists[0].result(density=density)
+
+    results = [hists[r].result(density=density) for r in sorted(hists)]
+    histograms = []
+    for k, (obs_edges, _, _) in enumerate(results[0]):
+        values, errs = _randomization_estimate([result[k][1] for result in results])
+        histograms.append((obs_edges, values, errs))
+    return histograms
 
 
 def integrate_over_phase_space(
@@ -240,6 +803,10 @@ def integrate_over_phase_space(
     num_ps_pts=10000,
     mat_elem_sqrd=lambda momenta: 1,
     num_cpus=None,
+    batched=None,
+    seed=None,
+    sampling="pseudo",
+    num_randomizations=8,
 ):
     """
     Returns the integral over phase space given a squared matrix element, a
@@ -255,9 +822,37 @@ def integrate_over_phase_space(
         Total number of phase space points to generate.
     mat_elem_sqrd : (double)(numpy.ndarray) {lambda momenta: 1]
         Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
     num_cpus : int {None]
-        Number of cpus to use in parallel with rambo. If not specified, 75% of
-        the cpus will be used.
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per chunk of points with an
+        array of four-momenta of shape (n, num_fsp, 4) and must return `n`
+        values. If False, it is called once per phase space point with an
+        array of shape (num_fsp, 4). If not specified, functions decorated
+        with `batched_matrix_element` are treated as batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generators. Independent, non-overlapping
+        streams are derived from it for each chunk of
+        ``RNG_CHUNK_SIZE`` points, so results are reproducible for a given
+        seed regardless of the number of cpus. If None, fresh entropy is
+        drawn from the operating system.
+    sampling : str {"pseudo"]
+        How the phase space is sampled. With "pseudo", the points are
+        generated from pseudo-random numbers. With "sobol", RAMBO is driven
+        by `num_randomizations` independently scrambled Sobol' sequences of
+        about ``num_ps_pts / num_randomizations`` points each, which
+        converges faster for smooth integrands. Powers of two points per
+        sequence give the best balance.
+    num_randomizations : int {8]
+        Number of independently scrambled Sobol' sequences used when
+        `sampling` is "sobol". Errors are estimated from the spread of the
+        results of the different sequences, so at least two are needed for
+        finite errors. Ignored for "pseudo" sampling.
 
     Returns
     -------
@@ -273,14 +868,330 @@ def integrate_over_phase_space(
     if cme < np.sum(fsp_masses):
         raise RamboCMETooSmall()
 
+    _check_arguments(num_ps_pts, sampling, num_randomizations)
+
+    num_fsp = len(fsp_masses)
+    # Accumulate the weights chunk by chunk to keep memory usage bounded. For
+    # "sobol" sampling, each randomization is accumulated separately.
+    stats = {}
+    for replica, points in _phase_space_chunks(
+        fsp_masses,
+        cme,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched,
+        seed,
+        sampling,
+        num_randomizations,
+    ):
+        if replica not in stats:
+            stats[replica] = statistics.WeightStatistics()
+        stats[replica].update(points[:, 4 * num_fsp])
+
+    if sampling == "pseudo":
+        return stats[0].mean, stats[0].std_of_mean
+
+    return _randomization_estimate([stats[r].mean for r in sorted(stats)])
+
+
+def _combine_estimates(integrals, variances):
+    """
+    Combine independent estimates of an integral weighted by their inverse
+    variances. Returns the combined estimate, its error and whether the
+    p-value of the chi^2 of the estimates is at least
+    ``VEGAS_MIN_CHI2_PVALUE``.
+    """
+    integrals = np.asarray(integrals)
+    wgts = 1.0 / np.asarray(variances)
+    integral = np.sum(wgts * integrals) / np.sum(wgts)
+    chi2 = np.sum(wgts * (integrals - integral) ** 2)
+    consistent = len(integrals) < 2 or (
+        stats.chi2.sf(chi2, len(integrals) - 1) >= VEGAS_MIN_CHI2_PVALUE
+    )
+    return integral, np.sqrt(1.0 / np.sum(wgts)), consistent
+
+
+def integrate_over_phase_space_adaptive(
+    fsp_masses,
+    cme,
+    mat_elem_sqrd=lambda momenta: 1,
+    rtol=1e-2,
+    num_ps_pts_per_iter=10000,
+    max_num_ps_pts=1000000,
+    num_bins=50,
+    alpha=1.5,
+    batched=None,
+    seed=None,
+):
+    """
+    Returns the integral over phase space given a squared matrix element, a
+    set of final state particle masses and a given energy using adaptive
+    importance sampling.
+
+    Phase space is parametrized as a chain of two-body decays, with the
+    invariant masses of the first k particles and the decay angles as
+    coordinates (see ``phase_space_helper_functions.sequential``). These
+    coordinates are sampled from a VEGAS grid. The grid is refined to
+    concentrate points where the integrand is large once enough points have
+    been accumulated, and the estimates from each grid are combined weighted
+    by their inverse variances. If the estimates are inconsistent, i.e. the
+    p-value of their chi^2 is below ``VEGAS_MIN_CHI2_PVALUE``, all but the
+    estimate from the current grid are discarded. The integration stops as soon as
+    the requested relative error is reached.
+
+    Resonances are best resolved if they appear in the invariant mass of the
+    first particles, i.e. order `fsp_masses` such that the resonant pair
+    comes first.
+
+    Parameters
+    ----------
+    fsp_masses : numpy.ndarray
+        List of masses of the final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    mat_elem_sqrd : (double)(numpy.ndarray) {lambda momenta: 1]
+        Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
+    rtol : float {1e-2]
+        Requested relative error of the integral.
+    num_ps_pts_per_iter : int {10000]
+        Number of phase space points to generate per iteration. Must be at
+        least twice `num_bins`.
+    max_num_ps_pts : int {1000000]
+        Maximum total number of phase space points to generate. The current
+        estimate is returned if the requested error is not reached.
+    num_bins : int {50]
+        Number of increments of the grid along each coordinate.
+    alpha : float {1.5]
+        Damping exponent controlling how fast the grid adapts.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per iteration with an array
+        of four-momenta of shape (num_ps_pts, num_fsp, 4). If not specified,
+        functions decorated with `batched_matrix_element` are treated as
+        batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generator.
+
+    Returns
+    -------
+    integral : float
+        The result of the integral over phase space.
+    std : float
+        The estimated error in the integral over phase space.
+    num_evals : int
+        Number of matrix element evaluations used.
+
+    Examples
+    --------
+
+    Integrate a resonant matrix element to 0.1% accuracy::
+
+        from hazma import rambo
+        import numpy as np
+
+        @rambo.batched_matrix_element
+        def msqrd(momenta):
+            p12 = momenta[:, 0] + momenta[:, 1]
+            s = p12[:, 0]**2 - np.sum(p12[:, 1:]**2, axis=1)
+            return 1.0 / ((s - 300.0**2)**2 + 300.0**2 * 5.0**2)
+
+        rambo.integrate_over_phase_space_adaptive(
+            [0., 0., 0.], 1000., mat_elem_sqrd=msqrd, rtol=1e-3)
+
+    """
+    if rtol <= 0.0:
+        raise ValueError("rtol must be positive.")
+    if num_bins < 2:
+        raise ValueError("num_bins must be at least 2.")
+    if num_ps_pts_per_iter < 2 * num_bins:
+        raise ValueError("num_ps_pts_per_iter must be at least 2 * num_bins.")
+    if max_num_ps_pts < 1:
+        raise ValueError("max_num_ps_pts must be at least 1.")
+
+    if not hasattr(fsp_masses, "__len__"):
+        fsp_masses = np.array([fsp_masses])
+
+    if cme < np.sum(fsp_masses):
+        raise RamboCMETooSmall()
+
+    fsp_masses = np.array(fsp_masses, dtype=np.float64)
     num_fsp = len(fsp_masses)
-    points = generate_phase_space(fsp_masses, cme, num_ps_pts, mat_elem_sqrd, num_cpus)
-    actual_num_ps_pts = len(points[:, 4 * num_fsp])
-    weights = points[:, 4 * num_fsp]
-    integral = np.average(weights)
-    std = np.std(weights) / np.sqrt(actual_num_ps_pts)
+    is_batched = _is_batched(mat_elem_sqrd, batched)
+
+    rng = np.random.default_rng(parallel.seed_sequence(seed))
+    grid = vegas.VegasGrid(
+        sequential.num_dims(num_fsp), num_bins=num_bins, alpha=alpha
+    )
+
+    # Estimates and variances from the grids used so far, and the integrand
+    # values sampled from the current grid
+    grid_ints, grid_vars = [], []
+    grid_fs = []
+    integral, std = 0.0, np.inf
+    num_evals = 0
+
+    while num_evals < max_num_ps_pts:
+        num_pts = min(num_ps_pts_per_iter, max_num_ps_pts - num_evals)
+        xs, jac, bins = grid.map(rng.random((num_pts, grid.ndim)))
+        points = sequential.generate_space_from_unit_cube(xs, fsp_masses, cme)
+        points = _apply_matrix_elem(points, num_fsp, mat_elem_sqrd, is_batched)
+        num_evals += num_pts
+
+        fs = points[:, 4 * num_fsp] * jac
+        grid_fs.append(fs)
+        # All points sampled from the same grid give a single estimate
+        all_fs = np.concatenate(grid_fs)
+        grid_int = np.average(all_fs)
+        grid_var = np.var(all_fs) / len(all_fs)
+
+        if grid_var > 0.0:
+            integral, std, consistent = _combine_estimates(
+                grid_ints + [grid_int], grid_vars + [grid_var]
+            )
+            if not consistent:
+                # The earlier grids were not adapted well enough
+                grid_ints, grid_vars = [], []
+                integral, std = grid_int, np.sqrt(grid_var)
+        elif not grid_ints:
+            # Constant integrand: the estimate is exact.
+            integral, std = grid_int, 0.0
+            break
+
+        if std <= rtol * abs(integral):
+            break
+
+        if grid.refine(bins, fs):
+            if grid_var > 0.0:
+                grid_ints.append(grid_int)
+                grid_vars.append(grid_var)
+            grid_fs = []
+
+    return integral, std, num_evals
+
 
-    return integral, std
+def integrate_over_phase_space_dalitz(
+    fsp_masses,
+    cme,
+    mat_elem_sqrd=lambda momenta: 1,
+    num_pts=16,
+    num_angle_pts=8,
+    batched=None,
+):
+    """
+    Returns the integral over two- or three-body phase space given a squared
+    matrix element, a set of final state particle masses and a given energy
+    using deterministic quadrature.
+
+    Two-body phase space is integrated over the direction of the first
+    particle. Three-body phase space is integrated over the Dalitz plot in
+    the Mandelstam variables s = (P - p_1)^2 and t = (P - p_2)^2 and over the
+    orientation of the final state (see
+    ``phase_space_helper_functions.dalitz``). The error is estimated from the
+    difference to a rule with half as many nodes along each direction.
+
+    Parameters
+    ----------
+    fsp_masses : numpy.ndarray
+        List of the masses of the two or three final state particles.
+    cme : double
+        Center-of-mass-energy of the process.
+    mat_elem_sqrd : (double)(numpy.ndarray) {lambda momenta: 1]
+        Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
+    num_pts : int {16]
+        Number of Gauss-Legendre nodes in the cosine of the polar angle for
+        two-body final states and along each direction of the Dalitz plot
+        for three-body final states.
+    num_angle_pts : int {8]
+        Number of nodes along each remaining angle of the orientation of the
+        final state: the azimuthal angle for two-body final states and the
+        three Euler angles for three-body final states. If the squared
+        matrix element only depends on the invariants of the final state
+        momenta, e.g. for the decay of an unpolarized particle at rest, 1 is
+        sufficient.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once with an array of four-momenta
+        of shape (n, num_fsp, 4). If not specified, functions decorated with
+        `batched_matrix_element` are treated as batched.
+
+    Returns
+    -------
+    integral : float
+        The result of the integral over phase space.
+    std : float
+        The estimated error in the integral over phase space.
+    """
+    if not hasattr(fsp_masses, "__len__"):
+        fsp_masses = np.array([fsp_masses])
+
+    if cme < np.sum(fsp_masses):
+        raise RamboCMETooSmall()
+
+    num_fsp = len(fsp_masses)
+    is_batched = _is_batched(mat_elem_sqrd, batched)
+
+    integrals = []
+    for n, n_angle in [
+        (num_pts, num_angle_pts),
+        (max(num_pts // 2, 1), max(num_angle_pts // 2, 1)),
+    ]:
+        points = dalitz.generate_space(fsp_masses, cme, n, n_angle)
+        points = _apply_matrix_elem(points, num_fsp, mat_elem_sqrd, is_batched)
+        integrals.append(np.sum(points[:, 4 * num_fsp]))
+
+    return integrals[0], abs(integrals[0] - integrals[1])
+
+
+def _integrate(
+    fsp_masses,
+    cme,
+    num_ps_pts,
+    mat_elem_sqrd,
+    num_cpus,
+    batched,
+    seed,
+    method,
+    num_angle_pts,
+):
+    """
+    Integrate over phase space with RAMBO or, for two- and three-body final
+    states, with deterministic quadrature, depending on `method`.
+    """
+    if method not in ("auto", "rambo", "dalitz"):
+        raise ValueError(
+            "Invalid method {!r}. Must be 'auto', 'rambo' or 'dalitz'.".format(method)
+        )
+    num_fsp = len(fsp_masses) if hasattr(fsp_masses, "__len__") else 1
+    # The quadrature evaluates the squared matrix element at many points, so
+    # it is only tried automatically when that is cheap
+    is_fast = _is_batched(mat_elem_sqrd, batched) or isinstance(
+        mat_elem_sqrd, native.NativeMatrixElement
+    )
+    if method == "dalitz" or (method == "auto" and num_fsp in (2, 3) and is_fast):
+        integral, std = integrate_over_phase_space_dalitz(
+            fsp_masses,
+            cme,
+            mat_elem_sqrd=mat_elem_sqrd,
+            num_angle_pts=num_angle_pts,
+            batched=batched,
+        )
+        # Narrow resonances, for example, are not resolved by the quadrature
+        if method == "dalitz" or std <= DALITZ_RTOL * abs(integral):
+            return integral, std
+    return integrate_over_phase_space(
+        fsp_masses,
+        cme,
+        num_ps_pts=num_ps_pts,
+        mat_elem_sqrd=mat_elem_sqrd,
+        num_cpus=num_cpus,
+        batched=batched,
+        seed=seed,
+    )
 
 
 def compute_annihilation_cross_section(
@@ -290,6 +1201,10 @@ def compute_annihilation_cross_section(
     num_ps_pts=10000,
     mat_elem_sqrd=lambda momenta: 1,
     num_cpus=None,
+    batched=None,
+    seed=None,
+    method="auto",
+    num_angle_pts=4,
 ):
     """
     Computes the cross section for a given process.
@@ -306,9 +1221,37 @@ def compute_annihilation_cross_section(
         Total number of phase space points to generate.
     mat_elem_sqrd : (double)(numpy.ndarray) {lambda momenta: 1]
         Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
     num_cpus : int {None]
-        Number of cpus to use in parallel with rambo. If not specified, 75% of
-        the cpus will be used.
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per chunk of points with an
+        array of four-momenta of shape (n, num_fsp, 4) and must return `n`
+        values. If False, it is called once per phase space point with an
+        array of shape (num_fsp, 4). If not specified, functions decorated
+        with `batched_matrix_element` are treated as batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generators. Independent, non-overlapping
+        streams are derived from it for each chunk of
+        ``RNG_CHUNK_SIZE`` points, so results are reproducible for a given
+        seed regardless of the number of cpus. If None, fresh entropy is
+        drawn from the operating system.
+    method : str {"auto"]
+        How phase space is integrated. With "rambo", RAMBO Monte-Carlo
+        integration is used. With "dalitz", two- and three-body phase space
+        is integrated with deterministic quadrature (see
+        `integrate_over_phase_space_dalitz`), in which case `num_ps_pts`,
+        `num_cpus` and `seed` are ignored. "auto" uses "dalitz" for two- and
+        three-body final states if `mat_elem_sqrd` is batched or native and
+        the estimated relative error is at most ``DALITZ_RTOL``, and "rambo"
+        otherwise.
+    num_angle_pts : int {4]
+        Number of quadrature nodes along each angle of the orientation of
+        the final state when `method` is "dalitz".
 
     Returns
     -------
@@ -356,12 +1299,16 @@ def compute_annihilation_cross_section(
             isp_masses, fsp_masses, cme, num_ps_pts=5000, mat_elem_sqrd=msqrd)
 
     """
-    integral, std = integrate_over_phase_space(
+    integral, std = _integrate(
         fsp_masses,
         cme,
-        num_ps_pts=num_ps_pts,
-        mat_elem_sqrd=mat_elem_sqrd,
-        num_cpus=num_cpus,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched,
+        seed,
+        method,
+        num_angle_pts,
     )
 
     m1 = isp_masses[0]
@@ -379,6 +1326,10 @@ def compute_decay_width(
     num_ps_pts=10000,
     mat_elem_sqrd=lambda momenta: 1,
     num_cpus=None,
+    batched=None,
+    seed=None,
+    method="auto",
+    num_angle_pts=1,
 ):
     r"""
     Computes the decay width for a given process.
@@ -393,9 +1344,39 @@ def compute_decay_width(
         Total number of phase space points to generate.
     mat_elem_sqrd : (double)(numpy.ndarray) {lambda momenta: 1]
         Function for the matrix element squared.
+        Native matrix elements obtained from
+        ``phase_space_helper_functions.native.get_matrix_element`` are
+        evaluated without the GIL.
     num_cpus : int {None]
-        Number of cpus to use in parallel with rambo. If not specified, 75% of
-        the cpus will be used.
+        Number of cpus to use in parallel with rambo. If not specified, all
+        workers of the shared executor (by default 75% of the cpus) will be
+        used. See ``hazma.parallel``.
+    batched : bool {None]
+        If True, `mat_elem_sqrd` is called once per chunk of points with an
+        array of four-momenta of shape (n, num_fsp, 4) and must return `n`
+        values. If False, it is called once per phase space point with an
+        array of shape (num_fsp, 4). If not specified, functions decorated
+        with `batched_matrix_element` are treated as batched.
+    seed : None, int, array_like[int] or numpy.random.SeedSequence {None]
+        Seed for the random number generators. Independent, non-overlapping
+        streams are derived from it for each chunk of
+        ``RNG_CHUNK_SIZE`` points, so results are reproducible for a given
+        seed regardless of the number of cpus. If None, fresh entropy is
+        drawn from the operating system.
+    method : str {"auto"]
+        How phase space is integrated. With "rambo", RAMBO Monte-Carlo
+        integration is used. With "dalitz", two- and three-body phase space
+        is integrated with deterministic quadrature (see
+        `integrate_over_phase_space_dalitz`), in which case `num_ps_pts`,
+        `num_cpus` and `seed` are ignored. "auto" uses "dalitz" for two- and
+        three-body final states if `mat_elem_sqrd` is batched or native and
+        the estimated relative error is at most ``DALITZ_RTOL``, and "rambo"
+        otherwise.
+    num_angle_pts : int {1]
+        Number of quadrature nodes along each angle of the orientation of
+        the final state when `method` is "dalitz". The width of an
+        unpolarized particle at rest does not depend on the orientation, so
+        one node suffices unless `mat_elem_sqrd` singles out a direction.
 
     Returns
     -------
@@ -434,12 +1415,16 @@ def compute_decay_width(
         cme = mmu
         compute_decay_width(fsp_masses, cme, mat_elem_sqrd=msqrd)
     """
-    integral, std = integrate_over_phase_space(
+    integral, std = _integrate(
         fsp_masses,
         cme,
-        num_ps_pts=num_ps_pts,
-        mat_elem_sqrd=mat_elem_sqrd,
-        num_cpus=num_cpus,
+        num_ps_pts,
+        mat_elem_sqrd,
+        num_cpus,
+        batched,
+        seed,
+        method,
+        num_angle_pts,
     )
 
     cross_section = integral / (2.0 * cme)
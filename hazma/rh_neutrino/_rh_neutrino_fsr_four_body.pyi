@@ -1,10 +1,10 @@
-def dnde_nu_l_l_fsr(self, photon_energies, width: float):
+def dnde_nu_l_l_fsr(self, photon_energies, width: float, seed=None):
     ...
 
 
-def dnde_l_pi_pi0_fsr(self, photon_energies, width: float):
+def dnde_l_pi_pi0_fsr(self, photon_energies, width: float, seed=None):
     ...
 
 
-def dnde_nu_pi_pi_fsr(self, photon_energies, width: float):
+def dnde_nu_pi_pi_fsr(self, photon_energies, width: float, seed=None):
     ...
@@ -4,6 +4,8 @@ from 4-body final states occuring in the right-handed neutrino model.
 """
 
 from hazma.gamma_ray_helper_functions.gamma_ray_fsr cimport c_gamma_ray_fsr
+from hazma.phase_space_helper_functions.generator cimport seed_words
+from hazma.phase_space_helper_functions.native cimport register_matrix_element
 from libcpp.vector cimport vector
 from libcpp.functional cimport function
 from libc.math cimport sqrt, M_PI
@@ -25,7 +27,7 @@ cdef double Vud = 0.974267
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double ldot(vector[double] &fv1,vector[double] &fv2):
+cdef double ldot(vector[double] &fv1,vector[double] &fv2) nogil:
     """
     Compute the scalar product between two four-vectors.
 
@@ -45,7 +47,7 @@ cdef double ldot(vector[double] &fv1,vector[double] &fv2):
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double msqrd_nu_pi_pi_g(vector[vector[double]] &momenta, vector[double]&params):
+cdef double msqrd_nu_pi_pi_g(vector[vector[double]] &momenta, vector[double]&params) nogil:
     """
     Compute the squared matrix-element for a RH neutrino decaying into a
     neutrino, two charged pions and a photon at leading order in the Fermi
@@ -184,7 +186,7 @@ cdef double msqrd_nu_pi_pi_g(vector[vector[double]] &momenta, vector[double]&par
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double msqrd_l_pi_pi0_g(vector[vector[double]] &momenta, vector[double]& params):
+cdef double msqrd_l_pi_pi0_g(vector[vector[double]] &momenta, vector[double]& params) nogil:
     """
     Compute the squared matrix-element for a RH neutrino decaying into a
     charged lepton, neutral pion, a charged pion and a photon at leading order
@@ -382,7 +384,7 @@ cdef double msqrd_l_pi_pi0_g(vector[vector[double]] &momenta, vector[double]& pa
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef double msqrd_nu_l_l_g(vector[vector[double]] &momenta, vector[double]& params):
+cdef double msqrd_nu_l_l_g(vector[vector[double]] &momenta, vector[double]& params) nogil:
     """
     Compute the squared matrix-element for a RH neutrino decaying into a
     neutrino, two charged leptons and a photon at leading order in the
@@ -566,11 +568,22 @@ cdef double msqrd_nu_l_l_g(vector[vector[double]] &momenta, vector[double]& para
     ) / (ldot(k2, k4) ** 2 * ldot(k3, k4) ** 2)
 
 
+# Make the radiative matrix elements available to ``hazma.rambo``.
+register_matrix_element(
+    "rh_neutrino.nu_pi_pi_g", msqrd_nu_pi_pi_g, 4, ("mx", "smix", "ml"), __name__
+)
+register_matrix_element(
+    "rh_neutrino.l_pi_pi0_g", msqrd_l_pi_pi0_g, 4, ("mx", "smix", "ml"), __name__
+)
+register_matrix_element(
+    "rh_neutrino.nu_l_l_g", msqrd_nu_l_l_g, 4, ("mx", "smix", "ml"), __name__
+)
+
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_nu_l_l_fsr(vector[double] photon_energies, double mx, double smix, double ml, double width):
+def dnde_nu_l_l_fsr(vector[double] photon_energies, double mx, double smix, double ml, double width, seed=None):
     """
     Compute the FSR spectra from a right-handed neutrino decaying into
     an active neutrino and two charged leptons.
@@ -582,6 +595,9 @@ def dnde_nu_l_l_fsr(vector[double] photon_energies, double mx, double smix, doub
         `hazma.rh_neutrino.__init__.py`)
     photon_energies: float or np.array
        The energy of the final state photon in MeV.
+    seed: None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed for the random number generator. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
@@ -591,6 +607,7 @@ def dnde_nu_l_l_fsr(vector[double] photon_energies, double mx, double smix, doub
     cdef vector[double] isp_masses = [mx]
     cdef vector[double] fsp_masses = [0.0, ml, ml]
     cdef vector[double] params = [mx, smix, ml]
+    cdef vector[unsigned int] seed_vec = seed_words(seed)
     cdef int nevents = 10000
 
     return c_gamma_ray_fsr(
@@ -602,13 +619,14 @@ def dnde_nu_l_l_fsr(vector[double] photon_energies, double mx, double smix, doub
         msqrd_nu_l_l_g,
         nevents,
         params,
+        seed_vec,
     ).first
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_l_pi_pi0_fsr(vector[double] photon_energies, double mx, double smix, double ml, double width):
+def dnde_l_pi_pi0_fsr(vector[double] photon_energies, double mx, double smix, double ml, double width, seed=None):
     """
     Compute the FSR spectra from a right-handed neutrino decaying into
     a neutral pion, charged pion and charged lepton.
@@ -620,6 +638,9 @@ def dnde_l_pi_pi0_fsr(vector[double] photon_energies, double mx, double smix, do
         `hazma.rh_neutrino.__init__.py`)
     photon_energies: float or np.array
        The energy of the final state photon in MeV.
+    seed: None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed for the random number generator. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
@@ -629,6 +650,7 @@ def dnde_l_pi_pi0_fsr(vector[double] photon_energies, double mx, double smix, do
     cdef vector[double] isp_masses = [mx]
     cdef vector[double] fsp_masses = [ml, mpi, mpi0]
     cdef vector[double] params = [mx, smix, ml]
+    cdef vector[unsigned int] seed_vec = seed_words(seed)
     cdef int nevents = 5000
 
     return c_gamma_ray_fsr(
@@ -640,13 +662,14 @@ def dnde_l_pi_pi0_fsr(vector[double] photon_energies, double mx, double smix, do
         msqrd_l_pi_pi0_g,
         nevents,
         params,
+        seed_vec,
     ).first
 
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def dnde_nu_pi_pi_fsr(vector[double] photon_energies, double mx, double smix, double ml, double width):
+def dnde_nu_pi_pi_fsr(vector[double] photon_energies, double mx, double smix, double ml, double width, seed=None):
     """
     Compute the FSR spectra from a right-handed neutrino decaying into
     an active neutrino and two charged pions.
@@ -658,6 +681,9 @@ def dnde_nu_pi_pi_fsr(vector[double] photon_energies, double mx, double smix, do
         `hazma.rh_neutrino.__init__.py`)
     photon_energies: float or np.array
        The energy of the final state photon in MeV.
+    seed: None, int, array_like[int] or numpy.random.SeedSequence, optional
+        Seed for the random number generator. If None, fresh entropy is
+        drawn from the operating system.
 
     Returns
     -------
@@ -667,6 +693,7 @@ def dnde_nu_pi_pi_fsr(vector[double] photon_energies, double mx, double smix, do
     cdef vector[double] isp_masses = [mx]
     cdef vector[double] fsp_masses = [0.0, mpi, mpi]
     cdef vector[double] params = [mx, smix, ml]
+    cdef vector[unsigned int] seed_vec = seed_words(seed)
     cdef int nevents = 1000
 
     return c_gamma_ray_fsr(
@@ -678,4 +705,5 @@ def dnde_nu_pi_pi_fsr(vector[double] photon_energies, double mx, double smix, do
         msqrd_nu_pi_pi_g,
         nevents,
         params,
+        seed_vec,
     ).first
@@ -0,0 +1,17251 @@
+/* Generated by Cython 0.29.37 */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__hazma__scalar_mediator___c_scalar_mediator_cross_sections
+#define __PYX_HAVE_API__hazma__scalar_mediator___c_scalar_mediator_cross_sections
+/* Early includes */
+#include <string.h>
+#include <stdio.h>
+#include "numpy/arrayobject.h"
+#include "numpy/ndarrayobject.h"
+#include "numpy/ndarraytypes.h"
+#include "numpy/arrayscalars.h"
+#include "numpy/ufuncobject.h"
+
+    /* NumPy API declarations from "numpy/__init__.pxd" */
+    
+#include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+/* Header.proto */
+#if !defined(CYTHON_CCOMPLEX)
+  #if defined(__cplusplus)
+    #define CYTHON_CCOMPLEX 1
+  #elif (defined(_Complex_I) && !defined(_MSC_VER))
+    #define CYTHON_CCOMPLEX 1
+  #else
+    #define CYTHON_CCOMPLEX 0
+  #endif
+#endif
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #include <complex>
+  #else
+    #include <complex.h>
+  #endif
+#endif
+#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
+  #undef _Complex_I
+  #define _Complex_I 1.0fj
+#endif
+
+
+static const char *__pyx_f[] = {
+  "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx",
+  "__init__.pxd",
+  "stringsource",
+  "type.pxd",
+};
+/* BufferFormatStructs.proto */
+#define IS_UNSIGNED(type) (((type) -1) > 0)
+struct __Pyx_StructField_;
+#define __PYX_BUF_FLAGS_PACKED_STRUCT (1 << 0)
+typedef struct {
+  const char* name;
+  struct __Pyx_StructField_* fields;
+  size_t size;
+  size_t arraysize[8];
+  int ndim;
+  char typegroup;
+  char is_unsigned;
+  int flags;
+} __Pyx_TypeInfo;
+typedef struct __Pyx_StructField_ {
+  __Pyx_TypeInfo* type;
+  const char* name;
+  size_t offset;
+} __Pyx_StructField;
+typedef struct {
+  __Pyx_StructField* field;
+  size_t parent_offset;
+} __Pyx_BufFmt_StackElem;
+typedef struct {
+  __Pyx_StructField root;
+  __Pyx_BufFmt_StackElem* head;
+  size_t fmt_offset;
+  size_t new_count, enc_count;
+  size_t struct_alignment;
+  int is_complex;
+  char enc_type;
+  char new_packmode;
+  char enc_packmode;
+  char is_valid_array;
+} __Pyx_BufFmt_Context;
+
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":688
+ * # in Cython to enable them only on the right systems.
+ * 
+ * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ */
+typedef npy_int8 __pyx_t_5numpy_int8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":689
+ * 
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t
+ */
+typedef npy_int16 __pyx_t_5numpy_int16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":690
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int64      int64_t
+ * #ctypedef npy_int96      int96_t
+ */
+typedef npy_int32 __pyx_t_5numpy_int32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":691
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_int96      int96_t
+ * #ctypedef npy_int128     int128_t
+ */
+typedef npy_int64 __pyx_t_5numpy_int64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":695
+ * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ */
+typedef npy_uint8 __pyx_t_5numpy_uint8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":696
+ * 
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t
+ */
+typedef npy_uint16 __pyx_t_5numpy_uint16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":697
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint64     uint64_t
+ * #ctypedef npy_uint96     uint96_t
+ */
+typedef npy_uint32 __pyx_t_5numpy_uint32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":698
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_uint96     uint96_t
+ * #ctypedef npy_uint128    uint128_t
+ */
+typedef npy_uint64 __pyx_t_5numpy_uint64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":702
+ * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_float64    float64_t
+ * #ctypedef npy_float80    float80_t
+ */
+typedef npy_float32 __pyx_t_5numpy_float32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":703
+ * 
+ * ctypedef npy_float32    float32_t
+ * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_float80    float80_t
+ * #ctypedef npy_float128   float128_t
+ */
+typedef npy_float64 __pyx_t_5numpy_float64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":712
+ * # The int types are mapped a bit surprising --
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   longlong_t
+ * 
+ */
+typedef npy_long __pyx_t_5numpy_int_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":713
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_ulong      uint_t
+ */
+typedef npy_longlong __pyx_t_5numpy_longlong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":715
+ * ctypedef npy_longlong   longlong_t
+ * 
+ * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ */
+typedef npy_ulong __pyx_t_5numpy_uint_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":716
+ * 
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_intp       intp_t
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":718
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uintp      uintp_t
+ * 
+ */
+typedef npy_intp __pyx_t_5numpy_intp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":719
+ * 
+ * ctypedef npy_intp       intp_t
+ * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_double     float_t
+ */
+typedef npy_uintp __pyx_t_5numpy_uintp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":721
+ * ctypedef npy_uintp      uintp_t
+ * 
+ * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t
+ */
+typedef npy_double __pyx_t_5numpy_float_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":722
+ * 
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ */
+typedef npy_double __pyx_t_5numpy_double_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":723
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ */
+typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< float > __pyx_t_float_complex;
+  #else
+    typedef float _Complex __pyx_t_float_complex;
+  #endif
+#else
+    typedef struct { float real, imag; } __pyx_t_float_complex;
+#endif
+static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
+
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< double > __pyx_t_double_complex;
+  #else
+    typedef double _Complex __pyx_t_double_complex;
+  #endif
+#else
+    typedef struct { double real, imag; } __pyx_t_double_complex;
+#endif
+static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":725
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t
+ */
+typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":726
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ */
+typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":727
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cdouble     complex_t
+ */
+typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":729
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ */
+typedef npy_cdouble __pyx_t_5numpy_complex_t;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_in;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_in;
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn;
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn;
+
+/* "scipy/special/cython_special.pxd":8
+ *     double
+ * 
+ * cpdef number_t spherical_jn(long n, number_t z, bint derivative=*) noexcept nogil             # <<<<<<<<<<<<<<
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) noexcept nogil
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_jn {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "scipy/special/cython_special.pxd":9
+ * 
+ * cpdef number_t spherical_jn(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) noexcept nogil             # <<<<<<<<<<<<<<
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_kn(long n, number_t z, bint derivative=*) noexcept nogil
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_yn {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "scipy/special/cython_special.pxd":10
+ * cpdef number_t spherical_jn(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) noexcept nogil             # <<<<<<<<<<<<<<
+ * cpdef number_t spherical_kn(long n, number_t z, bint derivative=*) noexcept nogil
+ * 
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_in {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_in {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "scipy/special/cython_special.pxd":11
+ * cpdef number_t spherical_yn(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_in(long n, number_t z, bint derivative=*) noexcept nogil
+ * cpdef number_t spherical_kn(long n, number_t z, bint derivative=*) noexcept nogil             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef fused Dd_number_t:
+ */
+struct __pyx_fuse_0__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn {
+  int __pyx_n;
+  int derivative;
+};
+struct __pyx_fuse_1__pyx_opt_args_5scipy_7special_14cython_special_spherical_kn {
+  int __pyx_n;
+  int derivative;
+};
+
+/* "cfunc.to_py":64
+ * 
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):             # <<<<<<<<<<<<<<
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ */
+struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py {
+  PyObject_HEAD
+  double (*__pyx_v_f)(double, double, double, double, double, double, double, double, double, double, double);
+};
+
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* IsLittleEndian.proto */
+static CYTHON_INLINE int __Pyx_Is_Little_Endian(void);
+
+/* BufferFormatCheck.proto */
+static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts);
+static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
+                              __Pyx_BufFmt_StackElem* stack,
+                              __Pyx_TypeInfo* type);
+
+/* BufferGetAndValidate.proto */
+#define __Pyx_GetBufferAndValidate(buf, obj, dtype, flags, nd, cast, stack)\
+    ((obj == Py_None || obj == NULL) ?\
+    (__Pyx_ZeroBuffer(buf), 0) :\
+    __Pyx__GetBufferAndValidate(buf, obj, dtype, flags, nd, cast, stack))
+static int  __Pyx__GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
+    __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
+static void __Pyx_ZeroBuffer(Py_buffer* buf);
+static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
+static Py_ssize_t __Pyx_minusones[] = { -1, -1, -1, -1, -1, -1, -1, -1 };
+static Py_ssize_t __Pyx_zeros[] = { 0, 0, 0, 0, 0, 0, 0, 0 };
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+#define __Pyx_BufPtrStrided1d(type, buf, i0, s0) (type)((char*)buf + i0 * s0)
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
+
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* BufferStructDeclare.proto */
+typedef struct {
+  Py_ssize_t shape, strides, suboffsets;
+} __Pyx_Buf_DimInfo;
+typedef struct {
+  size_t refcount;
+  Py_buffer pybuffer;
+} __Pyx_Buffer;
+typedef struct {
+  __Pyx_Buffer *rcbuffer;
+  char *data;
+  __Pyx_Buf_DimInfo diminfo[8];
+} __Pyx_LocalBuf_ND;
+
+#if PY_MAJOR_VERSION < 3
+    static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags);
+    static void __Pyx_ReleaseBuffer(Py_buffer *view);
+#else
+    #define __Pyx_GetBuffer PyObject_GetBuffer
+    #define __Pyx_ReleaseBuffer PyBuffer_Release
+#endif
+
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* RealImag.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #define __Pyx_CREAL(z) ((z).real())
+    #define __Pyx_CIMAG(z) ((z).imag())
+  #else
+    #define __Pyx_CREAL(z) (__real__(z))
+    #define __Pyx_CIMAG(z) (__imag__(z))
+  #endif
+#else
+    #define __Pyx_CREAL(z) ((z).real)
+    #define __Pyx_CIMAG(z) ((z).imag)
+#endif
+#if defined(__cplusplus) && CYTHON_CCOMPLEX\
+        && (defined(_WIN32) || defined(__clang__) || (defined(__GNUC__) && (__GNUC__ >= 5 || __GNUC__ == 4 && __GNUC_MINOR__ >= 4 )) || __cplusplus >= 201103)
+    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
+    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
+#else
+    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
+    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_float(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_float(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_float(a, b) ((a)-(b))
+    #define __Pyx_c_prod_float(a, b) ((a)*(b))
+    #define __Pyx_c_quot_float(a, b) ((a)/(b))
+    #define __Pyx_c_neg_float(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_float(z) ((z)==(float)0)
+    #define __Pyx_c_conj_float(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (::std::abs(z))
+        #define __Pyx_c_pow_float(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_float(z) ((z)==0)
+    #define __Pyx_c_conj_float(z)    (conjf(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (cabsf(z))
+        #define __Pyx_c_pow_float(a, b)  (cpowf(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex);
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex);
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    #endif
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_double(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_double(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_double(a, b) ((a)-(b))
+    #define __Pyx_c_prod_double(a, b) ((a)*(b))
+    #define __Pyx_c_quot_double(a, b) ((a)/(b))
+    #define __Pyx_c_neg_double(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_double(z) ((z)==(double)0)
+    #define __Pyx_c_conj_double(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (::std::abs(z))
+        #define __Pyx_c_pow_double(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_double(z) ((z)==0)
+    #define __Pyx_c_conj_double(z)    (conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (cabs(z))
+        #define __Pyx_c_pow_double(a, b)  (cpow(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex);
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex);
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    #endif
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'cython' */
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'numpy' */
+
+/* Module declarations from 'numpy' */
+static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
+static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
+static PyTypeObject *__pyx_ptype_5numpy_generic = 0;
+static PyTypeObject *__pyx_ptype_5numpy_number = 0;
+static PyTypeObject *__pyx_ptype_5numpy_integer = 0;
+static PyTypeObject *__pyx_ptype_5numpy_signedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_unsignedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_inexact = 0;
+static PyTypeObject *__pyx_ptype_5numpy_floating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_complexfloating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flexible = 0;
+static PyTypeObject *__pyx_ptype_5numpy_character = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
+
+/* Module declarations from 'scipy.special.cython_special' */
+static double (*__pyx_f_5scipy_7special_14cython_special_k1)(double, int __pyx_skip_dispatch); /*proto*/
+static double (*__pyx_fuse_0__pyx_f_5scipy_7special_14cython_special_kn)(double, double, int __pyx_skip_dispatch); /*proto*/
+static double (*__pyx_fuse_1__pyx_f_5scipy_7special_14cython_special_kn)(long, double, int __pyx_skip_dispatch); /*proto*/
+
+/* Module declarations from 'libc.math' */
+
+/* Module declarations from 'hazma.scalar_mediator._c_scalar_mediator_cross_sections' */
+static PyTypeObject *__pyx_ptype___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py = 0;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_alpha_em;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_me;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mmu;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq;
+static double __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq;
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(double, double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_gg(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pi0pi0(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pipi(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_ss(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_ss_to_xx(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_all(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xl_to_xl(double, double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi_to_xpi(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi0_to_xpi0(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xg_to_xg(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xs_to_xs(double, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_ff(PyArrayObject *, double, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_gg(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_pi0pi0(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_pipi(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_ss(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_ss_to_xx(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_all(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xl_to_xl(PyArrayObject *, double, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xpi_to_xpi(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xpi0_to_xpi0(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xg_to_xg(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xs_to_xs(PyArrayObject *, double, double, double, double, double, double, double, double, double); /*proto*/
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___thermal_cross_section_integrand(double, double, double, double, double, double, double, double, double, double, double); /*proto*/
+static PyObject *__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*)(double, double, double, double, double, double, double, double, double, double, double)); /*proto*/
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t = { "float64_t", NULL, sizeof(__pyx_t_5numpy_float64_t), { 0 }, 0, 'R', 0, 0 };
+#define __Pyx_MODULE_NAME "hazma.scalar_mediator._c_scalar_mediator_cross_sections"
+extern int __pyx_module_is_main_hazma__scalar_mediator___c_scalar_mediator_cross_sections;
+int __pyx_module_is_main_hazma__scalar_mediator___c_scalar_mediator_cross_sections = 0;
+
+/* Implementation of 'hazma.scalar_mediator._c_scalar_mediator_cross_sections' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_ImportError;
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_z[] = "z";
+static const char __pyx_k_mf[] = "mf";
+static const char __pyx_k_ms[] = "ms";
+static const char __pyx_k_mx[] = "mx";
+static const char __pyx_k_np[] = "np";
+static const char __pyx_k_pf[] = "pf";
+static const char __pyx_k_vs[] = "vs";
+static const char __pyx_k_lam[] = "lam";
+static const char __pyx_k_len[] = "__len__";
+static const char __pyx_k_log[] = "log";
+static const char __pyx_k_args[] = "args";
+static const char __pyx_k_e_cm[] = "e_cm";
+static const char __pyx_k_gsFF[] = "gsFF";
+static const char __pyx_k_gsGG[] = "gsGG";
+static const char __pyx_k_gsff[] = "gsff";
+static const char __pyx_k_gsxx[] = "gsxx";
+static const char __pyx_k_item[] = "item";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_ndim[] = "ndim";
+static const char __pyx_k_quad[] = "quad";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_wrap[] = "wrap";
+static const char __pyx_k_array[] = "array";
+static const char __pyx_k_e_cms[] = "e_cms";
+static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_zeros[] = "zeros";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_points[] = "points";
+static const char __pyx_k_float64[] = "float64";
+static const char __pyx_k_width_s[] = "width_s";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_cfunc_to_py[] = "cfunc.to_py";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_sigma_ss_to_xx[] = "sigma_ss_to_xx";
+static const char __pyx_k_sigma_xg_to_xg[] = "sigma_xg_to_xg";
+static const char __pyx_k_sigma_xl_to_xl[] = "sigma_xl_to_xl";
+static const char __pyx_k_sigma_xs_to_xs[] = "sigma_xs_to_xs";
+static const char __pyx_k_sigma_xx_to_ss[] = "sigma_xx_to_ss";
+static const char __pyx_k_scipy_integrate[] = "scipy.integrate";
+static const char __pyx_k_sigma_xx_to_all[] = "sigma_xx_to_all";
+static const char __pyx_k_sigma_xpi_to_xpi[] = "sigma_xpi_to_xpi";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_sigma_xpi0_to_xpi0[] = "sigma_xpi0_to_xpi0";
+static const char __pyx_k_sigma_xx_to_s_to_ff[] = "sigma_xx_to_s_to_ff";
+static const char __pyx_k_sigma_xx_to_s_to_gg[] = "sigma_xx_to_s_to_gg";
+static const char __pyx_k_sigma_xx_to_s_to_pipi[] = "sigma_xx_to_s_to_pipi";
+static const char __pyx_k_thermal_cross_section[] = "thermal_cross_section";
+static const char __pyx_k_sigma_xx_to_s_to_pi0pi0[] = "sigma_xx_to_s_to_pi0pi0";
+static const char __pyx_k_Pyx_CFunc_double____double[] = "__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.<locals>.wrap";
+static const char __pyx_k_hazma_scalar_mediator__c_scalar[] = "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx";
+static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
+static const char __pyx_k_hazma_scalar_mediator__c_scalar_2[] = "hazma.scalar_mediator._c_scalar_mediator_cross_sections";
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_n_s_Pyx_CFunc_double____double;
+static PyObject *__pyx_n_s_args;
+static PyObject *__pyx_n_s_array;
+static PyObject *__pyx_n_s_cfunc_to_py;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_e_cm;
+static PyObject *__pyx_n_s_e_cms;
+static PyObject *__pyx_n_s_float64;
+static PyObject *__pyx_n_s_gsFF;
+static PyObject *__pyx_n_s_gsGG;
+static PyObject *__pyx_n_s_gsff;
+static PyObject *__pyx_n_s_gsxx;
+static PyObject *__pyx_kp_s_hazma_scalar_mediator__c_scalar;
+static PyObject *__pyx_n_s_hazma_scalar_mediator__c_scalar_2;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_item;
+static PyObject *__pyx_n_s_lam;
+static PyObject *__pyx_n_s_len;
+static PyObject *__pyx_n_s_log;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_mf;
+static PyObject *__pyx_n_s_ms;
+static PyObject *__pyx_n_s_mx;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_ndim;
+static PyObject *__pyx_n_s_np;
+static PyObject *__pyx_n_s_numpy;
+static PyObject *__pyx_kp_s_numpy_core_multiarray_failed_to;
+static PyObject *__pyx_kp_s_numpy_core_umath_failed_to_impor;
+static PyObject *__pyx_n_s_pf;
+static PyObject *__pyx_n_s_points;
+static PyObject *__pyx_n_s_quad;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_scipy_integrate;
+static PyObject *__pyx_n_s_sigma_ss_to_xx;
+static PyObject *__pyx_n_s_sigma_xg_to_xg;
+static PyObject *__pyx_n_s_sigma_xl_to_xl;
+static PyObject *__pyx_n_s_sigma_xpi0_to_xpi0;
+static PyObject *__pyx_n_s_sigma_xpi_to_xpi;
+static PyObject *__pyx_n_s_sigma_xs_to_xs;
+static PyObject *__pyx_n_s_sigma_xx_to_all;
+static PyObject *__pyx_n_s_sigma_xx_to_s_to_ff;
+static PyObject *__pyx_n_s_sigma_xx_to_s_to_gg;
+static PyObject *__pyx_n_s_sigma_xx_to_s_to_pi0pi0;
+static PyObject *__pyx_n_s_sigma_xx_to_s_to_pipi;
+static PyObject *__pyx_n_s_sigma_xx_to_ss;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_thermal_cross_section;
+static PyObject *__pyx_n_s_vs;
+static PyObject *__pyx_n_s_width_s;
+static PyObject *__pyx_n_s_wrap;
+static PyObject *__pyx_n_s_x;
+static PyObject *__pyx_n_s_z;
+static PyObject *__pyx_n_s_zeros;
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_sigma_xx_to_s_to_ff(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs, double __pyx_v_mf); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_2sigma_xx_to_s_to_gg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_4sigma_xx_to_s_to_pi0pi0(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_6sigma_xx_to_s_to_pipi(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_8sigma_xx_to_ss(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_10sigma_ss_to_xx(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_12sigma_xx_to_all(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_14sigma_xl_to_xl(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs, double __pyx_v_mf); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_16sigma_xpi_to_xpi(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_18sigma_xpi0_to_xpi0(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_20sigma_xg_to_xg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_22sigma_xs_to_xs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_24thermal_cross_section(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_pf_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_wrap(PyObject *__pyx_self, double __pyx_v_z, double __pyx_v_x, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs); /* proto */
+static PyObject *__pyx_tp_new___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_float_2_0;
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_4;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__25;
+static PyObject *__pyx_tuple__27;
+static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_codeobj__4;
+static PyObject *__pyx_codeobj__6;
+static PyObject *__pyx_codeobj__8;
+static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_codeobj__12;
+static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_codeobj__16;
+static PyObject *__pyx_codeobj__18;
+static PyObject *__pyx_codeobj__20;
+static PyObject *__pyx_codeobj__22;
+static PyObject *__pyx_codeobj__24;
+static PyObject *__pyx_codeobj__26;
+static PyObject *__pyx_codeobj__28;
+static PyObject *__pyx_codeobj__30;
+/* Late includes */
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":20
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_ff(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                   double gsxx, double gsff, double gsGG,
+ *                                   double gsFF, double lam, double width_s,
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, CYTHON_UNUSED double __pyx_v_lam, double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs, double __pyx_v_mf) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("__sigma_xx_to_s_to_ff", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":24
+ *                                   double gsFF, double lam, double width_s,
+ *                                   double vs, double mf):
+ *     if e_cm < 2.0 * mf or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mf)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mx)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":25
+ *                                   double vs, double mf):
+ *     if e_cm < 2.0 * mf or e_cm < 2.0 * mx:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":24
+ *                                   double gsFF, double lam, double width_s,
+ *                                   double vs, double mf):
+ *     if e_cm < 2.0 * mf or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":33
+ *         * (-4 * mf ** 2 + e_cm ** 2) ** 1.5
+ *         * sqrt(-4 * mx ** 2 + e_cm ** 2)
+ *     ) / (             # <<<<<<<<<<<<<<
+ *         16.0
+ *         * M_PI
+ */
+  __pyx_r = (((((pow(__pyx_v_gsff, 2.0) * pow(__pyx_v_gsxx, 2.0)) * pow(__pyx_v_mf, 2.0)) * pow(((-4.0 * pow(__pyx_v_mf, 2.0)) + pow(__pyx_v_e_cm, 2.0)), 1.5)) * sqrt(((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)))) / ((((16.0 * M_PI) * pow(__pyx_v_e_cm, 2.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (pow((pow(__pyx_v_ms, 2.0) - pow(__pyx_v_e_cm, 2.0)), 2.0) + (pow(__pyx_v_ms, 2.0) * pow(__pyx_v_width_s, 2.0)))));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":20
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_ff(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                   double gsxx, double gsff, double gsGG,
+ *                                   double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":43
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_gg(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                   double gsxx, double gsff, double gsGG,
+ *                                   double gsFF, double lam, double width_s,
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_gg(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, CYTHON_UNUSED double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__sigma_xx_to_s_to_gg", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":47
+ *                                   double gsFF, double lam, double width_s,
+ *                                   double vs):
+ *     if e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mx)) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":48
+ *                                   double vs):
+ *     if e_cm < 2.0 * mx:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":47
+ *                                   double gsFF, double lam, double width_s,
+ *                                   double vs):
+ *     if e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":56
+ *         * e_cm ** 3
+ *         * sqrt(-4 * mx ** 2 + e_cm ** 2)
+ *     ) / (             # <<<<<<<<<<<<<<
+ *         128.0
+ *         * lam ** 2
+ */
+  __pyx_r = (((((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_alpha_em, 2.0) * pow(__pyx_v_gsFF, 2.0)) * pow(__pyx_v_gsxx, 2.0)) * pow(__pyx_v_e_cm, 3.0)) * sqrt(((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)))) / (((128.0 * pow(__pyx_v_lam, 2.0)) * pow(((double)M_PI), 3.0)) * (pow((pow(__pyx_v_ms, 2.0) - pow(__pyx_v_e_cm, 2.0)), 2.0) + (pow(__pyx_v_ms, 2.0) * pow(__pyx_v_width_s, 2.0)))));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":43
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_gg(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                   double gsxx, double gsff, double gsGG,
+ *                                   double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":65
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_pi0pi0(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                double gsxx, double gsff, double gsGG,
+ *                                double gsFF, double lam, double width_s,
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pi0pi0(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("__sigma_xx_to_s_to_pi0pi0", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":69
+ *                                double gsFF, double lam, double width_s,
+ *                                double vs):
+ *     if e_cm < 2.0 * mpi0 or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mx)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":70
+ *                                double vs):
+ *     if e_cm < 2.0 * mpi0 or e_cm < 2.0 * mx:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":69
+ *                                double gsFF, double lam, double width_s,
+ *                                double vs):
+ *     if e_cm < 2.0 * mpi0 or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":87
+ *         )
+ *         ** 2
+ *     ) / (             # <<<<<<<<<<<<<<
+ *         419904.0
+ *         * lam ** 6
+ */
+  __pyx_r = (((pow(__pyx_v_gsxx, 2.0) * sqrt((((-4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) + pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))))) * pow((((((162.0 * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * ((2.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) - pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) + ((((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0 * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((-3.0 * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + (((3.0 * __pyx_v_gsff) * __pyx_v_lam) * __pyx_v_vs)) + (((2.0 * __pyx_v_gsGG) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * __pyx_v_vs))) * ((((2.0 * __pyx_v_gsGG) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * ((9.0 * __pyx_v_lam) - ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) + (((9.0 * __pyx_v_gsff) * __pyx_v_lam) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)))))), 2.0)) / ((((((419904.0 * pow(__pyx_v_lam, 6.0)) * M_PI) * pow(__pyx_v_e_cm, 2.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * (pow((pow(__pyx_v_ms, 2.0) - pow(__pyx_v_e_cm, 2.0)), 2.0) + (pow(__pyx_v_ms, 2.0) * pow(__pyx_v_width_s, 2.0)))));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":65
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_pi0pi0(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                double gsxx, double gsff, double gsGG,
+ *                                double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":99
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_pipi(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                              double gsxx, double gsff, double gsGG,
+ *                              double gsFF, double lam, double width_s,
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pipi(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("__sigma_xx_to_s_to_pipi", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":103
+ *                              double gsFF, double lam, double width_s,
+ *                              double vs):
+ *     if e_cm < 2.0 * mpi or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mx)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":104
+ *                              double vs):
+ *     if e_cm < 2.0 * mpi or e_cm < 2.0 * mx:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":103
+ *                              double gsFF, double lam, double width_s,
+ *                              double vs):
+ *     if e_cm < 2.0 * mpi or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":121
+ *         )
+ *         ** 2
+ *     ) / (             # <<<<<<<<<<<<<<
+ *         209952.0
+ *         * lam ** 6
+ */
+  __pyx_r = (((pow(__pyx_v_gsxx, 2.0) * sqrt((((-4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) + pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))))) * pow((((((162.0 * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * ((2.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) - pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) + ((((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0 * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((-3.0 * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + (((3.0 * __pyx_v_gsff) * __pyx_v_lam) * __pyx_v_vs)) + (((2.0 * __pyx_v_gsGG) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * __pyx_v_vs))) * ((((2.0 * __pyx_v_gsGG) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * ((9.0 * __pyx_v_lam) - ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) + (((9.0 * __pyx_v_gsff) * __pyx_v_lam) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)))))), 2.0)) / ((((((209952.0 * pow(__pyx_v_lam, 6.0)) * M_PI) * pow(__pyx_v_e_cm, 2.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * (pow((pow(__pyx_v_ms, 2.0) - pow(__pyx_v_e_cm, 2.0)), 2.0) + (pow(__pyx_v_ms, 2.0) * pow(__pyx_v_width_s, 2.0)))));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":99
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_s_to_pipi(double e_cm, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                              double gsxx, double gsff, double gsGG,
+ *                              double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":133
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_ss(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                       double gsff, double gsGG, double gsFF, double lam,
+ *                       double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_ss(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, CYTHON_UNUSED double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, CYTHON_UNUSED double __pyx_v_lam, CYTHON_UNUSED double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("__sigma_xx_to_ss", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":136
+ *                       double gsff, double gsGG, double gsFF, double lam,
+ *                       double width_s, double vs):
+ *     if e_cm < 2.0 * ms or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_ms)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mx)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":137
+ *                       double width_s, double vs):
+ *     if e_cm < 2.0 * ms or e_cm < 2.0 * mx:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":136
+ *                       double gsff, double gsGG, double gsFF, double lam,
+ *                       double width_s, double vs):
+ *     if e_cm < 2.0 * ms or e_cm < 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":176
+ *             / (-2 * ms ** 2 + e_cm ** 2)
+ *         )
+ *     ) / (32.0 * M_PI * e_cm ** 2 * (-4 * mx ** 2 + e_cm ** 2))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((pow(__pyx_v_gsxx, 4.0) * ((-((sqrt((((-4.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)))) * (((3.0 * pow(__pyx_v_ms, 4.0)) - ((16.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0))) + ((2.0 * pow(__pyx_v_mx, 2.0)) * ((8.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))))) / ((pow(__pyx_v_ms, 4.0) - ((4.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0))) + (pow(__pyx_v_mx, 2.0) * pow(__pyx_v_e_cm, 2.0))))) + (((((((6.0 * pow(__pyx_v_ms, 4.0)) - (32.0 * pow(__pyx_v_mx, 4.0))) + ((16.0 * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_e_cm, 2.0))) + pow(__pyx_v_e_cm, 4.0)) - ((4.0 * pow(__pyx_v_ms, 2.0)) * ((4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)))) * log(((((-2.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_e_cm, 2.0)) + sqrt((((-4.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))))) / (((-2.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_e_cm, 2.0)) - sqrt((((-4.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)))))))) / ((-2.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_e_cm, 2.0))))) / (((32.0 * M_PI) * pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":133
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_ss(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                       double gsff, double gsGG, double gsFF, double lam,
+ *                       double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":180
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_ss_to_xx(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                              double gsff, double gsGG, double gsFF, double lam,
+ *                              double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_ss_to_xx(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, CYTHON_UNUSED double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, CYTHON_UNUSED double __pyx_v_lam, CYTHON_UNUSED double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs) {
+  double __pyx_v_rs;
+  double __pyx_v_rx;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("__sigma_ss_to_xx", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":183
+ *                              double gsff, double gsGG, double gsFF, double lam,
+ *                              double width_s, double vs):
+ *     if e_cm < 2 * mx or e_cm < 2 * ms:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_mx)) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_e_cm < (2.0 * __pyx_v_ms)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":184
+ *                              double width_s, double vs):
+ *     if e_cm < 2 * mx or e_cm < 2 * ms:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double rs = ms / e_cm
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":183
+ *                              double gsff, double gsGG, double gsFF, double lam,
+ *                              double width_s, double vs):
+ *     if e_cm < 2 * mx or e_cm < 2 * ms:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":186
+ *         return 0.0
+ * 
+ *     cdef double rs = ms / e_cm             # <<<<<<<<<<<<<<
+ *     cdef double rx = mx / e_cm
+ *     return (
+ */
+  __pyx_v_rs = (__pyx_v_ms / __pyx_v_e_cm);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":187
+ * 
+ *     cdef double rs = ms / e_cm
+ *     cdef double rx = mx / e_cm             # <<<<<<<<<<<<<<
+ *     return (
+ *         gsxx ** 4
+ */
+  __pyx_v_rx = (__pyx_v_mx / __pyx_v_e_cm);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":221
+ *             / (1 - 2 * rs ** 2)
+ *         )
+ *     ) / (8 * e_cm ** 2 * M_PI * (1 - 4 * rs ** 2))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((pow(__pyx_v_gsxx, 4.0) * ((((-2.0 * sqrt(((1.0 - (4.0 * pow(__pyx_v_rs, 2.0))) * (1.0 - (4.0 * pow(__pyx_v_rx, 2.0)))))) * (((3.0 * pow(__pyx_v_rs, 4.0)) + ((2.0 * (1.0 - (8.0 * pow(__pyx_v_rs, 2.0)))) * pow(__pyx_v_rx, 2.0))) + (16.0 * pow(__pyx_v_rx, 4.0)))) / ((pow(__pyx_v_rs, 4.0) + pow(__pyx_v_rx, 2.0)) - ((4.0 * pow(__pyx_v_rs, 2.0)) * pow(__pyx_v_rx, 2.0)))) + (((((((1.0 + (6.0 * pow(__pyx_v_rs, 4.0))) + (16.0 * pow(__pyx_v_rx, 2.0))) - (32.0 * pow(__pyx_v_rx, 4.0))) - ((4.0 * pow(__pyx_v_rs, 2.0)) * (1.0 + (4.0 * pow(__pyx_v_rx, 2.0))))) * 2.0) * (log(((1.0 - (2.0 * pow(__pyx_v_rs, 2.0))) + sqrt(((1.0 - (4.0 * pow(__pyx_v_rs, 2.0))) * (1.0 - (4.0 * pow(__pyx_v_rx, 2.0))))))) - log(((1.0 - (2.0 * pow(__pyx_v_rs, 2.0))) - sqrt(((1.0 - (4.0 * pow(__pyx_v_rs, 2.0))) * (1.0 - (4.0 * pow(__pyx_v_rx, 2.0))))))))) / (1.0 - (2.0 * pow(__pyx_v_rs, 2.0)))))) / (((8.0 * pow(__pyx_v_e_cm, 2.0)) * M_PI) * (1.0 - (4.0 * pow(__pyx_v_rs, 2.0)))));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":180
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_ss_to_xx(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                              double gsff, double gsGG, double gsFF, double lam,
+ *                              double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":225
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_all(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                               double gsff, double gsGG, double gsFF, double lam,
+ *                               double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_all(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_v_sig_e;
+  double __pyx_v_sig_mu;
+  double __pyx_v_sig_g;
+  double __pyx_v_sig_pi0;
+  double __pyx_v_sig_pi;
+  double __pyx_v_sig_s;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__sigma_xx_to_all", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":229
+ *                               double width_s, double vs):
+ * 
+ *     cdef double sig_e = __sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, me)
+ *     cdef double sig_mu = __sigma_xx_to_s_to_ff(
+ */
+  __pyx_v_sig_e = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_me);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":231
+ *     cdef double sig_e = __sigma_xx_to_s_to_ff(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, me)
+ *     cdef double sig_mu = __sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, mmu)
+ *     cdef double sig_g = __sigma_xx_to_s_to_gg(
+ */
+  __pyx_v_sig_mu = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mmu);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":233
+ *     cdef double sig_mu = __sigma_xx_to_s_to_ff(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, mmu)
+ *     cdef double sig_g = __sigma_xx_to_s_to_gg(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi0 = __sigma_xx_to_s_to_pi0pi0(
+ */
+  __pyx_v_sig_g = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_gg(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":235
+ *     cdef double sig_g = __sigma_xx_to_s_to_gg(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi0 = __sigma_xx_to_s_to_pi0pi0(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi = __sigma_xx_to_s_to_pipi(
+ */
+  __pyx_v_sig_pi0 = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pi0pi0(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":237
+ *     cdef double sig_pi0 = __sigma_xx_to_s_to_pi0pi0(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi = __sigma_xx_to_s_to_pipi(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_s = __sigma_xx_to_ss(
+ */
+  __pyx_v_sig_pi = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pipi(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":239
+ *     cdef double sig_pi = __sigma_xx_to_s_to_pipi(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_s = __sigma_xx_to_ss(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ * 
+ */
+  __pyx_v_sig_s = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_ss(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":242
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ * 
+ *     return sig_e + sig_mu + sig_g + sig_pi0 + sig_pi + sig_s             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (((((__pyx_v_sig_e + __pyx_v_sig_mu) + __pyx_v_sig_g) + __pyx_v_sig_pi0) + __pyx_v_sig_pi) + __pyx_v_sig_s);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":225
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_all(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                               double gsff, double gsGG, double gsFF, double lam,
+ *                               double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":246
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_sm(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                               double gsff, double gsGG, double gsFF, double lam,
+ *                               double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_sm(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_v_sig_e;
+  double __pyx_v_sig_mu;
+  double __pyx_v_sig_g;
+  double __pyx_v_sig_pi0;
+  double __pyx_v_sig_pi;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__sigma_xx_to_sm", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":250
+ *                               double width_s, double vs):
+ * 
+ *     cdef double sig_e = __sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, me)
+ *     cdef double sig_mu = __sigma_xx_to_s_to_ff(
+ */
+  __pyx_v_sig_e = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_me);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":252
+ *     cdef double sig_e = __sigma_xx_to_s_to_ff(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, me)
+ *     cdef double sig_mu = __sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, mmu)
+ *     cdef double sig_g = __sigma_xx_to_s_to_gg(
+ */
+  __pyx_v_sig_mu = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mmu);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":254
+ *     cdef double sig_mu = __sigma_xx_to_s_to_ff(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs, mmu)
+ *     cdef double sig_g = __sigma_xx_to_s_to_gg(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi0 = __sigma_xx_to_s_to_pi0pi0(
+ */
+  __pyx_v_sig_g = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_gg(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":256
+ *     cdef double sig_g = __sigma_xx_to_s_to_gg(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi0 = __sigma_xx_to_s_to_pi0pi0(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi = __sigma_xx_to_s_to_pipi(
+ */
+  __pyx_v_sig_pi0 = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pi0pi0(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":258
+ *     cdef double sig_pi0 = __sigma_xx_to_s_to_pi0pi0(
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     cdef double sig_pi = __sigma_xx_to_s_to_pipi(             # <<<<<<<<<<<<<<
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ * 
+ */
+  __pyx_v_sig_pi = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pipi(__pyx_v_e_cm, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":261
+ *         e_cm, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ * 
+ *     return sig_e + sig_mu + sig_g + sig_pi0 + sig_pi             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((((__pyx_v_sig_e + __pyx_v_sig_mu) + __pyx_v_sig_g) + __pyx_v_sig_pi0) + __pyx_v_sig_pi);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":246
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xx_to_sm(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                               double gsff, double gsGG, double gsFF, double lam,
+ *                               double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":265
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xl_to_xl(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                              double gsff, double gsGG, double gsFF,
+ *                              double lam, double width_s, double vs, double ml):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xl_to_xl(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, CYTHON_UNUSED double __pyx_v_lam, double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs, double __pyx_v_ml) {
+  double __pyx_v_s;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  double __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__sigma_xl_to_xl", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":269
+ *                              double lam, double width_s, double vs, double ml):
+ * 
+ *     if e_cm < mx + ml:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_e_cm < (__pyx_v_mx + __pyx_v_ml)) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":270
+ * 
+ *     if e_cm < mx + ml:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double s = e_cm**2
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":269
+ *                              double lam, double width_s, double vs, double ml):
+ * 
+ *     if e_cm < mx + ml:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":272
+ *         return 0.0
+ * 
+ *     cdef double s = e_cm**2             # <<<<<<<<<<<<<<
+ * 
+ *     return 2.0 * (
+ */
+  __pyx_v_s = pow(__pyx_v_e_cm, 2.0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":275
+ * 
+ *     return 2.0 * (
+ *         ((gsff * ml)**2 * gsxx**2 *             # <<<<<<<<<<<<<<
+ *          ((-4 * ml**2 * (ms**2 - 4 * mx**2) + ms**2 *
+ *            (ms**2 - 4 * mx**2 - width_s**2)) *
+ */
+  __pyx_t_2 = PyFloat_FromDouble((pow((__pyx_v_gsff * __pyx_v_ml), 2.0) * pow(__pyx_v_gsxx, 2.0))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":278
+ *          ((-4 * ml**2 * (ms**2 - 4 * mx**2) + ms**2 *
+ *            (ms**2 - 4 * mx**2 - width_s**2)) *
+ *           atan(ms / width_s) +             # <<<<<<<<<<<<<<
+ *           (4 * ml**2 * (ms**2 - 4 * mx**2) + ms**2 *
+ *            (-ms**2 + 4 * mx**2 + width_s**2)) *
+ */
+  __pyx_t_3 = PyFloat_FromDouble((((((-4.0 * pow(__pyx_v_ml, 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) + (pow(__pyx_v_ms, 2.0) * ((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))) * atan((__pyx_v_ms / __pyx_v_width_s))) + ((((4.0 * pow(__pyx_v_ml, 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) + (pow(__pyx_v_ms, 2.0) * (((-pow(__pyx_v_ms, 2.0)) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_width_s, 2.0)))) * atan((((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) + __pyx_v_s) / (__pyx_v_ms * __pyx_v_width_s)))))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 278, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":282
+ *            (-ms**2 + 4 * mx**2 + width_s**2)) *
+ *           atan((ms**2 - 4 * mx**2 + s) / (ms * width_s)) +
+ *           ms * width_s *             # <<<<<<<<<<<<<<
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *
+ */
+  __pyx_t_4 = PyFloat_FromDouble((__pyx_v_ms * __pyx_v_width_s)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":283
+ *           atan((ms**2 - 4 * mx**2 + s) / (ms * width_s)) +
+ *           ms * width_s *
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *             # <<<<<<<<<<<<<<
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *
+ *            log(4 * ms**2 * (ms**2 + width_s**2)) +
+ */
+  __pyx_t_5 = PyFloat_FromDouble(((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyFloat_FromDouble(pow(__pyx_v_ms, 2.0)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_np); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_log); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_9))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_9);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_9, function);
+    }
+  }
+  __pyx_t_7 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_9, __pyx_t_8, __pyx_int_4) : __Pyx_PyObject_CallOneArg(__pyx_t_9, __pyx_int_4);
+  __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyNumber_Multiply(__pyx_t_6, __pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = PyNumber_Add(__pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_9 = PyFloat_FromDouble((pow(__pyx_v_ml, 2.0) * log(16.0))); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_5 = PyNumber_Subtract(__pyx_t_7, __pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":284
+ *           ms * width_s *
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *             # <<<<<<<<<<<<<<
+ *            log(4 * ms**2 * (ms**2 + width_s**2)) +
+ *            (-2 * ml**2 + ms**2 - 2 * mx**2) *
+ */
+  __pyx_t_9 = PyFloat_FromDouble((pow(__pyx_v_mx, 2.0) * log(16.0))); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":283
+ *           atan((ms**2 - 4 * mx**2 + s) / (ms * width_s)) +
+ *           ms * width_s *
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *             # <<<<<<<<<<<<<<
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *
+ *            log(4 * ms**2 * (ms**2 + width_s**2)) +
+ */
+  __pyx_t_7 = PyNumber_Subtract(__pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 283, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":284
+ *           ms * width_s *
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *             # <<<<<<<<<<<<<<
+ *            log(4 * ms**2 * (ms**2 + width_s**2)) +
+ *            (-2 * ml**2 + ms**2 - 2 * mx**2) *
+ */
+  __pyx_t_9 = PyFloat_FromDouble(((((2.0 * pow(__pyx_v_ml, 2.0)) - pow(__pyx_v_ms, 2.0)) + (2.0 * pow(__pyx_v_mx, 2.0))) * log(((4.0 * pow(__pyx_v_ms, 2.0)) * (pow(__pyx_v_ms, 2.0) + pow(__pyx_v_width_s, 2.0)))))); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_5 = PyNumber_Add(__pyx_t_7, __pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":286
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *
+ *            log(4 * ms**2 * (ms**2 + width_s**2)) +
+ *            (-2 * ml**2 + ms**2 - 2 * mx**2) *             # <<<<<<<<<<<<<<
+ *            log(ms**4 + (-4 * mx**2 + s)**2 +
+ *                ms**2 * (-8 * mx**2 + 2 * s + width_s**2))))) /
+ */
+  __pyx_t_9 = PyFloat_FromDouble(((((-2.0 * pow(__pyx_v_ml, 2.0)) + pow(__pyx_v_ms, 2.0)) - (2.0 * pow(__pyx_v_mx, 2.0))) * log(((pow(__pyx_v_ms, 4.0) + pow(((-4.0 * pow(__pyx_v_mx, 2.0)) + __pyx_v_s), 2.0)) + (pow(__pyx_v_ms, 2.0) * (((-8.0 * pow(__pyx_v_mx, 2.0)) + (2.0 * __pyx_v_s)) + pow(__pyx_v_width_s, 2.0))))))); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":285
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *
+ *            log(4 * ms**2 * (ms**2 + width_s**2)) +             # <<<<<<<<<<<<<<
+ *            (-2 * ml**2 + ms**2 - 2 * mx**2) *
+ *            log(ms**4 + (-4 * mx**2 + s)**2 +
+ */
+  __pyx_t_7 = PyNumber_Add(__pyx_t_5, __pyx_t_9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 285, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":282
+ *            (-ms**2 + 4 * mx**2 + width_s**2)) *
+ *           atan((ms**2 - 4 * mx**2 + s) / (ms * width_s)) +
+ *           ms * width_s *             # <<<<<<<<<<<<<<
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *
+ *            log(16) + (2 * ml**2 - ms**2 + 2 * mx**2) *
+ */
+  __pyx_t_9 = PyNumber_Multiply(__pyx_t_4, __pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":281
+ *           (4 * ml**2 * (ms**2 - 4 * mx**2) + ms**2 *
+ *            (-ms**2 + 4 * mx**2 + width_s**2)) *
+ *           atan((ms**2 - 4 * mx**2 + s) / (ms * width_s)) +             # <<<<<<<<<<<<<<
+ *           ms * width_s *
+ *           (4 * mx**2 - s + ms**2 * np.log(4) - ml**2 * log(16) - mx**2 *
+ */
+  __pyx_t_7 = PyNumber_Add(__pyx_t_3, __pyx_t_9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":275
+ * 
+ *     return 2.0 * (
+ *         ((gsff * ml)**2 * gsxx**2 *             # <<<<<<<<<<<<<<
+ *          ((-4 * ml**2 * (ms**2 - 4 * mx**2) + ms**2 *
+ *            (ms**2 - 4 * mx**2 - width_s**2)) *
+ */
+  __pyx_t_9 = PyNumber_Multiply(__pyx_t_2, __pyx_t_7); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":289
+ *            log(ms**4 + (-4 * mx**2 + s)**2 +
+ *                ms**2 * (-8 * mx**2 + 2 * s + width_s**2))))) /
+ *         (32.0 * ms * M_PI * e_cm**2 * (4 * mx**2 - s) * width_s))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_7 = PyFloat_FromDouble((((((32.0 * __pyx_v_ms) * M_PI) * pow(__pyx_v_e_cm, 2.0)) * ((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)) * __pyx_v_width_s)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":288
+ *            (-2 * ml**2 + ms**2 - 2 * mx**2) *
+ *            log(ms**4 + (-4 * mx**2 + s)**2 +
+ *                ms**2 * (-8 * mx**2 + 2 * s + width_s**2))))) /             # <<<<<<<<<<<<<<
+ *         (32.0 * ms * M_PI * e_cm**2 * (4 * mx**2 - s) * width_s))
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_9, __pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 288, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":274
+ *     cdef double s = e_cm**2
+ * 
+ *     return 2.0 * (             # <<<<<<<<<<<<<<
+ *         ((gsff * ml)**2 * gsxx**2 *
+ *          ((-4 * ml**2 * (ms**2 - 4 * mx**2) + ms**2 *
+ */
+  __pyx_t_7 = PyNumber_Multiply(__pyx_float_2_0, __pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 274, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_10;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":265
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xl_to_xl(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                              double gsff, double gsGG, double gsFF,
+ *                              double lam, double width_s, double vs, double ml):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_WriteUnraisable("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__sigma_xl_to_xl", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":293
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xpi_to_xpi(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                                double gsff, double gsGG, double gsFF,
+ *                                double lam, double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi_to_xpi(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__sigma_xpi_to_xpi", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":297
+ *                                double lam, double width_s, double vs):
+ * 
+ *     if e_cm < mx + mpi:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_e_cm < (__pyx_v_mx + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi)) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":298
+ * 
+ *     if e_cm < mx + mpi:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return 2.0 * (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":297
+ *                                double lam, double width_s, double vs):
+ * 
+ *     if e_cm < mx + mpi:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":300
+ *         return 0.0
+ * 
+ *     return 2.0 * (             # <<<<<<<<<<<<<<
+ *         (gsxx**2 *
+ *          (2 *
+ */
+  __pyx_r = (2.0 * ((pow(__pyx_v_gsxx, 2.0) * ((((2.0 * ((((((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0)) + ((((((((324.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) * (((2.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) + (pow(__pyx_v_ms, 2.0) * (((-pow(__pyx_v_ms, 2.0)) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_width_s, 2.0)))))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * ((((pow(__pyx_v_ms, 6.0) + ((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 4.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))))) + (((4.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_width_s, 2.0))) - (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) * pow(__pyx_v_ms, 2.0)) * ((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))) - (pow(__pyx_v_ms, 4.0) * ((4.0 * pow(__pyx_v_mx, 2.0)) + (3.0 * pow(__pyx_v_width_s, 2.0)))))))) * atan((__pyx_v_ms / __pyx_v_width_s))) - ((2.0 * ((((((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0)) + ((((((((324.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) * (((2.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) + (pow(__pyx_v_ms, 2.0) * (((-pow(__pyx_v_ms, 2.0)) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_width_s, 2.0)))))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * ((((pow(__pyx_v_ms, 6.0) + ((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 4.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))))) + (((4.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_width_s, 2.0))) - (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) * pow(__pyx_v_ms, 2.0)) * ((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))) - (pow(__pyx_v_ms, 4.0) * ((4.0 * pow(__pyx_v_mx, 2.0)) + (3.0 * pow(__pyx_v_width_s, 2.0)))))))) * atan((((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_e_cm, 2.0)) / (__pyx_v_ms * __pyx_v_width_s))))) + ((__pyx_v_ms * __pyx_v_width_s) * (((((((-324.0 * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * ((4.0 * pow(__pyx_v_mx, 2.0)) - pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((((81.0 * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * ((((8.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) - (4.0 * pow(__pyx_v_ms, 2.0))) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) + ((((2.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))))) - (((((((((((648.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0) - pow(__pyx_v_ms, 2.0)) + (2.0 * pow(__pyx_v_mx, 2.0)))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) + (((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 4.0)) - ((8.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) * (pow(__pyx_v_ms, 2.0) - (2.0 * pow(__pyx_v_mx, 2.0))))) + (pow(__pyx_v_ms, 2.0) * (((3.0 * pow(__pyx_v_ms, 2.0)) - (8.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))))) * log((pow(__pyx_v_ms, 2.0) * (pow(__pyx_v_ms, 2.0) + pow(__pyx_v_width_s, 2.0)))))) + (((((((((((648.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0) - pow(__pyx_v_ms, 2.0)) + (2.0 * pow(__pyx_v_mx, 2.0)))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) + (((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 4.0)) - ((8.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi, 2.0)) * (pow(__pyx_v_ms, 2.0) - (2.0 * pow(__pyx_v_mx, 2.0))))) + (pow(__pyx_v_ms, 2.0) * (((3.0 * pow(__pyx_v_ms, 2.0)) - (8.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))))) * log(((pow(__pyx_v_ms, 4.0) + pow(((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)), 2.0)) + (pow(__pyx_v_ms, 2.0) * (((-8.0 * pow(__pyx_v_mx, 2.0)) + (2.0 * pow(__pyx_v_e_cm, 2.0))) + pow(__pyx_v_width_s, 2.0)))))))))) / ((((((((419904. * pow(__pyx_v_lam, 6.0)) * __pyx_v_ms) * M_PI) * pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * __pyx_v_width_s)));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":293
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xpi_to_xpi(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                                double gsff, double gsGG, double gsFF,
+ *                                double lam, double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":392
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xpi0_to_xpi0(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                                  double gsff, double gsGG, double gsFF,
+ *                                  double lam, double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi0_to_xpi0(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__sigma_xpi0_to_xpi0", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":396
+ *                                  double lam, double width_s, double vs):
+ * 
+ *     if e_cm < mx + mpi0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_e_cm < (__pyx_v_mx + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0)) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":397
+ * 
+ *     if e_cm < mx + mpi0:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":396
+ *                                  double lam, double width_s, double vs):
+ * 
+ *     if e_cm < mx + mpi0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":483
+ *              ms**2 * (3 * ms**2 - 8 * mx**2 - width_s**2))) *
+ *            log(ms**4 + (-4 * mx**2 + e_cm**2)**2 + ms**2 *
+ *                (-8 * mx**2 + 2 * e_cm**2 + width_s**2))))) /             # <<<<<<<<<<<<<<
+ *         (419904. * lam**6 * ms * M_PI * e_cm**2 *
+ *          (-4 * mx**2 + e_cm**2) * vh**4 *
+ */
+  __pyx_r = ((pow(__pyx_v_gsxx, 2.0) * ((((2.0 * ((((((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0)) + ((((((((324.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) * (((2.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) + (pow(__pyx_v_ms, 2.0) * (((-pow(__pyx_v_ms, 2.0)) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_width_s, 2.0)))))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * ((((pow(__pyx_v_ms, 6.0) + ((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 4.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))))) + (((4.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_width_s, 2.0))) - (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) * pow(__pyx_v_ms, 2.0)) * ((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))) - (pow(__pyx_v_ms, 4.0) * ((4.0 * pow(__pyx_v_mx, 2.0)) + (3.0 * pow(__pyx_v_width_s, 2.0)))))))) * atan((__pyx_v_ms / __pyx_v_width_s))) - ((2.0 * ((((((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0)) + ((((((((324.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) * (((2.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0)))) + (pow(__pyx_v_ms, 2.0) * (((-pow(__pyx_v_ms, 2.0)) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_width_s, 2.0)))))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * ((((pow(__pyx_v_ms, 6.0) + ((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 4.0)) * (pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))))) + (((4.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_width_s, 2.0))) - (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) * pow(__pyx_v_ms, 2.0)) * ((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))) - (pow(__pyx_v_ms, 4.0) * ((4.0 * pow(__pyx_v_mx, 2.0)) + (3.0 * pow(__pyx_v_width_s, 2.0)))))))) * atan((((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_e_cm, 2.0)) / (__pyx_v_ms * __pyx_v_width_s))))) + ((__pyx_v_ms * __pyx_v_width_s) * (((((((-324.0 * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * ((4.0 * pow(__pyx_v_mx, 2.0)) - pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((((81.0 * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * ((((8.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) - (4.0 * pow(__pyx_v_ms, 2.0))) + (4.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) + ((((2.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))))) - (((((((((((648.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0) - pow(__pyx_v_ms, 2.0)) + (2.0 * pow(__pyx_v_mx, 2.0)))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) + (((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 4.0)) - ((8.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) * (pow(__pyx_v_ms, 2.0) - (2.0 * pow(__pyx_v_mx, 2.0))))) + (pow(__pyx_v_ms, 2.0) * (((3.0 * pow(__pyx_v_ms, 2.0)) - (8.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))))) * log((pow(__pyx_v_ms, 2.0) * (pow(__pyx_v_ms, 2.0) + pow(__pyx_v_width_s, 2.0)))))) + (((((((((((648.0 * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0) * __pyx_v_gsGG) * pow(__pyx_v_lam, 3.0)) * (__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq)) * ((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0) - pow(__pyx_v_ms, 2.0)) + (2.0 * pow(__pyx_v_mx, 2.0)))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * ((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) * ((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0)))))) + (((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0, 2.0) * pow((__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq + __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq), 2.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * pow(((((((27.0 * pow(__pyx_v_gsff, 2.0)) * pow(__pyx_v_lam, 2.0)) * __pyx_v_vs) * ((3.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs))) - (((2.0 * __pyx_v_gsGG) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 2.0)) * (((27.0 * pow(__pyx_v_lam, 2.0)) - (((30.0 * __pyx_v_gsGG) * __pyx_v_lam) * __pyx_v_vs)) + ((8.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_vs, 2.0))))) + (__pyx_v_gsff * (((-81.0 * pow(__pyx_v_lam, 3.0)) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) + ((((48.0 * pow(__pyx_v_gsGG, 2.0)) * __pyx_v_lam) * __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh) * pow(__pyx_v_vs, 2.0))))), 2.0))) + ((((26244.0 * pow(__pyx_v_gsGG, 2.0)) * pow(__pyx_v_lam, 6.0)) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * (((4.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 4.0)) - ((8.0 * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0, 2.0)) * (pow(__pyx_v_ms, 2.0) - (2.0 * pow(__pyx_v_mx, 2.0))))) + (pow(__pyx_v_ms, 2.0) * (((3.0 * pow(__pyx_v_ms, 2.0)) - (8.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0)))))) * log(((pow(__pyx_v_ms, 4.0) + pow(((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0)), 2.0)) + (pow(__pyx_v_ms, 2.0) * (((-8.0 * pow(__pyx_v_mx, 2.0)) + (2.0 * pow(__pyx_v_e_cm, 2.0))) + pow(__pyx_v_width_s, 2.0)))))))))) / ((((((((419904. * pow(__pyx_v_lam, 6.0)) * __pyx_v_ms) * M_PI) * pow(__pyx_v_e_cm, 2.0)) * ((-4.0 * pow(__pyx_v_mx, 2.0)) + pow(__pyx_v_e_cm, 2.0))) * pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh, 4.0)) * pow(((9.0 * __pyx_v_lam) + ((4.0 * __pyx_v_gsGG) * __pyx_v_vs)), 2.0)) * __pyx_v_width_s));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":392
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xpi0_to_xpi0(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                                  double gsff, double gsGG, double gsFF,
+ *                                  double lam, double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":490
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xg_to_xg(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                                  double gsff, double gsGG, double gsFF,
+ *                                  double lam, double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xg_to_xg(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, CYTHON_UNUSED double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs) {
+  double __pyx_v_s;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("__sigma_xg_to_xg", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":495
+ * 
+ *     # for e_cm = 2mx there is complete destructive interference
+ *     if e_cm < mx or e_cm == 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_2 = ((__pyx_v_e_cm < __pyx_v_mx) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_e_cm == (2.0 * __pyx_v_mx)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":496
+ *     # for e_cm = 2mx there is complete destructive interference
+ *     if e_cm < mx or e_cm == 2.0 * mx:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double s = e_cm**2
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":495
+ * 
+ *     # for e_cm = 2mx there is complete destructive interference
+ *     if e_cm < mx or e_cm == 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":498
+ *         return 0.0
+ * 
+ *     cdef double s = e_cm**2             # <<<<<<<<<<<<<<
+ * 
+ *     return ((alpha_em**2 * gsFF**2 * gsxx**2 *
+ */
+  __pyx_v_s = pow(__pyx_v_e_cm, 2.0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":511
+ *                         ms**2 * (3 * ms**2 - 8 * mx**2 - width_s**2) *
+ *                         log(ms**4 + (-4 * mx**2 + s)**2 + ms**2 *
+ *                             (-8 * mx**2 + 2 * s + width_s**2))))) /             # <<<<<<<<<<<<<<
+ *             (128. * lam**2 * M_PI**3 * (4 * mx**2 - s) * s * width_s))
+ * 
+ */
+  __pyx_r = ((((pow(__pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_alpha_em, 2.0) * pow(__pyx_v_gsFF, 2.0)) * pow(__pyx_v_gsxx, 2.0)) * ((((-2.0 * ((pow(__pyx_v_ms, 5.0) + (((4.0 * __pyx_v_ms) * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_width_s, 2.0))) - (pow(__pyx_v_ms, 3.0) * ((4.0 * pow(__pyx_v_mx, 2.0)) + (3.0 * pow(__pyx_v_width_s, 2.0)))))) * atan((__pyx_v_ms / __pyx_v_width_s))) + ((2.0 * ((pow(__pyx_v_ms, 5.0) + (((4.0 * __pyx_v_ms) * pow(__pyx_v_mx, 2.0)) * pow(__pyx_v_width_s, 2.0))) - (pow(__pyx_v_ms, 3.0) * ((4.0 * pow(__pyx_v_mx, 2.0)) + (3.0 * pow(__pyx_v_width_s, 2.0)))))) * atan((((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))) + __pyx_v_s) / (__pyx_v_ms * __pyx_v_width_s))))) - (__pyx_v_width_s * ((((((4.0 * pow(__pyx_v_ms, 2.0)) - (4.0 * pow(__pyx_v_mx, 2.0))) - __pyx_v_s) * ((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)) + ((pow(__pyx_v_ms, 2.0) * (((-3.0 * pow(__pyx_v_ms, 2.0)) + (8.0 * pow(__pyx_v_mx, 2.0))) + pow(__pyx_v_width_s, 2.0))) * log((pow(__pyx_v_ms, 2.0) * (pow(__pyx_v_ms, 2.0) + pow(__pyx_v_width_s, 2.0)))))) + ((pow(__pyx_v_ms, 2.0) * (((3.0 * pow(__pyx_v_ms, 2.0)) - (8.0 * pow(__pyx_v_mx, 2.0))) - pow(__pyx_v_width_s, 2.0))) * log(((pow(__pyx_v_ms, 4.0) + pow(((-4.0 * pow(__pyx_v_mx, 2.0)) + __pyx_v_s), 2.0)) + (pow(__pyx_v_ms, 2.0) * (((-8.0 * pow(__pyx_v_mx, 2.0)) + (2.0 * __pyx_v_s)) + pow(__pyx_v_width_s, 2.0)))))))))) / (((((128. * pow(__pyx_v_lam, 2.0)) * pow(((double)M_PI), 3.0)) * ((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)) * __pyx_v_s) * __pyx_v_width_s));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":490
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xg_to_xg(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                                  double gsff, double gsGG, double gsFF,
+ *                                  double lam, double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":516
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xs_to_xs(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                              double gsff, double gsGG, double gsFF,
+ *                              double lam, double width_s, double vs):
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xs_to_xs(double __pyx_v_e_cm, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, CYTHON_UNUSED double __pyx_v_gsff, CYTHON_UNUSED double __pyx_v_gsGG, CYTHON_UNUSED double __pyx_v_gsFF, CYTHON_UNUSED double __pyx_v_lam, CYTHON_UNUSED double __pyx_v_width_s, CYTHON_UNUSED double __pyx_v_vs) {
+  double __pyx_v_s;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__sigma_xs_to_xs", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":519
+ *                              double gsff, double gsGG, double gsFF,
+ *                              double lam, double width_s, double vs):
+ *     if e_cm < mx + ms:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_e_cm < (__pyx_v_mx + __pyx_v_ms)) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":520
+ *                              double lam, double width_s, double vs):
+ *     if e_cm < mx + ms:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     if e_cm == 2.0 * mx:
+ */
+    __pyx_r = 0.0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":519
+ *                              double gsff, double gsGG, double gsFF,
+ *                              double lam, double width_s, double vs):
+ *     if e_cm < mx + ms:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":522
+ *         return 0.0
+ * 
+ *     if e_cm == 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return ((gsxx**4*(ms**4 - 10*ms**2*mx**2 + 9*mx**4)**2)/
+ *                 (36.0*mx**4*(2*ms**2 - 3*mx**2)**2*M_PI*e_cm**2))
+ */
+  __pyx_t_1 = ((__pyx_v_e_cm == (2.0 * __pyx_v_mx)) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":523
+ * 
+ *     if e_cm == 2.0 * mx:
+ *         return ((gsxx**4*(ms**4 - 10*ms**2*mx**2 + 9*mx**4)**2)/             # <<<<<<<<<<<<<<
+ *                 (36.0*mx**4*(2*ms**2 - 3*mx**2)**2*M_PI*e_cm**2))
+ * 
+ */
+    __pyx_r = ((pow(__pyx_v_gsxx, 4.0) * pow(((pow(__pyx_v_ms, 4.0) - ((10.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0))) + (9.0 * pow(__pyx_v_mx, 4.0))), 2.0)) / ((((36.0 * pow(__pyx_v_mx, 4.0)) * pow(((2.0 * pow(__pyx_v_ms, 2.0)) - (3.0 * pow(__pyx_v_mx, 2.0))), 2.0)) * M_PI) * pow(__pyx_v_e_cm, 2.0)));
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":522
+ *         return 0.0
+ * 
+ *     if e_cm == 2.0 * mx:             # <<<<<<<<<<<<<<
+ *         return ((gsxx**4*(ms**4 - 10*ms**2*mx**2 + 9*mx**4)**2)/
+ *                 (36.0*mx**4*(2*ms**2 - 3*mx**2)**2*M_PI*e_cm**2))
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":526
+ *                 (36.0*mx**4*(2*ms**2 - 3*mx**2)**2*M_PI*e_cm**2))
+ * 
+ *     cdef double s = e_cm**2             # <<<<<<<<<<<<<<
+ * 
+ *     return (
+ */
+  __pyx_v_s = pow(__pyx_v_e_cm, 2.0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":540
+ *             15*mx**4 + 18*mx**2*s - s**2)*
+ *            log(abs((2*ms**2 - 3*mx**2)/(2*ms**2 + mx**2 - s))))/
+ *           (4*mx**2 - s)))/(64.*M_PI*e_cm**2*(mx**2 - s)**2))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((pow(__pyx_v_gsxx, 4.0) * (((((((((4.0 * pow(__pyx_v_ms, 4.0)) - ((24.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0))) + (4.0 * pow(__pyx_v_mx, 4.0))) + (((4.0 * pow((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))), 2.0)) * pow((pow(__pyx_v_mx, 2.0) - __pyx_v_s), 2.0)) / (((2.0 * pow(__pyx_v_ms, 2.0)) - (3.0 * pow(__pyx_v_mx, 2.0))) * ((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)))) - (((4.0 * pow((pow(__pyx_v_ms, 2.0) - (4.0 * pow(__pyx_v_mx, 2.0))), 2.0)) * pow((pow(__pyx_v_mx, 2.0) - __pyx_v_s), 2.0)) / ((((2.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_mx, 2.0)) - __pyx_v_s) * ((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)))) - ((8.0 * pow(__pyx_v_ms, 2.0)) * __pyx_v_s)) + ((50.0 * pow(__pyx_v_mx, 2.0)) * __pyx_v_s)) + (10.0 * pow(__pyx_v_s, 2.0))) + ((((4.0 * (pow(__pyx_v_mx, 2.0) - __pyx_v_s)) * (((((-2.0 * pow(__pyx_v_ms, 4.0)) - ((16.0 * pow(__pyx_v_ms, 2.0)) * pow(__pyx_v_mx, 2.0))) + (15.0 * pow(__pyx_v_mx, 4.0))) + ((18.0 * pow(__pyx_v_mx, 2.0)) * __pyx_v_s)) - pow(__pyx_v_s, 2.0))) * log(fabs((((2.0 * pow(__pyx_v_ms, 2.0)) - (3.0 * pow(__pyx_v_mx, 2.0))) / (((2.0 * pow(__pyx_v_ms, 2.0)) + pow(__pyx_v_mx, 2.0)) - __pyx_v_s))))) / ((4.0 * pow(__pyx_v_mx, 2.0)) - __pyx_v_s)))) / (((64. * M_PI) * pow(__pyx_v_e_cm, 2.0)) * pow((pow(__pyx_v_mx, 2.0) - __pyx_v_s), 2.0)));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":516
+ * 
+ * @cython.cdivision(True)
+ * cdef double __sigma_xs_to_xs(double e_cm, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                              double gsff, double gsGG, double gsFF,
+ *                              double lam, double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":546
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx,
+ *     double ms, double gsxx, double gsff, double gsGG, double gsFF,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_ff(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs, double __pyx_v_mf) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xx_to_s_to_ff", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 546, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":551
+ *     double lam, double width_s, double vs, double mf):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":552
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 552, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 552, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 552, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 552, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 552, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 552, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 552, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":555
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xx_to_s_to_ff(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                         gsFF, lam, width_s, vs, mf)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":556
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_ff(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                         gsFF, lam, width_s, vs, mf)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":557
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_ff(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                         gsFF, lam, width_s, vs, mf)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":559
+ *                                         gsFF, lam, width_s, vs, mf)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":546
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx,
+ *     double ms, double gsxx, double gsff, double gsGG, double gsFF,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xx_to_s_to_ff", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":565
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_gg(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_gg(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xx_to_s_to_gg", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 565, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":570
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":571
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 571, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 571, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 571, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 571, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 571, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 571, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 571, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":574
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xx_to_s_to_gg(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                         gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":575
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_gg(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                         gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":576
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_gg(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                         gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_gg((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":578
+ *                                         gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":565
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_gg(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xx_to_s_to_gg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":584
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_pi0pi0(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms,
+ *     double gsxx, double gsff, double gsGG, double gsFF, double lam,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_pi0pi0(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xx_to_s_to_pi0pi0", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 584, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":589
+ *     double width_s, double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":590
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 590, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 590, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 590, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 590, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 590, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 590, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 590, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":593
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xx_to_s_to_pi0pi0(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                             gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":594
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_pi0pi0(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                             gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":595
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_pi0pi0(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pi0pi0((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":597
+ *                                             gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":584
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_pi0pi0(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms,
+ *     double gsxx, double gsff, double gsGG, double gsFF, double lam,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xx_to_s_to_pi0pi0", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":603
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_pipi(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_pipi(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xx_to_s_to_pipi", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 603, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":608
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":609
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 609, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 609, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 609, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 609, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 609, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 609, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 609, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":612
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xx_to_s_to_pipi(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                           gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":613
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_pipi(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                           gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":614
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_s_to_pipi(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                           gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pipi((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":616
+ *                                           gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":603
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_s_to_pipi(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xx_to_s_to_pipi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":622
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_ss(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_ss(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xx_to_ss", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 622, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":627
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":628
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 628, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 628, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 628, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 628, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 628, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 628, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 628, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 628, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 628, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 628, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 628, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":631
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xx_to_ss(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":632
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_ss(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":633
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xx_to_ss(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_ss((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":635
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":622
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_ss(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xx_to_ss", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":641
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_ss_to_xx(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_ss_to_xx(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_ss_to_xx", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 641, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":646
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":647
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 647, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 647, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 647, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 647, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 647, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 647, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 647, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":650
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_ss_to_xx(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":651
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_ss_to_xx(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":652
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_ss_to_xx(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_ss_to_xx((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":654
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":641
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_ss_to_xx(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_ss_to_xx", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":660
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_all(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_all(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  int __pyx_t_19;
+  PyObject *__pyx_t_20 = NULL;
+  __pyx_t_5numpy_float64_t __pyx_t_21;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xx_to_all", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 660, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":665
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":666
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 666, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 666, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 666, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 666, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 666, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 666, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 666, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 666, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 666, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 666, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 666, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":669
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = sigma_xx_to_all(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                   gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":670
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = sigma_xx_to_all(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                   gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_sigma_xx_to_all); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_11 = __pyx_v_i;
+    __pyx_t_7 = PyFloat_FromDouble((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides))); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_5 = PyFloat_FromDouble(__pyx_v_mx); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_ms); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyFloat_FromDouble(__pyx_v_gsxx); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_12 = PyFloat_FromDouble(__pyx_v_gsff); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_13 = PyFloat_FromDouble(__pyx_v_gsGG); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":671
+ *     for i in range(num_es):
+ *         sigs[i] = sigma_xx_to_all(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                   gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_14 = PyFloat_FromDouble(__pyx_v_gsFF); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 671, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_15 = PyFloat_FromDouble(__pyx_v_lam); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 671, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_15);
+    __pyx_t_16 = PyFloat_FromDouble(__pyx_v_width_s); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 671, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_16);
+    __pyx_t_17 = PyFloat_FromDouble(__pyx_v_vs); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 671, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __pyx_t_18 = NULL;
+    __pyx_t_19 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_18)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_18);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_19 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[11] = {__pyx_t_18, __pyx_t_7, __pyx_t_5, __pyx_t_2, __pyx_t_4, __pyx_t_12, __pyx_t_13, __pyx_t_14, __pyx_t_15, __pyx_t_16, __pyx_t_17};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_19, 10+__pyx_t_19); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 670, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+      PyObject *__pyx_temp[11] = {__pyx_t_18, __pyx_t_7, __pyx_t_5, __pyx_t_2, __pyx_t_4, __pyx_t_12, __pyx_t_13, __pyx_t_14, __pyx_t_15, __pyx_t_16, __pyx_t_17};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_19, 10+__pyx_t_19); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 670, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_20 = PyTuple_New(10+__pyx_t_19); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 670, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_20);
+      if (__pyx_t_18) {
+        __Pyx_GIVEREF(__pyx_t_18); PyTuple_SET_ITEM(__pyx_t_20, 0, __pyx_t_18); __pyx_t_18 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_20, 0+__pyx_t_19, __pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_20, 1+__pyx_t_19, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_20, 2+__pyx_t_19, __pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_20, 3+__pyx_t_19, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_20, 4+__pyx_t_19, __pyx_t_12);
+      __Pyx_GIVEREF(__pyx_t_13);
+      PyTuple_SET_ITEM(__pyx_t_20, 5+__pyx_t_19, __pyx_t_13);
+      __Pyx_GIVEREF(__pyx_t_14);
+      PyTuple_SET_ITEM(__pyx_t_20, 6+__pyx_t_19, __pyx_t_14);
+      __Pyx_GIVEREF(__pyx_t_15);
+      PyTuple_SET_ITEM(__pyx_t_20, 7+__pyx_t_19, __pyx_t_15);
+      __Pyx_GIVEREF(__pyx_t_16);
+      PyTuple_SET_ITEM(__pyx_t_20, 8+__pyx_t_19, __pyx_t_16);
+      __Pyx_GIVEREF(__pyx_t_17);
+      PyTuple_SET_ITEM(__pyx_t_20, 9+__pyx_t_19, __pyx_t_17);
+      __pyx_t_7 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_2 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_12 = 0;
+      __pyx_t_13 = 0;
+      __pyx_t_14 = 0;
+      __pyx_t_15 = 0;
+      __pyx_t_16 = 0;
+      __pyx_t_17 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_20, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 670, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":670
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = sigma_xx_to_all(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                   gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_21 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_21 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 670, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_11 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_t_21;
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":673
+ *                                   gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":660
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xx_to_all(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_20);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xx_to_all", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":679
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xl_to_xl(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xl_to_xl(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs, double __pyx_v_mf) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xl_to_xl", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 679, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":684
+ *     double vs, double mf):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":685
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 685, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 685, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 685, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 685, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 685, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 685, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 685, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":688
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xl_to_xl(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs, mf)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":689
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xl_to_xl(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs, mf)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":690
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xl_to_xl(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs, mf)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xl_to_xl((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":692
+ *                                    gsFF, lam, width_s, vs, mf)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":679
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xl_to_xl(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xl_to_xl", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":698
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xpi_to_xpi(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xpi_to_xpi(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xpi_to_xpi", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 698, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":703
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":704
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 704, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 704, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 704, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 704, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":707
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xpi_to_xpi(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":708
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xpi_to_xpi(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":709
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xpi_to_xpi(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi_to_xpi((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":711
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":698
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xpi_to_xpi(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xpi_to_xpi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":717
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xpi0_to_xpi0(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xpi0_to_xpi0(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xpi0_to_xpi0", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 717, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":722
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":723
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 723, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 723, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 723, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 723, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 723, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 723, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 723, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 723, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 723, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 723, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 723, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":726
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xpi0_to_xpi0(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":727
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xpi0_to_xpi0(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":728
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xpi0_to_xpi0(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi0_to_xpi0((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":730
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":717
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xpi0_to_xpi0(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xpi0_to_xpi0", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":736
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xg_to_xg(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xg_to_xg(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xg_to_xg", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 736, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":741
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":742
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 742, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 742, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 742, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 742, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 742, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 742, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 742, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 742, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 742, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 742, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 742, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":745
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xg_to_xg(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":746
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xg_to_xg(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":747
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xg_to_xg(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xg_to_xg((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":749
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":736
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xg_to_xg(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xg_to_xg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":755
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xs_to_xs(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+static PyArrayObject *__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xs_to_xs(PyArrayObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  int __pyx_v_num_es;
+  PyArrayObject *__pyx_v_sigs = 0;
+  int __pyx_v_i;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_e_cms;
+  __Pyx_Buffer __pyx_pybuffer_e_cms;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_sigs;
+  __Pyx_Buffer __pyx_pybuffer_sigs;
+  PyArrayObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyArrayObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__vec_sigma_xs_to_xs", 0);
+  __pyx_pybuffer_sigs.pybuffer.buf = NULL;
+  __pyx_pybuffer_sigs.refcount = 0;
+  __pyx_pybuffernd_sigs.data = NULL;
+  __pyx_pybuffernd_sigs.rcbuffer = &__pyx_pybuffer_sigs;
+  __pyx_pybuffer_e_cms.pybuffer.buf = NULL;
+  __pyx_pybuffer_e_cms.refcount = 0;
+  __pyx_pybuffernd_e_cms.data = NULL;
+  __pyx_pybuffernd_e_cms.rcbuffer = &__pyx_pybuffer_e_cms;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer, (PyObject*)__pyx_v_e_cms, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 755, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_e_cms.diminfo[0].strides = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_e_cms.diminfo[0].shape = __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.shape[0];
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":760
+ *     double vs):
+ * 
+ *     cdef int num_es = e_cms.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)
+ * 
+ */
+  __pyx_v_num_es = (__pyx_v_e_cms->dimensions[0]);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":761
+ * 
+ *     cdef int num_es = e_cms.shape[0]
+ *     cdef np.ndarray[np.float64_t, ndim=1] sigs = np.zeros(num_es, np.float64)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int i
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 761, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_zeros); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 761, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_num_es); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 761, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 761, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 761, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 761, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 761, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 761, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 761, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 761, __pyx_L1_error)
+  __pyx_t_8 = ((PyArrayObject *)__pyx_t_1);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+      __pyx_v_sigs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf = NULL;
+      __PYX_ERR(0, 761, __pyx_L1_error)
+    } else {__pyx_pybuffernd_sigs.diminfo[0].strides = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sigs.diminfo[0].shape = __pyx_pybuffernd_sigs.rcbuffer->pybuffer.shape[0];
+    }
+  }
+  __pyx_t_8 = 0;
+  __pyx_v_sigs = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":764
+ * 
+ *     cdef int i
+ *     for i in range(num_es):             # <<<<<<<<<<<<<<
+ *         sigs[i] = __sigma_xs_to_xs(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)
+ */
+  __pyx_t_6 = __pyx_v_num_es;
+  __pyx_t_9 = __pyx_t_6;
+  for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+    __pyx_v_i = __pyx_t_10;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":765
+ *     cdef int i
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xs_to_xs(e_cms[i], mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+    __pyx_t_11 = __pyx_v_i;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":766
+ *     for i in range(num_es):
+ *         sigs[i] = __sigma_xs_to_xs(e_cms[i], mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     return sigs
+ */
+    __pyx_t_12 = __pyx_v_i;
+    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_sigs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_sigs.diminfo[0].strides) = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xs_to_xs((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float64_t *, __pyx_pybuffernd_e_cms.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_e_cms.diminfo[0].strides)), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":768
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ *     return sigs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_sigs));
+  __pyx_r = ((PyArrayObject *)__pyx_v_sigs);
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":755
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef np.ndarray[np.float64_t, ndim=1] __vec_sigma_xs_to_xs(             # <<<<<<<<<<<<<<
+ *     np.ndarray[np.float64_t, ndim=1] e_cms, double mx, double ms, double gsxx,
+ *     double gsff, double gsGG, double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.__vec_sigma_xs_to_xs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_e_cms.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_sigs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_sigs);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":774
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_ff(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                         double gsff, double gsGG, double gsFF,
+ *                         double lam, double width_s, double vs,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_1sigma_xx_to_s_to_ff(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_sigma_xx_to_s_to_ff[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of fermions, *f* through a scalar mediator in\n    the s-channel.\n\n    Parameters\n    ----------\n    e_cms : double or array-like\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n    mf: double\n        Final state fermion mass.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s* -> f + f.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_1sigma_xx_to_s_to_ff = {"sigma_xx_to_s_to_ff", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_1sigma_xx_to_s_to_ff, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_sigma_xx_to_s_to_ff};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_1sigma_xx_to_s_to_ff(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  double __pyx_v_mf;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_ff (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,&__pyx_n_s_mf,0};
+    PyObject* values[11] = {0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 1); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 2); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 3); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 4); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 5); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 6); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 7); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 8); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 9); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mf)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, 10); __PYX_ERR(0, 774, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xx_to_s_to_ff") < 0)) __PYX_ERR(0, 774, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 11) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 774, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 774, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 774, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 775, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 775, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 775, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 776, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 776, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 776, __pyx_L3_error)
+    __pyx_v_mf = __pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_mf == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 777, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_ff", 1, 11, 11, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 774, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_ff", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_sigma_xx_to_s_to_ff(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_sigma_xx_to_s_to_ff(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs, double __pyx_v_mf) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_ff", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":813
+ *         Cross section for x + x -> s* -> f + f.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_ff(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 813, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 813, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":814
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs, mf)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":815
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_ff(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs, mf)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 815, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 815, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 815, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 815, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":814
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_ff(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs, mf)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_ff(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 814, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":813
+ *         Cross section for x + x -> s* -> f + f.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_ff(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":819
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xx_to_s_to_ff(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 819, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 819, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 819, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":821
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xx_to_s_to_ff(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                  gsFF, lam, width_s, vs, mf)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 821, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":822
+ * 
+ *     return __sigma_xx_to_s_to_ff(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                                  gsFF, lam, width_s, vs, mf)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_ff(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 821, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":774
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_ff(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                         double gsff, double gsGG, double gsFF,
+ *                         double lam, double width_s, double vs,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_ff", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":828
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_gg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                            double gsff, double gsGG, double gsFF,
+ *                            double lam, double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_3sigma_xx_to_s_to_gg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_2sigma_xx_to_s_to_gg[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of photons through a scalar mediator in the\n    s-channel.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s* -> g + g.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_3sigma_xx_to_s_to_gg = {"sigma_xx_to_s_to_gg", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_3sigma_xx_to_s_to_gg, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_2sigma_xx_to_s_to_gg};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_3sigma_xx_to_s_to_gg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_gg (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 1); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 2); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 3); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 4); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 5); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 6); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 7); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 8); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, 9); __PYX_ERR(0, 828, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xx_to_s_to_gg") < 0)) __PYX_ERR(0, 828, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 828, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 828, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 828, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 829, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 829, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 829, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 830, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 830, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 830, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_gg", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 828, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_gg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_2sigma_xx_to_s_to_gg(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_2sigma_xx_to_s_to_gg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_gg", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":864
+ *         Cross section for x + x -> s* -> g + g.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_gg(np.array(e_cms),
+ *                                          mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 864, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 864, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 864, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 864, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":865
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_gg(np.array(e_cms),             # <<<<<<<<<<<<<<
+ *                                          mx, ms, gsxx, gsff, gsGG,
+ *                                          gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 865, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 865, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 865, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 865, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":867
+ *         return __vec_sigma_xx_to_s_to_gg(np.array(e_cms),
+ *                                          mx, ms, gsxx, gsff, gsGG,
+ *                                          gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_gg(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 865, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":864
+ *         Cross section for x + x -> s* -> g + g.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_gg(np.array(e_cms),
+ *                                          mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":870
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xx_to_s_to_gg(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 870, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 870, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 870, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":872
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xx_to_s_to_gg(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                  gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 872, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":873
+ * 
+ *     return __sigma_xx_to_s_to_gg(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                                  gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_gg(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 872, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":828
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_gg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                            double gsff, double gsGG, double gsFF,
+ *                            double lam, double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_gg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":879
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pi0pi0(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                double gsxx, double gsff, double gsGG,
+ *                                double gsFF, double lam, double width_s,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_5sigma_xx_to_s_to_pi0pi0(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_4sigma_xx_to_s_to_pi0pi0[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of neutral pion through a scalar mediator in\n    the s-channel.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s* -> pi0 + pi0.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_5sigma_xx_to_s_to_pi0pi0 = {"sigma_xx_to_s_to_pi0pi0", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_5sigma_xx_to_s_to_pi0pi0, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_4sigma_xx_to_s_to_pi0pi0};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_5sigma_xx_to_s_to_pi0pi0(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_pi0pi0 (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 1); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 2); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 3); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 4); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 5); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 6); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 7); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 8); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, 9); __PYX_ERR(0, 879, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xx_to_s_to_pi0pi0") < 0)) __PYX_ERR(0, 879, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 879, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 879, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 880, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 880, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 880, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 881, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 881, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 881, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 882, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pi0pi0", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 879, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_pi0pi0", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_4sigma_xx_to_s_to_pi0pi0(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_4sigma_xx_to_s_to_pi0pi0(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_pi0pi0", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":916
+ *         Cross section for x + x -> s* -> pi0 + pi0.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_pi0pi0(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 916, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 916, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 916, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 916, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":917
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_pi0pi0(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":918
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_pi0pi0(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 918, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 918, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 918, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 918, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":917
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_pi0pi0(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_pi0pi0(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 917, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":916
+ *         Cross section for x + x -> s* -> pi0 + pi0.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_pi0pi0(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":922
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xx_to_s_to_pi0pi0(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 922, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 922, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 922, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":924
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xx_to_s_to_pi0pi0(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                      gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 924, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":925
+ * 
+ *     return __sigma_xx_to_s_to_pi0pi0(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                                      gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pi0pi0(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 924, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":879
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pi0pi0(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                double gsxx, double gsff, double gsGG,
+ *                                double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_pi0pi0", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":931
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pipi(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                              double gsxx, double gsff, double gsGG,
+ *                              double gsFF, double lam, double width_s,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_7sigma_xx_to_s_to_pipi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_6sigma_xx_to_s_to_pipi[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of charged pions through a scalar mediator in\n    the s-channel.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s* -> pi + pi.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_7sigma_xx_to_s_to_pipi = {"sigma_xx_to_s_to_pipi", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_7sigma_xx_to_s_to_pipi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_6sigma_xx_to_s_to_pipi};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_7sigma_xx_to_s_to_pipi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_pipi (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 1); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 2); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 3); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 4); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 5); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 6); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 7); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 8); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, 9); __PYX_ERR(0, 931, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xx_to_s_to_pipi") < 0)) __PYX_ERR(0, 931, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 931, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 931, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 932, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 932, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 932, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 933, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 933, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 933, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 934, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xx_to_s_to_pipi", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 931, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_pipi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_6sigma_xx_to_s_to_pipi(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_6sigma_xx_to_s_to_pipi(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xx_to_s_to_pipi", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":968
+ *         Cross section for x + x -> s* -> pi + pi.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_pipi(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 968, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 968, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 968, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 968, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":969
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_pipi(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":970
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_pipi(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 970, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 970, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 970, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 970, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":969
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_s_to_pipi(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_s_to_pipi(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 969, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":968
+ *         Cross section for x + x -> s* -> pi + pi.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_s_to_pipi(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":974
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xx_to_s_to_pipi(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 974, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 974, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 974, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":976
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xx_to_s_to_pipi(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                    gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 976, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":977
+ * 
+ *     return __sigma_xx_to_s_to_pipi(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                                    gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_s_to_pipi(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 976, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":931
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pipi(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                              double gsxx, double gsff, double gsGG,
+ *                              double gsFF, double lam, double width_s,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_s_to_pipi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":983
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_ss(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_9sigma_xx_to_ss(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_8sigma_xx_to_ss[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of scalar mediator through the t and u\n    channels.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s + s.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_9sigma_xx_to_ss = {"sigma_xx_to_ss", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_9sigma_xx_to_ss, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_8sigma_xx_to_ss};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_9sigma_xx_to_ss(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xx_to_ss (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 1); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 2); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 3); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 4); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 5); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 6); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 7); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 8); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, 9); __PYX_ERR(0, 983, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xx_to_ss") < 0)) __PYX_ERR(0, 983, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 983, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 983, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 983, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 984, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 984, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 984, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 984, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 985, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 985, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xx_to_ss", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 983, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_ss", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_8sigma_xx_to_ss(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_8sigma_xx_to_ss(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xx_to_ss", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1019
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_ss(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1019, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1019, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1019, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1019, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1020
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_ss(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1021
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_ss(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1021, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1021, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1021, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1021, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1020
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_ss(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_ss(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1020, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1019
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_ss(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1025
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xx_to_ss(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1025, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1025, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1025, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1027
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xx_to_ss(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1027, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1028
+ * 
+ *     return __sigma_xx_to_ss(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_ss(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1027, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":983
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_ss(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_ss", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1033
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_ss_to_xx(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_11sigma_ss_to_xx(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_11sigma_ss_to_xx = {"sigma_ss_to_xx", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_11sigma_ss_to_xx, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_11sigma_ss_to_xx(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_ss_to_xx (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 1); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 2); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 3); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 4); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 5); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 6); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 7); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 8); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, 9); __PYX_ERR(0, 1033, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_ss_to_xx") < 0)) __PYX_ERR(0, 1033, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1033, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1033, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1033, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1034, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1034, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1034, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1034, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1035, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1035, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_ss_to_xx", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1033, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_ss_to_xx", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_10sigma_ss_to_xx(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_10sigma_ss_to_xx(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_ss_to_xx", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1036
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_ss_to_xx(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1036, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1037
+ *                    double width_s, double vs):
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_ss_to_xx(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1038
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_ss_to_xx(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1038, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1038, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1038, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1038, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1037
+ *                    double width_s, double vs):
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_ss_to_xx(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_ss_to_xx(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1037, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1036
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_ss_to_xx(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1042
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_ss_to_xx(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1042, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1042, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1042, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1044
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_ss_to_xx(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1044, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1045
+ * 
+ *     return __sigma_ss_to_xx(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_ss_to_xx(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1044, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1033
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_ss_to_xx(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_ss_to_xx", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1051
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_all(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_13sigma_xx_to_all(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_12sigma_xx_to_all[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into all availible final states.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> anything except x + x.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_13sigma_xx_to_all = {"sigma_xx_to_all", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_13sigma_xx_to_all, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_12sigma_xx_to_all};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_13sigma_xx_to_all(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xx_to_all (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 1); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 2); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 3); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 4); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 5); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 6); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 7); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 8); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, 9); __PYX_ERR(0, 1051, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xx_to_all") < 0)) __PYX_ERR(0, 1051, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1051, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1051, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1051, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1052, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1052, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1052, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1052, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1053, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1053, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xx_to_all", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1051, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_all", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_12sigma_xx_to_all(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_12sigma_xx_to_all(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xx_to_all", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1086
+ *         Cross section for x + x -> anything except x + x.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_all(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1086, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1086, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1086, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1086, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1087
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_all(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1088
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_all(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1088, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1088, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1088, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1088, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1087
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xx_to_all(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xx_to_all(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1087, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1086
+ *         Cross section for x + x -> anything except x + x.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xx_to_all(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1092
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xx_to_all(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1092, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1092, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1092, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1094
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xx_to_all(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1094, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1095
+ * 
+ *     return __sigma_xx_to_all(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_all(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1094, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1051
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_all(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xx_to_all", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1101
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xl_to_xl(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs, double mf):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_15sigma_xl_to_xl(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_14sigma_xl_to_xl[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of scalar mediator through the t and u\n    channels.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s + s.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_15sigma_xl_to_xl = {"sigma_xl_to_xl", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_15sigma_xl_to_xl, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_14sigma_xl_to_xl};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_15sigma_xl_to_xl(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  double __pyx_v_mf;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xl_to_xl (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,&__pyx_n_s_mf,0};
+    PyObject* values[11] = {0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 1); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 2); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 3); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 4); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 5); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 6); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 7); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 8); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 9); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mf)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, 10); __PYX_ERR(0, 1101, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xl_to_xl") < 0)) __PYX_ERR(0, 1101, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 11) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1101, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1101, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1101, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1102, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1102, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1102, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1102, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1103, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1103, __pyx_L3_error)
+    __pyx_v_mf = __pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_mf == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1103, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xl_to_xl", 1, 11, 11, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1101, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xl_to_xl", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_14sigma_xl_to_xl(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_14sigma_xl_to_xl(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs, double __pyx_v_mf) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xl_to_xl", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1137
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xl_to_xl(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1137, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1137, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1137, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1137, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1138
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xl_to_xl(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs, mf)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1139
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xl_to_xl(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs, mf)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1139, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1139, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1139, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1139, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1138
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xl_to_xl(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs, mf)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xl_to_xl(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1138, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1137
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xl_to_xl(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1143
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xl_to_xl(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1143, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1145
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xl_to_xl(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs, mf)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1145, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1146
+ * 
+ *     return __sigma_xl_to_xl(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs, mf)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xl_to_xl(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs, __pyx_v_mf)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1145, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1101
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xl_to_xl(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs, double mf):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xl_to_xl", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1152
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi_to_xpi(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_17sigma_xpi_to_xpi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_16sigma_xpi_to_xpi[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of scalar mediator through the t and u\n    channels.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s + s.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_17sigma_xpi_to_xpi = {"sigma_xpi_to_xpi", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_17sigma_xpi_to_xpi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_16sigma_xpi_to_xpi};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_17sigma_xpi_to_xpi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xpi_to_xpi (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 1); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 2); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 3); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 4); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 5); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 6); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 7); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 8); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, 9); __PYX_ERR(0, 1152, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xpi_to_xpi") < 0)) __PYX_ERR(0, 1152, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1152, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1152, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1152, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1153, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1153, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1153, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1153, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1154, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1154, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xpi_to_xpi", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1152, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xpi_to_xpi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_16sigma_xpi_to_xpi(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_16sigma_xpi_to_xpi(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xpi_to_xpi", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1188
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xpi_to_xpi(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1188, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1188, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1188, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1189
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xpi_to_xpi(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1190
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xpi_to_xpi(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1190, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1190, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1189
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xpi_to_xpi(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xpi_to_xpi(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1188
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xpi_to_xpi(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1194
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xpi_to_xpi(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1194, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1194, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1194, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1196
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xpi_to_xpi(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1196, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1197
+ * 
+ *     return __sigma_xpi_to_xpi(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi_to_xpi(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1152
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi_to_xpi(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xpi_to_xpi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1203
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi0_to_xpi0(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                        double gsff, double gsGG, double gsFF, double lam,
+ *                        double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_19sigma_xpi0_to_xpi0(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_18sigma_xpi0_to_xpi0[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of scalar mediator through the t and u\n    channels.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s + s.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_19sigma_xpi0_to_xpi0 = {"sigma_xpi0_to_xpi0", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_19sigma_xpi0_to_xpi0, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_18sigma_xpi0_to_xpi0};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_19sigma_xpi0_to_xpi0(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xpi0_to_xpi0 (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 1); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 2); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 3); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 4); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 5); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 6); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 7); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 8); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, 9); __PYX_ERR(0, 1203, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xpi0_to_xpi0") < 0)) __PYX_ERR(0, 1203, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1203, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1203, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1203, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1204, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1204, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1204, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1204, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1205, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1205, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xpi0_to_xpi0", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1203, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xpi0_to_xpi0", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_18sigma_xpi0_to_xpi0(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_18sigma_xpi0_to_xpi0(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xpi0_to_xpi0", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1239
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xpi0_to_xpi0(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1239, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1239, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1239, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1239, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1240
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xpi0_to_xpi0(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1241
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xpi0_to_xpi0(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1241, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1240
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xpi0_to_xpi0(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xpi0_to_xpi0(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1240, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1239
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xpi0_to_xpi0(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1245
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xpi0_to_xpi0(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1245, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1247
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xpi0_to_xpi0(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                                 gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1247, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1248
+ * 
+ *     return __sigma_xpi0_to_xpi0(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                                 gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xpi0_to_xpi0(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1203
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi0_to_xpi0(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                        double gsff, double gsGG, double gsFF, double lam,
+ *                        double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xpi0_to_xpi0", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1254
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xg_to_xg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_21sigma_xg_to_xg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_20sigma_xg_to_xg[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of scalar mediator through the t and u\n    channels.\n\n    Parameters\n    ----------\n    e_cm : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s + s.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_21sigma_xg_to_xg = {"sigma_xg_to_xg", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_21sigma_xg_to_xg, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_20sigma_xg_to_xg};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_21sigma_xg_to_xg(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xg_to_xg (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 1); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 2); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 3); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 4); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 5); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 6); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 7); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 8); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, 9); __PYX_ERR(0, 1254, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xg_to_xg") < 0)) __PYX_ERR(0, 1254, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1254, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1254, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1254, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1255, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1255, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1255, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1255, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1256, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1256, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xg_to_xg", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1254, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xg_to_xg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_20sigma_xg_to_xg(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_20sigma_xg_to_xg(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xg_to_xg", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1290
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xg_to_xg(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1290, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1290, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1290, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1291
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xg_to_xg(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1292
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xg_to_xg(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1292, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1292, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1291
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xg_to_xg(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xg_to_xg(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1291, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1290
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xg_to_xg(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1296
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xg_to_xg(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1296, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1298
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xg_to_xg(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1298, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1299
+ * 
+ *     return __sigma_xg_to_xg(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xg_to_xg(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1254
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xg_to_xg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xg_to_xg", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1305
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xs_to_xs(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_23sigma_xs_to_xs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_22sigma_xs_to_xs[] = "\n    Returns the spin-averaged, cross section for dark matter\n    annihilating into a pair of scalar mediator through the t and u\n    channels.\n\n    Parameters\n    ----------\n    e_cms : double\n        Center of mass energy(ies).\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    sigma : double\n        Cross section for x + x -> s + s.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_23sigma_xs_to_xs = {"sigma_xs_to_xs", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_23sigma_xs_to_xs, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_22sigma_xs_to_xs};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_23sigma_xs_to_xs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_e_cms = 0;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("sigma_xs_to_xs (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_e_cms,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_e_cms)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 1); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 2); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 3); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 4); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 5); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 6); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 7); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 8); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, 9); __PYX_ERR(0, 1305, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sigma_xs_to_xs") < 0)) __PYX_ERR(0, 1305, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_e_cms = values[0];
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1305, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1305, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1305, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1306, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1306, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1306, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1306, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1307, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1307, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("sigma_xs_to_xs", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1305, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xs_to_xs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_22sigma_xs_to_xs(__pyx_self, __pyx_v_e_cms, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_22sigma_xs_to_xs(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_e_cms, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  PyObject *__pyx_v_e_cm = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  double __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("sigma_xs_to_xs", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1341
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xs_to_xs(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_2 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 1341, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_ndim); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_4, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1341, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 1341, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1342
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xs_to_xs(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __Pyx_XDECREF(__pyx_r);
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1343
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xs_to_xs(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *             gsFF, lam, width_s, vs)
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_4, __pyx_v_e_cms) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_e_cms);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1343, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 1343, __pyx_L1_error)
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1342
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:
+ *         return __vec_sigma_xs_to_xs(             # <<<<<<<<<<<<<<
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ *             gsFF, lam, width_s, vs)
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___vec_sigma_xs_to_xs(((PyArrayObject *)__pyx_t_5), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1342, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1341
+ *         Cross section for x + x -> s + s.
+ *     """
+ *     if hasattr(e_cms, '__len__') and e_cms.ndim > 0:             # <<<<<<<<<<<<<<
+ *         return __vec_sigma_xs_to_xs(
+ *             np.array(e_cms), mx, ms, gsxx, gsff, gsGG,
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1347
+ * 
+ *     # e_cms is either a 0-d array or a scalar
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms             # <<<<<<<<<<<<<<
+ * 
+ *     return __sigma_xs_to_xs(e_cm, mx, ms, gsxx, gsff, gsGG,
+ */
+  __pyx_t_1 = __Pyx_HasAttr(__pyx_v_e_cms, __pyx_n_s_len); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 1347, __pyx_L1_error)
+  if ((__pyx_t_1 != 0)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_e_cms, __pyx_n_s_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_7) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_7) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 1347, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_6 = __pyx_t_5;
+    __pyx_t_5 = 0;
+  } else {
+    __Pyx_INCREF(__pyx_v_e_cms);
+    __pyx_t_6 = __pyx_v_e_cms;
+  }
+  __pyx_v_e_cm = __pyx_t_6;
+  __pyx_t_6 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1349
+ *     e_cm = e_cms.item() if hasattr(e_cms, "__len__") else e_cms
+ * 
+ *     return __sigma_xs_to_xs(e_cm, mx, ms, gsxx, gsff, gsGG,             # <<<<<<<<<<<<<<
+ *                             gsFF, lam, width_s, vs)
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_v_e_cm); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1349, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1350
+ * 
+ *     return __sigma_xs_to_xs(e_cm, mx, ms, gsxx, gsff, gsGG,
+ *                             gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xs_to_xs(__pyx_t_8, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 1349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1305
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xs_to_xs(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.sigma_xs_to_xs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_e_cm);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1354
+ * 
+ * @cython.cdivision(True)
+ * cdef double __thermal_cross_section_integrand(double z, double x, double mx,             # <<<<<<<<<<<<<<
+ *                                               double ms, double gsxx,
+ *                                               double gsff, double gsGG, double gsFF,
+ */
+
+static double __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___thermal_cross_section_integrand(double __pyx_v_z, double __pyx_v_x, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_v_sig;
+  double __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__thermal_cross_section_integrand", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1358
+ *                                               double gsff, double gsGG, double gsFF,
+ *                                               double lam, double width_s, double vs):
+ *         cdef double sig = __sigma_xx_to_all(             # <<<<<<<<<<<<<<
+ *             mx * z, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs
+ *         )
+ */
+  __pyx_v_sig = __pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___sigma_xx_to_all((__pyx_v_mx * __pyx_v_z), __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1361
+ *             mx * z, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs
+ *         )
+ *         return sig * z**2 * (z**2 - 4.0) * k1(x * z)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = (((__pyx_v_sig * pow(__pyx_v_z, 2.0)) * (pow(__pyx_v_z, 2.0) - 4.0)) * __pyx_f_5scipy_7special_14cython_special_k1((__pyx_v_x * __pyx_v_z), 0));
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1354
+ * 
+ * @cython.cdivision(True)
+ * cdef double __thermal_cross_section_integrand(double z, double x, double mx,             # <<<<<<<<<<<<<<
+ *                                               double ms, double gsxx,
+ *                                               double gsff, double gsGG, double gsFF,
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1365
+ * 
+ * @cython.cdivision(True)
+ * def thermal_cross_section(double x, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                           double gsff, double gsGG, double gsFF,
+ *                           double lam, double width_s, double vs):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_25thermal_cross_section(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_24thermal_cross_section[] = "\n    Compute the thermally average cross section for scalar mediator model.\n\n    Parameters\n    ----------\n    x: float\n        Mass of the dark matter divided by its temperature.\n    mx: double\n        Dark matter mass\n    ms: double\n        Scalar mediator mass.\n    gsxx: double\n        Coupling of DM to scalar mediator.\n    gsff: double\n        Coupling of scalar mediator to fermions.\n    gsGG: double\n        Effective coupling of the scalar mediator to gluons.\n    gsFF: double\n        Effective coupling of the scalar mediator to photons.\n    lam: double\n        Cut-off scale of the SGG and SFF interactions.\n    width_s: double\n        Full decay width of the scalar mediator.\n    vs: double\n        Scalar mediator VEV.\n\n    Returns\n    -------\n    tcs: float\n        Thermally average cross section.\n    ";
+static PyMethodDef __pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_25thermal_cross_section = {"thermal_cross_section", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_25thermal_cross_section, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_24thermal_cross_section};
+static PyObject *__pyx_pw_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_25thermal_cross_section(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_x;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("thermal_cross_section (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 1); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 2); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 3); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 4); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 5); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 6); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 7); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 8); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, 9); __PYX_ERR(0, 1365, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "thermal_cross_section") < 0)) __PYX_ERR(0, 1365, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+    }
+    __pyx_v_x = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1365, __pyx_L3_error)
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1365, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1365, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1365, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1366, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1366, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1366, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1367, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1367, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 1367, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("thermal_cross_section", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 1365, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.thermal_cross_section", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_24thermal_cross_section(__pyx_self, __pyx_v_x, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_24thermal_cross_section(CYTHON_UNUSED PyObject *__pyx_self, double __pyx_v_x, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  double __pyx_v_pf;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  double __pyx_t_5;
+  double __pyx_t_6;
+  double __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("thermal_cross_section", 0);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1401
+ *     # If x is really large, we will get divide by zero errors
+ *     # TODO: p-wave expansion for low T!
+ *     if x > 300:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_x > 300.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1402
+ *     # TODO: p-wave expansion for low T!
+ *     if x > 300:
+ *         return 0.0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double pf = x / (2.0 * kn(2, x))**2
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_float_0_0);
+    __pyx_r = __pyx_float_0_0;
+    goto __pyx_L0;
+
+    /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1401
+ *     # If x is really large, we will get divide by zero errors
+ *     # TODO: p-wave expansion for low T!
+ *     if x > 300:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
+ */
+  }
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1404
+ *         return 0.0
+ * 
+ *     cdef double pf = x / (2.0 * kn(2, x))**2             # <<<<<<<<<<<<<<
+ * 
+ *     # points at which integrand may have trouble are:
+ */
+  __pyx_v_pf = (__pyx_v_x / pow((2.0 * __pyx_fuse_1__pyx_f_5scipy_7special_14cython_special_kn(2, __pyx_v_x, 0)), 2.0));
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1411
+ *     #   3. when we hit mediator resonance => z = ms / mx
+ *     # TODO: other thresholds!
+ *     return pf * quad(__thermal_cross_section_integrand, 2.0,             # <<<<<<<<<<<<<<
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_pf); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_quad); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(__pyx_f_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections___thermal_cross_section_integrand); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = 100.0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1412
+ *     # TODO: other thresholds!
+ *     return pf * quad(__thermal_cross_section_integrand, 2.0,
+ *                      max(50.0 / x, 100.0),             # <<<<<<<<<<<<<<
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ *                      points=[2.0, ms / mx, 2.0 * ms / mx])[0]
+ */
+  __pyx_t_6 = (50.0 / __pyx_v_x);
+  if (((__pyx_t_5 > __pyx_t_6) != 0)) {
+    __pyx_t_7 = __pyx_t_5;
+  } else {
+    __pyx_t_7 = __pyx_t_6;
+  }
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 1412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1411
+ *     #   3. when we hit mediator resonance => z = ms / mx
+ *     # TODO: other thresholds!
+ *     return pf * quad(__thermal_cross_section_integrand, 2.0,             # <<<<<<<<<<<<<<
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ */
+  __pyx_t_9 = PyTuple_New(3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 1411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_4);
+  __Pyx_INCREF(__pyx_float_2_0);
+  __Pyx_GIVEREF(__pyx_float_2_0);
+  PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_float_2_0);
+  __Pyx_GIVEREF(__pyx_t_8);
+  PyTuple_SET_ITEM(__pyx_t_9, 2, __pyx_t_8);
+  __pyx_t_4 = 0;
+  __pyx_t_8 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1413
+ *     return pf * quad(__thermal_cross_section_integrand, 2.0,
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),             # <<<<<<<<<<<<<<
+ *                      points=[2.0, ms / mx, 2.0 * ms / mx])[0]
+ * 
+ */
+  __pyx_t_8 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_10 = PyFloat_FromDouble(__pyx_v_mx); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = PyFloat_FromDouble(__pyx_v_ms); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  __pyx_t_12 = PyFloat_FromDouble(__pyx_v_gsxx); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = PyFloat_FromDouble(__pyx_v_gsff); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_14 = PyFloat_FromDouble(__pyx_v_gsGG); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __pyx_t_15 = PyFloat_FromDouble(__pyx_v_gsFF); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+  __pyx_t_16 = PyFloat_FromDouble(__pyx_v_lam); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_16);
+  __pyx_t_17 = PyFloat_FromDouble(__pyx_v_width_s); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __pyx_t_18 = PyFloat_FromDouble(__pyx_v_vs); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_18);
+  __pyx_t_19 = PyTuple_New(10); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_10);
+  PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_t_10);
+  __Pyx_GIVEREF(__pyx_t_11);
+  PyTuple_SET_ITEM(__pyx_t_19, 2, __pyx_t_11);
+  __Pyx_GIVEREF(__pyx_t_12);
+  PyTuple_SET_ITEM(__pyx_t_19, 3, __pyx_t_12);
+  __Pyx_GIVEREF(__pyx_t_13);
+  PyTuple_SET_ITEM(__pyx_t_19, 4, __pyx_t_13);
+  __Pyx_GIVEREF(__pyx_t_14);
+  PyTuple_SET_ITEM(__pyx_t_19, 5, __pyx_t_14);
+  __Pyx_GIVEREF(__pyx_t_15);
+  PyTuple_SET_ITEM(__pyx_t_19, 6, __pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_16);
+  PyTuple_SET_ITEM(__pyx_t_19, 7, __pyx_t_16);
+  __Pyx_GIVEREF(__pyx_t_17);
+  PyTuple_SET_ITEM(__pyx_t_19, 8, __pyx_t_17);
+  __Pyx_GIVEREF(__pyx_t_18);
+  PyTuple_SET_ITEM(__pyx_t_19, 9, __pyx_t_18);
+  __pyx_t_4 = 0;
+  __pyx_t_10 = 0;
+  __pyx_t_11 = 0;
+  __pyx_t_12 = 0;
+  __pyx_t_13 = 0;
+  __pyx_t_14 = 0;
+  __pyx_t_15 = 0;
+  __pyx_t_16 = 0;
+  __pyx_t_17 = 0;
+  __pyx_t_18 = 0;
+  if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_args, __pyx_t_19) < 0) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1414
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ *                      points=[2.0, ms / mx, 2.0 * ms / mx])[0]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_19 = PyFloat_FromDouble((__pyx_v_ms / __pyx_v_mx)); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 1414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_19);
+  __pyx_t_18 = PyFloat_FromDouble(((2.0 * __pyx_v_ms) / __pyx_v_mx)); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 1414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_18);
+  __pyx_t_17 = PyList_New(3); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 1414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __Pyx_INCREF(__pyx_float_2_0);
+  __Pyx_GIVEREF(__pyx_float_2_0);
+  PyList_SET_ITEM(__pyx_t_17, 0, __pyx_float_2_0);
+  __Pyx_GIVEREF(__pyx_t_19);
+  PyList_SET_ITEM(__pyx_t_17, 1, __pyx_t_19);
+  __Pyx_GIVEREF(__pyx_t_18);
+  PyList_SET_ITEM(__pyx_t_17, 2, __pyx_t_18);
+  __pyx_t_19 = 0;
+  __pyx_t_18 = 0;
+  if (PyDict_SetItem(__pyx_t_8, __pyx_n_s_points, __pyx_t_17) < 0) __PYX_ERR(0, 1413, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1411
+ *     #   3. when we hit mediator resonance => z = ms / mx
+ *     # TODO: other thresholds!
+ *     return pf * quad(__thermal_cross_section_integrand, 2.0,             # <<<<<<<<<<<<<<
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ */
+  __pyx_t_17 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 1411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1414
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ *                      points=[2.0, ms / mx, 2.0 * ms / mx])[0]             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_17, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 1414, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1411
+ *     #   3. when we hit mediator resonance => z = ms / mx
+ *     # TODO: other thresholds!
+ *     return pf * quad(__thermal_cross_section_integrand, 2.0,             # <<<<<<<<<<<<<<
+ *                      max(50.0 / x, 100.0),
+ *                      args=(x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs),
+ */
+  __pyx_t_17 = PyNumber_Multiply(__pyx_t_2, __pyx_t_8); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 1411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_r = __pyx_t_17;
+  __pyx_t_17 = 0;
+  goto __pyx_L0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1365
+ * 
+ * @cython.cdivision(True)
+ * def thermal_cross_section(double x, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                           double gsff, double gsGG, double gsFF,
+ *                           double lam, double width_s, double vs):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_AddTraceback("hazma.scalar_mediator._c_scalar_mediator_cross_sections.thermal_cross_section", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":732
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 732, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":735
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":738
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":741
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":744
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":748
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
+    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":750
+ *         return <tuple>d.subarray.shape
+ *     else:
+ *         return ()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_empty_tuple);
+    __pyx_r = __pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":927
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ */
+  Py_INCREF(__pyx_v_base);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":928
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ */
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 928, __pyx_L1_error)
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("numpy.set_array_base", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
+  PyObject *__pyx_v_base;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("get_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":931
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
+ *     if base is NULL:
+ *         return None
+ */
+  __pyx_v_base = PyArray_BASE(__pyx_v_arr);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":933
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ *         return None             # <<<<<<<<<<<<<<
+ *     return <object>base
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":934
+ *     if base is NULL:
+ *         return None
+ *     return <object>base             # <<<<<<<<<<<<<<
+ * 
+ * # Versions of the import_* functions which are more suitable for
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_base));
+  __pyx_r = ((PyObject *)__pyx_v_base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_array", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":940
+ * cdef inline int import_array() except -1:
+ *     try:
+ *         __pyx_import_array()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ */
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 940, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ *     try:
+ *         __pyx_import_array()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 941, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 942, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 942, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_umath", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":946
+ * cdef inline int import_umath() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 946, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 947, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 948, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 948, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_ufunc", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":952
+ * cdef inline int import_ufunc() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 952, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 953, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":954
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from *:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 954, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 954, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_timedelta64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":976
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_datetime64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":991
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
+  npy_datetime __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1001
+ *     also needed.  That can be found using `get_datetime64_unit`.
+ *     """
+ *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
+  npy_timedelta __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1008
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ *     """
+ *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
+  NPY_DATETIMEUNIT __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1015
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ *     """
+ *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cfunc.to_py":65
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):             # <<<<<<<<<<<<<<
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ *         return f(z, x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_1wrap(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_wrap[] = "wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float";
+static PyMethodDef __pyx_mdef_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_1wrap = {"wrap", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_1wrap, METH_VARARGS|METH_KEYWORDS, __pyx_doc_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_wrap};
+static PyObject *__pyx_pw_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_1wrap(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_z;
+  double __pyx_v_x;
+  double __pyx_v_mx;
+  double __pyx_v_ms;
+  double __pyx_v_gsxx;
+  double __pyx_v_gsff;
+  double __pyx_v_gsGG;
+  double __pyx_v_gsFF;
+  double __pyx_v_lam;
+  double __pyx_v_width_s;
+  double __pyx_v_vs;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("wrap (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_z,&__pyx_n_s_x,&__pyx_n_s_mx,&__pyx_n_s_ms,&__pyx_n_s_gsxx,&__pyx_n_s_gsff,&__pyx_n_s_gsGG,&__pyx_n_s_gsFF,&__pyx_n_s_lam,&__pyx_n_s_width_s,&__pyx_n_s_vs,0};
+    PyObject* values[11] = {0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_z)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 1); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 2); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_ms)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 3); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsxx)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 4); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsff)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 5); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsGG)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 6); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_gsFF)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 7); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lam)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 8); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (likely((values[9] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width_s)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 9); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (likely((values[10] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_vs)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, 10); __PYX_ERR(2, 65, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "wrap") < 0)) __PYX_ERR(2, 65, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 11) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+    }
+    __pyx_v_z = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_z == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_x = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_x == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_mx = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_mx == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_ms = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_ms == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_gsxx = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_gsxx == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_gsff = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_gsff == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_gsGG = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_gsGG == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_gsFF = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_gsFF == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_lam = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_lam == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_width_s = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_width_s == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+    __pyx_v_vs = __pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_vs == (double)-1) && PyErr_Occurred())) __PYX_ERR(2, 65, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("wrap", 1, 11, 11, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(2, 65, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("cfunc.to_py.__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.wrap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_wrap(__pyx_self, __pyx_v_z, __pyx_v_x, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_wrap(PyObject *__pyx_self, double __pyx_v_z, double __pyx_v_x, double __pyx_v_mx, double __pyx_v_ms, double __pyx_v_gsxx, double __pyx_v_gsff, double __pyx_v_gsGG, double __pyx_v_gsFF, double __pyx_v_lam, double __pyx_v_width_s, double __pyx_v_vs) {
+  struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *__pyx_cur_scope;
+  struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *__pyx_outer_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  double __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("wrap", 0);
+  __pyx_outer_scope = (struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *) __Pyx_CyFunction_GetClosure(__pyx_self);
+  __pyx_cur_scope = __pyx_outer_scope;
+
+  /* "cfunc.to_py":67
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ *         return f(z, x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)             # <<<<<<<<<<<<<<
+ *     return wrap
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_cur_scope->__pyx_v_f(__pyx_v_z, __pyx_v_x, __pyx_v_mx, __pyx_v_ms, __pyx_v_gsxx, __pyx_v_gsff, __pyx_v_gsGG, __pyx_v_gsFF, __pyx_v_lam, __pyx_v_width_s, __pyx_v_vs); if (unlikely(__pyx_t_1 == ((double)-1) && PyErr_Occurred())) __PYX_ERR(2, 67, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 67, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "cfunc.to_py":65
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):             # <<<<<<<<<<<<<<
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ *         return f(z, x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("cfunc.to_py.__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.wrap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cfunc.to_py":64
+ * 
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):             # <<<<<<<<<<<<<<
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ */
+
+static PyObject *__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*__pyx_v_f)(double, double, double, double, double, double, double, double, double, double, double)) {
+  struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *__pyx_cur_scope;
+  PyObject *__pyx_v_wrap = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py", 0);
+  __pyx_cur_scope = (struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *)__pyx_tp_new___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(__pyx_ptype___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(2, 64, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF(__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_v_f = __pyx_v_f;
+
+  /* "cfunc.to_py":65
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):             # <<<<<<<<<<<<<<
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ *         return f(z, x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ */
+  __pyx_t_1 = __Pyx_CyFunction_New(&__pyx_mdef_11cfunc_dot_to_py_136__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py_1wrap, 0, __pyx_n_s_Pyx_CFunc_double____double, ((PyObject*)__pyx_cur_scope), __pyx_n_s_cfunc_to_py, __pyx_d, ((PyObject *)__pyx_codeobj__4)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_wrap = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "cfunc.to_py":68
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ *         return f(z, x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ *     return wrap             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_wrap);
+  __pyx_r = __pyx_v_wrap;
+  goto __pyx_L0;
+
+  /* "cfunc.to_py":64
+ * 
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):             # <<<<<<<<<<<<<<
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cfunc.to_py.__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_wrap);
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *__pyx_freelist___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py[8];
+static int __pyx_freecount___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py = 0;
+
+static PyObject *__pyx_tp_new___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  if (CYTHON_COMPILING_IN_CPYTHON && likely((__pyx_freecount___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py > 0) & (t->tp_basicsize == sizeof(struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py)))) {
+    o = (PyObject*)__pyx_freelist___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py[--__pyx_freecount___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py];
+    memset(o, 0, sizeof(struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py));
+    (void) PyObject_INIT(o, t);
+  } else {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  return o;
+}
+
+static void __pyx_tp_dealloc___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(PyObject *o) {
+  if (CYTHON_COMPILING_IN_CPYTHON && ((__pyx_freecount___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py < 8) & (Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py)))) {
+    __pyx_freelist___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py[__pyx_freecount___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py++] = ((struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py *)o);
+  } else {
+    (*Py_TYPE(o)->tp_free)(o);
+  }
+}
+
+static PyTypeObject __pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "hazma.scalar_mediator._c_scalar_mediator_cross_sections.__pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py", /*tp_name*/
+  sizeof(struct __pyx_obj___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
+  0, /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__c_scalar_mediator_cross_sections(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__c_scalar_mediator_cross_sections},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_c_scalar_mediator_cross_sections",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_n_s_Pyx_CFunc_double____double, __pyx_k_Pyx_CFunc_double____double, sizeof(__pyx_k_Pyx_CFunc_double____double), 0, 0, 1, 1},
+  {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
+  {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
+  {&__pyx_n_s_cfunc_to_py, __pyx_k_cfunc_to_py, sizeof(__pyx_k_cfunc_to_py), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_e_cm, __pyx_k_e_cm, sizeof(__pyx_k_e_cm), 0, 0, 1, 1},
+  {&__pyx_n_s_e_cms, __pyx_k_e_cms, sizeof(__pyx_k_e_cms), 0, 0, 1, 1},
+  {&__pyx_n_s_float64, __pyx_k_float64, sizeof(__pyx_k_float64), 0, 0, 1, 1},
+  {&__pyx_n_s_gsFF, __pyx_k_gsFF, sizeof(__pyx_k_gsFF), 0, 0, 1, 1},
+  {&__pyx_n_s_gsGG, __pyx_k_gsGG, sizeof(__pyx_k_gsGG), 0, 0, 1, 1},
+  {&__pyx_n_s_gsff, __pyx_k_gsff, sizeof(__pyx_k_gsff), 0, 0, 1, 1},
+  {&__pyx_n_s_gsxx, __pyx_k_gsxx, sizeof(__pyx_k_gsxx), 0, 0, 1, 1},
+  {&__pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_k_hazma_scalar_mediator__c_scalar, sizeof(__pyx_k_hazma_scalar_mediator__c_scalar), 0, 0, 1, 0},
+  {&__pyx_n_s_hazma_scalar_mediator__c_scalar_2, __pyx_k_hazma_scalar_mediator__c_scalar_2, sizeof(__pyx_k_hazma_scalar_mediator__c_scalar_2), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_item, __pyx_k_item, sizeof(__pyx_k_item), 0, 0, 1, 1},
+  {&__pyx_n_s_lam, __pyx_k_lam, sizeof(__pyx_k_lam), 0, 0, 1, 1},
+  {&__pyx_n_s_len, __pyx_k_len, sizeof(__pyx_k_len), 0, 0, 1, 1},
+  {&__pyx_n_s_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_mf, __pyx_k_mf, sizeof(__pyx_k_mf), 0, 0, 1, 1},
+  {&__pyx_n_s_ms, __pyx_k_ms, sizeof(__pyx_k_ms), 0, 0, 1, 1},
+  {&__pyx_n_s_mx, __pyx_k_mx, sizeof(__pyx_k_mx), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_ndim, __pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 0, 1, 1},
+  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
+  {&__pyx_kp_s_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 0, 1, 0},
+  {&__pyx_kp_s_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 0, 1, 0},
+  {&__pyx_n_s_pf, __pyx_k_pf, sizeof(__pyx_k_pf), 0, 0, 1, 1},
+  {&__pyx_n_s_points, __pyx_k_points, sizeof(__pyx_k_points), 0, 0, 1, 1},
+  {&__pyx_n_s_quad, __pyx_k_quad, sizeof(__pyx_k_quad), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_scipy_integrate, __pyx_k_scipy_integrate, sizeof(__pyx_k_scipy_integrate), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_ss_to_xx, __pyx_k_sigma_ss_to_xx, sizeof(__pyx_k_sigma_ss_to_xx), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xg_to_xg, __pyx_k_sigma_xg_to_xg, sizeof(__pyx_k_sigma_xg_to_xg), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xl_to_xl, __pyx_k_sigma_xl_to_xl, sizeof(__pyx_k_sigma_xl_to_xl), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xpi0_to_xpi0, __pyx_k_sigma_xpi0_to_xpi0, sizeof(__pyx_k_sigma_xpi0_to_xpi0), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xpi_to_xpi, __pyx_k_sigma_xpi_to_xpi, sizeof(__pyx_k_sigma_xpi_to_xpi), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xs_to_xs, __pyx_k_sigma_xs_to_xs, sizeof(__pyx_k_sigma_xs_to_xs), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xx_to_all, __pyx_k_sigma_xx_to_all, sizeof(__pyx_k_sigma_xx_to_all), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xx_to_s_to_ff, __pyx_k_sigma_xx_to_s_to_ff, sizeof(__pyx_k_sigma_xx_to_s_to_ff), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xx_to_s_to_gg, __pyx_k_sigma_xx_to_s_to_gg, sizeof(__pyx_k_sigma_xx_to_s_to_gg), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xx_to_s_to_pi0pi0, __pyx_k_sigma_xx_to_s_to_pi0pi0, sizeof(__pyx_k_sigma_xx_to_s_to_pi0pi0), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xx_to_s_to_pipi, __pyx_k_sigma_xx_to_s_to_pipi, sizeof(__pyx_k_sigma_xx_to_s_to_pipi), 0, 0, 1, 1},
+  {&__pyx_n_s_sigma_xx_to_ss, __pyx_k_sigma_xx_to_ss, sizeof(__pyx_k_sigma_xx_to_ss), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_thermal_cross_section, __pyx_k_thermal_cross_section, sizeof(__pyx_k_thermal_cross_section), 0, 0, 1, 1},
+  {&__pyx_n_s_vs, __pyx_k_vs, sizeof(__pyx_k_vs), 0, 0, 1, 1},
+  {&__pyx_n_s_width_s, __pyx_k_width_s, sizeof(__pyx_k_width_s), 0, 0, 1, 1},
+  {&__pyx_n_s_wrap, __pyx_k_wrap, sizeof(__pyx_k_wrap), 0, 0, 1, 1},
+  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+  {&__pyx_n_s_z, __pyx_k_z, sizeof(__pyx_k_z), 0, 0, 1, 1},
+  {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 555, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 942, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 942, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 948, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "cfunc.to_py":65
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):             # <<<<<<<<<<<<<<
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ *         return f(z, x, mx, ms, gsxx, gsff, gsGG, gsFF, lam, width_s, vs)
+ */
+  __pyx_tuple__3 = PyTuple_Pack(11, __pyx_n_s_z, __pyx_n_s_x, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(2, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(11, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_wrap, 65, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(2, 65, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":774
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_ff(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                         double gsff, double gsGG, double gsFF,
+ *                         double lam, double width_s, double vs,
+ */
+  __pyx_tuple__5 = PyTuple_Pack(12, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_mf, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 774, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(11, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xx_to_s_to_ff, 774, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 774, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":828
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_gg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                            double gsff, double gsGG, double gsFF,
+ *                            double lam, double width_s, double vs):
+ */
+  __pyx_tuple__7 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 828, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xx_to_s_to_gg, 828, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 828, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":879
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pi0pi0(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                double gsxx, double gsff, double gsGG,
+ *                                double gsFF, double lam, double width_s,
+ */
+  __pyx_tuple__9 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 879, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xx_to_s_to_pi0pi0, 879, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 879, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":931
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pipi(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                              double gsxx, double gsff, double gsGG,
+ *                              double gsFF, double lam, double width_s,
+ */
+  __pyx_tuple__11 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 931, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xx_to_s_to_pipi, 931, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 931, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":983
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_ss(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_tuple__13 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xx_to_ss, 983, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 983, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1033
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_ss_to_xx(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_tuple__15 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 1033, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_ss_to_xx, 1033, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 1033, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1051
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_all(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_tuple__17 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 1051, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xx_to_all, 1051, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 1051, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1101
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xl_to_xl(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs, double mf):
+ */
+  __pyx_tuple__19 = PyTuple_Pack(12, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_mf, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 1101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(11, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xl_to_xl, 1101, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 1101, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1152
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi_to_xpi(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_tuple__21 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 1152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xpi_to_xpi, 1152, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 1152, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1203
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi0_to_xpi0(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                        double gsff, double gsGG, double gsFF, double lam,
+ *                        double width_s, double vs):
+ */
+  __pyx_tuple__23 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xpi0_to_xpi0, 1203, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 1203, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1254
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xg_to_xg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_tuple__25 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 1254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xg_to_xg, 1254, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 1254, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1305
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xs_to_xs(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_tuple__27 = PyTuple_Pack(11, __pyx_n_s_e_cms, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_e_cm); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 1305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_sigma_xs_to_xs, 1305, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 1305, __pyx_L1_error)
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1365
+ * 
+ * @cython.cdivision(True)
+ * def thermal_cross_section(double x, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                           double gsff, double gsGG, double gsFF,
+ *                           double lam, double width_s, double vs):
+ */
+  __pyx_tuple__29 = PyTuple_Pack(11, __pyx_n_s_x, __pyx_n_s_mx, __pyx_n_s_ms, __pyx_n_s_gsxx, __pyx_n_s_gsff, __pyx_n_s_gsGG, __pyx_n_s_gsFF, __pyx_n_s_lam, __pyx_n_s_width_s, __pyx_n_s_vs, __pyx_n_s_pf); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 1365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(10, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_hazma_scalar_mediator__c_scalar, __pyx_n_s_thermal_cross_section, 1365, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) __PYX_ERR(0, 1365, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_float_2_0 = PyFloat_FromDouble(2.0); if (unlikely(!__pyx_float_2_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  if (PyType_Ready(&__pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py) < 0) __PYX_ERR(2, 64, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.tp_dictoffset && __pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  __pyx_ptype___pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py = &__pyx_scope_struct____Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(1, 199, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(1, 222, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(1, 226, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(1, 238, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(1, 767, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_number) __PYX_ERR(1, 769, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(1, 771, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(1, 773, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(1, 775, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(1, 777, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(1, 779, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(1, 781, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(1, 783, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_character) __PYX_ERR(1, 785, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(1, 824, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("scipy.special.cython_special"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "k1", (void (**)(void))&__pyx_f_5scipy_7special_14cython_special_k1, "double (double, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "__pyx_fuse_0kn", (void (**)(void))&__pyx_fuse_0__pyx_f_5scipy_7special_14cython_special_kn, "double (double, double, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "__pyx_fuse_1kn", (void (**)(void))&__pyx_fuse_1__pyx_f_5scipy_7special_14cython_special_kn, "double (long, double, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_c_scalar_mediator_cross_sections(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_c_scalar_mediator_cross_sections(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__c_scalar_mediator_cross_sections(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__c_scalar_mediator_cross_sections(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__c_scalar_mediator_cross_sections(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_c_scalar_mediator_cross_sections' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__c_scalar_mediator_cross_sections(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_c_scalar_mediator_cross_sections", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_hazma__scalar_mediator___c_scalar_mediator_cross_sections) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "hazma.scalar_mediator._c_scalar_mediator_cross_sections")) {
+      if (unlikely(PyDict_SetItemString(modules, "hazma.scalar_mediator._c_scalar_mediator_cross_sections", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  if (unlikely(__Pyx_modinit_function_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":2
+ * import cython
+ * import numpy as np             # <<<<<<<<<<<<<<
+ * cimport numpy as np
+ * from scipy.special.cython_special cimport k1, kn
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":5
+ * cimport numpy as np
+ * from scipy.special.cython_special cimport k1, kn
+ * from scipy.integrate import quad             # <<<<<<<<<<<<<<
+ * 
+ * from libc.math cimport M_PI, sqrt, atanh, atan, log
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_quad);
+  __Pyx_GIVEREF(__pyx_n_s_quad);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_quad);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_scipy_integrate, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_quad); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_quad, __pyx_t_1) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":9
+ * from libc.math cimport M_PI, sqrt, atanh, atan, log
+ * 
+ * cdef double vh = 246.22795e3             # <<<<<<<<<<<<<<
+ * cdef double alpha_em = 1.0 / 137.04
+ * cdef double me = 0.510998928
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_vh = 246.22795e3;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":10
+ * 
+ * cdef double vh = 246.22795e3
+ * cdef double alpha_em = 1.0 / 137.04             # <<<<<<<<<<<<<<
+ * cdef double me = 0.510998928
+ * cdef double mmu = 105.6583715
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_alpha_em = (1.0 / 137.04);
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":11
+ * cdef double vh = 246.22795e3
+ * cdef double alpha_em = 1.0 / 137.04
+ * cdef double me = 0.510998928             # <<<<<<<<<<<<<<
+ * cdef double mmu = 105.6583715
+ * cdef double mpi0 = 134.9766
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_me = 0.510998928;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":12
+ * cdef double alpha_em = 1.0 / 137.04
+ * cdef double me = 0.510998928
+ * cdef double mmu = 105.6583715             # <<<<<<<<<<<<<<
+ * cdef double mpi0 = 134.9766
+ * cdef double mpi = 139.57018
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mmu = 105.6583715;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":13
+ * cdef double me = 0.510998928
+ * cdef double mmu = 105.6583715
+ * cdef double mpi0 = 134.9766             # <<<<<<<<<<<<<<
+ * cdef double mpi = 139.57018
+ * cdef double b0 = 2654.082197477761
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi0 = 134.9766;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":14
+ * cdef double mmu = 105.6583715
+ * cdef double mpi0 = 134.9766
+ * cdef double mpi = 139.57018             # <<<<<<<<<<<<<<
+ * cdef double b0 = 2654.082197477761
+ * cdef double muq = 2.3
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mpi = 139.57018;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":15
+ * cdef double mpi0 = 134.9766
+ * cdef double mpi = 139.57018
+ * cdef double b0 = 2654.082197477761             # <<<<<<<<<<<<<<
+ * cdef double muq = 2.3
+ * cdef double mdq = 4.8
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_b0 = 2654.082197477761;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":16
+ * cdef double mpi = 139.57018
+ * cdef double b0 = 2654.082197477761
+ * cdef double muq = 2.3             # <<<<<<<<<<<<<<
+ * cdef double mdq = 4.8
+ * 
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_muq = 2.3;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":17
+ * cdef double b0 = 2654.082197477761
+ * cdef double muq = 2.3
+ * cdef double mdq = 4.8             # <<<<<<<<<<<<<<
+ * 
+ * @cython.cdivision(True)
+ */
+  __pyx_v_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_mdq = 4.8;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":774
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_ff(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                         double gsff, double gsGG, double gsFF,
+ *                         double lam, double width_s, double vs,
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_1sigma_xx_to_s_to_ff, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 774, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xx_to_s_to_ff, __pyx_t_2) < 0) __PYX_ERR(0, 774, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":828
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_gg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                            double gsff, double gsGG, double gsFF,
+ *                            double lam, double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_3sigma_xx_to_s_to_gg, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 828, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xx_to_s_to_gg, __pyx_t_2) < 0) __PYX_ERR(0, 828, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":879
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pi0pi0(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                                double gsxx, double gsff, double gsGG,
+ *                                double gsFF, double lam, double width_s,
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_5sigma_xx_to_s_to_pi0pi0, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 879, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xx_to_s_to_pi0pi0, __pyx_t_2) < 0) __PYX_ERR(0, 879, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":931
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_s_to_pipi(e_cms, double mx, double ms,             # <<<<<<<<<<<<<<
+ *                              double gsxx, double gsff, double gsGG,
+ *                              double gsFF, double lam, double width_s,
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_7sigma_xx_to_s_to_pipi, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 931, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xx_to_s_to_pipi, __pyx_t_2) < 0) __PYX_ERR(0, 931, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":983
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_ss(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_9sigma_xx_to_ss, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xx_to_ss, __pyx_t_2) < 0) __PYX_ERR(0, 983, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1033
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_ss_to_xx(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_11sigma_ss_to_xx, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1033, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_ss_to_xx, __pyx_t_2) < 0) __PYX_ERR(0, 1033, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1051
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xx_to_all(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_13sigma_xx_to_all, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1051, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xx_to_all, __pyx_t_2) < 0) __PYX_ERR(0, 1051, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1101
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xl_to_xl(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs, double mf):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_15sigma_xl_to_xl, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xl_to_xl, __pyx_t_2) < 0) __PYX_ERR(0, 1101, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1152
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi_to_xpi(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_17sigma_xpi_to_xpi, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xpi_to_xpi, __pyx_t_2) < 0) __PYX_ERR(0, 1152, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1203
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xpi0_to_xpi0(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                        double gsff, double gsGG, double gsFF, double lam,
+ *                        double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_19sigma_xpi0_to_xpi0, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xpi0_to_xpi0, __pyx_t_2) < 0) __PYX_ERR(0, 1203, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1254
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xg_to_xg(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_21sigma_xg_to_xg, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1254, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xg_to_xg, __pyx_t_2) < 0) __PYX_ERR(0, 1254, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1305
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def sigma_xs_to_xs(e_cms, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                    double gsff, double gsGG, double gsFF, double lam,
+ *                    double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_23sigma_xs_to_xs, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1305, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sigma_xs_to_xs, __pyx_t_2) < 0) __PYX_ERR(0, 1305, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1365
+ * 
+ * @cython.cdivision(True)
+ * def thermal_cross_section(double x, double mx, double ms, double gsxx,             # <<<<<<<<<<<<<<
+ *                           double gsff, double gsGG, double gsFF,
+ *                           double lam, double width_s, double vs):
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5hazma_15scalar_mediator_33_c_scalar_mediator_cross_sections_25thermal_cross_section, NULL, __pyx_n_s_hazma_scalar_mediator__c_scalar_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_thermal_cross_section, __pyx_t_2) < 0) __PYX_ERR(0, 1365, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hazma/scalar_mediator/_c_scalar_mediator_cross_sections.pyx":1
+ * import cython             # <<<<<<<<<<<<<<
+ * import numpy as np
+ * cimport numpy as np
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cfunc.to_py":64
+ * 
+ * @cname("__Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py")
+ * cdef object __Pyx_CFunc_double____double____double____double____double____double____double____double____double____double____double____double___to_py(double (*f)(double, double, double, double, double, double, double, double, double, double, double) except *):             # <<<<<<<<<<<<<<
+ *     def wrap(double z, double x, double mx, double ms, double gsxx, double gsff, double gsGG, double gsFF, double lam, double width_s, double vs):
+ *         """wrap(z: float, x: float, mx: float, ms: float, gsxx: float, gsff: float, gsGG: float, gsFF: float, lam: float, width_s: float, vs: float) -> float"""
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init hazma.scalar_mediator._c_scalar_mediator_cross_sections", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init hazma.scalar_mediator._c_scalar_mediator_cross_sections");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* IsLittleEndian */
+static CYTHON_INLINE int __Pyx_Is_Little_Endian(void)
+{
+  union {
+    uint32_t u32;
+    uint8_t u8[4];
+  } S;
+  S.u32 = 0x01020304;
+  return S.u8[0] == 4;
+}
+
+/* BufferFormatCheck */
+static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
+                              __Pyx_BufFmt_StackElem* stack,
+                              __Pyx_TypeInfo* type) {
+  stack[0].field = &ctx->root;
+  stack[0].parent_offset = 0;
+  ctx->root.type = type;
+  ctx->root.name = "buffer dtype";
+  ctx->root.offset = 0;
+  ctx->head = stack;
+  ctx->head->field = &ctx->root;
+  ctx->fmt_offset = 0;
+  ctx->head->parent_offset = 0;
+  ctx->new_packmode = '@';
+  ctx->enc_packmode = '@';
+  ctx->new_count = 1;
+  ctx->enc_count = 0;
+  ctx->enc_type = 0;
+  ctx->is_complex = 0;
+  ctx->is_valid_array = 0;
+  ctx->struct_alignment = 0;
+  while (type->typegroup == 'S') {
+    ++ctx->head;
+    ctx->head->field = type->fields;
+    ctx->head->parent_offset = 0;
+    type = type->fields->type;
+  }
+}
+static int __Pyx_BufFmt_ParseNumber(const char** ts) {
+    int count;
+    const char* t = *ts;
+    if (*t < '0' || *t > '9') {
+      return -1;
+    } else {
+        count = *t++ - '0';
+        while (*t >= '0' && *t <= '9') {
+            count *= 10;
+            count += *t++ - '0';
+        }
+    }
+    *ts = t;
+    return count;
+}
+static int __Pyx_BufFmt_ExpectNumber(const char **ts) {
+    int number = __Pyx_BufFmt_ParseNumber(ts);
+    if (number == -1)
+        PyErr_Format(PyExc_ValueError,\
+                     "Does not understand character buffer dtype format string ('%c')", **ts);
+    return number;
+}
+static void __Pyx_BufFmt_RaiseUnexpectedChar(char ch) {
+  PyErr_Format(PyExc_ValueError,
+               "Unexpected format string character: '%c'", ch);
+}
+static const char* __Pyx_BufFmt_DescribeTypeChar(char ch, int is_complex) {
+  switch (ch) {
+    case '?': return "'bool'";
+    case 'c': return "'char'";
+    case 'b': return "'signed char'";
+    case 'B': return "'unsigned char'";
+    case 'h': return "'short'";
+    case 'H': return "'unsigned short'";
+    case 'i': return "'int'";
+    case 'I': return "'unsigned int'";
+    case 'l': return "'long'";
+    case 'L': return "'unsigned long'";
+    case 'q': return "'long long'";
+    case 'Q': return "'unsigned long long'";
+    case 'f': return (is_complex ? "'complex float'" : "'float'");
+    case 'd': return (is_complex ? "'complex double'" : "'double'");
+    case 'g': return (is_complex ? "'complex long double'" : "'long double'");
+    case 'T': return "a struct";
+    case 'O': return "Python object";
+    case 'P': return "a pointer";
+    case 's': case 'p': return "a string";
+    case 0: return "end";
+    default: return "unparseable format string";
+  }
+}
+static size_t __Pyx_BufFmt_TypeCharToStandardSize(char ch, int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return 2;
+    case 'i': case 'I': case 'l': case 'L': return 4;
+    case 'q': case 'Q': return 8;
+    case 'f': return (is_complex ? 8 : 4);
+    case 'd': return (is_complex ? 16 : 8);
+    case 'g': {
+      PyErr_SetString(PyExc_ValueError, "Python does not define a standard format string size for long double ('g')..");
+      return 0;
+    }
+    case 'O': case 'P': return sizeof(void*);
+    default:
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+}
+static size_t __Pyx_BufFmt_TypeCharToNativeSize(char ch, int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return sizeof(short);
+    case 'i': case 'I': return sizeof(int);
+    case 'l': case 'L': return sizeof(long);
+    #ifdef HAVE_LONG_LONG
+    case 'q': case 'Q': return sizeof(PY_LONG_LONG);
+    #endif
+    case 'f': return sizeof(float) * (is_complex ? 2 : 1);
+    case 'd': return sizeof(double) * (is_complex ? 2 : 1);
+    case 'g': return sizeof(long double) * (is_complex ? 2 : 1);
+    case 'O': case 'P': return sizeof(void*);
+    default: {
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+  }
+}
+typedef struct { char c; short x; } __Pyx_st_short;
+typedef struct { char c; int x; } __Pyx_st_int;
+typedef struct { char c; long x; } __Pyx_st_long;
+typedef struct { char c; float x; } __Pyx_st_float;
+typedef struct { char c; double x; } __Pyx_st_double;
+typedef struct { char c; long double x; } __Pyx_st_longdouble;
+typedef struct { char c; void *x; } __Pyx_st_void_p;
+#ifdef HAVE_LONG_LONG
+typedef struct { char c; PY_LONG_LONG x; } __Pyx_st_longlong;
+#endif
+static size_t __Pyx_BufFmt_TypeCharToAlignment(char ch, CYTHON_UNUSED int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return sizeof(__Pyx_st_short) - sizeof(short);
+    case 'i': case 'I': return sizeof(__Pyx_st_int) - sizeof(int);
+    case 'l': case 'L': return sizeof(__Pyx_st_long) - sizeof(long);
+#ifdef HAVE_LONG_LONG
+    case 'q': case 'Q': return sizeof(__Pyx_st_longlong) - sizeof(PY_LONG_LONG);
+#endif
+    case 'f': return sizeof(__Pyx_st_float) - sizeof(float);
+    case 'd': return sizeof(__Pyx_st_double) - sizeof(double);
+    case 'g': return sizeof(__Pyx_st_longdouble) - sizeof(long double);
+    case 'P': case 'O': return sizeof(__Pyx_st_void_p) - sizeof(void*);
+    default:
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+}
+/* These are for computing the padding at the end of the struct to align
+   on the first member of the struct. This will probably the same as above,
+   but we don't have any guarantees.
+ */
+typedef struct { short x; char c; } __Pyx_pad_short;
+typedef struct { int x; char c; } __Pyx_pad_int;
+typedef struct { long x; char c; } __Pyx_pad_long;
+typedef struct { float x; char c; } __Pyx_pad_float;
+typedef struct { double x; char c; } __Pyx_pad_double;
+typedef struct { long double x; char c; } __Pyx_pad_longdouble;
+typedef struct { void *x; char c; } __Pyx_pad_void_p;
+#ifdef HAVE_LONG_LONG
+typedef struct { PY_LONG_LONG x; char c; } __Pyx_pad_longlong;
+#endif
+static size_t __Pyx_BufFmt_TypeCharToPadding(char ch, CYTHON_UNUSED int is_complex) {
+  switch (ch) {
+    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
+    case 'h': case 'H': return sizeof(__Pyx_pad_short) - sizeof(short);
+    case 'i': case 'I': return sizeof(__Pyx_pad_int) - sizeof(int);
+    case 'l': case 'L': return sizeof(__Pyx_pad_long) - sizeof(long);
+#ifdef HAVE_LONG_LONG
+    case 'q': case 'Q': return sizeof(__Pyx_pad_longlong) - sizeof(PY_LONG_LONG);
+#endif
+    case 'f': return sizeof(__Pyx_pad_float) - sizeof(float);
+    case 'd': return sizeof(__Pyx_pad_double) - sizeof(double);
+    case 'g': return sizeof(__Pyx_pad_longdouble) - sizeof(long double);
+    case 'P': case 'O': return sizeof(__Pyx_pad_void_p) - sizeof(void*);
+    default:
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+}
+static char __Pyx_BufFmt_TypeCharToGroup(char ch, int is_complex) {
+  switch (ch) {
+    case 'c':
+        return 'H';
+    case 'b': case 'h': case 'i':
+    case 'l': case 'q': case 's': case 'p':
+        return 'I';
+    case '?': case 'B': case 'H': case 'I': case 'L': case 'Q':
+        return 'U';
+    case 'f': case 'd': case 'g':
+        return (is_complex ? 'C' : 'R');
+    case 'O':
+        return 'O';
+    case 'P':
+        return 'P';
+    default: {
+      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
+      return 0;
+    }
+  }
+}
+static void __Pyx_BufFmt_RaiseExpected(__Pyx_BufFmt_Context* ctx) {
+  if (ctx->head == NULL || ctx->head->field == &ctx->root) {
+    const char* expected;
+    const char* quote;
+    if (ctx->head == NULL) {
+      expected = "end";
+      quote = "";
+    } else {
+      expected = ctx->head->field->type->name;
+      quote = "'";
+    }
+    PyErr_Format(PyExc_ValueError,
+                 "Buffer dtype mismatch, expected %s%s%s but got %s",
+                 quote, expected, quote,
+                 __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex));
+  } else {
+    __Pyx_StructField* field = ctx->head->field;
+    __Pyx_StructField* parent = (ctx->head - 1)->field;
+    PyErr_Format(PyExc_ValueError,
+                 "Buffer dtype mismatch, expected '%s' but got %s in '%s.%s'",
+                 field->type->name, __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex),
+                 parent->type->name, field->name);
+  }
+}
+static int __Pyx_BufFmt_ProcessTypeChunk(__Pyx_BufFmt_Context* ctx) {
+  char group;
+  size_t size, offset, arraysize = 1;
+  if (ctx->enc_type == 0) return 0;
+  if (ctx->head->field->type->arraysize[0]) {
+    int i, ndim = 0;
+    if (ctx->enc_type == 's' || ctx->enc_type == 'p') {
+        ctx->is_valid_array = ctx->head->field->type->ndim == 1;
+        ndim = 1;
+        if (ctx->enc_count != ctx->head->field->type->arraysize[0]) {
+            PyErr_Format(PyExc_ValueError,
+                         "Expected a dimension of size %zu, got %zu",
+                         ctx->head->field->type->arraysize[0], ctx->enc_count);
+            return -1;
+        }
+    }
+    if (!ctx->is_valid_array) {
+      PyErr_Format(PyExc_ValueError, "Expected %d dimensions, got %d",
+                   ctx->head->field->type->ndim, ndim);
+      return -1;
+    }
+    for (i = 0; i < ctx->head->field->type->ndim; i++) {
+      arraysize *= ctx->head->field->type->arraysize[i];
+    }
+    ctx->is_valid_array = 0;
+    ctx->enc_count = 1;
+  }
+  group = __Pyx_BufFmt_TypeCharToGroup(ctx->enc_type, ctx->is_complex);
+  do {
+    __Pyx_StructField* field = ctx->head->field;
+    __Pyx_TypeInfo* type = field->type;
+    if (ctx->enc_packmode == '@' || ctx->enc_packmode == '^') {
+      size = __Pyx_BufFmt_TypeCharToNativeSize(ctx->enc_type, ctx->is_complex);
+    } else {
+      size = __Pyx_BufFmt_TypeCharToStandardSize(ctx->enc_type, ctx->is_complex);
+    }
+    if (ctx->enc_packmode == '@') {
+      size_t align_at = __Pyx_BufFmt_TypeCharToAlignment(ctx->enc_type, ctx->is_complex);
+      size_t align_mod_offset;
+      if (align_at == 0) return -1;
+      align_mod_offset = ctx->fmt_offset % align_at;
+      if (align_mod_offset > 0) ctx->fmt_offset += align_at - align_mod_offset;
+      if (ctx->struct_alignment == 0)
+          ctx->struct_alignment = __Pyx_BufFmt_TypeCharToPadding(ctx->enc_type,
+                                                                 ctx->is_complex);
+    }
+    if (type->size != size || type->typegroup != group) {
+      if (type->typegroup == 'C' && type->fields != NULL) {
+        size_t parent_offset = ctx->head->parent_offset + field->offset;
+        ++ctx->head;
+        ctx->head->field = type->fields;
+        ctx->head->parent_offset = parent_offset;
+        continue;
+      }
+      if ((type->typegroup == 'H' || group == 'H') && type->size == size) {
+      } else {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return -1;
+      }
+    }
+    offset = ctx->head->parent_offset + field->offset;
+    if (ctx->fmt_offset != offset) {
+      PyErr_Format(PyExc_ValueError,
+                   "Buffer dtype mismatch; next field is at offset %" CYTHON_FORMAT_SSIZE_T "d but %" CYTHON_FORMAT_SSIZE_T "d expected",
+                   (Py_ssize_t)ctx->fmt_offset, (Py_ssize_t)offset);
+      return -1;
+    }
+    ctx->fmt_offset += size;
+    if (arraysize)
+      ctx->fmt_offset += (arraysize - 1) * size;
+    --ctx->enc_count;
+    while (1) {
+      if (field == &ctx->root) {
+        ctx->head = NULL;
+        if (ctx->enc_count != 0) {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return -1;
+        }
+        break;
+      }
+      ctx->head->field = ++field;
+      if (field->type == NULL) {
+        --ctx->head;
+        field = ctx->head->field;
+        continue;
+      } else if (field->type->typegroup == 'S') {
+        size_t parent_offset = ctx->head->parent_offset + field->offset;
+        if (field->type->fields->type == NULL) continue;
+        field = field->type->fields;
+        ++ctx->head;
+        ctx->head->field = field;
+        ctx->head->parent_offset = parent_offset;
+        break;
+      } else {
+        break;
+      }
+    }
+  } while (ctx->enc_count);
+  ctx->enc_type = 0;
+  ctx->is_complex = 0;
+  return 0;
+}
+static PyObject *
+__pyx_buffmt_parse_array(__Pyx_BufFmt_Context* ctx, const char** tsp)
+{
+    const char *ts = *tsp;
+    int i = 0, number, ndim;
+    ++ts;
+    if (ctx->new_count != 1) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Cannot handle repeated arrays in format string");
+        return NULL;
+    }
+    if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+    ndim = ctx->head->field->type->ndim;
+    while (*ts && *ts != ')') {
+        switch (*ts) {
+            case ' ': case '\f': case '\r': case '\n': case '\t': case '\v':  continue;
+            default:  break;
+        }
+        number = __Pyx_BufFmt_ExpectNumber(&ts);
+        if (number == -1) return NULL;
+        if (i < ndim && (size_t) number != ctx->head->field->type->arraysize[i])
+            return PyErr_Format(PyExc_ValueError,
+                        "Expected a dimension of size %zu, got %d",
+                        ctx->head->field->type->arraysize[i], number);
+        if (*ts != ',' && *ts != ')')
+            return PyErr_Format(PyExc_ValueError,
+                                "Expected a comma in format string, got '%c'", *ts);
+        if (*ts == ',') ts++;
+        i++;
+    }
+    if (i != ndim)
+        return PyErr_Format(PyExc_ValueError, "Expected %d dimension(s), got %d",
+                            ctx->head->field->type->ndim, i);
+    if (!*ts) {
+        PyErr_SetString(PyExc_ValueError,
+                        "Unexpected end of format string, expected ')'");
+        return NULL;
+    }
+    ctx->is_valid_array = 1;
+    ctx->new_count = 1;
+    *tsp = ++ts;
+    return Py_None;
+}
+static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts) {
+  int got_Z = 0;
+  while (1) {
+    switch(*ts) {
+      case 0:
+        if (ctx->enc_type != 0 && ctx->head == NULL) {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return NULL;
+        }
+        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+        if (ctx->head != NULL) {
+          __Pyx_BufFmt_RaiseExpected(ctx);
+          return NULL;
+        }
+        return ts;
+      case ' ':
+      case '\r':
+      case '\n':
+        ++ts;
+        break;
+      case '<':
+        if (!__Pyx_Is_Little_Endian()) {
+          PyErr_SetString(PyExc_ValueError, "Little-endian buffer not supported on big-endian compiler");
+          return NULL;
+        }
+        ctx->new_packmode = '=';
+        ++ts;
+        break;
+      case '>':
+      case '!':
+        if (__Pyx_Is_Little_Endian()) {
+          PyErr_SetString(PyExc_ValueError, "Big-endian buffer not supported on little-endian compiler");
+          return NULL;
+        }
+        ctx->new_packmode = '=';
+        ++ts;
+        break;
+      case '=':
+      case '@':
+      case '^':
+        ctx->new_packmode = *ts++;
+        break;
+      case 'T':
+        {
+          const char* ts_after_sub;
+          size_t i, struct_count = ctx->new_count;
+          size_t struct_alignment = ctx->struct_alignment;
+          ctx->new_count = 1;
+          ++ts;
+          if (*ts != '{') {
+            PyErr_SetString(PyExc_ValueError, "Buffer acquisition: Expected '{' after 'T'");
+            return NULL;
+          }
+          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+          ctx->enc_type = 0;
+          ctx->enc_count = 0;
+          ctx->struct_alignment = 0;
+          ++ts;
+          ts_after_sub = ts;
+          for (i = 0; i != struct_count; ++i) {
+            ts_after_sub = __Pyx_BufFmt_CheckString(ctx, ts);
+            if (!ts_after_sub) return NULL;
+          }
+          ts = ts_after_sub;
+          if (struct_alignment) ctx->struct_alignment = struct_alignment;
+        }
+        break;
+      case '}':
+        {
+          size_t alignment = ctx->struct_alignment;
+          ++ts;
+          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+          ctx->enc_type = 0;
+          if (alignment && ctx->fmt_offset % alignment) {
+            ctx->fmt_offset += alignment - (ctx->fmt_offset % alignment);
+          }
+        }
+        return ts;
+      case 'x':
+        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+        ctx->fmt_offset += ctx->new_count;
+        ctx->new_count = 1;
+        ctx->enc_count = 0;
+        ctx->enc_type = 0;
+        ctx->enc_packmode = ctx->new_packmode;
+        ++ts;
+        break;
+      case 'Z':
+        got_Z = 1;
+        ++ts;
+        if (*ts != 'f' && *ts != 'd' && *ts != 'g') {
+          __Pyx_BufFmt_RaiseUnexpectedChar('Z');
+          return NULL;
+        }
+        CYTHON_FALLTHROUGH;
+      case '?': case 'c': case 'b': case 'B': case 'h': case 'H': case 'i': case 'I':
+      case 'l': case 'L': case 'q': case 'Q':
+      case 'f': case 'd': case 'g':
+      case 'O': case 'p':
+        if ((ctx->enc_type == *ts) && (got_Z == ctx->is_complex) &&
+            (ctx->enc_packmode == ctx->new_packmode) && (!ctx->is_valid_array)) {
+          ctx->enc_count += ctx->new_count;
+          ctx->new_count = 1;
+          got_Z = 0;
+          ++ts;
+          break;
+        }
+        CYTHON_FALLTHROUGH;
+      case 's':
+        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
+        ctx->enc_count = ctx->new_count;
+        ctx->enc_packmode = ctx->new_packmode;
+        ctx->enc_type = *ts;
+        ctx->is_complex = got_Z;
+        ++ts;
+        ctx->new_count = 1;
+        got_Z = 0;
+        break;
+      case ':':
+        ++ts;
+        while(*ts != ':') ++ts;
+        ++ts;
+        break;
+      case '(':
+        if (!__pyx_buffmt_parse_array(ctx, &ts)) return NULL;
+        break;
+      default:
+        {
+          int number = __Pyx_BufFmt_ExpectNumber(&ts);
+          if (number == -1) return NULL;
+          ctx->new_count = (size_t)number;
+        }
+    }
+  }
+}
+
+/* BufferGetAndValidate */
+  static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
+  if (unlikely(info->buf == NULL)) return;
+  if (info->suboffsets == __Pyx_minusones) info->suboffsets = NULL;
+  __Pyx_ReleaseBuffer(info);
+}
+static void __Pyx_ZeroBuffer(Py_buffer* buf) {
+  buf->buf = NULL;
+  buf->obj = NULL;
+  buf->strides = __Pyx_zeros;
+  buf->shape = __Pyx_zeros;
+  buf->suboffsets = __Pyx_minusones;
+}
+static int __Pyx__GetBufferAndValidate(
+        Py_buffer* buf, PyObject* obj,  __Pyx_TypeInfo* dtype, int flags,
+        int nd, int cast, __Pyx_BufFmt_StackElem* stack)
+{
+  buf->buf = NULL;
+  if (unlikely(__Pyx_GetBuffer(obj, buf, flags) == -1)) {
+    __Pyx_ZeroBuffer(buf);
+    return -1;
+  }
+  if (unlikely(buf->ndim != nd)) {
+    PyErr_Format(PyExc_ValueError,
+                 "Buffer has wrong number of dimensions (expected %d, got %d)",
+                 nd, buf->ndim);
+    goto fail;
+  }
+  if (!cast) {
+    __Pyx_BufFmt_Context ctx;
+    __Pyx_BufFmt_Init(&ctx, stack, dtype);
+    if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
+  }
+  if (unlikely((size_t)buf->itemsize != dtype->size)) {
+    PyErr_Format(PyExc_ValueError,
+      "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "d byte%s) does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "d byte%s)",
+      buf->itemsize, (buf->itemsize > 1) ? "s" : "",
+      dtype->name, (Py_ssize_t)dtype->size, (dtype->size > 1) ? "s" : "");
+    goto fail;
+  }
+  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
+  return 0;
+fail:;
+  __Pyx_SafeReleaseBuffer(buf);
+  return -1;
+}
+
+/* ExtTypeTest */
+  static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* RaiseArgTupleInvalid */
+  static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+  static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+  static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* GetAttr */
+  static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* HasAttr */
+  static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObjectCallNoArg */
+  #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* GetItemInt */
+  static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* GetTopmostException */
+  #if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+  #if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+  #if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetException */
+  #if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* RaiseException */
+  #if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* FetchCommonType */
+  static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CythonFunctionShared */
+  #include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (!PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(m->func.m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
+{
+#if PY_MAJOR_VERSION < 3
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+#endif
+    return __Pyx_PyMethod_New(func, obj, type);
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
+    }
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+  static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* PyObject_GenericGetAttrNoDict */
+  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* TypeImport */
+  #ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* Import */
+  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+  static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* CLineInTraceback */
+  #ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+  #include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+#if PY_MAJOR_VERSION < 3
+static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
+    if (PyObject_CheckBuffer(obj)) return PyObject_GetBuffer(obj, view, flags);
+    PyErr_Format(PyExc_TypeError, "'%.200s' does not have the buffer interface", Py_TYPE(obj)->tp_name);
+    return -1;
+}
+static void __Pyx_ReleaseBuffer(Py_buffer *view) {
+    PyObject *obj = view->obj;
+    if (!obj) return;
+    if (PyObject_CheckBuffer(obj)) {
+        PyBuffer_Release(view);
+        return;
+    }
+    if ((0)) {}
+    view->obj = NULL;
+    Py_DECREF(obj);
+}
+#endif
+
+
+  /* CIntFromPyVerify */
+  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* Declarations */
+  #if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return ::std::complex< float >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return x + y*(__pyx_t_float_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      __pyx_t_float_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+  #if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabsf(b.real) >= fabsf(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                float r = b.imag / b.real;
+                float s = (float)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_float_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            float r = b.real / b.imag;
+            float s = (float)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_float_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            float denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_float_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrtf(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypotf(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+            __pyx_t_float_complex z;
+            float r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    float denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_float(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = powf(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2f(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_float(a);
+                theta = atan2f(a.imag, a.real);
+            }
+            lnr = logf(r);
+            z_r = expf(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cosf(z_theta);
+            z.imag = z_r * sinf(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* Declarations */
+  #if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return ::std::complex< double >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return x + y*(__pyx_t_double_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      __pyx_t_double_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+  #if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabs(b.real) >= fabs(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                double r = b.imag / b.real;
+                double s = (double)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_double_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            double r = b.real / b.imag;
+            double s = (double)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_double_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            double denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_double_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrt(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypot(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+            __pyx_t_double_complex z;
+            double r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    double denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_double(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = pow(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_double(a);
+                theta = atan2(a.imag, a.real);
+            }
+            lnr = log(r);
+            z_r = exp(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cos(z_theta);
+            z.imag = z_r * sin(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* CIntToPy */
+  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+  #if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+  static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionImport */
+  #ifndef __PYX_HAVE_RT_ImportFunction_0_29_37
+#define __PYX_HAVE_RT_ImportFunction_0_29_37
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, funcname);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C function %.200s",
+                PyModule_GetName(module), funcname);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    tmp.p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, desc);
+        goto bad;
+    }
+    tmp.p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    *f = tmp.fp;
+    if (!(*f))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
@@ -1,7 +1,10 @@
 from hazma.decay_helper_functions.decay_charged_pion cimport c_charged_pion_decay_spectrum_array
-from hazma.decay_helper_functions.decay_neutral_pion cimport c_neutral_pion_decay_spectrum_array
 from hazma.decay_helper_functions.decay_neutral_pion cimport c_neutral_pion_decay_spectrum_point
+from hazma.decay_helper_functions.decay_neutral_pion cimport c_neutral_pion_boosted_decay_spectrum_point
 from hazma.decay_helper_functions.decay_muon cimport c_muon_decay_spectrum_point
+from hazma.decay_helper_functions.rest_frame_spectra cimport RestFrameSpectra, boost_by_quad
+
+from functools import lru_cache
 
 import cython
 import numpy as np
@@ -27,35 +30,18 @@ cdef double qe = sqrt(4. * M_PI * ALPHA_EM)
 ctypedef np.ndarray ndarray
 
 cdef int n_interp_pts = 500
+# Number of photon energies of the rest-frame spectra, spanning eight decades
+# below the maximum photon energy ms / 2.
+cdef int n_srf_pts = 1601
 
-cdef np.ndarray e_gams = np.zeros((n_interp_pts,), dtype=np.float64)
-cdef np.ndarray spec_cp = np.zeros((n_interp_pts,), dtype=np.float64)
+# Number of spectrum objects of the most recently used mediator masses kept
+# in memory.
+DECAY_SPECTRUM_CACHE_SIZE = 32
 
 # ===================================================================
 # ---- Internal functions -------------------------------------------
 # ===================================================================
 
-# Sets a global array so that we don't need to recompute decay spectra 
-# for the charged pion unless the scalar mass has changed.
-
-cdef double __set_spectra(double ms):
-    global e_gams
-    global spec_cp
-    e_gams = np.logspace(-1.0, np.log10(ms / 2.0), num=n_interp_pts)
-    spec_cp = c_charged_pion_decay_spectrum_array(e_gams, ms / 2.0, 7)
-
-
-# Use interpolating function to compute charged pion spectrum.
-
-@cython.cdivision(True)
-@cython.boundscheck(True)
-@cython.wraparound(False)
-cdef double interp_spec_cp(double eng_gam):
-    if eng_gam < 10**-1:
-        return spec_cp[0] * e_gams[0] / eng_gam
-    return np.interp(eng_gam, e_gams, spec_cp)
-
-
 # Compute the FSR off the charged pion.
 
 @cython.cdivision(True)
@@ -114,7 +100,8 @@ cdef double dnde_fsr_l_srf(double egam, double ml, double ms):
     return 2 * result / ms
 
 
-# Integrand for the scalar mediator decay spectrum.
+# Integrand for the scalar mediator decay spectrum, used when the spectrum is
+# boosted by quadrature.
 
 @cython.cdivision(True)
 @cython.boundscheck(True)
@@ -123,11 +110,12 @@ cdef double integrand(
     double cl,
     double eng_gam,
     double eng_s,
-    double ms,
+    ScalarMediatorDecaySpectrum spectrum,
     np.ndarray[np.float64_t,ndim=1] pws,
     int bitflag
 ):
     cdef double result = 0.0
+    cdef double ms = spectrum.ms
     cdef double pwee = pws[0]
     cdef double pwmumu = pws[1]
     cdef double pwpi0pi0 = pws[2]
@@ -143,7 +131,7 @@ cdef double integrand(
     if bitflag & BITFLAG_PPG:
         result += pwpipi * dnde_fsr_cp_srf(eng_gam_srf, ms)
     if bitflag & BITFLAG_PP:
-        result += 2. * pwpipi * interp_spec_cp(eng_gam_srf)
+        result += 2. * pwpipi * spectrum.interp_spec_cp(eng_gam_srf)
     if bitflag & BITFLAG_P0P0:
         result += 2. * pwpi0pi0 * c_neutral_pion_decay_spectrum_point(eng_gam_srf, ms / 2.0)
     if bitflag & BITFLAG_MMG:
@@ -153,60 +141,220 @@ cdef double integrand(
 
     return jac * result
 
-# ===================================================================
-# ---- Pure Cython API functions ------------------------------------
-# ===================================================================
 
-# Compute the photon spectrum from the decay of the scalar-mediator.
-
-@cython.boundscheck(True)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef double c_scalar_mediator_decay_spectrum_point(
-    double eng_gam,
-    double eng_s,
-    double ms,
-    np.ndarray[np.float64_t,ndim=1] pws, 
-    int bitflag
-):
-    if eng_s < ms:
-        return 0.
+cdef int modes_to_bitflag(modes) except -1:
+    cdef int bitflag = 0
 
-    cdef double lines_contrib = 0.0
-    cdef double beta = sqrt(1. - pow(ms / eng_s, 2.))
-    cdef double gamma = eng_s / ms
+    if "pi pi" in modes:
+        bitflag += BITFLAG_PP
+    if "mu mu" in modes:
+        bitflag += BITFLAG_MM
+    if "pi0 pi0" in modes:
+        bitflag += BITFLAG_P0P0
+    if "g g" in modes:
+        bitflag += BITFLAG_GG
+    if "e e g" in modes:
+        bitflag += BITFLAG_EEG
+    if "pi pi g" in modes:
+        bitflag += BITFLAG_PPG
+    if "mu mu g" in modes:
+        bitflag += BITFLAG_MMG
+    return bitflag
 
-    cdef double eplus = eng_s * (1. + beta) / 2.0
-    cdef double eminus = eng_s * (1. - beta) / 2.0
-    cdef double result = 0.0
 
-    result = quad(integrand, -1.0, 1.0, points=[-1.0, 1.0],
-                args=(eng_gam, eng_s, ms, pws, bitflag), epsabs=10**-10.,
-                epsrel=10**-5.)[0]
+# ===================================================================
+# ---- Pure Cython API functions ------------------------------------
+# ===================================================================
 
-    if (bitflag & BITFLAG_GG) and (eminus <= eng_gam <= eplus):
-        result += pws[4] * 1. / (eng_s * beta)
+cdef class ScalarMediatorDecaySpectrum:
+    """
+    Photon spectrum from the decay of a scalar mediator with a given mass.
 
-    return result
+    The rest-frame spectra of the decay products are computed once, when the
+    object is created, and can be boosted to any mediator energy and weighted
+    by any partial widths. The object is not modified afterwards, so it can
+    be shared between threads.
 
+    Parameters
+    ----------
+    ms : float
+        Mass of the scalar mediator.
+    """
+    cdef readonly double ms
+    # Rest-frame spectra of "pi pi", "mu mu", "e e g", "pi pi g" and
+    # "mu mu g". The spectrum of the neutral pions is boosted in closed
+    # form and the photon line is added analytically.
+    cdef RestFrameSpectra spectra
+    # Spectrum of a charged pion with energy ms / 2, interpolated when the
+    # spectrum is boosted by quadrature.
+    cdef np.ndarray e_gams
+    cdef np.ndarray spec_cp
+
+    def __init__(self, double ms):
+        self.ms = ms
+        engs = np.geomspace(1e-8 * ms / 2.0, ms / 2.0, n_srf_pts)
+        self.spectra = RestFrameSpectra(engs, [
+            c_charged_pion_decay_spectrum_array(engs, ms / 2.0, 7),
+            [c_muon_decay_spectrum_point(e, ms / 2.0) for e in engs],
+            [dnde_fsr_l_srf(e, me, ms) for e in engs],
+            [dnde_fsr_cp_srf(e, ms) for e in engs],
+            [dnde_fsr_l_srf(e, mmu, ms) for e in engs],
+        ])
+        self.e_gams = np.logspace(-1.0, np.log10(ms / 2.0), num=n_interp_pts)
+        self.spec_cp = c_charged_pion_decay_spectrum_array(self.e_gams, ms / 2.0, 7)
+
+    # Use interpolating function to compute charged pion spectrum.
+
+    @cython.cdivision(True)
+    cdef double interp_spec_cp(self, double eng_gam) except *:
+        if eng_gam < 10**-1:
+            return self.spec_cp[0] * self.e_gams[0] / eng_gam
+        return np.interp(eng_gam, self.e_gams, self.spec_cp)
+
+    # Compute the photon spectrum from the decay of the scalar-mediator.
+
+    @cython.boundscheck(True)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef double c_point_quad(
+        self,
+        double eng_gam,
+        double eng_s,
+        np.ndarray[np.float64_t,ndim=1] pws,
+        int bitflag
+    ) except *:
+        cdef double ms = self.ms
+        if eng_s < ms:
+            return 0.
+
+        cdef double beta = sqrt(1. - pow(ms / eng_s, 2.))
+        cdef double eplus = eng_s * (1. + beta) / 2.0
+        cdef double eminus = eng_s * (1. - beta) / 2.0
+        cdef double result = 0.0
+
+        result = quad(integrand, -1.0, 1.0, points=[-1.0, 1.0],
+                    args=(eng_gam, eng_s, self, pws, bitflag), epsabs=10**-10.,
+                    epsrel=10**-5.)[0]
+
+        if (bitflag & BITFLAG_GG) and (eminus <= eng_gam <= eplus):
+            result += pws[4] * 1. / (eng_s * beta)
+
+        return result
+
+    @cython.boundscheck(True)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef np.ndarray c_array(
+        self,
+        np.ndarray[np.float64_t,ndim=1] photon_energies,
+        double eng_s,
+        np.ndarray[np.float64_t,ndim=1] pws,
+        int bitflag
+    ):
+        cdef int i
+        cdef int npts = photon_energies.shape[0]
+        cdef double ms = self.ms
+        cdef double gamma = eng_s / ms
+        cdef double beta
+        cdef double eng_gam
+        cdef np.ndarray[np.float64_t,ndim=1] spec
+        cdef np.ndarray[np.float64_t,ndim=1] weights
+
+        if eng_s < ms:
+            return np.zeros_like(photon_energies)
+
+        if boost_by_quad():
+            spec = np.zeros_like(photon_energies)
+            for i in range(npts):
+                spec[i] = self.c_point_quad(photon_energies[i], eng_s, pws, bitflag)
+            return spec
+
+        weights = np.array([
+            2. * pws[3] * (bitflag & BITFLAG_PP != 0),
+            2. * pws[1] * (bitflag & BITFLAG_MM != 0),
+            pws[0] * (bitflag & BITFLAG_EEG != 0),
+            pws[3] * (bitflag & BITFLAG_PPG != 0),
+            pws[1] * (bitflag & BITFLAG_MMG != 0),
+        ])
+        spec = self.spectra.c_boosted_modes_array(photon_energies, eng_s, ms, weights)
+
+        beta = sqrt(1. - pow(ms / eng_s, 2.))
+        for i in range(npts):
+            eng_gam = photon_energies[i]
+            if bitflag & BITFLAG_P0P0:
+                spec[i] += 2. * pws[2] * c_neutral_pion_boosted_decay_spectrum_point(
+                    eng_gam, ms / 2.0, gamma, beta
+                )
+            if (bitflag & BITFLAG_GG) and (eng_s * (1. - beta) / 2.0 <= eng_gam <= eng_s * (1. + beta) / 2.0):
+                spec[i] += pws[4] * 1. / (eng_s * beta)
+        return spec
+
+    def __call__(
+        self,
+        photon_energies,
+        sm_energy,
+        partial_widths,
+        modes=["pi pi", "mu mu", "pi0 pi0", "g g", "e e g", "pi pi g", "mu mu g"]
+    ):
+        """
+        Compute the gamma ray spectrum from the decay of the scalar mediator.
+
+        Parameters
+        ----------
+        photon_energies : float or array-like
+            Gamma-ray energies to evaluate spectrum at.
+        sm_energy : float
+            Energy of the scalar mediator.
+        partial_widths: List[float]
+            Partial widths of the scalar mediator.
+        modes: List[str], optional
+            List of modes to compute spectrum for. Entries can be:
+            "pi pi", "mu mu", "pi0 pi0", "g g", "e e g", "pi pi g",
+            and/or "mu mu g". Default is all of these.
+
+        Returns
+        -------
+        dnde : float or array-like
+            Value of dnde at gamma-ray energies `photon_energies`.
+        """
+        if not hasattr(partial_widths, '__len__'):
+            raise ValueError("Partial widths must be a list or array.")
+        pws = np.array(partial_widths, dtype=np.float64)
+        assert len(pws.shape) == 1, "Partial widths must be 1-dimensional."
+        cdef int bitflag = modes_to_bitflag(modes)
+
+        if hasattr(photon_energies, '__len__'):
+            energies = np.array(photon_energies, dtype=np.float64)
+            assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
+            return self.c_array(energies, sm_energy, pws, bitflag)
+        return self.c_array(np.array([photon_energies], dtype=np.float64), sm_energy, pws, bitflag)[0]
+
+
+@lru_cache(maxsize=DECAY_SPECTRUM_CACHE_SIZE)
+def __cached_spectrum(double ms, bint by_quad):
+    return ScalarMediatorDecaySpectrum(ms)
+
+
+def decay_spectrum(double ms):
+    """
+    Returns the spectrum object of a scalar mediator with mass `ms`.
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef np.ndarray[np.float64_t,ndim=1] c_scalar_mediator_decay_spectrum_array(
-    np.ndarray[np.float64_t,ndim=1] photon_energies, 
-    double sm_energy, 
-    double sm_mass,
-    np.ndarray[np.float64_t,ndim=1] pws, 
-    int bitflag
-):
-    cdef int npts = photon_energies.shape[0]
-    cdef np.ndarray[np.float64_t,ndim=1] spec = np.zeros_like(photon_energies)
+    The objects of the `DECAY_SPECTRUM_CACHE_SIZE` most recently used masses
+    are cached, so repeated calls with the same mass do not tabulate the
+    rest-frame spectra again.
 
-    for i in range(npts):
-        spec[i] = c_scalar_mediator_decay_spectrum_point(photon_energies[i], sm_energy, sm_mass, pws, bitflag)
-    return spec
+    Parameters
+    ----------
+    ms : float
+        Mass of the scalar mediator.
 
+    Returns
+    -------
+    spectrum : ScalarMediatorDecaySpectrum
+        Spectrum object of the scalar mediator.
+    """
+    # The tabulated pion spectrum depends on the boost method.
+    return __cached_spectrum(ms, boost_by_quad())
 
 
 @cython.boundscheck(True)
@@ -216,7 +364,8 @@ def scalar_mediator_decay_spectrum(
     sm_energy, 
     sm_mass, 
     partial_widths, 
-    modes=["pi pi", "mu mu", "pi0 pi0", "g g", "e e g", "pi pi g", "mu mu g"]
+    modes=["pi pi", "mu mu", "pi0 pi0", "g g", "e e g", "pi pi g", "mu mu g"],
+    spectrum=None,
 ):
     """
     Compute the gamma ray spectrum from the decay of the scalar mediator.
@@ -235,37 +384,21 @@ def scalar_mediator_decay_spectrum(
         List of modes to compute spectrum for. Entries can be:
         "pi pi", "mu mu", "pi0 pi0", "g g", "e e g", "pi pi g", 
         and/or "mu mu g". Default is all of these.
+    spectrum: ScalarMediatorDecaySpectrum, optional
+        Precomputed spectrum for the mass `sm_mass`. If None, the cached
+        spectrum of this mass is used.
 
     Returns
     -------
     dnde : float or array-like
         Value of dnde at gamma-ray energy `eng_gam`.
     """
-    __set_spectra(sm_mass)
-    cdef int bitflag = 0
-
-    if not hasattr(partial_widths, '__len__'):
-        raise ValueError("Partial widths must be a list or array.")
-    pws = np.array(partial_widths)
-    assert len(pws.shape) == 1, "Partial widths must be 1-dimensional."
-
-    if "pi pi" in modes:
-        bitflag += BITFLAG_PP
-    if "mu mu" in modes:
-        bitflag += BITFLAG_MM
-    if "pi0 pi0" in modes:
-        bitflag += BITFLAG_P0P0
-    if "g g" in modes:
-        bitflag += BITFLAG_GG
-    if "e e g" in modes:
-        bitflag += BITFLAG_EEG
-    if "pi pi g" in modes:
-        bitflag += BITFLAG_PPG
-    if "mu mu g" in modes:
-        bitflag += BITFLAG_MMG
-
-    if hasattr(photon_energies, '__len__'):
-        energies = np.array(photon_energies)
-        assert len(energies.shape) == 1, "Photon energies must be 0 or 1-dimensional."
-        return c_scalar_mediator_decay_spectrum_array(energies, sm_energy, sm_mass, pws, bitflag)
-    return c_scalar_mediator_decay_spectrum_point(photon_energies, sm_energy, sm_mass, pws, bitflag)
+    if spectrum is None:
+        spectrum = decay_spectrum(sm_mass)
+    elif spectrum.ms != sm_mass:
+        raise ValueError(
+            "Spectrum was computed for a mediator mass of {} MeV, not {} MeV.".format(
+                spectrum.ms, sm_mass
+            )
+        )
+    return spectrum(photon_energies, sm_energy, partial_widths, modes)
@@ -8,9 +8,12 @@ from hazma.parameters import convolved_spectrum_fn
 from hazma.theory._theory_cmb import TheoryCMB
 from hazma.theory._theory_constrain import TheoryConstrain
 from hazma.theory._theory_gamma_ray_limits import TheoryGammaRayLimits
+from hazma.theory._theory_limit_curves import TheoryLimitCurves
 
 
-class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
+class TheoryAnn(
+    TheoryGammaRayLimits, TheoryLimitCurves, TheoryCMB, TheoryConstrain
+):
     """
     Represents a sub-GeV DM theory.
     """
@@ -246,7 +249,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
         return lines
 
     def total_conv_spectrum_fn(
-        self, e_gam_min, e_gam_max, e_cm, energy_res, n_pts=1000
+        self, e_gam_min, e_gam_max, e_cm, energy_res, n_pts=1000, include_lines=True
     ):
         r"""
         Computes the total gamma-ray spectrum convolved with an energy
@@ -268,6 +271,10 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
             More points gives higher accuracy at the cost of computing time,
             but is necessary if the continuum spectrum contains very sharp
             features.
+        include_lines : bool {True]
+            If False, only the continuum is included. Integrals of the lines
+            over energy windows are better computed exactly with
+            ``hazma.parameters.line_integrals``.
 
         Returns
         -------
@@ -281,7 +288,7 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
             e_gam_max,
             energy_res,
             lambda e_gams: self.total_spectrum(e_gams, e_cm),
-            self.gamma_ray_lines(e_cm),
+            self.gamma_ray_lines(e_cm) if include_lines else None,
             n_pts,
         )
 
@@ -451,7 +458,9 @@ class TheoryAnn(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
         )
 
 
-class TheoryDec(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
+class TheoryDec(
+    TheoryGammaRayLimits, TheoryLimitCurves, TheoryCMB, TheoryConstrain
+):
 
     __metaclass__ = ABCMeta
 
@@ -581,13 +590,15 @@ class TheoryDec(TheoryGammaRayLimits, TheoryCMB, TheoryConstrain):
 
         return lines
 
-    def total_conv_spectrum_fn(self, e_gam_min, e_gam_max, energy_res, n_pts=1000):
+    def total_conv_spectrum_fn(
+        self, e_gam_min, e_gam_max, energy_res, n_pts=1000, include_lines=True
+    ):
         return convolved_spectrum_fn(
             e_gam_min,
             e_gam_max,
             energy_res,
             self.total_spectrum,
-            self.gamma_ray_lines(),
+            self.gamma_ray_lines() if include_lines else None,
             n_pts,
         )
 
@@ -3,6 +3,8 @@ from skimage import measure
 
 import numpy as np
 
+from hazma.parameters import line_integrals
+
 
 class TheoryConstrain:
     def custom_constrain(self, param_grid, ls_or_img="image"):
@@ -128,42 +130,34 @@ class TheoryConstrain:
                 / (2 * f_dm * self.mx ** 2 * 4 * np.pi)
             )
             dnde_conv = self.total_conv_spectrum_fn(
-                e_min, e_max, e_cm, measurement.energy_res
+                e_min, e_max, e_cm, measurement.energy_res, include_lines=False
             )
+            lines = self.gamma_ray_lines(e_cm)
         elif self.kind == "dec":
             raise NotImplementedError()
 
-        def bin_constraint(e_low, e_high, phi, sigma):
-            """Subroutine to compute limit in a single bin."""
-            # Compute integrated flux from DM annihilation
-            phi_dm = dm_flux_factor * dnde_conv.integral(e_low, e_high)
-
-            # If flux is finite and nonzero, set a limit
-            if not np.isnan(phi_dm) and phi_dm > 0:
-                # Compute maximum allow integrated flux
-                phi_max = (
-                    measurement.target.dOmega
-                    * (e_high - e_low)
-                    * (n_sigma * sigma + phi)
-                )
-                assert phi_max > 0
-                return phi_max - phi_dm
-            else:
-                return np.inf
-
-        # Compute limits for each bin
-        bin_constraints = []
-
-        for (e_low, e_high, phi, sigma) in zip(
-            measurement.e_lows,
-            measurement.e_highs,
-            measurement.fluxes,
-            measurement.upper_errors,
-        ):
-            bin_constraints.append(bin_constraint(e_low, e_high, phi, sigma))
+        # Compute integrated flux from DM annihilation in each bin
+        phi_dms = dm_flux_factor * (
+            self._bin_integrals(dnde_conv, measurement.e_lows, measurement.e_highs)
+            + line_integrals(
+                lines, measurement.energy_res, measurement.e_lows, measurement.e_highs
+            )
+        )
+
+        # Compute maximum allowed integrated flux in each bin
+        phi_maxs = (
+            measurement.target.dOmega
+            * (measurement.e_highs - measurement.e_lows)
+            * (n_sigma * measurement.upper_errors + measurement.fluxes)
+        )
+
+        # Set limits in bins where the flux is finite and nonzero
+        has_flux = ~np.isnan(phi_dms) & (phi_dms > 0)
+        assert np.all(phi_maxs[has_flux] > 0)
+        bin_constraints = np.where(has_flux, phi_maxs - phi_dms, np.inf)
 
         if method == "1bin":
-            return min(bin_constraints)
+            return np.min(bin_constraints)
         else:
             raise NotImplementedError()
 
@@ -1,9 +1,10 @@
-from math import sqrt, pi
+from math import pi
 import numpy as np
-from scipy.optimize import root_scalar
 from scipy.interpolate import InterpolatedUnivariateSpline
 from scipy.stats import chi2, norm
 
+from hazma.parameters import line_integrals
+
 
 class TheoryGammaRayLimits:
     def _get_product_spline(self, f1, f2, grid, k=1, ext="raise"):
@@ -30,6 +31,152 @@ class TheoryGammaRayLimits:
         """
         return InterpolatedUnivariateSpline(grid, f1(grid) * f2(grid), k=k, ext=ext)
 
+    def _bin_integrals(self, spl, e_lows, e_highs):
+        """Integrates a spline over many bins at once.
+
+        Parameters
+        ----------
+        spl : InterpolatedUnivariateSpline
+            The spline to integrate.
+        e_lows, e_highs : numpy.array
+            Lower and upper bounds of the bins.
+
+        Returns
+        -------
+        integrals : numpy.array
+            Integrals of the spline over the bins, computed as differences of
+            its antiderivative.
+        """
+        antideriv = spl.antiderivative()
+        return antideriv(np.asarray(e_highs)) - antideriv(np.asarray(e_lows))
+
+    def _dm_flux_factor(self, target, mx=None):
+        """Returns the factor converting dN/dE into a flux per unit
+        <sigma v> (annihilation) or per unit width (decay).
+
+        Parameters
+        ----------
+        target : TargetParams
+            Object containing information about the observation target.
+        mx : float or numpy.array {None]
+            Dark matter masses. Defaults to the theory's mass.
+        """
+        mx = self.mx if mx is None else np.asarray(mx)
+
+        # Factor of 2 comes from DM not being self-conjugate.
+        if self.kind == "ann":
+            f_dm = 2.0
+            return target.J * target.dOmega / (2.0 * f_dm * mx ** 2 * 4.0 * pi)
+        elif self.kind == "dec":
+            return target.D * target.dOmega / (mx * 4.0 * pi)
+
+    def _binned_limits(self, measurement, Phi_dms_un, n_sigma, method):
+        """Computes binned limits from the integrated fluxes in each bin.
+
+        Parameters
+        ----------
+        measurement : FluxMeasurement
+            Information about the flux measurement and target.
+        Phi_dms_un : numpy.array
+            Integrated fluxes (excluding <sigma v>) in each bin, with shape
+            (..., n_bins).
+        n_sigma : float
+            See the notes for ``binned_limit``.
+        method : str
+            See ``binned_limit``.
+
+        Returns
+        -------
+        limits : numpy.array
+            Limits on <sigma v>, with shape (...).
+        bins : numpy.array
+            Index of the bin setting each limit. -1 if no bin sets a limit or
+            for the "chi2" method, which combines all bins.
+        """
+        if method == "1bin":
+            # Maximum allowed integrated flux in each bin
+            Phi_maxs = (
+                measurement.target.dOmega
+                * (measurement.e_highs - measurement.e_lows)
+                * (n_sigma * measurement.upper_errors + measurement.fluxes)
+            )
+
+            # Return the most stringent limit
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sv_lims = Phi_maxs / Phi_dms_un
+            sv_lims[np.isnan(sv_lims) | (Phi_dms_un <= 0)] = np.inf
+            bins = np.argmin(sv_lims, axis=-1)
+            limits = np.min(sv_lims, axis=-1)
+            return limits, np.where(np.isinf(limits), -1, bins)
+        elif method == "chi2":
+            # Observed integrated fluxes
+            Phi_obss = (
+                measurement.target.dOmega
+                * (measurement.e_highs - measurement.e_lows)
+                * measurement.fluxes
+            )
+            # Errors on integrated fluxes
+            Sigmas = (
+                measurement.target.dOmega
+                * (measurement.e_highs - measurement.e_lows)
+                * measurement.upper_errors
+            )
+
+            chi2_obs = np.sum(
+                np.maximum(Phi_dms_un - Phi_obss, 0) ** 2 / Sigmas ** 2, axis=-1
+            )
+
+            # Convert n_sigma to chi^2 critical value
+            p_val = norm.cdf(n_sigma)
+            chi2_crit = chi2.ppf(p_val, df=Phi_dms_un.shape[-1])
+            with np.errstate(divide="ignore"):
+                limits = np.where(
+                    chi2_obs == 0, np.inf, np.sqrt(chi2_crit / chi2_obs)
+                )
+            return limits, np.full(limits.shape, -1)
+        else:
+            raise NotImplementedError()
+
+    def _best_windows(self, I_S, I_B):
+        """Finds the energy windows maximizing the signal-to-noise ratio.
+
+        Parameters
+        ----------
+        I_S : numpy.array
+            Cumulative numbers of signal photons (up to normalization) on a
+            grid of energies, with shape (..., n_grid).
+        I_B : numpy.array
+            Cumulative numbers of background photons on the grid.
+
+        Returns
+        -------
+        snrs : numpy.array
+            Largest signal-to-noise ratios, with shape (...). NaN where no
+            window has a defined ratio.
+        idx_lows, idx_highs : numpy.array
+            Indices of the grid points bounding the best windows, or -1.
+        """
+        # Numbers of photons in every window [e_grid[i], e_grid[j]] with i < j
+        idx_lows, idx_highs = np.triu_indices(I_S.shape[-1], 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            snrs = (I_S[..., idx_highs] - I_S[..., idx_lows]) / np.sqrt(
+                I_B[..., idx_highs] - I_B[..., idx_lows]
+            )
+
+        if snrs.shape[-1] == 0:
+            nans = np.full(snrs.shape[:-1], np.nan)
+            return nans, np.full(nans.shape, -1), np.full(nans.shape, -1)
+
+        valid = ~np.all(np.isnan(snrs), axis=-1)
+        i_best = np.argmax(np.where(np.isnan(snrs), -np.inf, snrs), axis=-1)
+        best = np.take_along_axis(snrs, i_best[..., np.newaxis], axis=-1)[..., 0]
+        best = np.where(valid, best, np.nan)
+        return (
+            best,
+            np.where(valid, idx_lows[i_best], -1),
+            np.where(valid, idx_highs[i_best], -1),
+        )
+
     def binned_limit(self, measurement, n_sigma=2.0, method="1bin"):
         r"""
         Determines the limit on :math:`<sigma v>` from gamma-ray data.
@@ -63,73 +210,34 @@ class TheoryGammaRayLimits:
         """
         e_min, e_max = measurement.e_lows[0], measurement.e_highs[-1]
 
-        # Factor to convert dN/dE to Phi. Factor of 2 comes from DM not being
-        # self-conjugate.
-        if self.kind == "ann":
-            f_dm = 2.0
-            dm_flux_factor = (
-                measurement.target.J
-                * measurement.target.dOmega
-                / (2.0 * f_dm * self.mx ** 2 * 4.0 * pi)
-            )
+        # Factor to convert dN/dE to Phi
+        dm_flux_factor = self._dm_flux_factor(measurement.target)
 
+        if self.kind == "ann":
             # TODO: this should depend on the target!
             e_cm = 2.0 * self.mx * (1.0 + 0.5 * measurement.target.vx ** 2)
             dnde_conv = self.total_conv_spectrum_fn(
-                e_min, e_max, e_cm, measurement.energy_res
+                e_min, e_max, e_cm, measurement.energy_res, include_lines=False
             )
+            lines = self.gamma_ray_lines(e_cm)
         elif self.kind == "dec":
             # e_cm = self.mx
-            dm_flux_factor = (
-                measurement.target.D * measurement.target.dOmega / (self.mx * 4.0 * pi)
-            )
             dnde_conv = self.total_conv_spectrum_fn(
-                e_min, e_max, measurement.energy_res
-            )
-
-        # Integrated flux (excluding <sigma v>) from DM processes in each bin
-        Phi_dms_un = []
-        for e_low, e_high in zip(measurement.e_lows, measurement.e_highs):
-            Phi_dms_un.append(dm_flux_factor * dnde_conv.integral(e_low, e_high))
-        Phi_dms_un = np.array(Phi_dms_un)
-
-        if method == "1bin":
-            # Maximum allowed integrated flux in each bin
-            Phi_maxs = (
-                measurement.target.dOmega
-                * (measurement.e_highs - measurement.e_lows)
-                * (n_sigma * measurement.upper_errors + measurement.fluxes)
-            )
-
-            # Return the most stringent limit
-            sv_lims = Phi_maxs / Phi_dms_un
-            sv_lims[np.isnan(sv_lims) | (Phi_dms_un <= 0)] = np.inf
-            return np.min(sv_lims)
-        elif method == "chi2":
-            # Observed integrated fluxes
-            Phi_obss = (
-                measurement.target.dOmega
-                * (measurement.e_highs - measurement.e_lows)
-                * measurement.fluxes
+                e_min, e_max, measurement.energy_res, include_lines=False
             )
-            # Errors on integrated fluxes
-            Sigmas = (
-                measurement.target.dOmega
-                * (measurement.e_highs - measurement.e_lows)
-                * measurement.upper_errors
+            lines = self.gamma_ray_lines()
+
+        # Integrated flux (excluding <sigma v>) from DM processes in each bin.
+        # The lines are integrated exactly rather than on the grid.
+        Phi_dms_un = dm_flux_factor * (
+            self._bin_integrals(dnde_conv, measurement.e_lows, measurement.e_highs)
+            + line_integrals(
+                lines, measurement.energy_res, measurement.e_lows, measurement.e_highs
             )
+        )
 
-            chi2_obs = np.sum(np.maximum(Phi_dms_un - Phi_obss, 0) ** 2 / Sigmas ** 2)
-
-            if chi2_obs == 0:
-                return np.inf
-            else:
-                # Convert n_sigma to chi^2 critical value
-                p_val = norm.cdf(n_sigma)
-                chi2_crit = chi2.ppf(p_val, df=len(Phi_dms_un))
-                return sqrt(chi2_crit / chi2_obs)
-        else:
-            raise NotImplementedError()
+        limits, _ = self._binned_limits(measurement, Phi_dms_un, n_sigma, method)
+        return float(limits)
 
     def unbinned_limit(
         self,
@@ -176,6 +284,13 @@ class TheoryGammaRayLimits:
             Object containing information about the observation target.
         bg_model : BackgroundModel
             Object representing a gamma ray background model.
+        e_grid : numpy.array {None]
+            Increasing grid of energies whose pairs are the candidate
+            energy windows. Defaults to `n_grid` logarithmically spaced
+            energies spanning the effective area.
+        n_grid : int {20]
+            Number of points of the default `e_grid`. Since all windows are
+            computed at once from cumulative integrals, fine grids are cheap.
         n_sigma : float
             Number of standard deviations the signal must be above the
             background to be considered detectable
@@ -194,26 +309,18 @@ class TheoryGammaRayLimits:
         if self.kind == "ann":
             # TODO: this should depend on the target!
             e_cm = 2.0 * self.mx * (1.0 + 0.5 * target.vx ** 2)
-            dnde_conv = self.total_conv_spectrum_fn(e_min, e_max, e_cm, energy_res)
+            dnde_conv = self.total_conv_spectrum_fn(
+                e_min, e_max, e_cm, energy_res, include_lines=False
+            )
+            lines = self.gamma_ray_lines(e_cm)
         elif self.kind == "dec":
-            dnde_conv = self.total_conv_spectrum_fn(e_min, e_max, energy_res)
-
-        # Insert appropriate prefactors to convert result to <sigma v>_tot. The
-        # factor of 2 is from the DM not being self-conjugate.
-        if self.kind == "ann":
-            f_dm = 2.0  # TODO: refactor
-            prefactor = 2.0 * f_dm * self.mx ** 2
-        else:
-            prefactor = self.mx
-
-        prefactor *= (
-            4.0
-            * pi
-            / (
-                np.sqrt(T_obs * target.dOmega)
-                * (target.J if self.kind == "ann" else target.D)
+            dnde_conv = self.total_conv_spectrum_fn(
+                e_min, e_max, energy_res, include_lines=False
             )
-        )
+            lines = self.gamma_ray_lines()
+
+        # Insert appropriate prefactors to convert result to <sigma v>_tot
+        prefactor = np.sqrt(target.dOmega / T_obs) / self._dm_flux_factor(target)
 
         # Integrating these gives the number of signal and background photons,
         # up to normalization
@@ -225,20 +332,25 @@ class TheoryGammaRayLimits:
         # Optimize energy window
         if e_grid is None:
             e_grid = np.geomspace(e_min, e_max, n_grid)
-
-        snrs = []
-        for i, e_low in enumerate(e_grid[:-1]):
-            for e_high in e_grid[i + 1 :]:
-                assert e_low < e_high, (e_low, ", ", e_high)
-                I_S_val = integrand_S.integral(e_low, e_high)
-                I_B_val = integrand_B.integral(e_low, e_high)
-                snrs.append([e_low, e_high, I_S_val / np.sqrt(I_B_val)])
-
-        snrs = np.stack(snrs)
+        e_grid = np.asarray(e_grid, dtype=np.float64)
+        assert np.all(np.diff(e_grid) > 0), "e_grid must be increasing"
+
+        # Cumulative numbers of signal and background photons on the grid.
+        # The lines are integrated exactly, weighted by the effective area
+        # at their energies.
+        I_S = integrand_S.antiderivative()(e_grid) + line_integrals(
+            lines, energy_res, -np.inf, e_grid, effective_area=A_eff
+        )
+        I_B = integrand_B.antiderivative()(e_grid)
 
         # Find best energy window
-        try:
-            bound = prefactor * n_sigma / np.nanmax(snrs[:, 2])
-            return bound
-        except:
+        snr, idx_low, idx_high = self._best_windows(I_S, I_B)
+        if np.isnan(snr):
             return np.inf
+        if debug_msgs:
+            print(
+                "Best energy window: [{}, {}] MeV".format(
+                    e_grid[idx_low], e_grid[idx_high]
+                )
+            )
+        return prefactor * n_sigma / float(snr)
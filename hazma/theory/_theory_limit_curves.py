@@ -0,0 +1,246 @@
+import copy
+
+import numpy as np
+
+from hazma.cmb import p_ann_planck_temp_pol
+from hazma.parallel import parallel_map
+from hazma.parameters import DetectorResponse, line_integrals
+
+
+def _with_mass(theory, mx):
+    """Returns a shallow copy of a theory with a different DM mass."""
+    theory = copy.copy(theory)
+    theory.mx = mx
+    return theory
+
+
+def _gamma_ray_spectrum(theory, mx, e_gams, target):
+    """Computes the continuum gamma-ray spectrum and lines for one DM mass."""
+    theory = _with_mass(theory, mx)
+    if theory.kind == "ann":
+        # TODO: this should depend on the target!
+        e_cm = 2.0 * mx * (1.0 + 0.5 * target.vx ** 2)
+        return theory.total_spectrum(e_gams, e_cm), theory.gamma_ray_lines(e_cm)
+    elif theory.kind == "dec":
+        return theory.total_spectrum(e_gams), theory.gamma_ray_lines()
+
+
+def _cmb_limit(theory, mx, x_kd, p_ann):
+    """Computes the CMB limit for one DM mass."""
+    return _with_mass(theory, mx).cmb_limit(x_kd=x_kd, p_ann=p_ann)
+
+
+def _cumulative_integrals(es, dndes, e_evals):
+    """Integrates piecewise-linear spectra from the start of their grid.
+
+    Parameters
+    ----------
+    es : numpy.array
+        Increasing grid of energies.
+    dndes : numpy.array
+        Spectra on the grid, with shape (..., len(es)).
+    e_evals : numpy.array
+        Upper bounds of the integrals, inside of [es[0], es[-1]].
+
+    Returns
+    -------
+    integrals : numpy.array
+        Integrals of the linear interpolants of the spectra, with shape
+        (..., len(e_evals)). These match the integrals of the degree 1 splines
+        returned by ``convolved_spectrum_fn``.
+    """
+    e_evals = np.asarray(e_evals, dtype=np.float64)
+    if np.any((e_evals < es[0]) | (e_evals > es[-1])):
+        raise ValueError("energies must lie inside of the grid of the spectra")
+
+    widths = np.diff(es)
+    cumulative = np.zeros(dndes.shape)
+    cumulative[..., 1:] = np.cumsum(
+        0.5 * widths * (dndes[..., 1:] + dndes[..., :-1]), axis=-1
+    )
+
+    idxs = np.clip(np.searchsorted(es, e_evals, side="right") - 1, 0, len(es) - 2)
+    ts = e_evals - es[idxs]
+    slopes = (dndes[..., idxs + 1] - dndes[..., idxs]) / widths[idxs]
+    return cumulative[..., idxs] + dndes[..., idxs] * ts + 0.5 * slopes * ts ** 2
+
+
+class TheoryLimitCurves:
+    def limit_curve(self, mxs, limit, *args, parallel=False, n_pts=1000, **kwargs):
+        r"""
+        Computes a limit for an array of DM masses.
+
+        This gives the same results as setting ``mx`` to each mass and
+        calling ``binned_limit``, ``unbinned_limit`` or ``cmb_limit``, up to
+        the accuracy of the interpolation of the spectra. The gamma-ray
+        spectra of all masses are tabulated on the grid of a single
+        ``DetectorResponse``, convolved together and integrated over all bins
+        or energy windows at once. The theory itself is not modified.
+
+        Parameters
+        ----------
+        mxs : numpy.array
+            DM masses in MeV.
+        limit : str
+            Limit to compute: "binned", "unbinned" or "cmb".
+        *args, **kwargs
+            Arguments of the method computing the limit for a single mass,
+            e.g. the measurement for "binned".
+        parallel : bool {False]
+            If True, the spectra for different masses are computed by the
+            workers of ``hazma.parallel``. The theory must then be picklable.
+        n_pts : int {1000]
+            Number of points of the grids of the ``DetectorResponse``.
+
+        Returns
+        -------
+        limits : numpy.array
+            Limit for each mass. See the method for a single mass.
+        diagnostics : dict(str, numpy.array)
+            Additional information about each limit. For "binned", "bin" is
+            the index of the bin setting the limit (-1 if none does, or for
+            the "chi2" method). For "unbinned", "e_low" and "e_high" are the
+            bounds of the best energy window (NaN if there is none) and "snr"
+            is its signal-to-noise ratio up to normalization. This is empty
+            for "cmb".
+
+        Examples
+        --------
+
+        Limits from COMPTEL over a range of masses::
+
+            from hazma.gamma_ray_parameters import comptel_diffuse
+            mxs = np.geomspace(1.0, 250.0, 50)
+            limits, diagnostics = model.limit_curve(mxs, "binned", comptel_diffuse)
+
+        """
+        mxs = np.asarray(mxs, dtype=np.float64)
+        assert len(mxs.shape) == 1, "DM masses must be 1-dimensional."
+
+        if limit == "binned":
+            return self._binned_limit_curve(
+                mxs, *args, parallel=parallel, n_pts=n_pts, **kwargs
+            )
+        elif limit == "unbinned":
+            return self._unbinned_limit_curve(
+                mxs, *args, parallel=parallel, n_pts=n_pts, **kwargs
+            )
+        elif limit == "cmb":
+            return self._cmb_limit_curve(mxs, *args, parallel=parallel, **kwargs)
+        else:
+            raise ValueError(
+                "Invalid limit '{}'. Use 'binned', 'unbinned' or 'cmb'.".format(limit)
+            )
+
+    def _gamma_ray_spectra(self, mxs, e_gams, target, parallel):
+        """Computes the continuum spectra and lines for each DM mass."""
+        results = parallel_map(
+            _gamma_ray_spectrum,
+            [(self, mx, e_gams, target) for mx in mxs],
+            parallel=parallel,
+        )
+        dndes = np.array([dnde for dnde, _ in results], dtype=np.float64)
+        return dndes.reshape(len(mxs), len(e_gams)), [lines for _, lines in results]
+
+    def _binned_limit_curve(
+        self, mxs, measurement, n_sigma=2.0, method="1bin", *, parallel, n_pts
+    ):
+        e_lows, e_highs = measurement.e_lows, measurement.e_highs
+        response = DetectorResponse.get(
+            e_lows[0], e_highs[-1], measurement.energy_res, n_pts
+        )
+        dnde_srcs, lines = self._gamma_ray_spectra(
+            mxs, response.source_energies, measurement.target, parallel
+        )
+        dnde_convs = response.apply(dnde_srcs)
+
+        # Integrated flux (excluding <sigma v>) in each bin for each mass
+        Phi_dms_un = _cumulative_integrals(
+            response.energies, dnde_convs, e_highs
+        ) - _cumulative_integrals(response.energies, dnde_convs, e_lows)
+        Phi_dms_un += np.array(
+            [
+                line_integrals(ls, measurement.energy_res, e_lows, e_highs)
+                for ls in lines
+            ]
+        ).reshape(Phi_dms_un.shape)
+        Phi_dms_un *= self._dm_flux_factor(measurement.target, mxs)[:, np.newaxis]
+
+        limits, bins = self._binned_limits(measurement, Phi_dms_un, n_sigma, method)
+        return limits, {"bin": bins}
+
+    def _unbinned_limit_curve(
+        self,
+        mxs,
+        A_eff,
+        energy_res,
+        T_obs,
+        target,
+        bg_model,
+        e_grid=None,
+        n_grid=20,
+        n_sigma=5.0,
+        debug_msgs=False,
+        *,
+        parallel,
+        n_pts,
+    ):
+        e_min, e_max = A_eff.x[[0, -1]]
+        response = DetectorResponse.get(e_min, e_max, energy_res, n_pts)
+        dnde_srcs, lines = self._gamma_ray_spectra(
+            mxs, response.source_energies, target, parallel
+        )
+
+        # Integrating these gives the number of signal and background photons,
+        # up to normalization
+        areas = A_eff(response.energies)
+        integrand_S = response.apply(dnde_srcs) * areas
+        integrand_B = bg_model.dPhi_dEdOmega(response.energies) * areas
+
+        if e_grid is None:
+            e_grid = np.geomspace(e_min, e_max, n_grid)
+        e_grid = np.asarray(e_grid, dtype=np.float64)
+        assert np.all(np.diff(e_grid) > 0), "e_grid must be increasing"
+
+        # Cumulative numbers of photons on the grid, with the lines integrated
+        # exactly
+        I_S = _cumulative_integrals(response.energies, integrand_S, e_grid)
+        I_S += np.array(
+            [
+                line_integrals(ls, energy_res, -np.inf, e_grid, effective_area=A_eff)
+                for ls in lines
+            ]
+        ).reshape(I_S.shape)
+        I_B = _cumulative_integrals(response.energies, integrand_B, e_grid)
+
+        snrs, idx_lows, idx_highs = self._best_windows(I_S, I_B)
+        prefactors = np.sqrt(target.dOmega / T_obs) / self._dm_flux_factor(
+            target, mxs
+        )
+        with np.errstate(divide="ignore"):
+            limits = np.where(np.isnan(snrs), np.inf, prefactors * n_sigma / snrs)
+
+        found = idx_lows >= 0
+        if debug_msgs:
+            windows = zip(mxs[found], idx_lows[found], idx_highs[found])
+            for mx, idx_low, idx_high in windows:
+                print(
+                    "Best energy window for mx = {} MeV: [{}, {}] MeV".format(
+                        mx, e_grid[idx_low], e_grid[idx_high]
+                    )
+                )
+
+        diagnostics = {
+            "e_low": np.where(found, e_grid[idx_lows], np.nan),
+            "e_high": np.where(found, e_grid[idx_highs], np.nan),
+            "snr": snrs,
+        }
+        return limits, diagnostics
+
+    def _cmb_limit_curve(
+        self, mxs, x_kd=1.0e-4, p_ann=p_ann_planck_temp_pol, *, parallel
+    ):
+        limits = parallel_map(
+            _cmb_limit, [(self, mx, x_kd, p_ann) for mx in mxs], parallel=parallel
+        )
+        return np.array(limits, dtype=np.float64), {}
@@ -1,6 +1,23 @@
-def dnde_decay_v_pt(eng_gam, eng_v, mv, pws, mode):
+DECAY_SPECTRUM_CACHE_SIZE: int
+
+
+class VectorMediatorDecaySpectrum:
+    mv: float
+
+    def __init__(self, mv):
+        ...
+
+    def __call__(self, eng_gam, eng_v, pws, mode):
+        ...
+
+
+def decay_spectrum(mv):
+    ...
+
+
+def dnde_decay_v_pt(eng_gam, eng_v, mv, pws, mode, spectrum=None):
     ...
 
 
-def dnde_decay_v(eng_gam, eng_v, mv, pws, mode):
+def dnde_decay_v(eng_gam, eng_v, mv, pws, mode, spectrum=None):
     ...
@@ -1,7 +1,11 @@
 from hazma.decay_helper_functions.decay_charged_pion cimport c_charged_pion_decay_spectrum_array
-from hazma.decay_helper_functions.decay_neutral_pion cimport c_neutral_pion_decay_spectrum_array
 from hazma.decay_helper_functions.decay_neutral_pion cimport c_neutral_pion_decay_spectrum_point
+from hazma.decay_helper_functions.decay_neutral_pion cimport c_neutral_pion_boosted_decay_spectrum_point
 from hazma.decay_helper_functions.decay_muon cimport c_muon_decay_spectrum_array
+from hazma.decay_helper_functions.decay_muon cimport c_muon_decay_spectrum_point
+from hazma.decay_helper_functions.rest_frame_spectra cimport RestFrameSpectra, boost_by_quad
+
+from functools import lru_cache
 
 import cython
 import numpy as np
@@ -20,41 +24,32 @@ cdef double qe = sqrt(4. * M_PI * ALPHA_EM)
 ctypedef np.ndarray ndarray
 
 cdef int n_interp_pts = 500
-cdef np.ndarray __e_gams = np.zeros((n_interp_pts,), dtype=np.float64)
-cdef np.ndarray __spec_cp = np.zeros((n_interp_pts,), dtype=np.float64)
-cdef np.ndarray __spec_mu = np.zeros((n_interp_pts,), dtype=np.float64)
-
-cdef double __set_spectra(double mv):
-    global __e_gams
-    global __spec_cp
-    global __spec_mu
-
-    __e_gams = np.logspace(-1.0, log10(mv / 2.0), num=n_interp_pts)
 
-    __spec_cp = c_charged_pion_decay_spectrum_array(__e_gams, mv / 2.0, 7)
-    __spec_mu = c_muon_decay_spectrum_array(__e_gams, mv / 2.0)
-
-cdef double __interp_spec(double eng_gam, str mode):
-    """
-    Intepolation function for the short kaon data.
-
-    Parameters
-    ----------
-    eng_gam : double
-        Energy of the photon.
-    mode : str {"total"}
-        String specifying which decay mode to use.
-    """
-    if mode == "cp":
-        if eng_gam < 10**-1:
-            return __spec_cp[0] * __e_gams[0] / eng_gam
-        return np.interp(eng_gam, __e_gams, __spec_cp)
-    if mode == "mu":
-        if eng_gam < 10**-1:
-            return __spec_mu[0] * __e_gams[0] / eng_gam
-        return np.interp(eng_gam, __e_gams, __spec_mu)
-    else:
-        return 0.0
+# Number of photon energies of the rest-frame spectra, spanning eight decades
+# below the maximum photon energy mv / 2.
+cdef int n_vrf_pts = 1601
+
+# Number of spectrum objects of the most recently used mediator masses kept
+# in memory.
+DECAY_SPECTRUM_CACHE_SIZE = 32
+
+# Bitflags of the modes of the rest-frame spectra
+cdef int BITFLAG_EEG = 1
+cdef int BITFLAG_MMG = 2
+cdef int BITFLAG_PPG = 4
+cdef int BITFLAG_PP = 8
+cdef int BITFLAG_P0G = 16
+cdef int BITFLAG_MM = 32
+
+__MODE_BITFLAGS = {
+    "e e g": BITFLAG_EEG,
+    "mu mu g": BITFLAG_MMG,
+    "pi pi g": BITFLAG_PPG,
+    "pi pi": BITFLAG_PP,
+    "pi0 g": BITFLAG_P0G,
+    "mu mu": BITFLAG_MM,
+    "total": 63,
+}
 
 @cython.cdivision(True)
 cdef double __dnde_fsr_cp_vrf(double egam, double mv):
@@ -112,7 +107,8 @@ cdef double __dnde_fsr_l_vrf(double egam, double ml, double mv):
 @cython.boundscheck(True)
 @cython.wraparound(False)
 cdef double __integrand(double cl, double eng_gam, double eng_v,
-                        double mv, np.ndarray[double] pws, str mode):
+                        VectorMediatorDecaySpectrum spectrum,
+                        np.ndarray[double] pws, int bitflags):
     """
     Integrand of the boost integralself.
 
@@ -124,14 +120,19 @@ cdef double __integrand(double cl, double eng_gam, double eng_v,
         Gamma-ray energy to evaluate spectrum at.
     eng_s : float
         Energy of the scalar mediator.
-    params :
-        Scalar mediator model parameters.
+    spectrum :
+        Spectrum object of the vector mediator.
+    pws :
+        Partial widths of the vector mediator.
+    bitflags :
+        Bitflags of the modes to include.
 
     Returns
     -------
     integrand : float
         The value of the boost integral.
     """
+    cdef double mv = spectrum.mv
     cdef double pwee = pws[0]
     cdef double pwmumu = pws[1]
     cdef double pwpi0g = pws[2]
@@ -146,137 +147,285 @@ cdef double __integrand(double cl, double eng_gam, double eng_v,
 
     cdef double dnde = 0.0
 
-    cdef double dnde_ee_f = pwee * __dnde_fsr_l_vrf(eng_gam_vrf, me, mv)
-    cdef double dnde_mu_f = pwmumu * __dnde_fsr_l_vrf(eng_gam_vrf, mmu, mv)
-
-    cdef double dnde_cp_f = pwpipi * __dnde_fsr_cp_vrf(eng_gam_vrf, mv)
-
-    cdef double dnde_cp_d = 2. * pwpipi * __interp_spec(eng_gam_vrf, "cp")
-
-    # Neutral pion energy is:
-    cdef double e_pi0 = 0.5 * (mpi0**2 + mv**2) / mv
-    cdef double dnde_np_d = pwpi0g * c_neutral_pion_decay_spectrum_point(eng_gam_vrf, e_pi0)
-
-    cdef double dnde_mu_d = 2. * pwmumu * __interp_spec(eng_gam_vrf, "mu")
+    if bitflags & BITFLAG_EEG:
+        dnde += pwee * __dnde_fsr_l_vrf(eng_gam_vrf, me, mv)
+    if bitflags & BITFLAG_MMG:
+        dnde += pwmumu * __dnde_fsr_l_vrf(eng_gam_vrf, mmu, mv)
+    if bitflags & BITFLAG_PPG:
+        dnde += pwpipi * __dnde_fsr_cp_vrf(eng_gam_vrf, mv)
+    if bitflags & BITFLAG_PP:
+        dnde += 2. * pwpipi * spectrum.interp_spec(eng_gam_vrf, BITFLAG_PP)
+    if bitflags & BITFLAG_P0G:
+        # Neutral pion energy is:
+        dnde += pwpi0g * c_neutral_pion_decay_spectrum_point(
+            eng_gam_vrf, 0.5 * (mpi0**2 + mv**2) / mv
+        )
+    if bitflags & BITFLAG_MM:
+        dnde += 2. * pwmumu * spectrum.interp_spec(eng_gam_vrf, BITFLAG_MM)
+
+    return jac * dnde
+
+cdef class VectorMediatorDecaySpectrum:
+    """
+    Photon spectrum from the decay of a vector mediator with a given mass.
 
-    dnde = dnde_ee_f + dnde_mu_f + dnde_cp_f + \
-           dnde_cp_d + dnde_np_d + dnde_mu_d
+    The rest-frame spectra of the decay products are computed once, when the
+    object is created, and can be boosted to any mediator energy and weighted
+    by any partial widths. The object is not modified afterwards, so it can
+    be shared between threads.
 
-    if mode == "total":
-        return jac * dnde
-    if mode == "e e g":
-        return jac * dnde_ee_f
-    if mode == "pi pi g":
-        return jac * dnde_cp_f
-    if mode == "pi pi":
-        return jac * dnde_cp_d
-    if mode == "pi0 g":
-        return jac * dnde_np_d
-    if mode == "mu mu g":
-        return jac * dnde_mu_f
-    if mode == "mu mu":
-        return jac * dnde_mu_d
+    Parameters
+    ----------
+    mv : float
+        Mass of the vector mediator.
+    """
+    cdef readonly double mv
+    # Rest-frame spectra of the modes, in the order of their bitflags. The
+    # spectrum of the neutral pion is boosted in closed form and not
+    # tabulated.
+    cdef RestFrameSpectra spectra
+    # Decay spectra of the charged pion and muon with energy mv / 2,
+    # interpolated when the spectrum is boosted by quadrature.
+    cdef np.ndarray e_gams
+    cdef np.ndarray spec_cp
+    cdef np.ndarray spec_mu
+
+    def __init__(self, double mv):
+        self.mv = mv
+        engs = np.geomspace(1e-8 * mv / 2.0, mv / 2.0, n_vrf_pts)
+        self.spectra = RestFrameSpectra(engs, [
+            [__dnde_fsr_l_vrf(e, me, mv) for e in engs],
+            [__dnde_fsr_l_vrf(e, mmu, mv) for e in engs],
+            [__dnde_fsr_cp_vrf(e, mv) for e in engs],
+            c_charged_pion_decay_spectrum_array(engs, mv / 2.0, 7),
+            np.zeros_like(engs),
+            [c_muon_decay_spectrum_point(e, mv / 2.0) for e in engs],
+        ])
+        self.e_gams = np.logspace(-1.0, log10(mv / 2.0), num=n_interp_pts)
+        self.spec_cp = c_charged_pion_decay_spectrum_array(self.e_gams, mv / 2.0, 7)
+        self.spec_mu = c_muon_decay_spectrum_array(self.e_gams, mv / 2.0)
+
+    cdef double interp_spec(self, double eng_gam, int bitflag) except *:
+        """
+        Intepolation function for the charged pion and muon decay spectra.
+
+        Parameters
+        ----------
+        eng_gam : double
+            Energy of the photon.
+        bitflag : int
+            Bitflag of the mode, "pi pi" or "mu mu", whose decay spectrum
+            to use.
+        """
+        if bitflag == BITFLAG_PP:
+            if eng_gam < 10**-1:
+                return self.spec_cp[0] * self.e_gams[0] / eng_gam
+            return np.interp(eng_gam, self.e_gams, self.spec_cp)
+        if bitflag == BITFLAG_MM:
+            if eng_gam < 10**-1:
+                return self.spec_mu[0] * self.e_gams[0] / eng_gam
+            return np.interp(eng_gam, self.e_gams, self.spec_mu)
+        else:
+            return 0.0
+
+    @cython.boundscheck(True)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef double c_point_quad(self, double eng_gam, double eng_v,
+                             np.ndarray[double] pws, int bitflags) except *:
+        """
+        Returns the spectrum at `eng_gam`, boosted by quadrature.
+        """
+        cdef double mv = self.mv
+        if eng_v < mv:
+            return 0.
+
+        cdef double beta = sqrt(1. - pow(mv / eng_v, 2.))
+        cdef double eplus = eng_v * (1. + beta) / 2.0
+        cdef double eminus = eng_v * (1. - beta) / 2.0
+        cdef double result = quad(__integrand, -1.0, 1.0, points=[-1.0, 1.0],
+                                  args=(eng_gam, eng_v, self, pws, bitflags),
+                                  epsabs=10**-10., epsrel=10**-5.)[0]
+
+        if (bitflags & BITFLAG_P0G) and eminus <= eng_gam <= eplus:
+            result += pws[2] / (eng_v * beta)
+        return result
 
-@cython.boundscheck(True)
-@cython.wraparound(False)
-@cython.cdivision(True)
-cdef double __dnde_decay_v(double eng_gam, double eng_v, double mv,
-                           np.ndarray[double] pws, str mode):
+    @cython.boundscheck(True)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef np.ndarray c_array(self, np.ndarray[double] eng_gams, double eng_v,
+                            np.ndarray[double] pws, int bitflags):
+        """
+        Returns the spectrum at the photon energies `eng_gams`.
+        """
+        cdef int i
+        cdef int num_pts = eng_gams.shape[0]
+        cdef double mv = self.mv
+        cdef double beta, gamma, eng_gam, e_pi0
+        cdef np.ndarray[double] spec
+        cdef np.ndarray[double] weights
+
+        if eng_v < mv:
+            return np.zeros_like(eng_gams)
+
+        if boost_by_quad():
+            spec = np.zeros_like(eng_gams)
+            for i in range(num_pts):
+                spec[i] = self.c_point_quad(eng_gams[i], eng_v, pws, bitflags)
+            return spec
+
+        weights = np.array([
+            pws[0] * (bitflags & BITFLAG_EEG != 0),
+            pws[1] * (bitflags & BITFLAG_MMG != 0),
+            pws[3] * (bitflags & BITFLAG_PPG != 0),
+            2. * pws[3] * (bitflags & BITFLAG_PP != 0),
+            0.0,
+            2. * pws[1] * (bitflags & BITFLAG_MM != 0),
+        ])
+        spec = self.spectra.c_boosted_modes_array(eng_gams, eng_v, mv, weights)
+
+        if bitflags & BITFLAG_P0G:
+            beta = sqrt(1. - pow(mv / eng_v, 2.))
+            gamma = eng_v / mv
+            # Neutral pion energy is:
+            e_pi0 = 0.5 * (mpi0**2 + mv**2) / mv
+            for i in range(num_pts):
+                eng_gam = eng_gams[i]
+                spec[i] += pws[2] * c_neutral_pion_boosted_decay_spectrum_point(
+                    eng_gam, e_pi0, gamma, beta
+                )
+                if eng_v * (1. - beta) / 2.0 <= eng_gam <= eng_v * (1. + beta) / 2.0:
+                    spec[i] += pws[2] / (eng_v * beta)
+        return spec
+
+    def __call__(self, eng_gam, double eng_v, np.ndarray[double] pws, str mode):
+        """
+        Compute the gamma ray spectrum from the decay of the vector mediator.
+
+        Parameters
+        ----------
+        eng_gam : float or array-like
+            Gamma-ray energies to evaluate spectrum at.
+        eng_v : float
+            Energy of the vector mediator.
+        pws : np.ndarray[double]
+            Partial widths of the vector mediator into e e, mu mu, pi0 g and
+            pi pi.
+        mode : str
+            Mode to compute spectrum for: "e e g", "mu mu g", "pi pi g",
+            "pi pi", "pi0 g", "mu mu" or "total".
+
+        Returns
+        -------
+        dnde : float or array-like
+            Value of dnde at gamma-ray energies `eng_gam`.
+        """
+        cdef int bitflags = __MODE_BITFLAGS.get(mode, 0)
+        if hasattr(eng_gam, '__len__'):
+            return self.c_array(np.array(eng_gam, dtype=np.float64), eng_v, pws, bitflags)
+        return self.c_array(np.array([eng_gam], dtype=np.float64), eng_v, pws, bitflags)[0]
+
+
+@lru_cache(maxsize=DECAY_SPECTRUM_CACHE_SIZE)
+def __cached_spectrum(double mv, bint by_quad):
+    return VectorMediatorDecaySpectrum(mv)
+
+
+def decay_spectrum(double mv):
     """
-    Unvectorized dnde_decay_s
+    Returns the spectrum object of a vector mediator with mass `mv`.
 
-    Compute the gamma ray spectrum from the decay of the scalar mediator.
+    The objects of the `DECAY_SPECTRUM_CACHE_SIZE` most recently used masses
+    are cached, so repeated calls with the same mass do not tabulate the
+    rest-frame spectra again.
 
     Parameters
     ----------
-    eng_gams : float or array-like
-        Float or array of gamma-ray energies to evaluate spectrum at.
-    eng_s : float
-        Energy of the scalar mediator.
-    params :
-        Scalar mediator model parameters.
+    mv : float
+        Mass of the vector mediator.
 
     Returns
     -------
-    dnde : float or array-like
-        Values of dnde at gamma-ray energies `eng_gams`.
+    spectrum : VectorMediatorDecaySpectrum
+        Spectrum object of the vector mediator.
     """
-    cdef double lines_contrib = 0.0
-    cdef double beta = sqrt(1. - pow(mv / eng_v, 2.))
-    cdef double gamma = eng_v / mv
-
-    if eng_v < mv:
-        return 0.
-
-    cdef double eplus = eng_v * (1. + beta) / 2.0
-    cdef double eminus = eng_v * (1. - beta) / 2.0
-    cdef double result = 0.0
+    # The tabulated pion spectra depend on the boost method.
+    return __cached_spectrum(mv, boost_by_quad())
 
-    if eminus <= eng_gam <= eplus:
-        lines_contrib = pws[2] / (eng_v * beta)
 
-    result = quad(__integrand, -1.0, 1.0, points=[-1.0, 1.0],
-                  args=(eng_gam, eng_v, mv, pws, mode), epsabs=10**-10.,
-                  epsrel=10**-5.)[0]
-
-    if mode == "pi0 g" or mode == "total":
-        return result + lines_contrib
-
-    else:
-        return result
+cdef VectorMediatorDecaySpectrum __get_spectrum(double mv, spectrum):
+    """
+    Returns `spectrum`, or the cached spectrum object if it is None.
+    """
+    if spectrum is None:
+        return decay_spectrum(mv)
+    if spectrum.mv != mv:
+        raise ValueError(
+            "Spectrum was computed for a mediator mass of {} MeV, not {} MeV.".format(
+                spectrum.mv, mv
+            )
+        )
+    return spectrum
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
 def dnde_decay_v_pt(double eng_gam, double eng_v, double mv,
-                    np.ndarray[double] pws, str mode):
+                    np.ndarray[double] pws, str mode, spectrum=None):
     """
-    Compute the gamma ray spectrum from the decay of the scalar mediator.
+    Compute the gamma ray spectrum from the decay of the vector mediator.
 
     Parameters
     ----------
     eng_gams : float
         Gamma-ray energy to evaluate spectrum at.
-    eng_s : float
-        Energy of the scalar mediator.
-    params :
-        Scalar mediator model parameters.
+    eng_v : float
+        Energy of the vector mediator.
+    mv : float
+        Mass of the vector mediator.
+    pws : np.ndarray[double]
+        Partial widths of the vector mediator.
+    mode : str
+        Mode to compute spectrum for.
+    spectrum : VectorMediatorDecaySpectrum, optional
+        Precomputed spectrum for the mass `mv`. If None, the cached spectrum
+        of this mass is used.
 
     Returns
     -------
     dnde : float or array-like
         Value of dnde at gamma-ray energy `eng_gam`.
     """
-    __set_spectra(mv)
-    return __dnde_decay_v(eng_gam, eng_v, mv, pws, mode)
+    return __get_spectrum(mv, spectrum)(eng_gam, eng_v, pws, mode)
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
 def dnde_decay_v(np.ndarray[double] eng_gam, double eng_v, double mv,
-                 np.ndarray[double] pws, str mode):
+                 np.ndarray[double] pws, str mode, spectrum=None):
     """
-    Compute the gamma ray spectrum from the decay of the scalar mediator.
+    Compute the gamma ray spectrum from the decay of the vector mediator.
 
     Parameters
     ----------
-    eng_gams : float
-        Gamma-ray energy to evaluate spectrum at.
-    eng_s : float
-        Energy of the scalar mediator.
-    params :
-        Scalar mediator model parameters.
+    eng_gams : np.ndarray[double]
+        Gamma-ray energies to evaluate spectrum at.
+    eng_v : float
+        Energy of the vector mediator.
+    mv : float
+        Mass of the vector mediator.
+    pws : np.ndarray[double]
+        Partial widths of the vector mediator.
+    mode : str
+        Mode to compute spectrum for.
+    spectrum : VectorMediatorDecaySpectrum, optional
+        Precomputed spectrum for the mass `mv`. If None, the cached spectrum
+        of this mass is used.
 
     Returns
     -------
-    dnde : float or array-like
-        Value of dnde at gamma-ray energy `eng_gam`.
+    dnde : np.ndarray[double]
+        Values of dnde at gamma-ray energies `eng_gam`.
     """
-    __set_spectra(mv)
-    cdef int num_pts = len(eng_gam)
-    cdef int i
-
-    spec = np.zeros(num_pts, dtype=np.float64)
-
-    for i in range(num_pts):
-        spec[i] = __dnde_decay_v(eng_gam[i], eng_v, mv, pws, mode)
-
-    return spec
+    return __get_spectrum(mv, spectrum).c_array(
+        eng_gam, eng_v, pws, __MODE_BITFLAGS.get(mode, 0)
+    )
@@ -1,5 +1,7 @@
 from hazma.positron_helper_functions.positron_muon cimport c_muon_positron_spectrum_array
 from hazma.positron_helper_functions.positron_charged_pion cimport c_charged_pion_positron_spectrum_array
+from hazma.decay_helper_functions.rest_frame_spectra cimport LogGridSpectrum, RestFrameSpectra
+from hazma.decay_helper_functions.rest_frame_spectra cimport boost_by_quad, interp_log_grid
 
 import cython
 import numpy as np
@@ -8,7 +10,7 @@ from scipy.integrate import quad
 
 from libc.math cimport M_PI, sqrt, pow, log10
 
-include "../decay_helper_functions/parameters.pxd"
+include "../decay_helper_functions/common.pxd"
 
 cdef double mmu = MASS_MU
 cdef double me = MASS_E
@@ -27,6 +29,19 @@ cdef int n_interp_pts = 500
 cdef np.ndarray __e_ps = np.zeros((n_interp_pts,), dtype=np.float64)
 cdef np.ndarray __spec_cp = np.zeros((n_interp_pts,), dtype=np.float64)
 cdef np.ndarray __spec_mu = np.zeros((n_interp_pts,), dtype=np.float64)
+cdef RestFrameSpectra __spectra_vrf = None
+# Maximum energy of the positrons in the vector rest frame
+cdef double __eng_p_max_vrf = 0.0
+
+
+cdef struct BoostArgs:
+    double eng_p
+    double eng_v
+    double mv
+    double pwpipi
+    double pwmumu
+    LogGridSpectrum spec_cp
+    LogGridSpectrum spec_mu
 
 cdef int __recompute_rf_spectra(double mv, np.ndarray[double] pws):
     """
@@ -68,43 +83,23 @@ cdef void __set_spectra(double mv):
     global __e_ps
     global __spec_cp
     global __spec_mu
+    global __spectra_vrf
+    global __eng_p_max_vrf
 
     __e_ps = np.logspace(log10(me), log10(mv / 2.), num=n_interp_pts)
     __spec_cp = c_charged_pion_positron_spectrum_array(__e_ps, mv / 2.)
     __spec_mu = c_muon_positron_spectrum_array(__e_ps, mv / 2.)
+    __spectra_vrf = RestFrameSpectra(__e_ps, [__spec_cp, __spec_mu])
 
-cdef double __interp_spec(double eng_p, str fs):
-    """
-    Return the positron spectrum from the decay of the vector mediator into
-    either a charged pion or muon for a given electron/positron energy.
-
-    Parameters
-    ----------
-    eng_p: double
-        Energy of the positron/electron
-    fs: str
-        String specifying the final state: 'cp' for charged pion and 'mu' for
-        the muon.
-
-    Returns
-    -------
-    spectrum: double
-        The positron spectrum value from the decay of the vector mediator into
-        pions or muons.
-
-    """
-    if fs == "cp":
-        return np.interp(eng_p, __e_ps, __spec_cp)
-    if fs == "mu":
-        return np.interp(eng_p, __e_ps, __spec_mu)
+    # The spectra vanish from the node following the last non-zero value.
+    nonzero = np.nonzero(__spec_cp + __spec_mu)[0]
+    if len(nonzero) == 0:
+        __eng_p_max_vrf = __e_ps[0]
     else:
-        return 0.0
+        __eng_p_max_vrf = __e_ps[min(nonzero[-1] + 1, n_interp_pts - 1)]
 
 @cython.cdivision(True)
-@cython.boundscheck(True)
-@cython.wraparound(False)
-cdef double __integrand(double cl, double eng_p, double eng_v,
-                        double mv, np.ndarray[double] pws, str fs):
+cdef double __integrand(double cl, void* args) nogil:
     """
     Integrand of the boost integral.
 
@@ -112,53 +107,50 @@ cdef double __integrand(double cl, double eng_p, double eng_v,
     ----------
     cl : float
         Angle the final state particle make with respect to the z-axis.
-    eng_p : float
-        Gamma-ray energy to evaluate spectrum at.
-    eng_v : float
-        Energy of the vector mediator.
-    mv : double
-        Vector mediator mass.
-    pws: np.ndarray
-        Relevant partial widths: pws[0] = pw_ee, pws[1] = pw_mumu and
-        pws[2] = pw_pipi
-    fs: str
-        String specifying the final state to compute spectrum for.
+    args : BoostArgs*
+        Energies of the positron and vector mediator, mass of the vector
+        mediator and the partial widths and rest-frame spectra of the
+        charged pions and muons.
 
     Returns
     -------
     integrand : float
         The value of the boost integral.
     """
+    cdef BoostArgs* boost = <BoostArgs*>args
+    cdef double eng_p = boost.eng_p
+    cdef double mv = boost.mv
+
     if eng_p < me:
         return 0.0
 
-    cdef double pwmumu = pws[1]
-    cdef double pwpipi = pws[2]
-
     cdef double p = sqrt(eng_p * eng_p - me * me)
-    cdef double gamma = eng_v / mv
-    cdef double beta = sqrt(1. - pow(mv / eng_v, 2))
-    cdef double eng_p_vrf = gamma * (eng_p - p * beta * cl)
-    cdef double jac = p / (2. * sqrt((1 + pow(beta * cl, 2)) * eng_p * eng_p -
-                                     (1 + beta * beta * (-1 + cl * cl)) *
-                                     me * me -
-                                     2 * beta * cl * eng_p * p) * gamma)
+    cdef double eng_p_vrf = rest_frame_energy(eng_p, me, boost.eng_v, mv, cl)
+    if eng_p_vrf <= me:
+        return 0.0
+    cdef double jac = p / (2.0 * sqrt((eng_p_vrf - me) * (eng_p_vrf + me)))
 
     cdef double dnde_cp = 0.0
     cdef double dnde_mu = 0.0
 
-    if fs == "total":
-        dnde_cp = pwpipi * __interp_spec(eng_p_vrf, "cp")
-        dnde_mu = pwmumu * __interp_spec(eng_p_vrf, "mu")
-        return jac * (dnde_cp + dnde_mu)
-    if fs == "pi pi":
-        dnde_cp = pwpipi * __interp_spec(eng_p_vrf, "cp")
-        return jac * (dnde_cp + dnde_mu)
-    if fs == "mu mu":
-        dnde_mu = pwmumu * __interp_spec(eng_p_vrf, "mu")
-        return jac * (dnde_cp + dnde_mu)
-    if fs == "e e":
-        return 0.0
+    if boost.pwpipi != 0.0:
+        dnde_cp = boost.pwpipi * interp_log_grid(&boost.spec_cp, eng_p_vrf)
+    if boost.pwmumu != 0.0:
+        dnde_mu = boost.pwmumu * interp_log_grid(&boost.spec_mu, eng_p_vrf)
+    return jac * (dnde_cp + dnde_mu)
+
+
+def __quad_integrand(double cl, double eng_p, double eng_v, double mv,
+                     double pwpipi, double pwmumu):
+    cdef BoostArgs args
+    args.eng_p = eng_p
+    args.eng_v = eng_v
+    args.mv = mv
+    args.pwpipi = pwpipi
+    args.pwmumu = pwmumu
+    args.spec_cp = __spectra_vrf.c_spectrum(1)
+    args.spec_mu = __spectra_vrf.c_spectrum(2)
+    return __integrand(cl, &args)
 
 @cython.boundscheck(True)
 @cython.wraparound(False)
@@ -168,7 +160,7 @@ cdef double __dnde_decay_v(double eng_p, double eng_v, double mv,
     """
     Un-vectorized dnde_decay_s
 
-    Compute the gamma ray spectrum from the decay of the scalar mediator.
+    Compute the gamma ray spectrum from the decay of the vector mediator.
 
     Parameters
     ----------
@@ -205,10 +197,42 @@ cdef double __dnde_decay_v(double eng_p, double eng_v, double mv,
     if fs == "e e":
         return lines_contrib
 
+    cdef BoostArgs args
+    cdef double points[3]
+    cdef int num_points = 2
+    cdef double p, cl
+
     if fs == "total" or fs == "pi pi" or fs == "mu mu":
-        result = quad(__integrand, -1.0, 1.0, points=[-1.0, 1.0],
-                      args=(eng_p, eng_v, mv, pws, fs), epsabs=1e-10,
-                      epsrel=1e-5)[0]
+        args.pwpipi = pws[2] if fs != "mu mu" else 0.0
+        args.pwmumu = pws[1] if fs != "pi pi" else 0.0
+
+        if eng_p < me:
+            return lines_contrib
+
+        if boost_by_quad():
+            result = quad(__quad_integrand, -1.0, 1.0, points=[-1.0, 1.0],
+                          args=(eng_p, eng_v, mv, args.pwpipi, args.pwmumu),
+                          epsabs=1e-10, epsrel=1e-5)[0]
+            return result + lines_contrib
+
+        # Only positrons at angles inside of the one reaching the maximum
+        # energy in the vector rest frame contribute.
+        p = sqrt(eng_p * eng_p - me * me)
+        cl = (eng_p - __eng_p_max_vrf / gamma) / (p * beta)
+        points[0] = -1.0
+        if -1.0 < cl < 1.0:
+            points[1] = cl
+            points[2] = 1.0
+            num_points = 3
+        else:
+            points[1] = 1.0
+
+        args.eng_p = eng_p
+        args.eng_v = eng_v
+        args.mv = mv
+        args.spec_cp = __spectra_vrf.c_spectrum(1)
+        args.spec_mu = __spectra_vrf.c_spectrum(2)
+        result = gauss_kronrod(__integrand, &args, points, num_points, 1e-10, 1e-5)
 
         return result + lines_contrib
 
@@ -219,16 +243,16 @@ cdef double __dnde_decay_v(double eng_p, double eng_v, double mv,
 def dnde_decay_v_pt(double eng_p, double eng_v, double mv,
                     np.ndarray[double] pws, str fs):
     """
-    Compute the gamma ray spectrum from the decay of the scalar mediator.
+    Compute the gamma ray spectrum from the decay of the vector mediator.
 
     Parameters
     ----------
     eng_p : float
         Positron energy to evaluate spectrum at.
     eng_v : float
-        Energy of the scalar mediator.
+        Energy of the vector mediator.
     mv : double
-        Mass of the scalar mediator.
+        Mass of the vector mediator.
     pws: np.ndarray[double]
         Array of the relevant partial widths: pws[0] = pw_ee,
         pws[1] = pw_mumu and pws[2] = pw_pipi
@@ -249,16 +273,16 @@ def dnde_decay_v_pt(double eng_p, double eng_v, double mv,
 def dnde_decay_v(np.ndarray[double] eng_ps, double eng_v, double mv,
                  np.ndarray[double] pws, str fs):
     """
-    Compute the gamma ray spectrum from the decay of the scalar mediator.
+    Compute the gamma ray spectrum from the decay of the vector mediator.
 
     Parameters
     ----------
     eng_ps : float
         Positron energy to evaluate spectrum at.
     eng_v : float
-        Energy of the scalar mediator.
+        Energy of the vector mediator.
     mv : double
-        Mass of the scalar mediator.
+        Mass of the vector mediator.
     pws: np.ndarray[double]
         Array of the relevant partial widths: pws[0] = pw_ee,
         pws[1] = pw_mumu and pws[2] = pw_pipi
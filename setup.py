@@ -1,3 +1,5 @@
+import sys
+
 import numpy as np
 from setuptools import Extension, find_packages, setup  # type: ignore
 
@@ -11,21 +13,33 @@ def long_description():
     return "\n".join([str(line) for line in ld.split("\n")[4:]])
 
 
-def make_extension(module, name, cpp=False):
+# The default compiler on macOS does not support OpenMP. The parallel loops
+# then run serially.
+OPENMP_ARGS = [] if sys.platform == "darwin" else ["-fopenmp"]
+
+
+def make_extension(module, name, cpp=False, openmp=False):
     package = ".".join(["hazma", module, name])
     sources = ["/".join(["hazma", module, name]) + ".pyx"]
+    omp_args = OPENMP_ARGS if openmp else []
     if cpp:
         return Extension(
-            package, sources, extra_compile_args=["-g", "-std=c++11"], language="c++"
+            package,
+            sources,
+            extra_compile_args=["-g", "-std=c++11"] + omp_args,
+            extra_link_args=omp_args,
+            language="c++",
         )
     else:
-        return Extension(package, sources)
+        return Extension(
+            package, sources, extra_compile_args=omp_args, extra_link_args=omp_args
+        )
 
 
-def make_extensions(module, names, cpp=False):
+def make_extensions(module, names, cpp=False, openmp=False):
     extensions = []
     for name in names:
-        extensions += [make_extension(module, name, cpp)]
+        extensions += [make_extension(module, name, cpp, openmp)]
     return extensions
 
 
@@ -42,8 +56,12 @@ EXTENSIONS += make_extensions(
         "decay_charged_kaon",
         "decay_long_kaon",
         "decay_short_kaon",
+        "decay_tables",
+        "rest_frame_spectra",
+        "kaon_matrix_elements",
     ],
     cpp=True,
+    openmp=True,
 )
 
 # Gamma-Ray Helper
@@ -53,7 +71,9 @@ EXTENSIONS += make_extensions(
 
 # Phase space
 EXTENSIONS += make_extensions(
-    "phase_space_helper_functions", ["generator", "histogram", "modifiers"], cpp=True
+    "phase_space_helper_functions",
+    ["generator", "histogram", "modifiers", "native"],
+    cpp=True,
 )
 
 # Field Theory helper
@@ -67,6 +87,7 @@ EXTENSIONS += make_extensions(
 EXTENSIONS += make_extensions(
     "positron_helper_functions",
     ["positron_muon", "positron_charged_pion", "positron_decay"],
+    openmp=True,
 )
 
 # Scalar mediator
@@ -89,6 +110,11 @@ EXTENSIONS += make_extensions(
     ],
 )
 
+# Pseudo-scalar mediator
+EXTENSIONS += make_extensions(
+    "pseudo_scalar_mediator", ["_c_pseudo_scalar_mediator_msqrd"], cpp=True
+)
+
 # RH-neutrino
 EXTENSIONS += [
     Extension(
@@ -1,11 +1,17 @@
 import os
+import tempfile
 import unittest
 from os import path
 
 import numpy as np
 from numpy.testing import assert_allclose
 
-from hazma.decay import charged_pion, muon, neutral_pion
+from hazma import positron_spectra
+from hazma.decay import charged_pion, muon, neutral_pion, short_kaon
+from hazma.decay import disable_tables, enable_tables, set_boost_method
+from hazma.decay_helper_functions import decay_tables
+from hazma.parallel import num_threads, set_num_threads
+from hazma.decay_helper_functions.rest_frame_spectra import RestFrameSpectra
 
 
 class TestDecay(unittest.TestCase):
@@ -71,3 +77,199 @@ class TestDecay(unittest.TestCase):
 
     def test_dnde_charged_pion(self):
         self.compare_spectra("pi_data", charged_pion)
+
+    def test_charged_pion_endpoints(self):
+        """
+        Test the boosted spectra of the charged pion pointwise against the
+        reference data, up to the endpoints of the spectra. The reference
+        values were integrated with an absolute tolerance of 1e-10 and vanish
+        where that quadrature missed the narrow forward cone.
+        """
+        for e, (e_gams, dnde_ref) in self.load_data("pi_data").items():
+            found = dnde_ref > 0.0
+            assert_allclose(
+                charged_pion(e_gams[found], e),
+                dnde_ref[found],
+                rtol=1e-4,
+                atol=2e-10,
+            )
+
+    def test_dnde_parent_energy_arrays(self):
+        """
+        Test that spectra for arrays of parent energies agree with the
+        spectra computed one parent energy at a time.
+        """
+        e_gams = np.geomspace(1.0, 500.0, 7)
+        for dnde_func, energies in [
+            (muon, [150.0, 300.0]),
+            (neutral_pion, [150.0, 300.0]),
+            (charged_pion, [150.0, 300.0]),
+            (short_kaon, [600.0, 800.0]),
+        ]:
+            dnde = dnde_func(e_gams, np.array(energies))
+            self.assertEqual(dnde.shape, (len(energies), len(e_gams)))
+            for e, row in zip(energies, dnde):
+                assert_allclose(row, dnde_func(e_gams, e), rtol=1e-12)
+            assert_allclose(dnde_func(e_gams[3], np.array(energies)), dnde[:, 3])
+
+    def test_decay_tables(self):
+        """
+        Test that the spectra interpolated from tables agree with the
+        quadrature and that the tables are cached.
+        """
+        e_gams = np.geomspace(1.0, 700.0, 50)
+        e_pis = [150.0, 700.0]
+        spec_quad = charged_pion(e_gams, e_pis)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            enable_tables(cache_dir=cache_dir)
+            try:
+                spec_table = charged_pion(e_gams, e_pis)
+                table_path = path.join(
+                    cache_dir, decay_tables.get_tables("charged_pion").filename(7)
+                )
+                self.assertTrue(path.exists(table_path))
+                # The cached table is loaded instead of being rebuilt
+                enable_tables(cache_dir=cache_dir)
+                assert_allclose(charged_pion(e_gams, e_pis), spec_table, rtol=1e-12)
+            finally:
+                disable_tables()
+
+        for dnde_table, dnde_quad in zip(spec_table, spec_quad):
+            assert_allclose(
+                e_gams * dnde_table,
+                e_gams * dnde_quad,
+                rtol=0.0,
+                atol=1e-2 * np.max(e_gams * dnde_quad),
+            )
+
+    def test_boost_methods(self):
+        """
+        Test that the spectra boosted with the cumulative integrals of the
+        rest-frame spectra agree with the quadrature over the angle.
+        """
+        e_gams = np.geomspace(1.0, 2000.0, 60)
+        for dnde, e_parents in [(charged_pion, [150.0, 1000.0]), (short_kaon, [600.0])]:
+            set_boost_method("quad")
+            try:
+                spec_quad = dnde(e_gams, e_parents)
+            finally:
+                set_boost_method("cumulative")
+            spec = dnde(e_gams, e_parents)
+
+            for dnde_cum, dnde_quad in zip(spec, spec_quad):
+                assert_allclose(
+                    e_gams * dnde_cum,
+                    e_gams * dnde_quad,
+                    rtol=0.0,
+                    atol=1e-3 * np.max(e_gams * dnde_quad),
+                )
+
+        with self.assertRaises(ValueError):
+            set_boost_method("trapezoid")
+
+    def test_num_threads(self):
+        """
+        Test that the spectra do not depend on the number of threads.
+        """
+        e_gams = np.geomspace(1e-2, 2000.0, 5000)
+        dndes = [muon, neutral_pion, charged_pion, short_kaon]
+        spec = [dnde(e_gams, 700.0) for dnde in dndes]
+
+        set_num_threads(1)
+        try:
+            self.assertEqual(num_threads(), 1)
+            for dnde, expected in zip(dndes, spec):
+                assert_allclose(dnde(e_gams, 700.0), expected, rtol=0.0, atol=0.0)
+        finally:
+            set_num_threads()
+
+        with self.assertRaises(ValueError):
+            set_num_threads(0)
+
+    def test_rest_frame_spectra(self):
+        """
+        Test that the summed rest-frame spectra of the kaons match the sum of
+        the interpolated spectra of their modes.
+        """
+        data_dir = path.join(
+            path.dirname(decay_tables.__file__), "interpolation_data", "lkaon"
+        )
+        modes = ["000", "penu", "penug", "pm0", "pm0g", "pmunu", "pmunug"]
+        data = [
+            np.loadtxt(
+                path.join(data_dir, "long_kaon_interp_{}.dat".format(mode)),
+                delimiter=",",
+            )
+            for mode in modes
+        ]
+        spectra = RestFrameSpectra(data[0][:, 0], [d[:, 1] for d in data])
+
+        engs = np.concatenate(
+            [[1e-6, 1e5], data[0][:5, 0], np.geomspace(1e-5, 1e4, 517)]
+        )
+        for bitflags in [1, 6, 127]:
+            expected = sum(
+                np.interp(engs, d[:, 0], d[:, 1])
+                for i, d in enumerate(data)
+                if bitflags & (1 << i)
+            )
+            assert_allclose(spectra(engs, bitflags), expected, rtol=1e-12, atol=0.0)
+
+        # Grids that are not uniform in logarithm are searched by bisection
+        keep = np.arange(len(data[0])) % 3 != 1
+        spectra = RestFrameSpectra(data[0][keep, 0], [d[keep, 1] for d in data])
+        expected = sum(np.interp(engs, d[keep, 0], d[keep, 1]) for d in data)
+        assert_allclose(spectra(engs, 127), expected, rtol=1e-12, atol=0.0)
+
+        with self.assertRaises(ValueError):
+            RestFrameSpectra(data[0][::-1, 0], [d[::-1, 1] for d in data])
+
+    def test_positron_normalization(self):
+        """
+        Test that the positron spectra integrate to the number of positrons
+        per decay, including large boosts where only a narrow forward cone
+        contributes to the boost integral.
+        """
+        for energy in [110.0, 500.0, 3000.0, 1e5]:
+            e_ps = np.geomspace(0.511, 2.0 * energy, 20000)
+            self.assertAlmostEqual(
+                np.trapz(positron_spectra.muon(e_ps, energy), e_ps), 1.0, places=3
+            )
+            self.assertAlmostEqual(
+                np.trapz(positron_spectra.charged_pion(e_ps, 1.3 * energy), e_ps),
+                0.9998,
+                places=3,
+            )
+
+    def test_positron_matrix(self):
+        """
+        Test that the positron spectra for arrays of parent energies match the
+        spectra for each of the energies, with and without tables.
+        """
+        e_ps = np.geomspace(0.6, 3000.0, 50)
+        e_mus = np.array([100.0, 110.0, 500.0, 3000.0])
+        spec = positron_spectra.muon(e_ps, e_mus)
+        self.assertEqual(spec.shape, (len(e_mus), len(e_ps)))
+        for e_mu, expected in zip(e_mus, spec):
+            assert_allclose(
+                positron_spectra.muon(e_ps, e_mu), expected, rtol=0.0, atol=0.0
+            )
+        assert_allclose(
+            positron_spectra.muon(e_ps[9], e_mus), spec[:, 9], rtol=0.0, atol=0.0
+        )
+        assert_allclose(
+            positron_spectra.charged_pion(e_ps, [200.0, 500.0])[1],
+            positron_spectra.charged_pion(e_ps, 500.0),
+            rtol=0.0,
+            atol=0.0,
+        )
+
+        enable_tables()
+        try:
+            tabulated = positron_spectra.muon(e_ps, e_mus)
+        finally:
+            disable_tables()
+        peak = np.max(e_ps * spec, axis=1)[:, np.newaxis]
+        errs = np.abs(e_ps * (tabulated - spec)) / np.maximum(peak, 1e-300)
+        self.assertLess(np.max(errs), 1e-2)
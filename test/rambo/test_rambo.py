@@ -1,14 +1,44 @@
+import os
+import pickle
+import tempfile
 import unittest
+import warnings
 
 import numpy as np
 from numpy.testing import assert_allclose
 
 from hazma.field_theory_helper_functions.common_functions import minkowski_dot as MDot
+# Registers the native kaon matrix elements.
+from hazma.decay_helper_functions import kaon_matrix_elements  # noqa
 from hazma.parameters import GF, alpha_em
+from hazma.parameters import charged_kaon_mass as mk
 from hazma.parameters import electron_mass as me
 from hazma.parameters import muon_mass as mmu
+from hazma.parameters import neutral_pion_mass as mpi0
 from hazma.parameters import qe
-from hazma.rambo import compute_annihilation_cross_section, compute_decay_width
+from hazma.rambo import (
+    DALITZ_RTOL,
+    batched_matrix_element,
+    compute_annihilation_cross_section,
+    compute_decay_width,
+    generate_energy_histogram,
+    generate_histograms,
+    generate_phase_space,
+    generate_phase_space_chunks,
+    integrate_over_phase_space,
+    integrate_over_phase_space_adaptive,
+    integrate_over_phase_space_dalitz,
+)
+from hazma.phase_space_helper_functions.event_store import EventStore
+from hazma.phase_space_helper_functions.histogram import (
+    WeightedHistogram,
+    linear_bins,
+    log_bins,
+)
+from hazma.phase_space_helper_functions.native import (
+    get_matrix_element,
+    registered_matrix_elements,
+)
 
 mw = 80.385 * 10 ** 3  # W-mass
 mz = 91.1876 * 10 ** 3  # Z-Mass
@@ -116,3 +146,412 @@ class TestRambo(unittest.TestCase):
         analytic = num / den
 
         assert_allclose(rambo[0], analytic, rtol=5e-3)
+
+    def test_compute_decay_width_muon_batched(self):
+        """
+        Test rambo decay width function on mu -> e nu nu using a batched
+        matrix element.
+        """
+
+        def mdot(p1, p2):
+            return p1[:, 0] * p2[:, 0] - np.sum(p1[:, 1:] * p2[:, 1:], axis=1)
+
+        def msqrd_mu_to_enunu(momenta):
+            """
+            Matrix element squared for mu -> e nu nu evaluated on all phase
+            space points at once.
+            """
+            pe = momenta[:, 0]
+            pve = momenta[:, 1]
+            pvmu = momenta[:, 2]
+
+            pmu = np.sum(momenta, axis=1)
+
+            return 64.0 * GF ** 2 * mdot(pe, pvmu) * mdot(pmu, pve)
+
+        fsp_masses = np.array([me, 0.0, 0.0])
+        r = me ** 2 / mmu ** 2
+        corr_fac = 1.0 - 8.0 * r + 8 * r ** 3 - r ** 4 - 12.0 * r ** 2 * np.log(r)
+        analytic = GF ** 2 * mmu ** 5 / (192.0 * np.pi ** 3) * corr_fac
+
+        rambo = compute_decay_width(
+            fsp_masses,
+            mmu,
+            num_ps_pts=50000,
+            mat_elem_sqrd=msqrd_mu_to_enunu,
+            num_cpus=1,
+            batched=True,
+        )
+        assert_allclose(rambo[0], analytic, rtol=5e-3)
+
+        rambo = compute_decay_width(
+            fsp_masses,
+            mmu,
+            num_ps_pts=50000,
+            mat_elem_sqrd=batched_matrix_element(msqrd_mu_to_enunu),
+            num_cpus=1,
+        )
+        assert_allclose(rambo[0], analytic, rtol=5e-3)
+
+    def test_integrate_over_phase_space_adaptive(self):
+        """
+        Test the adaptive integrator on mu -> e nu nu.
+        """
+
+        @batched_matrix_element
+        def msqrd_mu_to_enunu(momenta):
+            pe = momenta[:, 0]
+            pve = momenta[:, 1]
+            pvmu = momenta[:, 2]
+            pmu = np.sum(momenta, axis=1)
+
+            def mdot(p1, p2):
+                return p1[:, 0] * p2[:, 0] - np.sum(p1[:, 1:] * p2[:, 1:], axis=1)
+
+            return 64.0 * GF ** 2 * mdot(pe, pvmu) * mdot(pmu, pve)
+
+        fsp_masses = np.array([me, 0.0, 0.0])
+        integral, std, num_evals = integrate_over_phase_space_adaptive(
+            fsp_masses, mmu, mat_elem_sqrd=msqrd_mu_to_enunu, rtol=1e-3, seed=42
+        )
+        r = me ** 2 / mmu ** 2
+        corr_fac = 1.0 - 8.0 * r + 8 * r ** 3 - r ** 4 - 12.0 * r ** 2 * np.log(r)
+        analytic = GF ** 2 * mmu ** 5 / (192.0 * np.pi ** 3) * corr_fac
+
+        self.assertLessEqual(std, 1e-3 * integral)
+        self.assertLess(num_evals, 1000000)
+        assert_allclose(integral / (2.0 * mmu), analytic, rtol=5e-3)
+
+        # Few points per iteration on flat, massless four-body phase space
+        cme = 10.0
+        volume = (np.pi / 2.0) ** 3 * cme ** 4 / 12.0 / (2.0 * np.pi) ** 8
+        for seed in range(6):
+            integral, std, _ = integrate_over_phase_space_adaptive(
+                np.zeros(4), cme, num_ps_pts_per_iter=100, seed=seed
+            )
+            self.assertLessEqual(std, 1e-2 * integral)
+            assert_allclose(integral, volume, rtol=0.0, atol=4.0 * std)
+
+        for kwargs in [
+            dict(rtol=0.0),
+            dict(num_bins=1),
+            dict(num_ps_pts_per_iter=0),
+            dict(num_ps_pts_per_iter=99),
+            dict(max_num_ps_pts=0),
+        ]:
+            with self.assertRaises(ValueError):
+                integrate_over_phase_space_adaptive(np.zeros(4), cme, **kwargs)
+
+    def test_streaming(self):
+        """
+        Test that the chunked generator, streaming integral and streaming
+        histograms agree with the dense phase space points.
+        """
+        masses = np.array([100.0, 100.0, 0.0, 0.0])
+        cme = 1000.0
+        num_ps_pts = 40000
+
+        pts = generate_phase_space(masses, cme, num_ps_pts, seed=7)
+        chunks = list(generate_phase_space_chunks(masses, cme, num_ps_pts, seed=7))
+        self.assertGreater(len(chunks), 1)
+        np.testing.assert_array_equal(np.concatenate(chunks), pts)
+
+        integral, std = integrate_over_phase_space(masses, cme, num_ps_pts, seed=7)
+        assert_allclose(integral, np.mean(pts[:, -1]), rtol=1e-12)
+        assert_allclose(std, np.std(pts[:, -1]) / np.sqrt(num_ps_pts), rtol=1e-8)
+
+        probs, errs = generate_energy_histogram(
+            masses, cme, num_ps_pts, num_bins=20, density=True, seed=7
+        )
+        self.assertEqual(probs.shape, (4, 2, 20))
+        self.assertEqual(errs.shape, (4, 20))
+        for i in range(len(masses)):
+            widths = np.diff(probs[i, 0])[0]
+            assert_allclose(np.sum(probs[i, 1]) * widths, 1.0, rtol=1e-10)
+            counts, _ = np.histogram(
+                pts[:, 4 * i],
+                bins=20,
+                range=(probs[i, 0, 0] - widths / 2, probs[i, 0, -1] + widths / 2),
+                weights=pts[:, -1],
+                density=True,
+            )
+            assert_allclose(probs[i, 1], counts, rtol=1e-8)
+
+        # Empty samples are rejected up front
+        with self.assertRaises(ValueError):
+            generate_phase_space_chunks(masses, cme, 0)
+        with self.assertRaises(ValueError):
+            generate_phase_space(masses, cme, 0)
+        with self.assertRaises(ValueError):
+            generate_energy_histogram(masses, cme, 0)
+        with self.assertRaises(ValueError):
+            integrate_over_phase_space(masses, cme, 0)
+
+    def test_sobol_sampling(self):
+        """
+        Test that quasi-Monte-Carlo sampling reproduces mu -> e nu nu with a
+        smaller error than pseudo-random sampling.
+        """
+
+        @batched_matrix_element
+        def msqrd_mu_to_enunu(momenta):
+            pe = momenta[:, 0]
+            pve = momenta[:, 1]
+            pvmu = momenta[:, 2]
+            pmu = np.sum(momenta, axis=1)
+
+            def mdot(p1, p2):
+                return p1[:, 0] * p2[:, 0] - np.sum(p1[:, 1:] * p2[:, 1:], axis=1)
+
+            return 64.0 * GF ** 2 * mdot(pe, pvmu) * mdot(pmu, pve)
+
+        fsp_masses = np.array([me, 0.0, 0.0])
+        r = me ** 2 / mmu ** 2
+        corr_fac = 1.0 - 8.0 * r + 8 * r ** 3 - r ** 4 - 12.0 * r ** 2 * np.log(r)
+        analytic = GF ** 2 * mmu ** 5 / (192.0 * np.pi ** 3) * corr_fac
+
+        results = {}
+        for sampling in ["pseudo", "sobol"]:
+            results[sampling] = integrate_over_phase_space(
+                fsp_masses,
+                mmu,
+                num_ps_pts=2 ** 15,
+                mat_elem_sqrd=msqrd_mu_to_enunu,
+                num_cpus=1,
+                seed=1,
+                sampling=sampling,
+            )
+        integral, std = results["sobol"]
+        assert_allclose(integral / (2.0 * mmu), analytic, rtol=5e-3)
+        self.assertLess(std, results["pseudo"][1])
+
+        probs, errs = generate_energy_histogram(
+            fsp_masses,
+            mmu,
+            2 ** 12,
+            msqrd_mu_to_enunu,
+            num_cpus=1,
+            num_bins=10,
+            seed=1,
+            sampling="sobol",
+        )
+        self.assertEqual(probs.shape, (3, 2, 10))
+        self.assertEqual(errs.shape, (3, 10))
+        self.assertTrue(np.all(np.isfinite(errs)))
+
+        # Sequences of any length are allowed without warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            pts = generate_phase_space(
+                fsp_masses, mmu, 1000, num_cpus=1, seed=1, sampling="sobol"
+            )
+        self.assertEqual(pts.shape, (1000, 13))
+
+        with self.assertRaises(ValueError):
+            integrate_over_phase_space(fsp_masses, mmu, sampling="halton")
+
+    def test_dalitz_dispatch(self):
+        """
+        Test that two- and three-body widths are computed with deterministic
+        quadrature by default for batched matrix elements and agree with the
+        analytic results, and that RAMBO is used otherwise or when the
+        quadrature has not converged.
+        """
+
+        def msqrd_mu_to_enunu(momenta):
+            pe = momenta[0]
+            pve = momenta[1]
+            pvmu = momenta[2]
+            pmu = sum(momenta)
+            return 64.0 * GF ** 2 * MDot(pe, pvmu) * MDot(pmu, pve)
+
+        fsp_masses = np.array([me, 0.0, 0.0])
+        r = me ** 2 / mmu ** 2
+        corr_fac = 1.0 - 8.0 * r + 8 * r ** 3 - r ** 4 - 12.0 * r ** 2 * np.log(r)
+        analytic = GF ** 2 * mmu ** 5 / (192.0 * np.pi ** 3) * corr_fac
+
+        msqrd_batched = batched_matrix_element(
+            lambda momenta: np.array([msqrd_mu_to_enunu(p) for p in momenta])
+        )
+        width, err = compute_decay_width(fsp_masses, mmu, mat_elem_sqrd=msqrd_batched)
+        assert_allclose(width, analytic, rtol=1e-8)
+        self.assertLess(err, 1e-6 * width)
+
+        rambo = compute_decay_width(
+            fsp_masses,
+            mmu,
+            num_ps_pts=1000,
+            mat_elem_sqrd=msqrd_mu_to_enunu,
+            num_cpus=1,
+            seed=3,
+            method="rambo",
+        )
+        self.assertGreater(rambo[1], 0.0)
+        assert_allclose(rambo[0], analytic, rtol=10 * rambo[1] / rambo[0])
+        self.assertEqual(
+            compute_decay_width(
+                fsp_masses,
+                mmu,
+                num_ps_pts=1000,
+                mat_elem_sqrd=msqrd_mu_to_enunu,
+                num_cpus=1,
+                seed=3,
+            ),
+            rambo,
+        )
+
+        # Narrow resonance in the invariant mass of the neutrinos
+        @batched_matrix_element
+        def msqrd_resonance(momenta):
+            p = momenta[:, 1] + momenta[:, 2]
+            s = p[:, 0] ** 2 - np.sum(p[:, 1:] ** 2, axis=1)
+            return 1.0 / ((s - 50.0 ** 2) ** 2 + (50.0 * 0.01) ** 2)
+
+        kwargs = dict(
+            num_ps_pts=1000, mat_elem_sqrd=msqrd_resonance, num_cpus=1, seed=3
+        )
+        integral, std = integrate_over_phase_space_dalitz(
+            fsp_masses, mmu, msqrd_resonance, num_angle_pts=1
+        )
+        self.assertGreater(std, DALITZ_RTOL * integral)
+        self.assertEqual(
+            compute_decay_width(fsp_masses, mmu, **kwargs),
+            compute_decay_width(fsp_masses, mmu, method="rambo", **kwargs),
+        )
+
+        # Orientation dependent matrix element, integrated over all angles.
+        msqrd = batched_matrix_element(lambda momenta: momenta[:, 0, 3] ** 2)
+        masses = np.array([100.0, 200.0, 300.0])
+        cme = 1000.0
+        integral, _ = integrate_over_phase_space_dalitz(masses, cme, msqrd)
+        k1sq = integrate_over_phase_space_dalitz(
+            masses,
+            cme,
+            batched_matrix_element(
+                lambda momenta: np.sum(momenta[:, 0, 1:] ** 2, axis=1)
+            ),
+            num_angle_pts=1,
+        )[0]
+        assert_allclose(integral, k1sq / 3.0, rtol=1e-10)
+
+        with self.assertRaises(ValueError):
+            integrate_over_phase_space_dalitz(np.zeros(4), cme)
+
+    def test_native_matrix_element(self):
+        msqrd = get_matrix_element("charged_kaon.0lnu", [mmu])
+        self.assertIn("charged_kaon.0lnu", registered_matrix_elements())
+        self.assertEqual(msqrd.param_names, ("ml",))
+
+        masses = np.array([mpi0, mmu, 0.0])
+        points = generate_phase_space(masses, mk, 100, msqrd, num_cpus=1, seed=5)
+        expected = generate_phase_space(
+            masses, mk, 100, lambda momenta: msqrd(momenta), num_cpus=1, seed=5
+        )
+        assert_allclose(points, expected, rtol=1e-12)
+
+        momenta = points[:, :12].reshape(-1, 3, 4)
+        assert_allclose(msqrd(momenta), [msqrd(moms) for moms in momenta])
+
+        unpickled = pickle.loads(pickle.dumps(msqrd))
+        assert_allclose(unpickled(momenta), msqrd(momenta))
+
+        with self.assertRaises(KeyError):
+            get_matrix_element("charged_kaon.missing")
+        with self.assertRaises(ValueError):
+            get_matrix_element("charged_kaon.0lnu")
+
+    def test_generate_histograms(self):
+        """
+        Test that the single-pass histograms of several observables agree
+        with numpy and can be merged and pickled.
+        """
+        masses = np.array([100.0, 100.0, 0.0, 0.0])
+        cme = 1000.0
+        pts = generate_phase_space(masses, cme, 20000, seed=11)
+        weights = pts[:, -1]
+        e34 = pts[:, 8] + pts[:, 12]
+        k34 = pts[:, 9:12] + pts[:, 13:16]
+        m34 = np.sqrt(np.maximum(e34 ** 2 - np.sum(k34 ** 2, axis=1), 0.0))
+        k1, k2 = pts[:, 1:4], pts[:, 5:8]
+        cos12 = np.sum(k1 * k2, axis=1) / np.sqrt(
+            np.sum(k1 ** 2, axis=1) * np.sum(k2 ** 2, axis=1)
+        )
+
+        observables = [("energy", 0), ("invariant_mass", 2, 3), ("cos_angle", 0, 1)]
+        edges = [
+            log_bins(100.0, 500.0, 10),
+            np.array([0.0, 100.0, 150.0, 400.0, 800.0]),
+            linear_bins(-1.0, 1.0, 8),
+        ]
+        hists = generate_histograms(
+            masses, cme, observables, edges, 20000, num_cpus=1, seed=11
+        )
+        for (obs_edges, values, errs), x in zip(hists, [pts[:, 0], m34, cos12]):
+            counts, _ = np.histogram(x, bins=obs_edges, weights=weights)
+            assert_allclose(values, counts / 20000 / np.diff(obs_edges), rtol=1e-10)
+            self.assertEqual(errs.shape, values.shape)
+
+        # Bins spanning the kinematic limits hold the full integral.
+        hists = generate_histograms(
+            masses, cme, observables, 20, 20000, num_cpus=1, seed=11
+        )
+        for obs_edges, values, _ in hists:
+            assert_allclose(
+                np.sum(values * np.diff(obs_edges)), np.mean(weights), rtol=1e-10
+            )
+
+        hist = WeightedHistogram(observables, edges, len(masses))
+        hist.update(pts[:10000])
+        rest = WeightedHistogram(observables, edges, len(masses))
+        rest.update(pts[10000:])
+        hist.merge(pickle.loads(pickle.dumps(rest)))
+        self.assertEqual(hist.count, 20000)
+        counts, _ = np.histogram(pts[:, 0], bins=edges[0], weights=weights ** 2)
+        assert_allclose(hist.sum_weights_sqrd[0], counts, rtol=1e-10)
+
+        with self.assertRaises(ValueError):
+            hist.merge(WeightedHistogram(observables[:1], edges[:1], len(masses)))
+        with self.assertRaises(ValueError):
+            WeightedHistogram([("energy", 4)], edges[:1], len(masses))
+
+    def test_event_store(self):
+        """
+        Test that reweighting stored events reproduces the integrals and
+        histograms of freshly generated events with the same seed.
+        """
+        masses = np.array([me, 0.0, 0.0])
+
+        @batched_matrix_element
+        def msqrd(momenta):
+            return momenta[:, 0, 0] ** 2
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            events = EventStore(masses, mmu, 20000, seed=4, cache_dir=cache_dir)
+            self.assertTrue(os.path.exists(events.path))
+            cached = EventStore(masses, mmu, 20000, seed=4, cache_dir=cache_dir)
+            self.assertIsInstance(cached.events, np.memmap)
+            np.testing.assert_array_equal(cached.events, events.events)
+
+            integral = integrate_over_phase_space(
+                masses, mmu, 20000, msqrd, num_cpus=1, seed=4
+            )
+            assert_allclose(cached.integrate(msqrd), integral, rtol=1e-12)
+
+            probs, errs = generate_energy_histogram(
+                masses, mmu, 20000, msqrd, num_bins=10, num_cpus=1, seed=4
+            )
+            stored_probs, stored_errs = cached.energy_histogram(msqrd, num_bins=10)
+            assert_allclose(stored_probs, probs, rtol=1e-12)
+            assert_allclose(stored_errs, errs, rtol=1e-12)
+            del cached
+
+        unweighted = EventStore(masses, mmu, 20000, seed=4, unweighted=True)
+        self.assertLessEqual(unweighted.num_events, 20000)
+        self.assertEqual(len(np.unique(unweighted.events[:, -1])), 1)
+        rtol = 10.0 * integral[1] / integral[0]
+        assert_allclose(unweighted.integrate(msqrd)[0], integral[0], rtol=rtol)
+
+        with self.assertRaises(ValueError):
+            events.check_kinematics(np.array([me, me, 0.0]), mmu)
+        with self.assertRaises(ValueError):
+            EventStore(masses, mmu, 100, seed=None, cache_dir=".")
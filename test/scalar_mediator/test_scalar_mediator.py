@@ -2,12 +2,28 @@
 Test module for the scalar mediator model.
 """
 
+import contextlib
+import io
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from numpy.testing import assert_allclose
 
+from hazma.gamma_ray_parameters import (
+    A_eff_comptel,
+    comptel_diffuse,
+    default_bg_model,
+    energy_res_comptel,
+    gc_targets,
+)
+from hazma.parallel import use_executor
 from hazma.scalar_mediator import HeavyQuark, ScalarMediator
+from hazma.scalar_mediator.scalar_mediator_decay_spectrum import (
+    ScalarMediatorDecaySpectrum,
+    decay_spectrum,
+    scalar_mediator_decay_spectrum,
+)
 
 sm1_dir = "test/scalar_mediator/data/sm_1/"
 sm2_dir = "test/scalar_mediator/data/sm_2/"
@@ -230,3 +246,120 @@ class TestScalarMediator(unittest.TestCase):
         assert_allclose(
             lns2_new["e e"]["energy"], self.lns2_old["e e"]["energy"], rtol=1e-4
         )
+
+    def test_decay_spectrum_objects(self):
+        """
+        Test that spectra of mediators with different masses computed
+        concurrently agree with the serial ones.
+        """
+        e_gams = np.geomspace(1.0, 1e3, 50)
+        pws = np.array([0.2, 0.2, 0.2, 0.2, 0.2])
+        masses = [200.0, 550.0, 900.0]
+        serial = [
+            scalar_mediator_decay_spectrum(e_gams, 1.5 * ms, ms, pws)
+            for ms in masses
+        ]
+
+        spectra = [ScalarMediatorDecaySpectrum(ms) for ms in masses]
+        with ThreadPoolExecutor(3) as pool:
+            futures = [
+                pool.submit(spectrum, e_gams, 1.5 * spectrum.ms, pws)
+                for spectrum in spectra * 4
+            ]
+            results = [future.result() for future in futures]
+
+        for i, result in enumerate(results):
+            assert_allclose(result, serial[i % len(masses)], rtol=1e-12)
+
+        with self.assertRaises(ValueError):
+            scalar_mediator_decay_spectrum(
+                e_gams, 600.0, 550.0, pws, spectrum=spectra[0]
+            )
+
+    def test_decay_spectrum_cache(self):
+        """
+        Test that the spectrum objects are reused for repeated masses.
+        """
+        e_gams = np.geomspace(1.0, 1e3, 50)
+        pws = np.array([0.2, 0.2, 0.2, 0.2, 0.2])
+        spectrum = decay_spectrum(550.0)
+
+        self.assertIs(decay_spectrum(550.0), spectrum)
+        self.assertIsNot(decay_spectrum(200.0), spectrum)
+        assert_allclose(
+            scalar_mediator_decay_spectrum(e_gams, 600.0, 550.0, pws),
+            ScalarMediatorDecaySpectrum(550.0)(e_gams, 600.0, pws),
+            rtol=1e-12,
+        )
+
+    def test_gamma_ray_limits(self):
+        """
+        Test that the vectorized bin integrals match integrals of the
+        convolved spectrum over each bin, and that refining the grid of
+        energy windows can only strengthen the unbinned limit.
+        """
+        sm = ScalarMediator(
+            mx=20.0, ms=1e3, gsxx=1.0, gsff=1.0, gsGG=0.0, gsFF=1.0, lam=1e3
+        )
+        e_lows, e_highs = comptel_diffuse.e_lows, comptel_diffuse.e_highs
+        dnde_conv = sm.total_conv_spectrum_fn(
+            e_lows[0], e_highs[-1], 40.0, energy_res_comptel
+        )
+        assert_allclose(
+            sm._bin_integrals(dnde_conv, e_lows, e_highs),
+            [dnde_conv.integral(e_l, e_h) for e_l, e_h in zip(e_lows, e_highs)],
+            rtol=1e-12,
+        )
+
+        args = (A_eff_comptel, energy_res_comptel, 1e6)
+        kwargs = dict(
+            target=gc_targets["nfw"]["1 arcmin cone"], bg_model=default_bg_model
+        )
+        e_min, e_max = A_eff_comptel.x[[0, -1]]
+        # The coarse grid is a subset of the fine one
+        coarse = sm.unbinned_limit(
+            *args, e_grid=np.geomspace(e_min, e_max, 20), **kwargs
+        )
+        fine = sm.unbinned_limit(*args, e_grid=np.geomspace(e_min, e_max, 77), **kwargs)
+        self.assertTrue(np.isfinite(coarse))
+        self.assertLessEqual(fine, coarse * (1 + 1e-12))
+
+    def test_limit_curve(self):
+        """
+        Test that limit curves match the limits computed for each mass,
+        without modifying the theory.
+        """
+        sm = ScalarMediator(
+            mx=20.0, ms=1e3, gsxx=1.0, gsff=1.0, gsGG=0.0, gsFF=1.0, lam=1e3
+        )
+        mxs = np.array([5.0, 20.0, 60.0])
+        unbinned_args = (
+            A_eff_comptel,
+            energy_res_comptel,
+            1e6,
+            gc_targets["nfw"]["1 arcmin cone"],
+            default_bg_model,
+        )
+
+        with ThreadPoolExecutor(2) as pool, use_executor(pool, 2):
+            binned, binned_info = sm.limit_curve(
+                mxs, "binned", comptel_diffuse, parallel=True
+            )
+        unbinned, unbinned_info = sm.limit_curve(mxs, "unbinned", *unbinned_args)
+        self.assertEqual(sm.mx, 20.0)
+
+        for i, mx in enumerate(mxs):
+            sm.mx = mx
+            assert_allclose(binned[i], sm.binned_limit(comptel_diffuse), rtol=1e-10)
+            assert_allclose(unbinned[i], sm.unbinned_limit(*unbinned_args), rtol=1e-10)
+        self.assertTrue(np.all(binned_info["bin"] >= 0))
+        self.assertTrue(np.all(unbinned_info["e_low"] < unbinned_info["e_high"]))
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            limits, _ = sm.limit_curve(mxs, "unbinned", *unbinned_args, debug_msgs=True)
+        assert_allclose(limits, unbinned, rtol=0.0, atol=0.0)
+        self.assertEqual(len(out.getvalue().splitlines()), len(mxs))
+
+        with self.assertRaises(ValueError):
+            sm.limit_curve(mxs, "invalid")
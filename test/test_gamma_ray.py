@@ -1,4 +1,9 @@
 from hazma import gamma_ray
+from hazma.parameters import charged_pion_mass as mpi, muon_mass as mmu
+from hazma.parameters import DetectorResponse, convolve_gaussian, spec_res_fn
+from hazma.parameters import line_integrals
+from hazma.gamma_ray_parameters import A_eff_comptel, energy_res_comptel
+from hazma.phase_space_helper_functions.event_store import EventStore
 import warnings
 import numpy as np
 
@@ -46,3 +51,147 @@ class TestGammaRay(unittest.TestCase):
     def test_np_mu_mu(self):
         particles = np.array(["neutral_pion", "muon", "muon"])
         gamma_ray.gamma_ray_decay(particles, self.cme, self.eng_gams)
+
+    def test_events_method(self):
+        """
+        Test that convolving the spectra with the exact energy distributions
+        converges to the spectrum from many quadrature nodes within the
+        estimated errors.
+        """
+        particles = np.array(["muon", "charged_pion", "charged_pion"])
+        cme = 1000.0
+        eng_gams = np.geomspace(1.0, 300.0, 20)
+        events = EventStore([mmu, mpi, mpi], cme, 20000, seed=1)
+
+        expected = gamma_ray.gamma_ray_decay(
+            particles, cme, eng_gams, events=events, num_bins=400, method="events"
+        )
+        spec, errs = gamma_ray.gamma_ray_decay(
+            particles,
+            cme,
+            eng_gams,
+            events=events,
+            method="events",
+            return_errors=True,
+        )
+        self.assertEqual(errs.shape, (len(particles), len(eng_gams)))
+        total_errs = np.sqrt(np.sum(errs ** 2, axis=0))
+        self.assertTrue(np.all(np.abs(spec - expected) <= total_errs))
+        np.testing.assert_allclose(spec, expected, rtol=5e-3)
+
+        _, errs = gamma_ray.gamma_ray_decay(
+            ["muon", "muon"], cme, eng_gams, method="events", return_errors=True
+        )
+        self.assertTrue(np.all(errs == 0.0))
+
+        with self.assertRaises(ValueError):
+            gamma_ray.gamma_ray_decay(particles, cme, eng_gams, method="bins")
+
+    def test_convolve_gaussian(self):
+        """
+        Test that the banded convolution with the resolution function matches
+        the full trapezoidal integrals.
+        """
+        es = np.geomspace(1.0, 1000.0, 200)
+        es_src = np.geomspace(0.1, 1e4, 500)
+        dnde_src = np.where(es_src < 300.0, es_src ** -1.5, 0.0)
+
+        def energy_res(e):
+            return 0.02 + 0.1 / np.sqrt(e)
+
+        expected = []
+        for e in es:
+            kernel = spec_res_fn(es_src, e, energy_res)
+            expected.append(
+                np.trapz(dnde_src * kernel, es_src) / np.trapz(kernel, es_src)
+            )
+        np.testing.assert_allclose(
+            convolve_gaussian(es, es_src, dnde_src, energy_res),
+            expected,
+            rtol=0.0,
+            atol=1e-13 * np.max(expected),
+        )
+
+        # Without resolution, the spectrum is interpolated.
+        np.testing.assert_allclose(
+            convolve_gaussian(es, es_src, dnde_src, lambda e: 0.0),
+            np.interp(es, es_src, dnde_src),
+        )
+
+    def test_detector_response(self):
+        """
+        Test that a detector response convolves a batch of spectra like the
+        convolution of each spectrum, and that it is only built once.
+        """
+        response = DetectorResponse(0.3, 30.0, energy_res_comptel, n_pts=300)
+        dnde_srcs = np.array(
+            [response.source_energies ** -p for p in [1.0, 1.5, 2.0]]
+        )
+        dnde_convs = response.apply(dnde_srcs)
+        self.assertEqual(dnde_convs.shape, dnde_srcs.shape)
+        for dnde_src, dnde_conv in zip(dnde_srcs, dnde_convs):
+            np.testing.assert_allclose(
+                dnde_conv,
+                convolve_gaussian(
+                    response.energies,
+                    response.source_energies,
+                    dnde_src,
+                    energy_res_comptel,
+                ),
+                rtol=1e-12,
+            )
+
+        with_area = DetectorResponse(
+            0.3, 30.0, energy_res_comptel, n_pts=300, effective_area=A_eff_comptel
+        )
+        np.testing.assert_allclose(
+            with_area.apply(dnde_srcs[0]),
+            response.apply(dnde_srcs[0] * A_eff_comptel(response.source_energies)),
+            rtol=1e-12,
+        )
+
+        self.assertIs(
+            DetectorResponse.get(0.3, 30.0, energy_res_comptel, 300),
+            DetectorResponse.get(0.3, 30.0, energy_res_comptel, 300),
+        )
+
+    def test_line_integrals(self):
+        """
+        Test that the exact integrals of lines over energy windows match
+        numerical integrals of the resolution function.
+        """
+        from scipy.integrate import quad
+
+        lines = {"g g": {"energy": 5.0, "bf": 0.3}, "g pi0": {"energy": 3.0, "bf": 0.7}}
+        e_lows = np.array([0.5, 2.5, 2.9, 4.8, 5.1])
+        e_highs = np.array([2.5, 3.5, 5.0, 5.2, 50.0])
+
+        expected = np.zeros(len(e_lows))
+        for i, (e_low, e_high) in enumerate(zip(e_lows, e_highs)):
+            for ch, line in lines.items():
+                e_line = line["energy"]
+                integral = quad(
+                    spec_res_fn,
+                    e_low,
+                    e_high,
+                    args=(e_line, energy_res_comptel),
+                    points=[e_line] if e_low < e_line < e_high else None,
+                    epsabs=0,
+                )[0]
+                expected[i] += (2.0 if ch == "g g" else 1.0) * line["bf"] * integral
+
+        np.testing.assert_allclose(
+            line_integrals(lines, energy_res_comptel, e_lows, e_highs),
+            expected,
+            rtol=1e-10,
+            atol=1e-14,
+        )
+        line = {"g pi0": lines["g pi0"]}
+        np.testing.assert_allclose(
+            line_integrals(
+                line, energy_res_comptel, e_lows, e_highs, effective_area=A_eff_comptel
+            ),
+            A_eff_comptel(3.0)
+            * line_integrals(line, energy_res_comptel, e_lows, e_highs),
+            rtol=1e-12,
+        )
@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+import hazma
+from hazma import parallel, rambo
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        self.masses = np.array([0.0, 0.0, 0.0])
+        self.cme = 100.0
+
+    def test_serial_fast_path(self):
+        pts = rambo.generate_phase_space(self.masses, self.cme, num_ps_pts=100)
+        self.assertEqual(pts.shape, (100, 13))
+
+    def test_use_executor(self):
+        with ThreadPoolExecutor(3) as pool, parallel.use_executor(pool, 3):
+            self.assertIs(parallel.get_executor(), pool)
+            self.assertEqual(parallel.num_workers(), 3)
+            pts = rambo.generate_phase_space(
+                self.masses, self.cme, num_ps_pts=parallel.serial_threshold() + 1
+            )
+        self.assertEqual(pts.shape, (parallel.serial_threshold() + 1, 13))
+        self.assertIsNot(parallel.get_executor(), pool)
+
+    def test_set_executor(self):
+        with ThreadPoolExecutor(2) as pool:
+            parallel.set_executor(pool, 2)
+            try:
+                self.assertEqual(parallel.num_workers(), 2)
+                self.assertEqual(
+                    parallel.parallel_map(pow, [(2, 3), (3, 2)]), [8, 9]
+                )
+            finally:
+                parallel.set_executor(None)
+        self.assertEqual(parallel.num_workers(), parallel.default_num_workers())
+
+        # Without an explicit number of workers, the number of cpus is assumed
+        with ThreadPoolExecutor(2) as pool, parallel.use_executor(pool):
+            self.assertEqual(parallel.num_workers(), os.cpu_count() or 1)
+
+    def test_imap_max_pending(self):
+        """
+        Test that `max_pending` caps the number of calls running at once.
+        """
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def task(x):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return x
+
+        with ThreadPoolExecutor(4) as pool, parallel.use_executor(pool, 4):
+            out = list(
+                parallel.parallel_imap(task, ((i,) for i in range(20)), max_pending=2)
+            )
+        self.assertEqual(out, list(range(20)))
+        self.assertLessEqual(running[1], 2)
+
+    def test_seed_independent_of_workers(self):
+        num_ps_pts = parallel.serial_threshold() + rambo.RNG_CHUNK_SIZE
+        serial = rambo.generate_phase_space(
+            self.masses, self.cme, num_ps_pts=num_ps_pts, num_cpus=1, seed=1234
+        )
+        with ThreadPoolExecutor(3) as pool, parallel.use_executor(pool, 3):
+            pooled = rambo.generate_phase_space(
+                self.masses, self.cme, num_ps_pts=num_ps_pts, seed=1234
+            )
+        np.testing.assert_array_equal(serial, pooled)
+
+        other = rambo.generate_phase_space(
+            self.masses, self.cme, num_ps_pts=num_ps_pts, num_cpus=1, seed=4321
+        )
+        self.assertFalse(np.array_equal(serial, other))
+        # Different chunks must use different streams.
+        chunk = rambo.RNG_CHUNK_SIZE
+        self.assertFalse(np.array_equal(serial[:10], serial[chunk : chunk + 10]))
+
+    def test_kernels_after_fork(self):
+        """
+        Test that forked workers can run the multi-threaded decay kernels
+        after the parent has run them.
+        """
+        script = textwrap.dedent(
+            """
+            import numpy as np
+            from concurrent.futures import ProcessPoolExecutor
+            from hazma import decay, parallel
+            from hazma.gamma_ray import gamma_ray_decay
+
+            if __name__ == "__main__":
+                e_gams = np.geomspace(1.0, 500.0, 200)
+                parallel.set_num_threads(4)
+                decay.charged_pion(e_gams, 700.0)
+                parallel.set_serial_threshold(10)
+                with ProcessPoolExecutor(2) as pool, parallel.use_executor(pool, 2):
+                    gamma_ray_decay(
+                        ["charged_pion", "muon", "neutral_pion"],
+                        1000.0,
+                        e_gams,
+                        num_ps_pts=2000,
+                    )
+            """
+        )
+        # Run from the directory containing hazma so that it is importable
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(hazma.__file__))),
+            timeout=300,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
+
+        with ProcessPoolExecutor(1) as pool:
+            self.assertEqual(pool.submit(parallel.num_threads).result(), 1)